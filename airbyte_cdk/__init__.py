@@ -141,6 +141,7 @@ from .sources.streams.call_rate import (
     LimiterSession,
     MovingWindowCallRatePolicy,
     Rate,
+    SlidingWindowCallRatePolicy,
 )
 from .sources.streams.checkpoint import Cursor as LegacyCursor
 from .sources.streams.checkpoint import ResumableFullRefreshCursor
@@ -286,6 +287,7 @@ __all__ = [
     "Oauth2Authenticator",
     "Rate",
     "SingleUseRefreshTokenOauth2Authenticator",
+    "SlidingWindowCallRatePolicy",
     "TokenAuthenticator",
     "UserDefinedBackoffException",
     # Logger
@@ -27,6 +27,7 @@ from airbyte_cdk.models import (
     AirbyteConnectionStatus,
     AirbyteMessage,
     AirbyteMessageSerializer,
+    AirbyteRecordMessage,
     AirbyteStateStats,
     ConnectorSpecification,
     FailureType,
@@ -36,9 +37,7 @@ from airbyte_cdk.models import (
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
-
-# from airbyte_cdk.utils import PrintBuffer, is_cloud_environment, message_utils  # add PrintBuffer back once fixed
-from airbyte_cdk.utils import is_cloud_environment, message_utils
+from airbyte_cdk.utils import PrintBuffer, is_cloud_environment, message_utils
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
@@ -48,6 +47,9 @@ logger = init_logger("airbyte")
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
 _HAS_LOGGED_FOR_SERIALIZATION_ERROR = False
+_RECORD_MESSAGE_PREFIX = b'{"type":"RECORD","record":{"stream":'
+# `type` is the first field of AirbyteMessage hence serialized messages always start with it
+_STATE_MESSAGE_PREFIX = b'{"type":"STATE"'
 
 
 class AirbyteEntrypoint(object):
@@ -118,6 +120,18 @@ class AirbyteEntrypoint(object):
         return main_parser.parse_args(args)
 
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        for message in self.run_as_bytes(parsed_args):
+            yield message.decode()
+
+    def run_as_bytes(self, parsed_args: argparse.Namespace) -> Iterable[bytes]:
+        """
+        Same as `run` but the messages are returned as serialized bytes, so they can be written to a binary output without being decoded
+        and encoded again.
+        """
+        for message in self._run(parsed_args):
+            yield self.airbyte_message_to_bytes(message)
+
+    def _run(self, parsed_args: argparse.Namespace) -> Iterable[AirbyteMessage]:
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -141,44 +155,26 @@ class AirbyteEntrypoint(object):
                 )
                 if cmd == "spec":
                     message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                    yield from [
-                        self.airbyte_message_to_string(queued_message)
-                        for queued_message in self._emit_queued_messages(self.source)
-                    ]
-                    yield self.airbyte_message_to_string(message)
+                    yield from self._emit_queued_messages(self.source)
+                    yield message
                 else:
                     raw_config = self.source.read_config(parsed_args.config)
                     config = self.source.configure(raw_config, temp_dir)
 
-                    yield from [
-                        self.airbyte_message_to_string(queued_message)
-                        for queued_message in self._emit_queued_messages(self.source)
-                    ]
+                    yield from self._emit_queued_messages(self.source)
                     if cmd == "check":
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.check(source_spec, config),
-                        )
+                        yield from self.check(source_spec, config)
                     elif cmd == "discover":
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.discover(source_spec, config),
-                        )
+                        yield from self.discover(source_spec, config)
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.read(source_spec, config, config_catalog, state),
-                        )
+                        yield from self.read(source_spec, config, config_catalog, state)
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
-            yield from [
-                self.airbyte_message_to_string(queued_message)
-                for queued_message in self._emit_queued_messages(self.source)
-            ]
+            yield from self._emit_queued_messages(self.source)
 
     def check(
         self, source_spec: ConnectorSpecification, config: TConfig
@@ -293,17 +289,30 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> str:
+        return AirbyteEntrypoint.airbyte_message_to_bytes(airbyte_message).decode()
+
+    @staticmethod
+    def airbyte_message_to_bytes(airbyte_message: AirbyteMessage) -> bytes:
         global _HAS_LOGGED_FOR_SERIALIZATION_ERROR
+        if airbyte_message.type == Type.RECORD and airbyte_message.record is not None:
+            try:
+                fast_serialized_record = _record_message_to_bytes(airbyte_message.record)  # type: ignore[arg-type] # record is an AirbyteRecordMessage
+                if fast_serialized_record is not None:
+                    return fast_serialized_record
+            except Exception:
+                # The generic path below will handle the error and the fallback
+                pass
+
         serialized_message = AirbyteMessageSerializer.dump(airbyte_message)
         try:
-            return orjson.dumps(serialized_message).decode()
+            return orjson.dumps(serialized_message)
         except Exception as exception:
             if not _HAS_LOGGED_FOR_SERIALIZATION_ERROR:
                 logger.warning(
                     f"There was an error during the serialization of an AirbyteMessage: `{exception}`. This might impact the sync performances."
                 )
                 _HAS_LOGGED_FOR_SERIALIZATION_ERROR = True
-            return json.dumps(serialized_message)
+            return json.dumps(serialized_message).encode()
 
     @classmethod
     def extract_state(cls, args: List[str]) -> Optional[Any]:
@@ -332,16 +341,54 @@ class AirbyteEntrypoint(object):
         return
 
 
+def _record_message_to_bytes(record: AirbyteRecordMessage) -> Optional[bytes]:
+    """
+    Serialize the most common record messages without building the intermediate dict AirbyteMessageSerializer would create. The output is
+    the same as the generic path including the fact that the serializer omits top-level `None` values from the record data. None is
+    returned for records using fields this path does not support, in which case the generic serialization should be used.
+    """
+    if record.meta is not None or record.file_reference is not None:
+        return None
+
+    data = record.data
+    for value in data.values():
+        # an explicit loop is faster than `None in data.values()` as it only checks identity
+        if value is None:
+            data = {key: value for key, value in data.items() if value is not None}
+            break
+    return b"".join(
+        (
+            _RECORD_MESSAGE_PREFIX,
+            orjson.dumps(record.stream),
+            b',"data":',
+            orjson.dumps(data),
+            b',"emitted_at":',
+            orjson.dumps(record.emitted_at),
+            b"" if record.namespace is None else b',"namespace":' + orjson.dumps(record.namespace),
+            b"}}",
+        )
+    )
+
+
+def _write_to_stdout(message: bytes) -> None:
+    stdout = sys.stdout
+    if isinstance(stdout, PrintBuffer):
+        # State messages are flushed right away so that the platform can checkpoint as soon as the state is emitted
+        stdout.write_bytes(message, flush=message.startswith(_STATE_MESSAGE_PREFIX))
+    else:
+        # stdout was not redirected to the print buffer (for example, when it is captured by pytest) so we can't assume it has a binary
+        # layer that is safe to write to
+        stdout.write(message.decode())
+
+
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    # temporarily removes the PrintBuffer because we're seeing weird print behavior for concurrent syncs
-    # Refer to: https://github.com/airbytehq/oncall/issues/6235
     with PRINT_BUFFER:
-        for message in source_entrypoint.run(parsed_args):
-            # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
-            # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
-            print(f"{message}\n", end="")
+        for message in source_entrypoint.run_as_bytes(parsed_args):
+            # the break line is added to the message so that both are written by the same instruction. Otherwise, outputs of concurrent
+            # threads could be interleaved between the message and the break line
+            _write_to_stdout(message + b"\n")
 
 
 def _init_internal_request_filter() -> None:
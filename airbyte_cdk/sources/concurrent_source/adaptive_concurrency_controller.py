@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from airbyte_cdk.sources.streams.http.error_handlers.response_models import ResponseAction
+from airbyte_cdk.sources.streams.http.request_observer import HttpRequestObserver
+
+
+class AdaptiveConcurrencyController(HttpRequestObserver):
+    """
+    Limits the number of partitions read at the same time and adjusts the limit from the outcome of the requests, in the style of
+    additive increase/multiplicative decrease (AIMD).
+
+    The requests are observed in windows of `window_size` attempts. At the end of each window:
+    * if requests were rate limited or if too many requests were retried, the limit is multiplied by `decrease_factor`
+    * else if the 90th percentile of the latency degraded by more than `latency_tolerance` times the baseline, the limit is decreased by 1
+    * else the limit is increased by 1
+
+    The baseline latency follows the lowest 90th percentile observed and slowly rises when the latency stays higher so that a
+    permanently slower API does not keep reducing the limit. The limit always stays between `min_concurrency` and `max_concurrency`.
+    """
+
+    _PERCENTILE = 0.9
+    _BASELINE_ADJUSTMENT_RATE = 0.1
+
+    def __init__(
+        self,
+        min_concurrency: int,
+        max_concurrency: int,
+        logger: logging.Logger,
+        initial_concurrency: Optional[int] = None,
+        window_size: int = 50,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_retry_ratio: float = 0.1,
+    ) -> None:
+        """
+        :param min_concurrency: The minimum number of partitions read at the same time
+        :param max_concurrency: The maximum number of partitions read at the same time
+        :param logger: The logger the decisions are logged to
+        :param initial_concurrency: The number of partitions read at the same time at the start of the sync. Defaults to max_concurrency
+        :param window_size: The number of request attempts observed before the limit is adjusted
+        :param decrease_factor: The factor applied to the limit when requests are rate limited or retried
+        :param latency_tolerance: How many times the baseline latency the 90th percentile can reach before the limit is decreased
+        :param max_retry_ratio: The ratio of retried attempts in a window above which the limit is decreased
+        """
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"min_concurrency must be between 1 and max_concurrency but was {min_concurrency} with a max_concurrency of {max_concurrency}"
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be between 0 and 1 but was {decrease_factor}")
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max_concurrency
+        self._logger = logger
+        self._concurrency = min(
+            max(initial_concurrency or max_concurrency, min_concurrency), max_concurrency
+        )
+        self._window_size = window_size
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._max_retry_ratio = max_retry_ratio
+
+        self._condition = threading.Condition()
+        self._partitions_being_read = 0
+        self._latencies: List[float] = []
+        self._rate_limited_attempts = 0
+        self._retried_attempts = 0
+        self._baseline_latency: Optional[float] = None
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    @contextmanager
+    def partition_slot(self) -> Iterator[None]:
+        """
+        Block until a partition can be read without exceeding the limit and hold the slot until the partition is read.
+        """
+        with self._condition:
+            while self._partitions_being_read >= self._concurrency:
+                self._condition.wait()
+            self._partitions_being_read += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._partitions_being_read -= 1
+                self._condition.notify()
+
+    def on_request_attempt(
+        self, latency_in_seconds: float, response_action: Optional[ResponseAction]
+    ) -> None:
+        with self._condition:
+            self._latencies.append(latency_in_seconds)
+            if response_action == ResponseAction.RATE_LIMITED:
+                self._rate_limited_attempts += 1
+            elif response_action == ResponseAction.RETRY:
+                self._retried_attempts += 1
+            if len(self._latencies) >= self._window_size:
+                self._adjust_concurrency()
+
+    def _adjust_concurrency(self) -> None:
+        latencies = sorted(self._latencies)
+        latency = latencies[int(self._PERCENTILE * (len(latencies) - 1))]
+        retry_ratio = self._retried_attempts / len(latencies)
+        if self._baseline_latency is None or latency < self._baseline_latency:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency += (
+                latency - self._baseline_latency
+            ) * self._BASELINE_ADJUSTMENT_RATE
+
+        if self._rate_limited_attempts:
+            reason = f"{self._rate_limited_attempts} requests were rate limited"
+            concurrency = int(self._concurrency * self._decrease_factor)
+        elif retry_ratio > self._max_retry_ratio:
+            reason = f"{retry_ratio:.0%} of the requests were retried"
+            concurrency = int(self._concurrency * self._decrease_factor)
+        elif latency > self._baseline_latency * self._latency_tolerance:
+            reason = f"the p90 latency of {latency:.3f}s degraded from a baseline of {self._baseline_latency:.3f}s"
+            concurrency = self._concurrency - 1
+        else:
+            reason = f"requests are healthy with a p90 latency of {latency:.3f}s"
+            concurrency = self._concurrency + 1
+        concurrency = min(max(concurrency, self._min_concurrency), self._max_concurrency)
+
+        if concurrency != self._concurrency:
+            self._logger.info(
+                f"Adaptive concurrency: {reason}, changing the number of partitions read concurrently from {self._concurrency} to {concurrency}"
+            )
+            if concurrency > self._concurrency:
+                self._condition.notify(concurrency - self._concurrency)
+            self._concurrency = concurrency
+
+        self._latencies = []
+        self._rate_limited_attempts = 0
+        self._retried_attempts = 0
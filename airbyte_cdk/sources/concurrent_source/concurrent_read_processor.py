@@ -164,6 +164,14 @@ class ConcurrentReadProcessor:
         yield message
         yield from self._message_repository.consume_queue()
 
+    def on_record_batch(self, records: List[Record]) -> Iterable[AirbyteMessage]:
+        """
+        This method is called when a batch of records is read from a partition. The records are handled in order exactly as if they were
+        passed one by one to `on_record`.
+        """
+        for record in records:
+            yield from self.on_record(record)
+
     def on_exception(self, exception: StreamThreadException) -> Iterable[AirbyteMessage]:
         """
         This method is called when an exception is raised.
@@ -3,11 +3,15 @@
 #
 import concurrent
 import logging
-from queue import Queue
-from typing import Iterable, Iterator, List
+import time
+from typing import Iterable, Iterator, List, Optional
 
 from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import MemoryBoundedQueue
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
 )
@@ -35,6 +39,9 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    DEFAULT_MAX_QUEUE_SIZE_IN_BYTES = 64 * 1024 * 1024
+    DEFAULT_METRICS_LOG_INTERVAL_SECONDS = 60.0
+    DEFAULT_RECORD_BATCH_SIZE = 100
 
     @staticmethod
     def create(
@@ -44,6 +51,12 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+        record_batch_max_wait_seconds: float = PartitionReader.DEFAULT_BATCH_MAX_WAIT_SECONDS,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        max_queue_size_in_bytes: int = DEFAULT_MAX_QUEUE_SIZE_IN_BYTES,
+        max_pending_tasks: int = ThreadPoolManager.DEFAULT_MAX_QUEUE_SIZE,
+        metrics_log_interval_seconds: float = DEFAULT_METRICS_LOG_INTERVAL_SECONDS,
     ) -> "ConcurrentSource":
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = (
@@ -57,6 +70,7 @@ class ConcurrentSource:
                 max_workers=num_workers, thread_name_prefix="workerpool"
             ),
             logger,
+            max_concurrent_tasks=max_pending_tasks,
         )
         return ConcurrentSource(
             threadpool,
@@ -65,6 +79,11 @@ class ConcurrentSource:
             message_repository,
             initial_number_of_partitions_to_generate,
             timeout_seconds,
+            record_batch_size,
+            record_batch_max_wait_seconds,
+            concurrency_controller,
+            max_queue_size_in_bytes,
+            metrics_log_interval_seconds,
         )
 
     def __init__(
@@ -75,6 +94,11 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+        record_batch_max_wait_seconds: float = PartitionReader.DEFAULT_BATCH_MAX_WAIT_SECONDS,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        max_queue_size_in_bytes: int = DEFAULT_MAX_QUEUE_SIZE_IN_BYTES,
+        metrics_log_interval_seconds: float = DEFAULT_METRICS_LOG_INTERVAL_SECONDS,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -83,6 +107,11 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param record_batch_size: The maximum number of records a worker hands to the main thread at once. Batching records reduces the number of queue operations and type checks done per record. With a value of 1, records are handed one by one.
+        :param record_batch_max_wait_seconds: The maximum time a worker keeps a batch of records before handing it to the main thread.
+        :param concurrency_controller: If provided, adjusts the number of partitions read at the same time. The workers above the limit wait for a partition being read to complete.
+        :param max_queue_size_in_bytes: The estimated size of the records waiting to be processed by the main thread above which the workers wait. The size of the records is estimated from their size serialized as JSON, which is lower than the memory they use.
+        :param metrics_log_interval_seconds: The interval at which the depth of the queue and the time the threads were blocked are logged.
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -90,6 +119,11 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._record_batch_size = record_batch_size
+        self._record_batch_max_wait_seconds = record_batch_max_wait_seconds
+        self._concurrency_controller = concurrency_controller
+        self._max_queue_size_in_bytes = max_queue_size_in_bytes
+        self._metrics_log_interval_seconds = metrics_log_interval_seconds
 
     def read(
         self,
@@ -97,11 +131,11 @@ class ConcurrentSource:
     ) -> Iterator[AirbyteMessage]:
         self._logger.info("Starting syncing")
 
-        # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
+        # We bound the queue for the main thread to process record items when the queue size grows. This assumes that there are less
         # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
-        # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
-        # information and might even need to be configurable depending on the source
-        queue: Queue[QueueItem] = Queue(maxsize=10_000)
+        # partitions which would fill the queue. The queue is bounded by the estimated size of the records rather than their number so
+        # that the memory used does not depend on the size of the records or on how they are batched.
+        queue = MemoryBoundedQueue(self._max_queue_size_in_bytes)
         concurrent_stream_processor = ConcurrentReadProcessor(
             streams,
             PartitionEnqueuer(queue, self._threadpool),
@@ -109,7 +143,12 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            PartitionReader(
+                queue,
+                batch_size=self._record_batch_size,
+                batch_max_wait_seconds=self._record_batch_max_wait_seconds,
+                concurrency_controller=self._concurrency_controller,
+            ),
         )
 
         # Enqueue initial partition generation tasks
@@ -133,9 +172,10 @@ class ConcurrentSource:
 
     def _consume_from_queue(
         self,
-        queue: Queue[QueueItem],
+        queue: MemoryBoundedQueue,
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
+        next_metrics_log_time = time.monotonic() + self._metrics_log_interval_seconds
         while airbyte_message_or_record_or_exception := queue.get():
             yield from self._handle_item(
                 airbyte_message_or_record_or_exception,
@@ -144,14 +184,31 @@ class ConcurrentSource:
             if concurrent_stream_processor.is_done() and queue.empty():
                 # all partitions were generated and processed. we're done here
                 break
+            if time.monotonic() >= next_metrics_log_time:
+                self._log_queue_metrics(queue)
+                next_metrics_log_time = time.monotonic() + self._metrics_log_interval_seconds
+
+    def _log_queue_metrics(self, queue: MemoryBoundedQueue) -> None:
+        metrics = queue.metrics
+        self._logger.info(
+            f"Queue metrics: {metrics.depth} items of an estimated {metrics.size_in_bytes / 2**20:.1f} MiB out of "
+            f"{metrics.max_size_in_bytes / 2**20:.1f} MiB, workers blocked on a full queue for {metrics.producer_blocked_seconds:.1f}s, "
+            f"main thread blocked on an empty queue for {metrics.consumer_blocked_seconds:.1f}s, partition generation blocked on "
+            f"pending tasks for {self._threadpool.task_slot_wait_seconds:.1f}s"
+        )
 
     def _handle_item(
         self,
         queue_item: QueueItem,
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
-        # handle queue item and call the appropriate handler depending on the type of the queue item
-        if isinstance(queue_item, StreamThreadException):
+        # handle queue item and call the appropriate handler depending on the type of the queue item. Records are checked first as they
+        # are by far the most common items
+        if isinstance(queue_item, Record):
+            yield from concurrent_stream_processor.on_record(queue_item)
+        elif isinstance(queue_item, list):
+            yield from concurrent_stream_processor.on_record_batch(queue_item)
+        elif isinstance(queue_item, StreamThreadException):
             yield from concurrent_stream_processor.on_exception(queue_item)
         elif isinstance(queue_item, PartitionGenerationCompletedSentinel):
             yield from concurrent_stream_processor.on_partition_generation_completed(queue_item)
@@ -159,7 +216,5 @@ class ConcurrentSource:
             concurrent_stream_processor.on_partition(queue_item)
         elif isinstance(queue_item, PartitionCompleteSentinel):
             yield from concurrent_stream_processor.on_partition_complete_sentinel(queue_item)
-        elif isinstance(queue_item, Record):
-            yield from concurrent_stream_processor.on_record(queue_item)
         else:
             raise ValueError(f"Unknown queue item type: {type(queue_item)}")
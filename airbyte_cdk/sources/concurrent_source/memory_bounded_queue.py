@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+from typing import Deque, Dict, Optional, Sequence
+
+import orjson
+
+from airbyte_cdk.sources.streams.concurrent.partitions.types import QueueItem
+from airbyte_cdk.sources.types import Record
+
+
+@dataclass
+class QueueMetrics:
+    """
+    Usage of a MemoryBoundedQueue.
+
+    :param depth: the number of items in the queue
+    :param size_in_bytes: the estimated size of the items in the queue
+    :param max_size_in_bytes: the estimated size above which producers wait for the consumer
+    :param producer_blocked_seconds: the total time producers waited for space in the queue
+    :param consumer_blocked_seconds: the total time the consumer waited for items
+    """
+
+    depth: int
+    size_in_bytes: int
+    max_size_in_bytes: int
+    producer_blocked_seconds: float
+    consumer_blocked_seconds: float
+
+
+class _StreamRecordSize:
+    __slots__ = ("records", "samples", "average")
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.samples = 0
+        self.average = 0.0
+
+
+class MemoryBoundedQueue(Queue[QueueItem]):
+    """
+    A queue bounded by the estimated size of the items it holds instead of their number so that the memory held by the queue does not
+    depend on the size of the records.
+
+    The size of a record is estimated from its data serialized as JSON. Only one record out of every `sample_interval` records of a stream
+    is serialized and the other records are assumed to have the average size of the sampled records of their stream. Other items are
+    assumed to have a small fixed size. An empty queue always accepts an item so that a record larger than the limit does not block the
+    producers forever.
+    """
+
+    _NON_RECORD_SIZE_IN_BYTES = 1024
+
+    def __init__(self, max_size_in_bytes: int, sample_interval: int = 100) -> None:
+        """
+        :param max_size_in_bytes: The estimated size of the items above which producers wait for the consumer
+        :param sample_interval: The number of records of a stream for which the size of one record is measured
+        """
+        if max_size_in_bytes < 1:
+            raise ValueError(
+                f"max_size_in_bytes must be a positive integer but was {max_size_in_bytes}"
+            )
+        if sample_interval < 1:
+            raise ValueError(
+                f"sample_interval must be a positive integer but was {sample_interval}"
+            )
+        super().__init__()
+        self._max_size_in_bytes = max_size_in_bytes
+        self._sample_interval = sample_interval
+        self._size_in_bytes = 0
+        self._item_sizes: Deque[int] = deque()
+        self._record_sizes: Dict[str, _StreamRecordSize] = {}
+        self._producer_blocked_seconds = 0.0
+        self._consumer_blocked_seconds = 0.0
+
+    @property
+    def metrics(self) -> QueueMetrics:
+        """
+        A snapshot of the usage of the queue.
+        """
+        with self.mutex:
+            return QueueMetrics(
+                depth=self._qsize(),
+                size_in_bytes=self._size_in_bytes,
+                max_size_in_bytes=self._max_size_in_bytes,
+                producer_blocked_seconds=self._producer_blocked_seconds,
+                consumer_blocked_seconds=self._consumer_blocked_seconds,
+            )
+
+    def put(self, item: QueueItem, block: bool = True, timeout: Optional[float] = None) -> None:
+        size = self._estimate_size(item)
+        with self.not_full:
+            if self._is_full(size):
+                if not block:
+                    raise Full
+                start = time.monotonic()
+                try:
+                    while self._is_full(size):
+                        if not self._wait(self.not_full, start, timeout):
+                            raise Full
+                finally:
+                    self._producer_blocked_seconds += time.monotonic() - start
+            self._put(item)
+            self._item_sizes.append(size)
+            self._size_in_bytes += size
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> QueueItem:
+        with self.not_empty:
+            if not self._qsize():
+                if not block:
+                    raise Empty
+                start = time.monotonic()
+                try:
+                    while not self._qsize():
+                        if not self._wait(self.not_empty, start, timeout):
+                            raise Empty
+                finally:
+                    self._consumer_blocked_seconds += time.monotonic() - start
+            item = self._get()
+            self._size_in_bytes -= self._item_sizes.popleft()
+            self.not_full.notify()
+            return item
+
+    def _is_full(self, size: int) -> bool:
+        return self._size_in_bytes > 0 and self._size_in_bytes + size > self._max_size_in_bytes
+
+    @staticmethod
+    def _wait(condition: threading.Condition, start: float, timeout: Optional[float]) -> bool:
+        """
+        Wait for the condition to be notified. Return False if the timeout is reached.
+        """
+        if timeout is None:
+            condition.wait()
+            return True
+        remaining = start + timeout - time.monotonic()
+        if remaining <= 0:
+            return False
+        condition.wait(remaining)
+        return True
+
+    def _estimate_size(self, item: QueueItem) -> int:
+        if isinstance(item, Record):
+            return self._estimate_records_size(item.stream_name, [item])
+        if isinstance(item, list):
+            return self._estimate_records_size(item[0].stream_name, item) if item else 0
+        return self._NON_RECORD_SIZE_IN_BYTES
+
+    def _estimate_records_size(self, stream_name: str, records: Sequence[Record]) -> int:
+        """
+        Estimate the size of records of the same stream. The statistics are updated by the producers without a lock as losing an update
+        only makes an estimate slightly off.
+        """
+        record_size = self._record_sizes.get(stream_name)
+        if record_size is None:
+            record_size = self._record_sizes.setdefault(stream_name, _StreamRecordSize())
+        previous_records = record_size.records
+        record_size.records += len(records)
+        if (
+            not record_size.samples
+            or previous_records // self._sample_interval
+            != record_size.records // self._sample_interval
+        ):
+            size = len(orjson.dumps(records[0].data, default=str))
+            record_size.samples += 1
+            record_size.average += (size - record_size.average) / record_size.samples
+        return int(record_size.average * len(records))
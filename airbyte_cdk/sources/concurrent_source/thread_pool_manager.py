@@ -3,6 +3,7 @@
 #
 import logging
 import threading
+import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, List, Optional
 
@@ -10,6 +11,9 @@ from typing import Any, Callable, List, Optional
 class ThreadPoolManager:
     """
     Wrapper to abstract away the threadpool and the logic to wait for pending tasks to be completed.
+
+    Each task submitted holds a slot of a semaphore until it is done so that the threads generating tasks can wait for the number of
+    pending tasks to go below the limit without polling.
     """
 
     DEFAULT_MAX_QUEUE_SIZE = 10_000
@@ -31,9 +35,32 @@ class ThreadPoolManager:
         self._futures: List[Future[Any]] = []
         self._lock = threading.Lock()
         self._most_recently_seen_exception: Optional[Exception] = None
+        self._task_slots = threading.Semaphore(max_concurrent_tasks)
+        self._task_slot_wait_seconds = 0.0
+        self._next_pruning_size = max_concurrent_tasks * 2
 
         self._logging_threshold = max_concurrent_tasks * 2
 
+    @property
+    def task_slot_wait_seconds(self) -> float:
+        """
+        The total time threads waited in `wait_for_task_slot`.
+        """
+        with self._lock:
+            return self._task_slot_wait_seconds
+
+    def wait_for_task_slot(self) -> None:
+        """
+        Block until fewer than `max_concurrent_tasks` tasks are pending. As the slot is not reserved, tasks submitted by other threads in
+        the meantime can go slightly over the limit.
+        """
+        start = time.monotonic()
+        self._task_slots.acquire()
+        self._task_slots.release()
+        wait_seconds = time.monotonic() - start
+        with self._lock:
+            self._task_slot_wait_seconds += wait_seconds
+
     def prune_to_validate_has_reached_futures_limit(self) -> bool:
         self._prune_futures(self._futures)
         if len(self._futures) > self._logging_threshold:
@@ -43,7 +70,19 @@ class ThreadPoolManager:
         return len(self._futures) >= self._max_concurrent_tasks
 
     def submit(self, function: Callable[..., Any], *args: Any) -> None:
-        self._futures.append(self._threadpool.submit(function, *args))
+        future = self._threadpool.submit(function, *args)
+        self._futures.append(future)
+        # Tasks submitted over the limit don't take a slot. This can only happen if other threads submitted tasks after a thread waited
+        # for a slot
+        if self._task_slots.acquire(blocking=False):
+            future.add_done_callback(self._release_task_slot)
+        # Futures are pruned whenever their number doubles so that pruning does not iterate over all the futures on every submission
+        if len(self._futures) >= self._next_pruning_size:
+            self._prune_futures(self._futures)
+            self._next_pruning_size = max(len(self._futures), self._max_concurrent_tasks) * 2
+
+    def _release_task_slot(self, future: Future[Any]) -> None:
+        self._task_slots.release()
 
     def _prune_futures(self, futures: List[Future[Any]]) -> None:
         """
@@ -17,12 +17,16 @@ class ConcurrencyLevel:
     Attributes:
         default_concurrency (Union[int, str]): The hardcoded integer or interpolation of how many worker threads to use during a sync
         max_concurrency (Optional[int]): The maximum number of worker threads to use when the default_concurrency is exceeded
+        adaptive (bool): Whether the number of partitions read at the same time is adjusted during the sync
+        min_concurrency (int): The minimum number of partitions read at the same time when the concurrency is adaptive
     """
 
     default_concurrency: Union[int, str]
     max_concurrency: Optional[int]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
+    adaptive: bool = False
+    min_concurrency: int = 1
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         if isinstance(self.default_concurrency, int):
@@ -11,6 +11,9 @@ from airbyte_cdk.models import (
     AirbyteStateMessage,
     ConfiguredAirbyteCatalog,
 )
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
@@ -99,6 +102,7 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
         )
 
         concurrency_level_from_manifest = self._source_config.get("concurrency_level")
+        concurrency_controller = None
         if concurrency_level_from_manifest:
             concurrency_level_component = self._constructor.create_component(
                 model_type=ConcurrencyLevelModel,
@@ -114,6 +118,16 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             initial_number_of_partitions_to_generate = max(
                 concurrency_level // 2, 1
             )  # Partition_generation iterates using range based on this value. If this is floored to zero we end up in a dead lock during start up
+            if concurrency_level_component.adaptive:
+                concurrency_controller = AdaptiveConcurrencyController(
+                    min_concurrency=min(
+                        concurrency_level_component.min_concurrency, concurrency_level
+                    ),
+                    max_concurrency=concurrency_level,
+                    logger=self.logger,
+                )
+                # The requests of the streams created from now on feed the controller
+                self._constructor.set_http_request_observer(concurrency_controller)
         else:
             concurrency_level = self._LOWEST_SAFE_CONCURRENCY_LEVEL
             initial_number_of_partitions_to_generate = self._LOWEST_SAFE_CONCURRENCY_LEVEL // 2
@@ -124,6 +138,7 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             logger=self.logger,
             slice_logger=self._slice_logger,
             message_repository=self.message_repository,
+            concurrency_controller=concurrency_controller,
         )
 
     # TODO: Remove this. This property is necessary to safely migrate Stripe during the transition state.
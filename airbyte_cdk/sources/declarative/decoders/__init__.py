@@ -17,6 +17,7 @@ from airbyte_cdk.sources.declarative.decoders.noop_decoder import NoopDecoder
 from airbyte_cdk.sources.declarative.decoders.pagination_decoder_decorator import (
     PaginationDecoderDecorator,
 )
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.decoders.xml_decoder import XmlDecoder
 from airbyte_cdk.sources.declarative.decoders.zipfile_decoder import ZipfileDecoder
 
@@ -28,6 +29,7 @@ __all__ = [
     "IterableDecoder",
     "NoopDecoder",
     "PaginationDecoderDecorator",
+    "StreamingJsonDecoder",
     "XmlDecoder",
     "ZipfileDecoder",
 ]
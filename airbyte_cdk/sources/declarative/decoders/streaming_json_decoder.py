@@ -0,0 +1,281 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+import re
+from typing import Any, Callable, Generator, Iterable, Iterator, Mapping, MutableMapping, Sequence
+
+import orjson
+import requests
+
+from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import JsonParser
+from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+
+logger = logging.getLogger("airbyte")
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+# A string, possibly not terminated if the buffer ends before the closing quote (group 1 is then not set), or a bracket
+_STRUCTURE_TOKEN = re.compile(rb'"[^"\\]*(?:\\(?:.|\Z)[^"\\]*)*(")?|[\[\]{}]', re.DOTALL)
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb"[^,:\]} \t\n\r]*")
+
+_OPEN_BRACKETS = frozenset(b"[{")
+_QUOTE = ord('"')
+_OPEN_CURLY = ord("{")
+_OPEN_SQUARE = ord("[")
+_CLOSE_SQUARE = ord("]")
+_COMMA = ord(",")
+_COLON = ord(":")
+
+
+class _InvalidJson(Exception):
+    pass
+
+
+class _JsonStream:
+    """
+    Read a JSON document from chunks of bytes without loading the whole document in memory.
+
+    The bytes read before the target array is found are retained so that the whole document can still be parsed if there is no array at
+    the target path.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], chunk_size: int):
+        self._chunks = chunks
+        self._chunk_size = chunk_size
+        self._buffer = b""
+        self._position = 0
+        self._is_exhausted = False
+        self._retained_chunks: list[bytes] = []
+        self._is_retaining = True
+
+    def find_array(self, field_path: Sequence[str]) -> bool:
+        """
+        Move to the first item of the array at `field_path`. Return False if the document does not have an array at `field_path`.
+        """
+        for key in field_path:
+            if self._next_non_whitespace() != _OPEN_CURLY:
+                return False
+            self._position += 1
+            while True:
+                character = self._next_non_whitespace()
+                if character != _QUOTE:
+                    return False
+                current_key = orjson.loads(self._read_value())
+                if self._next_non_whitespace() != _COLON:
+                    return False
+                self._position += 1
+                if current_key == key:
+                    break
+                self._next_non_whitespace()
+                self._skip_value()
+                self._compact()
+                if self._next_non_whitespace() != _COMMA:
+                    return False
+                self._position += 1
+
+        if self._next_non_whitespace() != _OPEN_SQUARE:
+            return False
+        self._position += 1
+        self._is_retaining = False
+        self._retained_chunks = []
+        return True
+
+    def iterate_items(self) -> Iterable[Any]:
+        """
+        Yield the items of the array `find_array` moved to. Only the bytes of the current item are kept in memory.
+        """
+        if self._next_non_whitespace() == _CLOSE_SQUARE:
+            return
+        while True:
+            if self._next_non_whitespace() == -1:
+                raise _InvalidJson("Unexpected end of document")
+            self._compact()
+            yield orjson.loads(self._read_value())
+            separator = self._next_non_whitespace()
+            if separator == _CLOSE_SQUARE:
+                return
+            if separator != _COMMA:
+                raise _InvalidJson(f"Expected ',' or ']' after an array item but got {separator!r}")
+            self._position += 1
+
+    def read_document(self) -> bytes:
+        """
+        Return the whole document, including the bytes that were already read.
+        """
+        rest = b"".join(self._chunks)
+        self._is_exhausted = True
+        return b"".join(self._retained_chunks) + rest
+
+    def _next_non_whitespace(self) -> int:
+        """
+        Move past whitespaces and return the next character or -1 if the document is over.
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]  # the pattern always matches
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                return -1
+
+    def _read_value(self) -> bytes:
+        """
+        Return the bytes of the value starting at the current position and move past it. The current position must not be a whitespace.
+        """
+        start = self._position
+        self._position = self._find_value_end(start)
+        return self._buffer[start : self._position]
+
+    def _skip_value(self) -> None:
+        self._position = self._find_value_end(self._position)
+
+    def _find_value_end(self, start: int) -> int:
+        first_character = self._buffer[start]
+        if first_character == _QUOTE:
+            return self._find_match_end(_STRING, start)
+        if first_character not in _OPEN_BRACKETS:
+            return self._find_match_end(_SCALAR, start, allow_end_of_document=True)
+
+        depth = 0
+        position = start
+        while True:
+            for token in _STRUCTURE_TOKEN.finditer(self._buffer, position):
+                character = self._buffer[token.start()]
+                if character == _QUOTE:
+                    if token.group(1) is None:
+                        # The string continues in the next chunk
+                        position = token.start()
+                        break
+                elif character in _OPEN_BRACKETS:
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return token.end()
+            else:
+                position = len(self._buffer)
+            # Positions stay valid as reading more only appends to the buffer
+            if not self._read_more(minimum_size=len(self._buffer) - start):
+                raise _InvalidJson("Unexpected end of document")
+
+    def _find_match_end(
+        self, pattern: "re.Pattern[bytes]", start: int, allow_end_of_document: bool = False
+    ) -> int:
+        while True:
+            match = pattern.match(self._buffer, start)
+            if match and match.end() < len(self._buffer):
+                return match.end()
+            if not self._read_more(minimum_size=len(self._buffer) - start):
+                if match and allow_end_of_document:
+                    return match.end()
+                raise _InvalidJson("Unexpected end of document")
+
+    def _compact(self) -> None:
+        """
+        Drop the bytes that were already processed.
+        """
+        if self._position > self._chunk_size:
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+
+    def _read_more(self, minimum_size: int = 0) -> bool:
+        """
+        Append at least `minimum_size` bytes to the buffer so that scanning a large value is linear. Return False if the document is over.
+        """
+        if self._is_exhausted:
+            return False
+        chunks = []
+        size = 0
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= minimum_size:
+                break
+        else:
+            self._is_exhausted = True
+        if not chunks:
+            return False
+        if self._is_retaining:
+            self._retained_chunks.extend(chunks)
+        self._buffer += b"".join(chunks)
+        return True
+
+
+class StreamingJsonDecoder(Decoder):
+    """
+    Decoder for JSON responses that reads the records of the array targeted by a DpathExtractor one by one while the response is
+    downloaded. Memory is then proportional to the size of one record instead of the size of the page.
+
+    The response is streamed so it can't be decoded for pagination: pagination strategies relying on the response body are not
+    supported.
+    """
+
+    _DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, parameters: Mapping[str, Any], chunk_size: int = _DEFAULT_CHUNK_SIZE):
+        self._chunk_size = chunk_size
+        self._parser = JsonParser()
+
+    def is_stream_response(self) -> bool:
+        return True
+
+    def decode(
+        self, response: requests.Response
+    ) -> Generator[MutableMapping[str, Any], None, None]:
+        """
+        Decode the whole response the same way as the JsonDecoder.
+        """
+        yield from self._decode_document(
+            b"".join(response.iter_content(chunk_size=self._chunk_size))
+        )
+
+    def decode_array_items(
+        self,
+        response: requests.Response,
+        field_path: Sequence[str],
+        extract_from_body: Callable[[MutableMapping[str, Any]], Iterable[Any]],
+    ) -> Iterable[Any]:
+        """
+        Yield the items of the array at `field_path` as they are read from the response.
+
+        If there is no array at `field_path`, the whole response is decoded the same way as the JsonDecoder and each decoded body is
+        passed to `extract_from_body` instead.
+
+        :param response: the response to decode
+        :param field_path: the keys of the objects leading to the array. They are matched literally, without glob patterns
+        :param extract_from_body: the function extracting the items from a body when the response can't be streamed
+        """
+        if not field_path:
+            for body in self.decode(response):
+                yield from extract_from_body(body)
+            return
+
+        stream = _JsonStream(response.iter_content(chunk_size=self._chunk_size), self._chunk_size)
+        try:
+            is_array = stream.find_array(field_path)
+        except Exception as exception:
+            logger.debug(f"Failed to stream the JSON response. Decoding it as a whole. {exception}")
+            is_array = False
+
+        if is_array:
+            yield from stream.iterate_items()
+        else:
+            for body in self._decode_document(stream.read_document()):
+                yield from extract_from_body(body)
+
+    def _decode_document(self, document: bytes) -> Generator[MutableMapping[str, Any], None, None]:
+        # Same behavior as the JsonDecoder: the body is {} if the response is empty or can't be parsed
+        has_yielded = False
+        try:
+            for element in self._parser.parse(data=io.BytesIO(document)):
+                yield element
+                has_yielded = True
+        except Exception:
+            yield {}
+
+        if not has_yielded:
+            yield {}
@@ -2,17 +2,136 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import re
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
 import dpath
 import requests
 
-from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.types import Config
 
+_WILDCARD = "*"
+# Characters with a special meaning in dpath globs. Segments with such characters other than a single wildcard are matched with dpath
+_GLOB_CHARACTERS = re.compile(r"[*?\[\]]")
+_JINJA_DELIMITERS = re.compile(r"{{|{%|{#")
+_MISSING = object()
+
+
+class _CompiledPath:
+    """
+    Extract the values at a path from a decoded body with plain lookups instead of walking the whole body with dpath.
+
+    Only paths made of literal keys, list indexes and `*` wildcards can be compiled. They are matched the same way as dpath does:
+    * a string segment matches the mapping key equal to it and, if it can be converted to an int, the list item at that index
+    * an int segment only matches the list item at that index
+    * a `*` segment matches all the values of a mapping or a list
+    Negative indexes are supported like with Python lists.
+    """
+
+    def __init__(self, steps: Sequence[Tuple[Optional[str], Optional[int], bool]]):
+        """
+        :param steps: for each segment of the path, the mapping key, the list index and whether it is a wildcard
+        """
+        self._steps = steps
+        self._has_wildcard = any(is_wildcard for _, _, is_wildcard in steps)
+
+    @property
+    def has_wildcard(self) -> bool:
+        return self._has_wildcard
+
+    @property
+    def keys(self) -> Optional[List[str]]:
+        """
+        The mapping keys of the path if it is only made of string segments without wildcards, None otherwise.
+        """
+        keys = [key for key, _, is_wildcard in self._steps if key is not None and not is_wildcard]
+        return keys if keys and len(keys) == len(self._steps) else None
+
+    @classmethod
+    def compile(cls, path: Sequence[Any]) -> Optional["_CompiledPath"]:
+        """
+        Return None if the path has segments that need to be matched with dpath, e.g. glob patterns.
+        """
+        steps: List[Tuple[Optional[str], Optional[int], bool]] = []
+        for segment in path:
+            # bool is a subclass of int but dpath does not treat it as an index
+            if type(segment) is int:
+                steps.append((None, segment, False))
+            elif type(segment) is str:
+                if segment == _WILDCARD:
+                    steps.append((None, None, True))
+                    continue
+                if _GLOB_CHARACTERS.search(segment):
+                    return None
+                try:
+                    index: Optional[int] = int(segment)
+                except ValueError:
+                    index = None
+                steps.append((segment, index, False))
+            else:
+                return None
+        return cls(steps)
+
+    def extract(self, body: Any) -> Any:
+        """
+        Return the same value as `dpath.values` if the path has a wildcard and as `dpath.get` with an empty list as default otherwise.
+        """
+        if self._has_wildcard:
+            return self._extract_all(body)
+
+        value = self._extract_one(body)
+        return [] if value is _MISSING else value
+
+    def get(self, body: Any) -> Any:
+        """
+        Return the same value as `dpath.get` without default, i.e. raise a KeyError if the path is not in the body. The path must not
+        have a wildcard.
+        """
+        value = self._extract_one(body)
+        if value is _MISSING:
+            raise KeyError([key if key is not None else index for key, index, _ in self._steps])
+        return value
+
+    def _extract_one(self, body: Any) -> Any:
+        current = body
+        for key, index, _ in self._steps:
+            current = self._child(current, key, index)
+            if current is _MISSING:
+                return _MISSING
+        return current
+
+    def _extract_all(self, body: Any) -> List[Any]:
+        values = [body]
+        for key, index, is_wildcard in self._steps:
+            children: List[Any] = []
+            for value in values:
+                if is_wildcard:
+                    if isinstance(value, Mapping):
+                        children.extend(value.values())
+                    elif isinstance(value, (list, tuple)):
+                        children.extend(value)
+                else:
+                    child = self._child(value, key, index)
+                    if child is not _MISSING:
+                        children.append(child)
+            values = children
+        return values
+
+    @staticmethod
+    def _child(value: Any, key: Optional[str], index: Optional[int]) -> Any:
+        if isinstance(value, Mapping):
+            return value.get(key, _MISSING) if key is not None else _MISSING
+        if index is not None and isinstance(value, (list, tuple)):
+            try:
+                return value[index]
+            except IndexError:
+                return _MISSING
+        return _MISSING
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -67,20 +186,51 @@ class DpathExtractor(RecordExtractor):
                 self._field_path[path_index] = InterpolatedString.create(
                     self.field_path[path_index], parameters=parameters
                 )
+        # A path without interpolation evaluates to the same segments for every response so it is evaluated and compiled only once
+        self._static_path: Optional[List[Any]] = None
+        self._compiled_static_path: Optional[_CompiledPath] = None
+        if not any(_JINJA_DELIMITERS.search(path.string) for path in self._field_path):
+            self._static_path = self._evaluate_path()
+            self._compiled_static_path = _CompiledPath.compile(self._static_path)
 
     def extract_records(self, response: requests.Response) -> Iterable[MutableMapping[Any, Any]]:
-        for body in self.decoder.decode(response):
-            if len(self._field_path) == 0:
-                extracted = body
-            else:
-                path = [path.eval(self.config) for path in self._field_path]
-                if "*" in path:
-                    extracted = dpath.values(body, path)
-                else:
-                    extracted = dpath.get(body, path, default=[])  # type: ignore # extracted will be a MutableMapping, given input data structure
-            if isinstance(extracted, list):
-                yield from extracted
-            elif extracted:
-                yield extracted
-            else:
-                yield from []
+        if self._static_path is not None:
+            path = self._static_path
+            compiled_path = self._compiled_static_path
+        else:
+            path = self._evaluate_path()
+            compiled_path = _CompiledPath.compile(path)
+
+        # Only the arrays at paths made of object keys can be read while the response is streamed
+        streamed_keys = compiled_path.keys if compiled_path else None
+        if isinstance(self.decoder, StreamingJsonDecoder) and streamed_keys:
+            yield from self.decoder.decode_array_items(
+                response,
+                streamed_keys,
+                lambda body: self._extract_from_body(body, path, compiled_path),
+            )
+        else:
+            for body in self.decoder.decode(response):
+                yield from self._extract_from_body(body, path, compiled_path)
+
+    def _evaluate_path(self) -> List[Any]:
+        return [path.eval(self.config) for path in self._field_path]
+
+    @staticmethod
+    def _extract_from_body(
+        body: MutableMapping[Any, Any], path: List[Any], compiled_path: Optional[_CompiledPath]
+    ) -> Iterable[MutableMapping[Any, Any]]:
+        if len(path) == 0:
+            extracted = body
+        elif compiled_path:
+            extracted = compiled_path.extract(body)
+        elif "*" in path:
+            extracted = dpath.values(body, path)
+        else:
+            extracted = dpath.get(body, path, default=[])  # type: ignore # extracted will be a MutableMapping, given input data structure
+        if isinstance(extracted, list):
+            yield from extracted
+        elif extracted:
+            yield extracted
+        else:
+            yield from []
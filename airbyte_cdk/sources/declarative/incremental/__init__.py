@@ -11,6 +11,12 @@ from airbyte_cdk.sources.declarative.incremental.declarative_cursor import Decla
 from airbyte_cdk.sources.declarative.incremental.global_substream_cursor import (
     GlobalSubstreamCursor,
 )
+from airbyte_cdk.sources.declarative.incremental.partition_state_store import (
+    InMemoryPartitionStateStore,
+    LazyPartitionStateStore,
+    PartitionStateStore,
+    SqlitePartitionStateStore,
+)
 from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import (
     CursorFactory,
     PerPartitionCursor,
@@ -30,8 +36,12 @@ __all__ = [
     "DatetimeBasedCursor",
     "DeclarativeCursor",
     "GlobalSubstreamCursor",
+    "InMemoryPartitionStateStore",
+    "LazyPartitionStateStore",
+    "PartitionStateStore",
     "PerPartitionCursor",
     "PerPartitionWithGlobalCursor",
     "ResumableFullRefreshCursor",
+    "SqlitePartitionStateStore",
     "ChildPartitionResumableFullRefreshCursor",
 ]
@@ -9,13 +9,17 @@ import time
 from collections import OrderedDict
 from copy import deepcopy
 from datetime import timedelta
-from typing import Any, Callable, Iterable, Mapping, MutableMapping, Optional
+from typing import Any, Callable, Dict, Iterable, Mapping, MutableMapping, Optional
 
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.declarative.incremental.global_substream_cursor import (
     Timer,
     iterate_with_last_flag_and_state,
 )
+from airbyte_cdk.sources.declarative.incremental.partition_state_store import (
+    InMemoryPartitionStateStore,
+    PartitionStateStore,
+)
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.checkpoint.per_partition_key_serializer import (
@@ -56,6 +60,11 @@ class ConcurrentPerPartitionCursor(Cursor):
     - **Global Cursor Fallback**
       New partitions use global state as the initial state to progress the state for deleted or new partitions. The history data added after the initial sync will be missing.
 
+    - **Partition State Store**
+      If a `PartitionStateStore` is provided, the state of finished partitions is moved to the store instead of being dropped when the
+      limit is reached and the cursor does not switch to the global cursor. The state of every partition is kept and the store decides
+      where it lives (for example on disk with `SqlitePartitionStateStore`).
+
     CurrentPerPartitionCursor expects the state of the ConcurrentCursor to follow the format {cursor_field: cursor_value}.
     """
 
@@ -81,6 +90,7 @@ class ConcurrentPerPartitionCursor(Cursor):
         connector_state_converter: AbstractStreamStateConverter,
         cursor_field: CursorField,
         use_global_cursor: bool = False,
+        partition_state_store: Optional[PartitionStateStore] = None,
     ) -> None:
         self._global_cursor: Optional[StreamState] = {}
         self._stream_name = stream_name
@@ -97,14 +107,27 @@ class ConcurrentPerPartitionCursor(Cursor):
         # the oldest partitions can be efficiently removed, maintaining the most recent partitions.
         self._cursor_per_partition: OrderedDict[str, ConcurrentCursor] = OrderedDict()
         self._semaphore_per_partition: OrderedDict[str, threading.Semaphore] = OrderedDict()
+        # State of the partitions without cursor in memory. Partitions can be both in the store and in `_cursor_per_partition` in which
+        # case the cursor holds the most recent state. The cursor closes the store once the stream is done.
+        self._partition_state_store = partition_state_store
+        # Entries of the `states` list for the partitions with a cursor in memory, None if the partition has no state. An entry is
+        # removed when the state of its cursor changes so the state message only serializes the partitions that changed since the last
+        # one. The decoded partitions are kept separately as they don't change.
+        self._state_entry_per_partition: Dict[str, Optional[Mapping[str, Any]]] = {}
+        self._decoded_partition_per_key: Dict[str, Mapping[str, Any]] = {}
 
         # Parent-state tracking: store each partition’s parent state in creation order
         self._partition_parent_state_map: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
 
         self._finished_partitions: set[str] = set()
+        # Finished partitions without slices being processed in the order they became idle. This allows evicting finished partitions
+        # without scanning all the partitions. Entries can get stale so they are validated when popped.
+        self._idle_partitions: OrderedDict[str, None] = OrderedDict()
         self._lock = threading.Lock()
         self._timer = Timer()
         self._new_global_cursor: Optional[StreamState] = None
+        # The value of `_new_global_cursor` parsed to be compared with the cursor values of the records
+        self._new_global_cursor_value: Any = None
         self._lookback_window: int = 0
         self._parent_state: Optional[StreamState] = None
         self._number_of_partitions: int = 0
@@ -123,16 +146,9 @@ class ConcurrentPerPartitionCursor(Cursor):
     def state(self) -> MutableMapping[str, Any]:
         state: dict[str, Any] = {"use_global_cursor": self._use_global_cursor}
         if not self._use_global_cursor:
-            states = []
-            for partition_tuple, cursor in self._cursor_per_partition.items():
-                if cursor.state:
-                    states.append(
-                        {
-                            "partition": self._to_dict(partition_tuple),
-                            "cursor": copy.deepcopy(cursor.state),
-                        }
-                    )
-            state[self._PERPARTITION_STATE_KEY] = states
+            state[self._PERPARTITION_STATE_KEY] = [
+                state_entry for state_entry in self._partition_state_entries() if state_entry
+            ]
 
         if self._global_cursor:
             state[self._GLOBAL_STATE_KEY] = self._global_cursor
@@ -142,6 +158,57 @@ class ConcurrentPerPartitionCursor(Cursor):
             state["parent_state"] = self._parent_state
         return state
 
+    def _partition_state_entries(self) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        Iterate over the `states` entry of every partition, using the cursor state for the partitions with a cursor in memory.
+        """
+        if self._partition_state_store is None:
+            for partition_key, cursor in self._cursor_per_partition.items():
+                yield self._get_state_entry(partition_key, cursor)
+            return
+
+        for partition_key, stored_state in self._partition_state_store.items():
+            partition_cursor = self._cursor_per_partition.get(partition_key)
+            if partition_cursor:
+                yield self._get_state_entry(partition_key, partition_cursor)
+            elif stored_state:
+                yield {
+                    "partition": self._to_dict(partition_key),
+                    "cursor": copy.deepcopy(stored_state),
+                }
+        for partition_key, partition_cursor in list(self._cursor_per_partition.items()):
+            if partition_key not in self._partition_state_store:
+                yield self._get_state_entry(partition_key, partition_cursor)
+
+    def _get_state_entry(
+        self, partition_key: str, cursor: ConcurrentCursor
+    ) -> Optional[Mapping[str, Any]]:
+        """
+        Return the `states` entry of a partition with a cursor in memory, serializing the state of the cursor only if it changed since
+        the entry was last built.
+        """
+        if partition_key in self._state_entry_per_partition:
+            return self._state_entry_per_partition[partition_key]
+
+        partition_state = cursor.state
+        state_entry: Optional[Mapping[str, Any]] = None
+        if partition_state:
+            partition = self._decoded_partition_per_key.get(partition_key)
+            if partition is None:
+                partition = self._to_dict(partition_key)
+                self._decoded_partition_per_key[partition_key] = partition
+            state_entry = {"partition": partition, "cursor": copy.deepcopy(partition_state)}
+        self._state_entry_per_partition[partition_key] = state_entry
+        return state_entry
+
+    def _invalidate_state_entry(self, partition_key: str) -> None:
+        self._state_entry_per_partition.pop(partition_key, None)
+
+    def _remove_cursor(self, partition_key: str) -> ConcurrentCursor:
+        self._state_entry_per_partition.pop(partition_key, None)
+        self._decoded_partition_per_key.pop(partition_key, None)
+        return self._cursor_per_partition.pop(partition_key)
+
     def close_partition(self, partition: Partition) -> None:
         # Attempt to retrieve the stream slice
         stream_slice: Optional[StreamSlice] = partition.to_slice()  # type: ignore[assignment]
@@ -153,13 +220,14 @@ class ConcurrentPerPartitionCursor(Cursor):
         partition_key = self._to_partition_key(stream_slice.partition)
         with self._lock:
             self._semaphore_per_partition[partition_key].acquire()
+            is_partition_idle = self._is_partition_idle(partition_key)
+            if is_partition_idle:
+                self._idle_partitions[partition_key] = None
             if not self._use_global_cursor:
                 self._cursor_per_partition[partition_key].close_partition(partition=partition)
+                self._invalidate_state_entry(partition_key)
                 cursor = self._cursor_per_partition[partition_key]
-                if (
-                    partition_key in self._finished_partitions
-                    and self._semaphore_per_partition[partition_key]._value == 0
-                ):
+                if is_partition_idle:
                     self._update_global_cursor(cursor.state[self.cursor_field.cursor_field_key])
 
             self._check_and_update_parent_state()
@@ -182,9 +250,7 @@ class ConcurrentPerPartitionCursor(Cursor):
 
             # Verify ALL partitions from the left up to earliest_key are finished
             all_left_finished = True
-            for p_key, sem in list(
-                self._semaphore_per_partition.items()
-            ):  # Use list to allow modification during iteration
+            for p_key, sem in self._semaphore_per_partition.items():
                 # If any earlier partition is still not finished, we must stop
                 if p_key not in self._finished_partitions or sem._value != 0:
                     all_left_finished = False
@@ -202,13 +268,15 @@ class ConcurrentPerPartitionCursor(Cursor):
             last_closed_state = closed_parent_state
 
             # Clean up finished semaphores with value 0 up to and including earliest_key
-            for p_key in list(self._semaphore_per_partition.keys()):
-                sem = self._semaphore_per_partition[p_key]
+            finished_semaphore_keys = []
+            for p_key, sem in self._semaphore_per_partition.items():
                 if p_key in self._finished_partitions and sem._value == 0:
-                    del self._semaphore_per_partition[p_key]
-                    logger.debug(f"Deleted finished semaphore for partition {p_key} with value 0")
+                    finished_semaphore_keys.append(p_key)
                 if p_key == earliest_key:
                     break
+            for p_key in finished_semaphore_keys:
+                del self._semaphore_per_partition[p_key]
+                logger.debug(f"Deleted finished semaphore for partition {p_key} with value 0")
 
         # Update _parent_state if we popped at least one partition
         if last_closed_state is not None:
@@ -226,6 +294,22 @@ class ConcurrentPerPartitionCursor(Cursor):
             self._lookback_window = self._timer.finish()
             self._parent_state = self._partition_router.get_stream_state()
         self._emit_state_message(throttle=False)
+        self._release_partition_state_store()
+
+    def _release_partition_state_store(self) -> None:
+        """
+        Close the partition state store once the stream is done. The stored states were all serialized in the final state message so
+        they are kept in memory for the state to still be available.
+        """
+        if self._partition_state_store is None or isinstance(
+            self._partition_state_store, InMemoryPartitionStateStore
+        ):
+            return
+        in_memory_store = InMemoryPartitionStateStore()
+        for partition_key, stored_state in self._partition_state_store.items():
+            in_memory_store.set(partition_key, stored_state)
+        self._partition_state_store.close()
+        self._partition_state_store = in_memory_store
 
     def _throttle_state_message(self) -> Optional[float]:
         """
@@ -277,13 +361,23 @@ class ConcurrentPerPartitionCursor(Cursor):
 
         cursor = self._cursor_per_partition.get(self._to_partition_key(partition.partition))
         if not cursor:
-            cursor = self._create_cursor(
-                self._global_cursor,
-                self._lookback_window if self._global_cursor else 0,
+            stored_state = (
+                self._partition_state_store.get(partition_key)
+                if self._partition_state_store is not None
+                else None
             )
+            if stored_state is not None:
+                cursor = self._create_cursor(stored_state)
+            else:
+                cursor = self._create_cursor(
+                    self._global_cursor,
+                    self._lookback_window if self._global_cursor else 0,
+                )
             with self._lock:
-                self._number_of_partitions += 1
+                if stored_state is None:
+                    self._number_of_partitions += 1
                 self._cursor_per_partition[partition_key] = cursor
+                self._invalidate_state_entry(partition_key)
 
         if partition_key in self._semaphore_per_partition:
             if not self._IS_PARTITION_DUPLICATION_LOGGED:
@@ -323,6 +417,10 @@ class ConcurrentPerPartitionCursor(Cursor):
         2. If the limit is still exceeded and no finished partitions are available for removal,
            remove the oldest partition unconditionally. We expect failed partitions to be removed.
 
+        If a partition state store is configured, the state of the finished partitions is moved to the store instead of being dropped.
+        Partitions that are not finished are never removed in that case as their cursor is still needed to track the slices being
+        processed.
+
         Logging:
         - Logs a warning each time a partition is removed, indicating whether it was finished
           or removed due to being the oldest.
@@ -337,27 +435,50 @@ class ConcurrentPerPartitionCursor(Cursor):
         with self._lock:
             while len(self._cursor_per_partition) > self.DEFAULT_MAX_PARTITIONS_NUMBER - 1:
                 # Try removing finished partitions first
-                for partition_key in list(self._cursor_per_partition.keys()):
-                    if partition_key in self._finished_partitions and (
-                        partition_key not in self._semaphore_per_partition
-                        or self._semaphore_per_partition[partition_key]._value == 0
-                    ):
-                        oldest_partition = self._cursor_per_partition.pop(
-                            partition_key
-                        )  # Remove the oldest partition
-                        logger.warning(
-                            f"The maximum number of partitions has been reached. Dropping the oldest finished partition: {oldest_partition}. Over limit: {self._number_of_partitions - self.DEFAULT_MAX_PARTITIONS_NUMBER}."
-                        )
-                        break
+                partition_key = self._pop_oldest_idle_partition()
+                if partition_key is not None:
+                    oldest_partition = self._remove_cursor(partition_key)
+                    if self._partition_state_store is not None:
+                        if oldest_partition.state:
+                            self._partition_state_store.set(
+                                partition_key, copy.deepcopy(oldest_partition.state)
+                            )
+                        continue
+                    logger.warning(
+                        f"The maximum number of partitions has been reached. Dropping the oldest finished partition: {oldest_partition}. Over limit: {self._number_of_partitions - self.DEFAULT_MAX_PARTITIONS_NUMBER}."
+                    )
+                elif self._partition_state_store is not None:
+                    break
                 else:
                     # If no finished partitions can be removed, fall back to removing the oldest partition
-                    oldest_partition = self._cursor_per_partition.popitem(last=False)[
-                        1
-                    ]  # Remove the oldest partition
+                    # Remove the oldest partition
+                    oldest_partition = self._remove_cursor(next(iter(self._cursor_per_partition)))
                     logger.warning(
                         f"The maximum number of partitions has been reached. Dropping the oldest partition: {oldest_partition}. Over limit: {self._number_of_partitions - self.DEFAULT_MAX_PARTITIONS_NUMBER}."
                     )
 
+    def _is_partition_idle(self, partition_key: str) -> bool:
+        """
+        A partition is idle once all its slices have been generated and closed.
+        """
+        return partition_key in self._finished_partitions and (
+            partition_key not in self._semaphore_per_partition
+            or self._semaphore_per_partition[partition_key]._value == 0
+        )
+
+    def _pop_oldest_idle_partition(self) -> Optional[str]:
+        """
+        Pop the partition that has been idle for the longest time and still has a cursor. Each partition is pushed to
+        `_idle_partitions` once per closed slice at most so the cost of skipping stale entries is amortized over the evictions.
+        """
+        while self._idle_partitions:
+            partition_key, _ = self._idle_partitions.popitem(last=False)
+            if partition_key in self._cursor_per_partition and self._is_partition_idle(
+                partition_key
+            ):
+                return partition_key
+        return None
+
     def _set_initial_state(self, stream_state: StreamState) -> None:
         """
         Initialize the cursor's state using the provided `stream_state`.
@@ -416,9 +537,12 @@ class ConcurrentPerPartitionCursor(Cursor):
 
             for state in stream_state.get(self._PERPARTITION_STATE_KEY, []):
                 self._number_of_partitions += 1
-                self._cursor_per_partition[self._to_partition_key(state["partition"])] = (
-                    self._create_cursor(state["cursor"])
-                )
+                partition_key = self._to_partition_key(state["partition"])
+                if self._partition_state_store is not None:
+                    # Cursors are only created for the partitions that are synced
+                    self._partition_state_store.set(partition_key, state["cursor"])
+                else:
+                    self._cursor_per_partition[partition_key] = self._create_cursor(state["cursor"])
 
             # set default state for missing partitions if it is per partition with fallback to global
             if self._GLOBAL_STATE_KEY in stream_state:
@@ -441,8 +565,11 @@ class ConcurrentPerPartitionCursor(Cursor):
         """
         if self.cursor_field.cursor_field_key in stream_state:
             global_state_value = stream_state[self.cursor_field.cursor_field_key]
+            parsed_global_state_value = self._connector_state_converter.parse_value(
+                global_state_value
+            )
             final_format_global_state_value = self._connector_state_converter.output_format(
-                self._connector_state_converter.parse_value(global_state_value)
+                parsed_global_state_value
             )
 
             fixed_global_state = {
@@ -451,6 +578,7 @@ class ConcurrentPerPartitionCursor(Cursor):
 
             self._global_cursor = deepcopy(fixed_global_state)
             self._new_global_cursor = deepcopy(fixed_global_state)
+            self._new_global_cursor_value = parsed_global_state_value
 
     def observe(self, record: Record) -> None:
         if not record.associated_slice:
@@ -458,21 +586,38 @@ class ConcurrentPerPartitionCursor(Cursor):
                 "Invalid state as stream slices that are emitted should refer to an existing cursor"
             )
 
-        record_cursor = self._connector_state_converter.output_format(
-            self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
-        )
-        self._update_global_cursor(record_cursor)
+        self._observe_global_cursor(self._cursor_field.extract_value(record))
         if not self._use_global_cursor:
             self._cursor_per_partition[
                 self._to_partition_key(record.associated_slice.partition)
             ].observe(record)
 
+    def _observe_global_cursor(self, raw_value: Any) -> None:
+        """
+        Update the global cursor if the record cursor value is more recent. Like ConcurrentCursor, the values are parsed with the cheaper
+        `parse_value_for_comparison` and only the values that become the global cursor are fully parsed and formatted.
+        """
+        value = self._connector_state_converter.parse_value_for_comparison(raw_value)
+        if self._new_global_cursor is not None and self._new_global_cursor_value is None:
+            self._new_global_cursor_value = self._connector_state_converter.parse_value(
+                self._new_global_cursor[self.cursor_field.cursor_field_key]
+            )
+        if self._new_global_cursor_value is None or self._new_global_cursor_value < value:
+            self._new_global_cursor_value = value
+            self._new_global_cursor = {
+                self.cursor_field.cursor_field_key: self._connector_state_converter.output_format(
+                    self._connector_state_converter.parse_value(raw_value)
+                )
+            }
+
     def _update_global_cursor(self, value: Any) -> None:
         if (
             self._new_global_cursor is None
             or self._new_global_cursor[self.cursor_field.cursor_field_key] < value
         ):
             self._new_global_cursor = {self.cursor_field.cursor_field_key: copy.deepcopy(value)}
+            # Parsed again by the next record observed
+            self._new_global_cursor_value = None
 
     def _to_partition_key(self, partition: Mapping[str, Any]) -> str:
         return self._partition_serializer.to_partition_key(partition)
@@ -506,4 +651,7 @@ class ConcurrentPerPartitionCursor(Cursor):
         return cursor
 
     def limit_reached(self) -> bool:
+        if self._partition_state_store is not None:
+            # The state of every partition is kept in the store so there is no need to fall back on the global cursor
+            return False
         return self._number_of_partitions > self.SWITCH_TO_GLOBAL_LIMIT
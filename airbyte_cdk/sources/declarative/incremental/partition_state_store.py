@@ -0,0 +1,204 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Mapping, Optional, Tuple
+
+
+class PartitionStateStore(ABC):
+    """
+    Stores the cursor state of partitions that are not being synced. This allows ConcurrentPerPartitionCursor to keep the exact state
+    of every partition without keeping a cursor in memory for each of them.
+
+    Partitions are returned by `items` in the order they were first added.
+    """
+
+    @abstractmethod
+    def get(self, partition_key: str) -> Optional[Mapping[str, Any]]:
+        """
+        Return the state of the partition or None if the partition is not in the store.
+        """
+
+    @abstractmethod
+    def set(self, partition_key: str, state: Mapping[str, Any]) -> None:
+        """
+        Add or replace the state of the partition. Replacing the state of a partition does not change its position.
+        """
+
+    @abstractmethod
+    def items(self) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+        """
+        Iterate over the partition keys and their state in the order the partitions were added.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def __contains__(self, partition_key: str) -> bool:
+        return self.get(partition_key) is not None
+
+    def close(self) -> None:
+        """
+        Release the resources used by the store.
+        """
+
+
+class InMemoryPartitionStateStore(PartitionStateStore):
+    """
+    Keeps the partition states in an OrderedDict. This is lighter than keeping a cursor per partition but memory still grows with the
+    number of partitions.
+    """
+
+    def __init__(self) -> None:
+        self._states: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
+
+    def get(self, partition_key: str) -> Optional[Mapping[str, Any]]:
+        return self._states.get(partition_key)
+
+    def set(self, partition_key: str, state: Mapping[str, Any]) -> None:
+        self._states[partition_key] = state
+
+    def items(self) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+        # Copy so that partitions can be added while the states are iterated on
+        return list(self._states.items())
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class SqlitePartitionStateStore(PartitionStateStore):
+    """
+    Keeps the partition states serialized as JSON in a local SQLite database so that memory does not grow with the number of
+    partitions. SQLite caches the recently used pages so frequently accessed partitions are still served from memory.
+
+    The database is only used for the duration of the sync: durability is traded for speed as changes are only committed on `close`.
+    The database is a temporary file deleted on `close` unless a path is provided.
+    """
+
+    _ITEMS_PAGE_SIZE = 1000
+
+    def __init__(self, database_path: Optional[str] = None, cache_size_kib: int = 16 * 1024):
+        """
+        :param database_path: The file to store the partition states in. A temporary file is used if not provided
+        :param cache_size_kib: The maximum size of the pages kept in memory by SQLite
+        """
+        self._temporary_directory: Optional[tempfile.TemporaryDirectory[str]] = None
+        if database_path is None:
+            self._temporary_directory = tempfile.TemporaryDirectory(
+                prefix="airbyte-partition-state-"
+            )
+            database_path = os.path.join(self._temporary_directory.name, "partition_state.db")
+        self._lock = threading.Lock()
+        # The store is accessed from both the partition generation thread and the main thread. Access is serialized with `_lock`.
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute(f"PRAGMA cache_size = -{cache_size_kib}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS partition_state (partition_key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+        )
+
+    def get(self, partition_key: str) -> Optional[Mapping[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state FROM partition_state WHERE partition_key = ?", (partition_key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, partition_key: str, state: Mapping[str, Any]) -> None:
+        serialized_state = json.dumps(state)
+        with self._lock:
+            # Updating the conflicting row keeps its rowid and hence the position of the partition
+            self._connection.execute(
+                "INSERT INTO partition_state (partition_key, state) VALUES (?, ?) "
+                "ON CONFLICT (partition_key) DO UPDATE SET state = excluded.state",
+                (partition_key, serialized_state),
+            )
+
+    def __contains__(self, partition_key: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM partition_state WHERE partition_key = ?", (partition_key,)
+            ).fetchone()
+        return row is not None
+
+    def items(self) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+        # Paginate on the rowid so that the lock is not held while the caller processes the states
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT rowid, partition_key, state FROM partition_state WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, self._ITEMS_PAGE_SIZE),
+                ).fetchall()
+            for last_rowid, partition_key, state in rows:
+                yield partition_key, json.loads(state)
+            if len(rows) < self._ITEMS_PAGE_SIZE:
+                return
+
+    def __len__(self) -> int:
+        with self._lock:
+            (length,) = self._connection.execute("SELECT COUNT(*) FROM partition_state").fetchone()
+        return int(length)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
+        if self._temporary_directory:
+            self._temporary_directory.cleanup()
+            self._temporary_directory = None
+
+
+class LazyPartitionStateStore(PartitionStateStore):
+    """
+    Creates the store it wraps when the first partition state is set so that streams that are not read, like during check and
+    discover, do not allocate the store. Until then, the store is empty and reading from it does not create it.
+    """
+
+    def __init__(self, create_store: Callable[[], PartitionStateStore]) -> None:
+        """
+        :param create_store: Creates the wrapped store. It is called at most once
+        """
+        self._create_store = create_store
+        self._store: Optional[PartitionStateStore] = None
+        # The store is accessed from both the partition generation thread and the main thread
+        self._lock = threading.Lock()
+
+    def get(self, partition_key: str) -> Optional[Mapping[str, Any]]:
+        store = self._store
+        return store.get(partition_key) if store is not None else None
+
+    def set(self, partition_key: str, state: Mapping[str, Any]) -> None:
+        store = self._store
+        if store is None:
+            with self._lock:
+                if self._store is None:
+                    self._store = self._create_store()
+                store = self._store
+        store.set(partition_key, state)
+
+    def __contains__(self, partition_key: str) -> bool:
+        store = self._store
+        return store is not None and partition_key in store
+
+    def items(self) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+        store = self._store
+        return store.items() if store is not None else []
+
+    def __len__(self) -> int:
+        store = self._store
+        return len(store) if store is not None else 0
+
+    def close(self) -> None:
+        store = self._store
+        if store is not None:
+            store.close()
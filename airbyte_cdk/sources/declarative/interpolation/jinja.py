@@ -3,10 +3,11 @@
 #
 
 import ast
-from functools import cache
-from typing import Any, Mapping, Optional, Set, Tuple, Type
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, Type
 
-from jinja2 import meta
+from jinja2 import meta, nodes
 from jinja2.environment import Template
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
@@ -64,6 +65,107 @@ for builtin in _RESTRICTED_BUILTIN_FUNCTIONS:
     _ENVIRONMENT.globals.pop(builtin, None)
 
 
+# Output of a template starting with an ASCII character that can't start a Python literal. Such outputs are returned as is without
+# trying to parse them with ast.literal_eval
+_NOT_A_LITERAL = re.compile(
+    r"\s*(?:[!$%&)*,/:;<=>?@\]^_`|}~]|(?!True|False|None|set|[bBrRuUfF]{1,2}['\"])[A-Za-z])"
+)
+_IMMUTABLE_LITERAL_TYPES = (str, bytes, int, float, complex, bool, type(None))
+_NOT_EVALUATED = object()
+_TEMPLATE_CACHE_SIZE = 4096
+
+
+class _CompiledTemplate:
+    """
+    The result of the static analysis of a string to interpolate. It is shared by all the evaluations of the same string so that the
+    string is parsed only once and constant strings are not rendered at all.
+    """
+
+    def __init__(self, input_str: str):
+        self.input_str = input_str
+        self.unsupported_variable_message = next(
+            (
+                message
+                for variable_name, message in _UNSUPPORTED_INTERPOLATION_VARIABLES.items()
+                if variable_name in input_str
+            ),
+            None,
+        )
+        template_ast = _ENVIRONMENT.parse(input_str)
+        self._undeclared_variables: FrozenSet[str] = frozenset(
+            meta.find_undeclared_variables(template_ast)
+        )
+        self._aliases: List[Tuple[str, str]] = [
+            (alias, equivalent)
+            for alias, equivalent in _ALIASES.items()
+            if alias in self._undeclared_variables
+        ]
+        self._template: Template = _ENVIRONMENT.from_string(template_ast)
+        # Jinja copies the globals for every render. Flattening the ChainMap of the template and environment globals makes the copy cheap
+        self._template.globals = dict(self._template.globals)
+        self._constant_output: Optional[str] = None
+        self._constant_value: Any = _NOT_EVALUATED
+        if self._is_constant(template_ast):
+            self._constant_output = self._template.render()
+            value = _literal_eval(self._constant_output)
+            # Mutable values are evaluated for each call so that callers can't alter the value returned to the next ones
+            if isinstance(value, _IMMUTABLE_LITERAL_TYPES):
+                self._constant_value = value
+
+    @staticmethod
+    def _is_constant(template_ast: nodes.Template) -> bool:
+        return all(
+            isinstance(node, nodes.Output)
+            and all(isinstance(child, (nodes.TemplateData, nodes.Const)) for child in node.nodes)
+            for node in template_ast.body
+        )
+
+    def render(self, context: Dict[str, Any]) -> str:
+        for alias, equivalent in self._aliases:
+            if equivalent in context:
+                context[alias] = context[equivalent]
+
+        undeclared_not_in_context = {
+            var for var in self._undeclared_variables if var not in context
+        }
+        if undeclared_not_in_context:
+            raise ValueError(
+                f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}"
+            )
+
+        if self._constant_output is not None:
+            return self._constant_output
+        try:
+            return self._template.render(context)
+        except TypeError:
+            # The string is a static value, not a jinja template
+            # It can be returned as is
+            return self.input_str
+
+    def literal_eval(self, result: str, valid_types: Optional[Tuple[Type[Any]]]) -> Any:
+        if self._constant_value is not _NOT_EVALUATED and result is self._constant_output:
+            evaluated = self._constant_value
+        else:
+            evaluated = _literal_eval(result)
+        if not valid_types or isinstance(evaluated, valid_types):
+            return evaluated
+        return result
+
+
+def _literal_eval(result: Optional[str]) -> Any:
+    if result is None or _NOT_A_LITERAL.match(result):
+        return result
+    try:
+        return ast.literal_eval(result)
+    except (ValueError, SyntaxError):
+        return result
+
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile(input_str: str) -> _CompiledTemplate:
+    return _CompiledTemplate(input_str)
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -90,72 +192,33 @@ class JinjaInterpolation(Interpolation):
         valid_types: Optional[Tuple[Type[Any]]] = None,
         **additional_parameters: Any,
     ) -> Any:
-        context = {"config": config, **additional_parameters}
-
-        for alias, equivalent in _ALIASES.items():
-            if alias in context:
+        for alias in _ALIASES:
+            if alias in additional_parameters:
                 # This is unexpected. We could ignore or log a warning, but failing loudly should result in fewer surprises
                 raise ValueError(
                     f"Found reserved keyword {alias} in interpolation context. This is unexpected and indicative of a bug in the CDK."
                 )
-            elif equivalent in context:
-                context[alias] = context[equivalent]
+        if not isinstance(input_str, str):
+            raise Exception(f"Expected a string, got {input_str}")
 
-        for variable_name in _UNSUPPORTED_INTERPOLATION_VARIABLES:
-            if variable_name in input_str:
-                raise AirbyteTracedException(
-                    message=_UNSUPPORTED_INTERPOLATION_VARIABLES[variable_name],
-                    internal_message=_UNSUPPORTED_INTERPOLATION_VARIABLES[variable_name],
-                    failure_type=FailureType.config_error,
-                )
+        compiled_template = _compile(input_str)
+        if compiled_template.unsupported_variable_message:
+            raise AirbyteTracedException(
+                message=compiled_template.unsupported_variable_message,
+                internal_message=compiled_template.unsupported_variable_message,
+                failure_type=FailureType.config_error,
+            )
+
+        context = {"config": config, **additional_parameters}
         try:
-            if isinstance(input_str, str):
-                result = self._eval(input_str, context)
-                if result:
-                    return self._literal_eval(result, valid_types)
-            else:
-                # If input is not a string, return it as is
-                raise Exception(f"Expected a string, got {input_str}")
+            result = compiled_template.render(context)
+            if result:
+                return compiled_template.literal_eval(result, valid_types)
         except UndefinedError:
             pass
 
         # If result is empty or resulted in an undefined error, evaluate and return the default string
-        return self._literal_eval(self._eval(default, context), valid_types)
-
-    def _literal_eval(self, result: Optional[str], valid_types: Optional[Tuple[Type[Any]]]) -> Any:
-        try:
-            evaluated = ast.literal_eval(result)  # type: ignore # literal_eval is able to handle None
-        except (ValueError, SyntaxError):
-            return result
-        if not valid_types or (valid_types and isinstance(evaluated, valid_types)):
-            return evaluated
-        return result
-
-    def _eval(self, s: Optional[str], context: Mapping[str, Any]) -> Optional[str]:
-        try:
-            undeclared = self._find_undeclared_variables(s)
-            undeclared_not_in_context = {var for var in undeclared if var not in context}
-            if undeclared_not_in_context:
-                raise ValueError(
-                    f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}"
-                )
-            return self._compile(s).render(context)  # type: ignore # from_string is able to handle None
-        except TypeError:
-            # The string is a static value, not a jinja template
-            # It can be returned as is
-            return s
-
-    @cache
-    def _find_undeclared_variables(self, s: Optional[str]) -> Set[str]:
-        """
-        Find undeclared variables and cache them
-        """
-        ast = _ENVIRONMENT.parse(s)  # type: ignore # parse is able to handle None
-        return meta.find_undeclared_variables(ast)
-
-    @cache
-    def _compile(self, s: str) -> Template:
-        """
-        We must cache the Jinja Template ourselves because we're using `from_string` instead of a template loader
-        """
-        return _ENVIRONMENT.from_string(s)
+        if default is None:
+            return None
+        compiled_default = _compile(default)
+        return compiled_default.literal_eval(compiled_default.render(context), valid_types)
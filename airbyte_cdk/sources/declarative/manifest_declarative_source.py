@@ -56,6 +56,9 @@ from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import (
     ModelToComponentFactory,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.resolvers import COMPONENTS_RESOLVER_TYPE_MAPPING
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.core import Stream
@@ -131,6 +134,7 @@ class ManifestDeclarativeSource(DeclarativeSource):
             AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
         )
         self._config = config or {}
+        self._parent_record_cache: Optional[ParentRecordCache] = None
 
         # resolve all components in the manifest
         self._source_config = self._pre_process_manifest(dict(source_config))
@@ -270,6 +274,12 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if api_budget_model:
             self._constructor.set_api_budget(api_budget_model, config)
 
+        # The child streams created together share the records read from their parent streams
+        if self._parent_record_cache:
+            self._parent_record_cache.close()
+        self._parent_record_cache = ParentRecordCache()
+        self._constructor.set_parent_record_cache(self._parent_record_cache)
+
         source_streams = [
             self._constructor.create_component(
                 (
@@ -291,11 +301,18 @@ class ManifestDeclarativeSource(DeclarativeSource):
         stream_configs: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
         parent_streams = set()
+        stream_names = {stream_config.get("name") for stream_config in stream_configs}
 
         def update_with_cache_parent_configs(
             parent_configs: list[dict[str, Any]],
         ) -> None:
             for parent_config in parent_configs:
+                # The records of the parent streams are cached by the ParentRecordCache. Their responses only need to be cached if the
+                # parent is also read as a stream or read incrementally, which bypasses the ParentRecordCache
+                if parent_config["stream"].get(
+                    "name"
+                ) not in stream_names and not parent_config.get("incremental_dependency"):
+                    continue
                 parent_streams.add(parent_config["stream"]["name"])
                 if parent_config["stream"]["type"] == "StateDelegatingStream":
                     parent_config["stream"]["full_refresh_stream"]["retriever"]["requester"][
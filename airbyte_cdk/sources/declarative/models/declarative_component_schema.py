@@ -88,6 +88,17 @@ class ConcurrencyLevel(BaseModel):
         examples=[20, 100],
         title="Max Concurrency",
     )
+    adaptive: Optional[bool] = Field(
+        False,
+        description="When enabled, the number of partitions read at the same time is adjusted during the sync between min_concurrency and the concurrency level. It is decreased when requests are rate limited, retried or get slower and increased while requests are healthy.",
+        title="Adaptive Concurrency",
+    )
+    min_concurrency: Optional[int] = Field(
+        1,
+        description="The minimum number of partitions read at the same time when the concurrency is adaptive.",
+        examples=[1, 5],
+        title="Min Concurrency",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -860,6 +871,11 @@ class JsonFileSchemaLoader(BaseModel):
 
 class JsonDecoder(BaseModel):
     type: Literal["JsonDecoder"]
+    stream_records: Optional[bool] = Field(
+        False,
+        description="Read the records targeted by the record extractor one by one while the response is downloaded instead of loading the whole response in memory. Pagination strategies relying on the response body are not supported when enabled.",
+        title="Stream Records",
+    )
 
 
 class JsonlDecoder(BaseModel):
@@ -1252,6 +1268,11 @@ class PropertyChunking(BaseModel):
         description="Dictates how to records that require multiple requests to get all properties should be emitted to the destination",
         title="Record Merge Strategy",
     )
+    max_concurrent_requests: Optional[int] = Field(
+        1,
+        description="The maximum number of requests sent at the same time for the property chunks of a page. Requests are still subject to the API budget. Records are merged as the responses arrive and are emitted in the same order as when the chunks are fetched one after another.",
+        title="Maximum Concurrent Requests",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -1647,6 +1668,11 @@ class IncrementingCountCursor(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
+class PartitionStateStore(Enum):
+    in_memory = "in_memory"
+    sqlite = "sqlite"
+
+
 class DatetimeBasedCursor(BaseModel):
     type: Literal["DatetimeBasedCursor"]
     clamping: Optional[Clamping] = Field(
@@ -1714,6 +1740,11 @@ class DatetimeBasedCursor(BaseModel):
         description="This setting optimizes performance when the parent stream has thousands of partitions by storing the cursor as a single value rather than per partition. Notably, the substream state is updated only at the end of the sync, which helps prevent data loss in case of a sync failure. See more info in the [docs](https://docs.airbyte.com/connector-development/config-based/understanding-the-yaml-file/incremental-syncs).",
         title="Whether to store cursor as one value instead of per partition",
     )
+    partition_state_store: Optional[PartitionStateStore] = Field(
+        None,
+        description="Where to keep the state of the partitions that are not being synced when the stream has a partition router. With a store, the state of every partition is kept instead of falling back to a global cursor once the stream has more partitions than can be kept in memory. `in_memory` keeps the states in memory, which is lighter than keeping a cursor per partition. `sqlite` keeps the states in a temporary local database so that memory does not grow with the number of partitions.",
+        title="Partition State Store",
+    )
     lookback_window: Optional[str] = Field(
         None,
         description="Time interval before the start_datetime to read data for, e.g. P1M for looking back one month.",
@@ -1783,6 +1814,23 @@ class MovingWindowCallRatePolicy(BaseModel):
     )
 
 
+class SlidingWindowCallRatePolicy(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    type: Literal["SlidingWindowCallRatePolicy"]
+    rates: List[Rate] = Field(
+        ...,
+        description="List of rates that define the call limits for different time intervals.",
+        title="Rates",
+    )
+    matchers: List[HttpRequestRegexMatcher] = Field(
+        ...,
+        description="List of matchers that define which requests this policy applies to.",
+        title="Matchers",
+    )
+
+
 class UnlimitedCallRatePolicy(BaseModel):
     class Config:
         extra = Extra.allow
@@ -1949,6 +1997,7 @@ class HTTPAPIBudget(BaseModel):
         Union[
             FixedWindowCallRatePolicy,
             MovingWindowCallRatePolicy,
+            SlidingWindowCallRatePolicy,
             UnlimitedCallRatePolicy,
         ]
     ] = Field(
@@ -2473,6 +2522,12 @@ class ParentStreamConfig(BaseModel):
         description="Array of field paths to include as additional fields in the stream slice. Each path is an array of strings representing keys to access fields in the respective parent record. Accessible via `stream_slice.extra_fields`. Missing fields are set to `None`.",
         title="Extra Fields",
     )
+    read_concurrency: Optional[int] = Field(
+        1,
+        description="The number of partitions of the parent stream read at the same time. If set above 1 on any parent stream, the parent streams are also read at the same time and the slices are created as the parent records are read so their order is not preserved. The partitions of parent streams with an incremental dependency or with a single paginated partition are read one after the other.",
+        examples=[4],
+        title="Read Concurrency",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -2560,6 +2615,12 @@ class SimpleRetriever(BaseModel):
         False,
         description="If true, the partition router and incremental request options will be ignored when paginating requests. Request options set directly on the requester will not be ignored.",
     )
+    prefetch_pages: Optional[int] = Field(
+        0,
+        description="The number of pages to fetch ahead while the records of the current page are processed. Prefetching only applies when the paginator computes the next page token from the response alone (i.e. the pagination strategy does not use `last_record` or `last_page_size`) and query properties are not used. Each prefetched page is held in memory.",
+        examples=[1, 2],
+        title="Prefetch Pages",
+    )
     partition_router: Optional[
         Union[
             ListPartitionRouter,
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import importlib
 import inspect
 import re
@@ -71,6 +72,7 @@ from airbyte_cdk.sources.declarative.decoders import (
     IterableDecoder,
     JsonDecoder,
     PaginationDecoderDecorator,
+    StreamingJsonDecoder,
     XmlDecoder,
     ZipfileDecoder,
 )
@@ -99,9 +101,13 @@ from airbyte_cdk.sources.declarative.incremental import (
     DatetimeBasedCursor,
     DeclarativeCursor,
     GlobalSubstreamCursor,
+    InMemoryPartitionStateStore,
+    LazyPartitionStateStore,
+    PartitionStateStore,
     PerPartitionCursor,
     PerPartitionWithGlobalCursor,
     ResumableFullRefreshCursor,
+    SqlitePartitionStateStore,
 )
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.interpolation.interpolated_mapping import InterpolatedMapping
@@ -337,6 +343,9 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     ParentStreamConfig as ParentStreamConfigModel,
 )
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    PartitionStateStore as PartitionStateStoreModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     PropertiesFromEndpoint as PropertiesFromEndpointModel,
 )
@@ -385,6 +394,9 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     SimpleRetriever as SimpleRetrieverModel,
 )
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    SlidingWindowCallRatePolicy as SlidingWindowCallRatePolicyModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     StateDelegatingStream as StateDelegatingStreamModel,
@@ -429,6 +441,9 @@ from airbyte_cdk.sources.declarative.partition_routers import (
 from airbyte_cdk.sources.declarative.partition_routers.async_job_partition_router import (
     AsyncJobPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
 )
@@ -544,6 +559,7 @@ from airbyte_cdk.sources.streams.call_rate import (
     HttpRequestRegexMatcher,
     MovingWindowCallRatePolicy,
     Rate,
+    SlidingWindowCallRatePolicy,
     UnlimitedCallRatePolicy,
 )
 from airbyte_cdk.sources.streams.concurrent.clamping import (
@@ -564,6 +580,7 @@ from airbyte_cdk.sources.streams.concurrent.state_converters.incrementing_count_
     IncrementingCountStreamStateConverter,
 )
 from airbyte_cdk.sources.streams.http.error_handlers.response_models import ResponseAction
+from airbyte_cdk.sources.streams.http.request_observer import HttpRequestObserver
 from airbyte_cdk.sources.types import Config
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
@@ -602,6 +619,8 @@ class ModelToComponentFactory:
         )
         self._connector_state_manager = connector_state_manager or ConnectorStateManager()
         self._api_budget: Optional[Union[APIBudget, HttpAPIBudget]] = None
+        self._http_request_observer: Optional[HttpRequestObserver] = None
+        self._parent_record_cache: Optional[ParentRecordCache] = None
         self._job_tracker: JobTracker = JobTracker(max_concurrent_async_job_count or 1)
         # placeholder for deprecation warnings
         self._collected_deprecation_logs: List[ConnectorBuilderLogMessage] = []
@@ -700,6 +719,7 @@ class ModelToComponentFactory:
             FileUploaderModel: self.create_file_uploader,
             FixedWindowCallRatePolicyModel: self.create_fixed_window_call_rate_policy,
             MovingWindowCallRatePolicyModel: self.create_moving_window_call_rate_policy,
+            SlidingWindowCallRatePolicyModel: self.create_sliding_window_call_rate_policy,
             UnlimitedCallRatePolicyModel: self.create_unlimited_call_rate_policy,
             RateModel: self.create_rate,
             HttpRequestRegexMatcherModel: self.create_http_request_matcher,
@@ -1099,6 +1119,8 @@ class ModelToComponentFactory:
             max_concurrency=model.max_concurrency,
             config=config,
             parameters={},
+            adaptive=bool(model.adaptive),
+            min_concurrency=model.min_concurrency or 1,
         )
 
     @staticmethod
@@ -1502,8 +1524,26 @@ class ModelToComponentFactory:
             connector_state_converter=connector_state_converter,
             cursor_field=cursor_field,
             use_global_cursor=use_global_cursor,
+            partition_state_store=self._create_partition_state_store(
+                datetime_based_cursor_model.partition_state_store
+            ),
         )
 
+    @staticmethod
+    def _create_partition_state_store(
+        partition_state_store_model: Optional[PartitionStateStoreModel],
+    ) -> Optional[PartitionStateStore]:
+        match partition_state_store_model:
+            case None:
+                return None
+            case PartitionStateStoreModel.in_memory:
+                return InMemoryPartitionStateStore()
+            case PartitionStateStoreModel.sqlite:
+                # The database is only created once the cursor stores a partition state, not for check and discover
+                return LazyPartitionStateStore(SqlitePartitionStateStore)
+            case _:
+                raise ValueError(f"Invalid PartitionStateStore {partition_state_store_model}")
+
     @staticmethod
     def create_constant_backoff_strategy(
         model: ConstantBackoffStrategyModel, config: Config, **kwargs: Any
@@ -1523,7 +1563,7 @@ class ModelToComponentFactory:
             inner_decoder = decoder
             decoder = PaginationDecoderDecorator(decoder=decoder)
 
-        if self._is_supported_decoder_for_pagination(inner_decoder):
+        if self._is_supported_decoder_for_pagination(inner_decoder, model):
             decoder_to_use = decoder
         else:
             raise ValueError(
@@ -2142,7 +2182,7 @@ class ModelToComponentFactory:
         cursor_used_for_stop_condition: Optional[DeclarativeCursor] = None,
     ) -> Union[DefaultPaginator, PaginatorTestReadDecorator]:
         if decoder:
-            if self._is_supported_decoder_for_pagination(decoder):
+            if self._is_supported_decoder_for_pagination(decoder, model.pagination_strategy):
                 decoder_to_use = PaginationDecoderDecorator(decoder=decoder)
             else:
                 raise ValueError(self._UNSUPPORTED_DECODER_ERROR.format(decoder_type=type(decoder)))
@@ -2295,6 +2335,7 @@ class ModelToComponentFactory:
             use_cache=should_use_cache,
             decoder=decoder,
             stream_response=decoder.is_stream_response() if decoder else False,
+            request_observer=self._http_request_observer,
         )
 
     @staticmethod
@@ -2422,8 +2463,11 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
-    @staticmethod
-    def create_json_decoder(model: JsonDecoderModel, config: Config, **kwargs: Any) -> Decoder:
+    def create_json_decoder(
+        self, model: JsonDecoderModel, config: Config, **kwargs: Any
+    ) -> Decoder:
+        if model.stream_records and not self._emit_connector_builder_messages:
+            return StreamingJsonDecoder(parameters={})
         return JsonDecoder(parameters={})
 
     def create_csv_decoder(self, model: CsvDecoderModel, config: Config, **kwargs: Any) -> Decoder:
@@ -2754,6 +2798,14 @@ class ModelToComponentFactory:
             [x for x in model.lazy_read_pointer] if model.lazy_read_pointer else []
         )
 
+        record_cache = None if self._disable_cache else self._parent_record_cache
+        # Parent streams with the same definition read the same records so they can share their records in the cache
+        record_cache_key = (
+            hashlib.sha256(model.stream.json(sort_keys=True).encode()).hexdigest()
+            if record_cache
+            else None
+        )
+
         return ParentStreamConfig(
             parent_key=model.parent_key,
             request_option=request_option,
@@ -2764,6 +2816,9 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
             extra_fields=model.extra_fields,
             lazy_read_pointer=model_lazy_read_pointer,
+            record_cache=record_cache,
+            record_cache_key=record_cache_key,
+            read_concurrency=model.read_concurrency or 1,
         )
 
     def create_properties_from_endpoint(
@@ -2810,6 +2865,7 @@ class ModelToComponentFactory:
             property_limit=model.property_limit,
             record_merge_strategy=record_merge_strategy,
             config=config,
+            max_concurrent_requests=model.max_concurrent_requests or 1,
             parameters=model.parameters or {},
         )
 
@@ -3188,6 +3244,7 @@ class ModelToComponentFactory:
             config=config,
             ignore_stream_slicer_parameters_on_paginated_requests=ignore_stream_slicer_parameters_on_paginated_requests,
             additional_query_properties=query_properties,
+            prefetch_pages=model.prefetch_pages or 0,
             parameters=model.parameters or {},
         )
 
@@ -3521,6 +3578,8 @@ class ModelToComponentFactory:
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
         )
+        if self._parent_record_cache:
+            substream_factory.set_parent_record_cache(self._parent_record_cache)
 
         # This flag will be used exclusively for StateDelegatingStream when a parent stream is created
         has_parent_state = bool(
@@ -3657,16 +3716,41 @@ class ModelToComponentFactory:
         "Specified decoder of {decoder_type} is not supported for pagination."
         "Please set as `JsonDecoder`, `XmlDecoder`, or a `CompositeRawDecoder` with an inner_parser of `JsonParser` or `GzipParser` instead."
         "If using `GzipParser`, please ensure that the lowest level inner_parser is a `JsonParser`."
+        "A `JsonDecoder` with `stream_records` is only supported by `PageIncrement` and by `CursorPagination` not reading the `response`."
     )
+    _RESPONSE_REFERENCE = re.compile(r"\bresponse\b")
 
-    def _is_supported_decoder_for_pagination(self, decoder: Decoder) -> bool:
-        if isinstance(decoder, (JsonDecoder, XmlDecoder)):
+    def _is_supported_decoder_for_pagination(
+        self, decoder: Decoder, pagination_strategy_model: Optional[BaseModel] = None
+    ) -> bool:
+        if isinstance(decoder, StreamingJsonDecoder):
+            # The records are read while the response is streamed so the body can't be decoded for pagination
+            return pagination_strategy_model is not None and self._paginates_without_response_body(
+                pagination_strategy_model
+            )
+        elif isinstance(decoder, (JsonDecoder, XmlDecoder)):
             return True
         elif isinstance(decoder, CompositeRawDecoder):
             return self._is_supported_parser_for_pagination(decoder.parser)
         else:
             return False
 
+    def _paginates_without_response_body(self, pagination_strategy_model: BaseModel) -> bool:
+        if isinstance(pagination_strategy_model, PageIncrementModel):
+            return True
+        elif isinstance(pagination_strategy_model, CursorPaginationModel):
+            return not any(
+                self._RESPONSE_REFERENCE.search(interpolated_string)
+                for interpolated_string in (
+                    pagination_strategy_model.cursor_value,
+                    pagination_strategy_model.stop_condition,
+                )
+                if interpolated_string
+            )
+        else:
+            # OffsetIncrement extracts the records of the response again to count them
+            return False
+
     def _is_supported_parser_for_pagination(self, parser: Parser) -> bool:
         if isinstance(parser, JsonParser):
             return True
@@ -3756,6 +3840,21 @@ class ModelToComponentFactory:
             matchers=matchers,
         )
 
+    def create_sliding_window_call_rate_policy(
+        self, model: SlidingWindowCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> SlidingWindowCallRatePolicy:
+        rates = [
+            self._create_component_from_model(model=rate, config=config) for rate in model.rates
+        ]
+        matchers = [
+            self._create_component_from_model(model=matcher, config=config)
+            for matcher in model.matchers
+        ]
+        return SlidingWindowCallRatePolicy(
+            rates=rates,
+            matchers=matchers,
+        )
+
     def create_unlimited_call_rate_policy(
         self, model: UnlimitedCallRatePolicyModel, config: Config, **kwargs: Any
     ) -> UnlimitedCallRatePolicy:
@@ -3786,6 +3885,18 @@ class ModelToComponentFactory:
             headers=model.headers,
         )
 
+    def set_http_request_observer(self, request_observer: HttpRequestObserver) -> None:
+        """
+        Set the observer notified of every attempt to send a request by the HttpRequesters created from now on.
+        """
+        self._http_request_observer = request_observer
+
+    def set_parent_record_cache(self, parent_record_cache: ParentRecordCache) -> None:
+        """
+        Set the cache shared by the SubstreamPartitionRouters created from now on to read each parent stream only once.
+        """
+        self._parent_record_cache = parent_record_cache
+
     def set_api_budget(self, component_definition: ComponentDefinition, config: Config) -> None:
         self._api_budget = self.create_component(
             model_type=HTTPAPIBudgetModel, component_definition=component_definition, config=config
@@ -14,6 +14,9 @@ from airbyte_cdk.sources.declarative.partition_routers.grouping_partition_router
 from airbyte_cdk.sources.declarative.partition_routers.list_partition_router import (
     ListPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.declarative.partition_routers.single_partition_router import (
     SinglePartitionRouter,
@@ -27,6 +30,7 @@ __all__ = [
     "CartesianProductStreamSlicer",
     "GroupingPartitionRouter",
     "ListPartitionRouter",
+    "ParentRecordCache",
     "SinglePartitionRouter",
     "SubstreamPartitionRouter",
     "PartitionRouter",
@@ -0,0 +1,251 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import itertools
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import orjson
+
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+
+logger = logging.getLogger("airbyte")
+
+# A parent record and the partition of the parent stream it was read from
+ParentRecord = Tuple[Mapping[str, Any], Mapping[str, Any]]
+
+
+@dataclass
+class ParentRecordCacheMetrics:
+    """
+    Usage of a ParentRecordCache.
+
+    :param cached_records: the number of parent records stored on disk
+    :param disk_usage_in_bytes: the size of the files storing the parent records
+    :param memory_usage_in_bytes: the size of the write buffers of the parent streams being cached
+    :param hits: the number of parent stream reads served from the cache
+    :param misses: the number of parent stream reads that were read from the parent stream
+    """
+
+    cached_records: int = 0
+    disk_usage_in_bytes: int = 0
+    memory_usage_in_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class _CacheEntry:
+    __slots__ = (
+        "path",
+        "writer_thread",
+        "last_write_time",
+        "is_complete",
+        "records",
+        "size_in_bytes",
+    )
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.writer_thread = threading.current_thread()
+        self.last_write_time = time.monotonic()
+        self.is_complete = False
+        self.records = 0
+        self.size_in_bytes = 0
+
+
+class ParentRecordCache:
+    """
+    Stores the records read from parent streams so that the child streams of the same parent read the parent stream only once during
+    a sync. Only the record data and the partition of the parent stream are kept: they are appended as JSON lines to a file per parent
+    stream so memory does not grow with the number of parent records.
+
+    A parent stream read is identified by a key that has to be the same only for parent streams that read the same records. A read is
+    cached only once it has been consumed completely. If the parent stream is being cached by a reader on another thread, the other
+    readers wait for it to be cached and then read the cached records, or read the parent stream themselves if the caching failed. They
+    also read the parent stream themselves if the reader caching it is gone: its thread ended or it did not cache any record for
+    `writer_timeout_in_seconds`. A reader on the thread caching the parent stream reads the parent stream again instead as it would
+    otherwise wait for itself. Records that can't be serialized as JSON without loss are not cached.
+
+    The files are created in a temporary directory within the directory of the request cache if the `REQUEST_CACHE_PATH` environment
+    variable is set or within the default temporary directory otherwise. They are deleted on `close`.
+    """
+
+    # How often the readers waiting for a parent stream to be cached check whether the reader caching it is gone
+    _WAIT_INTERVAL_IN_SECONDS = 1.0
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        buffer_size: int = 1024 * 1024,
+        writer_timeout_in_seconds: float = 60.0,
+    ):
+        """
+        :param directory: The directory to store the parent records in. Defaults to the request cache directory or a temporary directory
+        :param buffer_size: The size of the buffer used to write the parent records of each parent stream
+        :param writer_timeout_in_seconds: How long the readers wait for the next record of a parent stream being cached before reading
+        the parent stream themselves
+        """
+        self._directory = directory
+        self._buffer_size = buffer_size
+        self._writer_timeout_in_seconds = writer_timeout_in_seconds
+        self._temporary_directory: Optional[tempfile.TemporaryDirectory[str]] = None
+        self._lock = threading.Lock()
+        # Notified whenever an entry is completed or removed
+        self._entry_changed = threading.Condition(self._lock)
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._file_ids = itertools.count()
+        self._metrics = ParentRecordCacheMetrics()
+
+    @property
+    def metrics(self) -> ParentRecordCacheMetrics:
+        """
+        A snapshot of the usage of the cache.
+        """
+        with self._lock:
+            return replace(self._metrics)
+
+    def read(
+        self, key: str, read_records: Callable[[], Iterable[ParentRecord]], stream_name: str = ""
+    ) -> Iterable[ParentRecord]:
+        """
+        Yield the parent records cached for `key` or the records returned by `read_records`, caching them if no other reader is. If
+        another thread is caching them, wait until it is done.
+
+        :param key: Identifies the records read by `read_records`
+        :param read_records: Reads the records of the parent stream
+        :param stream_name: The name of the parent stream, used for logging
+        """
+        with self._lock:
+            while True:
+                entry: Optional[_CacheEntry] = self._entries.get(key)
+                if entry is None:
+                    entry = _CacheEntry(
+                        os.path.join(self._get_directory(), f"{next(self._file_ids)}.jsonl")
+                    )
+                    self._entries[key] = entry
+                    self._metrics.misses += 1
+                    is_writer = True
+                    break
+                if entry.is_complete:
+                    self._metrics.hits += 1
+                    is_writer = False
+                    break
+                if entry.writer_thread is threading.current_thread() or self._is_writer_gone(entry):
+                    self._metrics.misses += 1
+                    entry = None
+                    is_writer = False
+                    break
+                self._entry_changed.wait(
+                    min(self._WAIT_INTERVAL_IN_SECONDS, self._writer_timeout_in_seconds)
+                )
+
+        if entry is None:
+            logger.debug(
+                f"Parent stream {stream_name} is being cached by another stream on the same thread or by a stream that is gone. Reading it without the cache."
+            )
+            yield from read_records()
+        elif is_writer:
+            yield from self._read_and_cache(key, entry, read_records(), stream_name)
+        else:
+            yield from self._replay(entry)
+
+    def close(self) -> None:
+        """
+        Delete the files storing the parent records.
+        """
+        with self._lock:
+            self._entries = {}
+            self._entry_changed.notify_all()
+            self._metrics.cached_records = 0
+            self._metrics.disk_usage_in_bytes = 0
+            if self._temporary_directory:
+                self._temporary_directory.cleanup()
+                self._temporary_directory = None
+
+    def _read_and_cache(
+        self, key: str, entry: _CacheEntry, records: Iterable[ParentRecord], stream_name: str
+    ) -> Iterable[ParentRecord]:
+        records_iterator: Iterator[ParentRecord] = iter(records)
+        uncacheable_record: Optional[ParentRecord] = None
+        is_complete = False
+        with self._lock:
+            self._metrics.memory_usage_in_bytes += self._buffer_size
+        try:
+            with open(entry.path, "wb", buffering=self._buffer_size) as file:
+                for record, partition in records_iterator:
+                    try:
+                        # Datetimes would be read back as strings so they are not cached
+                        line = orjson.dumps(
+                            [record, partition], option=orjson.OPT_PASSTHROUGH_DATETIME
+                        )
+                    except TypeError as exception:
+                        logger.debug(
+                            f"Parent stream {stream_name} has records that can't be cached: {exception}"
+                        )
+                        uncacheable_record = (record, partition)
+                        break
+                    file.write(line)
+                    file.write(b"\n")
+                    entry.records += 1
+                    entry.size_in_bytes += len(line) + 1
+                    entry.last_write_time = time.monotonic()
+                    yield record, partition
+            is_complete = uncacheable_record is None
+        finally:
+            with self._lock:
+                self._metrics.memory_usage_in_bytes -= self._buffer_size
+                if is_complete and self._entries.get(key) is entry:
+                    entry.is_complete = True
+                    self._metrics.cached_records += entry.records
+                    self._metrics.disk_usage_in_bytes += entry.size_in_bytes
+                else:
+                    # The read failed, was not consumed completely or the cache was closed: the next reader reads the parent stream again
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                    self._delete(entry.path)
+                self._entry_changed.notify_all()
+
+        if uncacheable_record:
+            yield uncacheable_record
+            yield from records_iterator
+        elif entry.is_complete:
+            logger.info(
+                f"Cached {entry.records} records of parent stream {stream_name} in {entry.size_in_bytes} bytes on disk"
+            )
+
+    def _is_writer_gone(self, entry: _CacheEntry) -> bool:
+        return (
+            not entry.writer_thread.is_alive()
+            or time.monotonic() - entry.last_write_time > self._writer_timeout_in_seconds
+        )
+
+    @staticmethod
+    def _replay(entry: _CacheEntry) -> Iterable[ParentRecord]:
+        with open(entry.path, "rb") as file:
+            for line in file:
+                record, partition = orjson.loads(line)
+                yield record, partition
+
+    def _get_directory(self) -> str:
+        if self._temporary_directory is None:
+            # A directory per cache so that caches sharing the request cache directory don't overwrite each other's files
+            parent_directory = self._directory or os.getenv(ENV_REQUEST_CACHE_PATH)
+            if parent_directory:
+                os.makedirs(parent_directory, exist_ok=True)
+            self._temporary_directory = tempfile.TemporaryDirectory(
+                prefix="airbyte-parent-records-", dir=parent_directory, ignore_cleanup_errors=True
+            )
+        return self._temporary_directory.name
+
+    @staticmethod
+    def _delete(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -6,15 +6,35 @@
 import copy
 import json
 import logging
+import queue
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import InitVar, dataclass
-from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import dpath
 import requests
 
-from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.models import AirbyteMessage, SyncMode
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import (
     RequestOption,
@@ -25,6 +45,73 @@ from airbyte_cdk.utils import AirbyteTracedException
 
 if TYPE_CHECKING:
     from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+    from airbyte_cdk.sources.declarative.extractors.dpath_extractor import _CompiledPath
+
+# Put on the queue of a parent stream read concurrently once a partition is read completely
+_PARTITION_READ = object()
+
+
+def _compile_path(path: Union[str, List[str]]) -> Optional["_CompiledPath"]:
+    """
+    Compile the path to look the values up directly if it has no glob, which is much faster than matching every leaf of the record
+    against the path with dpath.
+    """
+    # Imported here as the extractors package depends on the partition routers
+    from airbyte_cdk.sources.declarative.extractors.dpath_extractor import _CompiledPath
+
+    segments = path.lstrip("/").split("/") if isinstance(path, str) else path
+    compiled_path = _CompiledPath.compile(segments)
+    return compiled_path if compiled_path and not compiled_path.has_wildcard else None
+
+
+def _get_value(
+    record: Mapping[str, Any], path: Union[str, List[str]], compiled_path: Optional["_CompiledPath"]
+) -> Any:
+    """
+    Same as `dpath.get(record, path)` but uses the path compiled with `_compile_path` if any.
+    """
+    if compiled_path:
+        return compiled_path.get(record)
+    return dpath.get(record, path)  # type: ignore[arg-type]  # dpath only reads the record
+
+
+class _ReadStopped(Exception):
+    """
+    Raised in the threads reading the parent streams once the slices are no longer consumed.
+    """
+
+
+class _ParentRecordQueue:
+    """
+    A bounded queue between the threads reading the parent streams concurrently. Putting or getting an item raises _ReadStopped once
+    the read is stopped so that no thread stays blocked when the slices are not consumed completely.
+    """
+
+    _POLL_INTERVAL_IN_SECONDS = 0.1
+
+    def __init__(self, stopped: threading.Event, maxsize: int = 1000) -> None:
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize)
+        self._stopped = stopped
+
+    def put(self, item: Any) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=self._POLL_INTERVAL_IN_SECONDS)
+                return
+            except queue.Full:
+                pass
+        raise _ReadStopped()
+
+    def get(self) -> Any:
+        while not self._stopped.is_set():
+            try:
+                return self._queue.get(timeout=self._POLL_INTERVAL_IN_SECONDS)
+            except queue.Empty:
+                pass
+        raise _ReadStopped()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
 
 
 @dataclass
@@ -38,6 +125,9 @@ class ParentStreamConfig:
     extra_fields: Additional field paths to include in the stream slice
     request_option: How to inject the slice value on an outgoing HTTP request
     incremental_dependency (bool): Indicates if the parent stream should be read incrementally.
+    record_cache: If provided and the parent stream is not read incrementally, caches the parent records so that they are read only once for all the parent stream configs sharing the cache
+    record_cache_key: Identifies the parent stream definition in the record cache. Parent streams with the same key must read the same records
+    read_concurrency: The number of partitions of the parent stream read at the same time. If above 1 on any parent stream config, the parent streams of the router are also read at the same time
     """
 
     stream: "DeclarativeStream"  # Parent streams must be DeclarativeStream because we can't know which part of the stream slice is a partition for regular Stream
@@ -51,8 +141,15 @@ class ParentStreamConfig:
     request_option: Optional[RequestOption] = None
     incremental_dependency: bool = False
     lazy_read_pointer: Optional[List[Union[InterpolatedString, str]]] = None
+    record_cache: Optional[ParentRecordCache] = None
+    record_cache_key: Optional[str] = None
+    read_concurrency: int = 1
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if self.read_concurrency < 1:
+            raise ValueError(
+                f"read_concurrency must be at least 1 but was {self.read_concurrency} for parent stream {self.stream.name}"
+            )
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
         self.partition_field = InterpolatedString.create(
             self.partition_field, parameters=parameters
@@ -82,6 +179,14 @@ class SubstreamPartitionRouter(PartitionRouter):
     Partition router that iterates over the parent's stream records and emits slices
     Will populate the state with `partition_field` and `parent_slice` so they can be accessed by other components
 
+    If a parent stream config has a `read_concurrency` above 1, the parent streams are read at the same time on worker threads and the
+    slices are yielded as soon as the parent records are read. Within a parent stream, up to `read_concurrency` partitions are read at
+    the same time, except for parent streams with an incremental dependency or read with a resumable full refresh cursor as their
+    partitions have to be read in order, and for test reads limiting the number of pages. The partitions are read on a copy of the
+    parent stream whose retriever has no cursor as the cursors are not thread safe. While the parents are read this way,
+    `get_stream_state` returns the state of each parent stream as of the last slice yielded for it so that the parent state never
+    gets ahead of the slices.
+
     Attributes:
         parent_stream_configs (List[ParentStreamConfig]): parent streams to iterate over and their config
     """
@@ -94,6 +199,8 @@ class SubstreamPartitionRouter(PartitionRouter):
         if not self.parent_stream_configs:
             raise ValueError("SubstreamPartitionRouter needs at least 1 parent stream")
         self._parameters = parameters
+        # The state of the parent streams as of the last slices yielded while the parent streams are read concurrently
+        self._parent_state_snapshots: Optional[Dict[str, StreamState]] = None
 
     def get_request_params(
         self,
@@ -164,71 +271,346 @@ class SubstreamPartitionRouter(PartitionRouter):
         """
         if not self.parent_stream_configs:
             yield from []
+            return
+
+        fields = []
+        for parent_stream_config in self.parent_stream_configs:
+            parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
+            partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
+            extra_fields = None
+            if parent_stream_config.extra_fields:
+                extra_fields = [
+                    [field_path_part.eval(self.config) for field_path_part in field_path]  # type: ignore [union-attr]
+                    for field_path in parent_stream_config.extra_fields
+                ]
+            fields.append(
+                (
+                    parent_field,
+                    _compile_path(parent_field),
+                    partition_field,
+                    [(path, _compile_path(path)) for path in extra_fields]
+                    if extra_fields
+                    else None,
+                )
+            )
+
+        if any(config.read_concurrency > 1 for config in self.parent_stream_configs):
+            parent_records = self._read_parents_concurrently()
         else:
-            for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
-                parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
-                partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
-                extra_fields = None
-                if parent_stream_config.extra_fields:
-                    extra_fields = [
-                        [field_path_part.eval(self.config) for field_path_part in field_path]  # type: ignore [union-attr]
-                        for field_path in parent_stream_config.extra_fields
-                    ]
-
-                # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
-                # not support either substreams or RFR, but something that needs to be considered once we do
-                for parent_record in parent_stream.read_only_records():
-                    parent_partition = None
-                    # Skip non-records (eg AirbyteLogMessage)
-                    if isinstance(parent_record, AirbyteMessage):
-                        self.logger.warning(
-                            f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
-                        )
-                        if parent_record.type == MessageType.RECORD:
-                            parent_record = parent_record.record.data  # type: ignore[union-attr, assignment]  # record is always a Record
-                        else:
-                            continue
-                    elif isinstance(parent_record, Record):
-                        parent_partition = (
-                            parent_record.associated_slice.partition
-                            if parent_record.associated_slice
-                            else {}
-                        )
-                        parent_record = parent_record.data
-                    elif not isinstance(parent_record, Mapping):
-                        # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
-                        raise AirbyteTracedException(
-                            message=f"Parent stream returned records as invalid type {type(parent_record)}"
-                        )
-                    try:
-                        partition_value = dpath.get(
-                            parent_record,  # type: ignore [arg-type]
-                            parent_field,
-                        )
-                    except KeyError:
-                        continue
-
-                    # Add extra fields
-                    extracted_extra_fields = self._extract_extra_fields(parent_record, extra_fields)
-
-                    if parent_stream_config.lazy_read_pointer:
-                        extracted_extra_fields = {
-                            "child_response": self._extract_child_response(
-                                parent_record,
-                                parent_stream_config.lazy_read_pointer,  # type: ignore[arg-type]  # lazy_read_pointer type handeled in __post_init__ of parent_stream_config
-                            ),
-                            **extracted_extra_fields,
-                        }
-
-                    yield StreamSlice(
-                        partition={
-                            partition_field: partition_value,
-                            "parent_slice": parent_partition or {},
-                        },
-                        cursor_slice={},
-                        extra_fields=extracted_extra_fields,
+            parent_records = (
+                (index, parent_record, parent_partition)
+                for index, parent_stream_config in enumerate(self.parent_stream_configs)
+                for parent_record, parent_partition in self._read_parent_records(
+                    parent_stream_config
+                )
+            )
+
+        for index, parent_record, parent_partition in parent_records:
+            parent_stream_config = self.parent_stream_configs[index]
+            parent_field, compiled_parent_field, partition_field, extra_field_paths = fields[index]
+            try:
+                partition_value = _get_value(parent_record, parent_field, compiled_parent_field)
+            except KeyError:
+                continue
+
+            # Add extra fields
+            extracted_extra_fields = self._extract_extra_fields(parent_record, extra_field_paths)
+
+            if parent_stream_config.lazy_read_pointer:
+                extracted_extra_fields = {
+                    "child_response": self._extract_child_response(
+                        parent_record,
+                        parent_stream_config.lazy_read_pointer,  # type: ignore[arg-type]  # lazy_read_pointer type handeled in __post_init__ of parent_stream_config
+                    ),
+                    **extracted_extra_fields,
+                }
+
+            yield StreamSlice(
+                partition={
+                    partition_field: partition_value,
+                    "parent_slice": parent_partition,
+                },
+                cursor_slice={},
+                extra_fields=extracted_extra_fields,
+            )
+
+    def _read_parents_concurrently(
+        self,
+    ) -> Iterable[Tuple[int, Mapping[str, Any], Mapping[str, Any]]]:
+        """
+        Read all the parent streams on a pool of worker threads and yield the index of their config with each parent record as soon as
+        it is read. The state snapshot sent with the records of parent streams with an incremental dependency is only exposed by
+        `get_stream_state` once the record has been yielded.
+        """
+        stopped = threading.Event()
+        records = _ParentRecordQueue(stopped)
+        # A thread per parent stream and the threads reading the partitions of the parent streams
+        max_workers = len(self.parent_stream_configs) + sum(
+            config.read_concurrency
+            for config in self.parent_stream_configs
+            if self._can_read_partitions_concurrently(config)
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="parent_stream_reader"
+        )
+        self._parent_state_snapshots = {
+            config.stream.name: copy.deepcopy(config.stream.state)
+            for config in self.parent_stream_configs
+            if config.incremental_dependency
+        }
+        try:
+            for index, parent_stream_config in enumerate(self.parent_stream_configs):
+                executor.submit(
+                    self._read_parent_into_queue,
+                    index,
+                    parent_stream_config,
+                    records,
+                    executor,
+                    stopped,
+                )
+
+            parents_being_read = len(self.parent_stream_configs)
+            while parents_being_read:
+                item = records.get()
+                if isinstance(item, Exception):
+                    raise item
+                index, parent_record, parent_partition, parent_state = item
+                if parent_state is not None:
+                    self._parent_state_snapshots[self.parent_stream_configs[index].stream.name] = (
+                        parent_state
                     )
+                if parent_record is None:
+                    parents_being_read -= 1
+                else:
+                    yield index, parent_record, parent_partition
+        finally:
+            stopped.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._parent_state_snapshots = None
+
+    def _read_parent_into_queue(
+        self,
+        index: int,
+        parent_stream_config: ParentStreamConfig,
+        records: _ParentRecordQueue,
+        executor: Executor,
+        stopped: threading.Event,
+    ) -> None:
+        """
+        Put the records of a parent stream on the queue, followed by a None record once the parent stream is read. The records of parent
+        streams with an incremental dependency come with a snapshot of the parent state as of the record, or None if it did not change.
+        """
+        parent_stream = parent_stream_config.stream
+        last_state: Optional[StreamState] = None
+        parent_records: Optional[Iterator[Tuple[Mapping[str, Any], Mapping[str, Any]]]] = None
+        try:
+            parent_records = iter(
+                self._read_parent_records(parent_stream_config, executor, stopped)
+            )
+            for parent_record, parent_partition in parent_records:
+                parent_state = None
+                if parent_stream_config.incremental_dependency:
+                    state = parent_stream.state
+                    if state != last_state:
+                        parent_state = last_state = copy.deepcopy(state)
+                records.put((index, parent_record, parent_partition, parent_state))
+            records.put(
+                (
+                    index,
+                    None,
+                    None,
+                    copy.deepcopy(parent_stream.state)
+                    if parent_stream_config.incremental_dependency
+                    else None,
+                )
+            )
+        except _ReadStopped:
+            pass
+        except Exception as exception:
+            try:
+                records.put(exception)
+            except _ReadStopped:
+                pass
+        finally:
+            # Stop reading the partitions of the parent stream if the read failed or was stopped
+            close = getattr(parent_records, "close", None)
+            if close:
+                close()
+
+    def _read_parent_records(
+        self,
+        parent_stream_config: ParentStreamConfig,
+        executor: Optional[Executor] = None,
+        stopped: Optional[threading.Event] = None,
+    ) -> Iterable[Tuple[Mapping[str, Any], Mapping[str, Any]]]:
+        parent_stream = parent_stream_config.stream
+        read_parent_stream: Callable[[], Iterable[Tuple[Mapping[str, Any], Mapping[str, Any]]]]
+        if executor and stopped and self._can_read_partitions_concurrently(parent_stream_config):
+            read_parent_stream = partial(
+                self._read_parent_partitions_concurrently, parent_stream_config, executor, stopped
+            )
+        else:
+            read_parent_stream = partial(self._read_parent_stream, parent_stream)
+        if (
+            parent_stream_config.record_cache
+            and parent_stream_config.record_cache_key
+            and not parent_stream_config.incremental_dependency
+        ):
+            return parent_stream_config.record_cache.read(
+                parent_stream_config.record_cache_key,
+                read_parent_stream,
+                parent_stream.name,
+            )
+        return read_parent_stream()
+
+    @staticmethod
+    def _can_read_partitions_concurrently(parent_stream_config: ParentStreamConfig) -> bool:
+        # Imported here as these packages depend on the partition routers
+        from airbyte_cdk.sources.declarative.incremental.resumable_full_refresh_cursor import (
+            ResumableFullRefreshCursor,
+        )
+        from airbyte_cdk.sources.declarative.requesters.paginators.default_paginator import (
+            PaginatorTestReadDecorator,
+        )
+
+        # The state of parent streams with an incremental dependency has to follow the order of the partitions, a resumable full
+        # refresh cursor reads a page per call and the paginator of test reads counts the pages read across partitions
+        return (
+            parent_stream_config.read_concurrency > 1
+            and not parent_stream_config.incremental_dependency
+            and not isinstance(parent_stream_config.stream.get_cursor(), ResumableFullRefreshCursor)
+            and not isinstance(
+                getattr(
+                    getattr(parent_stream_config.stream, "retriever", None), "_paginator", None
+                ),
+                PaginatorTestReadDecorator,
+            )
+        )
+
+    @staticmethod
+    def _create_partition_stream(parent_stream: "DeclarativeStream") -> "DeclarativeStream":
+        """
+        Return a copy of the parent stream to read its partitions on the worker threads. Its retriever has no cursor so that the
+        threads don't update the cursor at the same time, like the retrievers of the concurrent declarative streams. The cursor
+        state is not needed as the parent stream is not read incrementally.
+        """
+        # Imported here as the retrievers depend on the partition routers
+        from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+
+        retriever = getattr(parent_stream, "retriever", None)
+        if not isinstance(retriever, SimpleRetriever) or retriever.cursor is None:
+            return parent_stream
+        partition_retriever = copy.copy(retriever)
+        partition_retriever.cursor = None
+        partition_stream = copy.copy(parent_stream)
+        partition_stream.retriever = partition_retriever
+        return partition_stream
+
+    def _read_parent_partitions_concurrently(
+        self,
+        parent_stream_config: ParentStreamConfig,
+        executor: Executor,
+        stopped: threading.Event,
+    ) -> Iterable[Tuple[Mapping[str, Any], Mapping[str, Any]]]:
+        """
+        Read up to `read_concurrency` partitions of the parent stream at the same time and yield the records as they are read.
+        """
+        parent_stream = parent_stream_config.stream
+        partition_stream = self._create_partition_stream(parent_stream)
+        records = _ParentRecordQueue(stopped)
+        stream_slices: Iterator[Optional[Mapping[str, Any]]] = iter(
+            parent_stream.stream_slices(sync_mode=SyncMode.full_refresh)
+        )
+        has_more_partitions = True
+        partitions_being_read = 0
+        while has_more_partitions or partitions_being_read:
+            # The records already read are yielded before the next partition is created as creating it may require reading records
+            if (
+                has_more_partitions
+                and partitions_being_read < parent_stream_config.read_concurrency
+                and records.empty()
+            ):
+                try:
+                    stream_slice = next(stream_slices)
+                except StopIteration:
+                    has_more_partitions = False
+                    continue
+                executor.submit(
+                    self._read_parent_partition, partition_stream, stream_slice, records
+                )
+                partitions_being_read += 1
+                continue
+
+            item = records.get()
+            if item is _PARTITION_READ:
+                partitions_being_read -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+
+    def _read_parent_partition(
+        self,
+        parent_stream: "DeclarativeStream",
+        stream_slice: Optional[Mapping[str, Any]],
+        records: _ParentRecordQueue,
+    ) -> None:
+        try:
+            for parent_record in parent_stream.read_records(
+                sync_mode=SyncMode.full_refresh, stream_slice=stream_slice
+            ):
+                normalized_record = self._normalize_parent_record(parent_stream, parent_record)
+                if normalized_record:
+                    records.put(normalized_record)
+            records.put(_PARTITION_READ)
+        except _ReadStopped:
+            pass
+        except Exception as exception:
+            try:
+                records.put(exception)
+            except _ReadStopped:
+                pass
+
+    def _read_parent_stream(
+        self, parent_stream: "DeclarativeStream"
+    ) -> Iterable[Tuple[Mapping[str, Any], Mapping[str, Any]]]:
+        """
+        Yield the data of the parent records with the partition of the parent stream they were read from.
+        """
+        # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
+        # not support either substreams or RFR, but something that needs to be considered once we do
+        for parent_record in parent_stream.read_only_records():
+            normalized_record = self._normalize_parent_record(parent_stream, parent_record)
+            if normalized_record:
+                yield normalized_record
+
+    def _normalize_parent_record(
+        self, parent_stream: "DeclarativeStream", parent_record: Any
+    ) -> Optional[Tuple[Mapping[str, Any], Mapping[str, Any]]]:
+        """
+        Return the data of the parent record with the partition of the parent stream it was read from or None if it is not a record.
+        """
+        parent_partition = None
+        # Skip non-records (eg AirbyteLogMessage)
+        if isinstance(parent_record, AirbyteMessage):
+            self.logger.warning(
+                f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
+            )
+            if parent_record.type == MessageType.RECORD:
+                parent_record = parent_record.record.data  # type: ignore[union-attr]  # record is always a Record
+            else:
+                return None
+        elif isinstance(parent_record, Record):
+            parent_partition = (
+                parent_record.associated_slice.partition if parent_record.associated_slice else {}
+            )
+            parent_record = parent_record.data
+        elif not isinstance(parent_record, Mapping):
+            # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
+            raise AirbyteTracedException(
+                message=f"Parent stream returned records as invalid type {type(parent_record)}"
+            )
+        return parent_record, parent_partition or {}
 
     def _extract_child_response(
         self, parent_record: Mapping[str, Any] | AirbyteMessage, pointer: List[InterpolatedString]
@@ -248,14 +630,14 @@ class SubstreamPartitionRouter(PartitionRouter):
     def _extract_extra_fields(
         self,
         parent_record: Mapping[str, Any] | AirbyteMessage,
-        extra_fields: Optional[List[List[str]]] = None,
+        extra_fields: Optional[List[Tuple[List[str], Optional["_CompiledPath"]]]] = None,
     ) -> Mapping[str, Any]:
         """
         Extracts additional fields specified by their paths from the parent record.
 
         Args:
             parent_record (Mapping[str, Any]): The record from the parent stream to extract fields from.
-            extra_fields (Optional[List[List[str]]]): A list of field paths (as lists of strings) to extract from the parent record.
+            extra_fields (Optional[List[Tuple[List[str], Optional[_CompiledPath]]]]): A list of field paths (as lists of strings) to extract from the parent record, each with its compiled path if any.
 
         Returns:
             Mapping[str, Any]: A dictionary containing the extracted fields.
@@ -263,17 +645,23 @@ class SubstreamPartitionRouter(PartitionRouter):
         """
         extracted_extra_fields = {}
         if extra_fields:
-            for extra_field_path in extra_fields:
+            logger = self.logger
+            # The values are only formatted if they are logged as this is done for every parent record
+            is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            for extra_field_path, compiled_extra_field_path in extra_fields:
                 try:
-                    extra_field_value = dpath.get(
+                    extra_field_value = _get_value(
                         parent_record,  # type: ignore [arg-type]
                         extra_field_path,
+                        compiled_extra_field_path,
                     )
-                    self.logger.debug(
-                        f"Extracted extra_field_path: {extra_field_path} with value: {extra_field_value}"
-                    )
+                    if is_debug_enabled:
+                        logger.debug(
+                            f"Extracted extra_field_path: {extra_field_path} with value: {extra_field_value}"
+                        )
                 except KeyError:
-                    self.logger.debug(f"Failed to extract extra_field_path: {extra_field_path}")
+                    if is_debug_enabled:
+                        logger.debug(f"Failed to extract extra_field_path: {extra_field_path}")
                     extra_field_value = None
                 extracted_extra_fields[".".join(extra_field_path)] = extra_field_value
         return extracted_extra_fields
@@ -412,9 +800,17 @@ class SubstreamPartitionRouter(PartitionRouter):
         }
         """
         parent_state = {}
+        parent_state_snapshots = self._parent_state_snapshots
         for parent_config in self.parent_stream_configs:
             if parent_config.incremental_dependency:
-                parent_state[parent_config.stream.name] = copy.deepcopy(parent_config.stream.state)
+                if parent_state_snapshots is not None:
+                    parent_state[parent_config.stream.name] = copy.deepcopy(
+                        parent_state_snapshots[parent_config.stream.name]
+                    )
+                else:
+                    parent_state[parent_config.stream.name] = copy.deepcopy(
+                        parent_config.stream.state
+                    )
         return parent_state
 
     @property
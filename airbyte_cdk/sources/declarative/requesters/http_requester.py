@@ -26,6 +26,7 @@ from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
 from airbyte_cdk.sources.streams.call_rate import APIBudget
 from airbyte_cdk.sources.streams.http import HttpClient
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler
+from airbyte_cdk.sources.streams.http.request_observer import HttpRequestObserver
 from airbyte_cdk.sources.types import Config, EmptyString, StreamSlice, StreamState
 from airbyte_cdk.utils.mapping_helpers import (
     combine_mappings,
@@ -49,6 +50,7 @@ class HttpRequester(Requester):
         backoff_strategies (Optional[List[BackoffStrategy]]): List of backoff strategies to use when retrying requests
         config (Config): The user-provided configuration as specified by the source's spec
         use_cache (bool): Indicates that data should be cached for this stream
+        request_observer (Optional[HttpRequestObserver]): Receives the outcome of every attempt to send a request
     """
 
     name: str
@@ -69,6 +71,7 @@ class HttpRequester(Requester):
     _exit_on_rate_limit: bool = False
     stream_response: bool = False
     decoder: Decoder = field(default_factory=lambda: JsonDecoder(parameters={}))
+    request_observer: Optional[HttpRequestObserver] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._url = InterpolatedString.create(
@@ -114,6 +117,7 @@ class HttpRequester(Requester):
             backoff_strategy=backoff_strategies,
             disable_retries=self.disable_retries,
             message_repository=self.message_repository,
+            request_observer=self.request_observer,
         )
 
     @property
@@ -151,6 +151,9 @@ class DefaultPaginator(Paginator):
         else:
             return None
 
+    def next_page_token_depends_on_records(self) -> bool:
+        return self.pagination_strategy.next_page_token_depends_on_records()
+
     def path(
         self,
         next_page_token: Optional[Mapping[str, Any]],
@@ -270,6 +273,9 @@ class PaginatorTestReadDecorator(Paginator):
             response, last_page_size, last_record, last_page_token_value
         )
 
+    def next_page_token_depends_on_records(self) -> bool:
+        return self._decorated.next_page_token_depends_on_records()
+
     def path(
         self,
         next_page_token: Optional[Mapping[str, Any]],
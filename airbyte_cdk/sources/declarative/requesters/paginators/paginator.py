@@ -48,6 +48,14 @@ class Paginator(ABC, RequestOptionsProvider):
         """
         pass
 
+    def next_page_token_depends_on_records(self) -> bool:
+        """
+        Returns False if the next page token only depends on the response. In that case, `next_page_token` can be called before the
+        records of the page are read, with a `last_page_size` of 0 and no `last_record`, which allows fetching the next page while the
+        records of the current one are processed.
+        """
+        return True
+
     @abstractmethod
     def path(
         self,
@@ -19,6 +19,9 @@ from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination
 )
 from airbyte_cdk.sources.types import Config, Record
 
+# The interpolation variables that are only known once the records of the page have been read
+_RECORD_INTERPOLATION_VARIABLES = ("last_record", "last_page_size")
+
 
 @dataclass
 class CursorPaginationStrategy(PaginationStrategy):
@@ -94,5 +97,15 @@ class CursorPaginationStrategy(PaginationStrategy):
         )
         return token if token else None
 
+    def next_page_token_depends_on_records(self) -> bool:
+        expressions = [self._cursor_value.string]
+        if self._stop_condition:
+            expressions.append(self._stop_condition.condition)
+        return any(
+            variable in expression
+            for expression in expressions
+            for variable in _RECORD_INTERPOLATION_VARIABLES
+        )
+
     def get_page_size(self) -> Optional[int]:
         return self.page_size
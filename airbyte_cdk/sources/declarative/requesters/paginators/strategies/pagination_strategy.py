@@ -41,6 +41,12 @@ class PaginationStrategy:
         """
         pass
 
+    def next_page_token_depends_on_records(self) -> bool:
+        """
+        :return: False if the next page token only depends on the response and the last page token value
+        """
+        return True
+
     @abstractmethod
     def get_page_size(self) -> Optional[int]:
         """
@@ -3,13 +3,16 @@
 #
 
 import json
-from collections import defaultdict
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import InitVar, dataclass, field
 from functools import partial
 from itertools import islice
+from queue import Queue
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterable,
     List,
     Mapping,
@@ -48,6 +51,9 @@ from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.utils.mapping_helpers import combine_mappings
 
 FULL_REFRESH_SYNC_COMPLETE_KEY = "__ab_full_refresh_sync_complete"
+# Marks the end of the pages fetched ahead by SimpleRetriever._prefetch_pages
+_NO_MORE_PAGES = object()
+_PREFETCH_POLL_INTERVAL_IN_SECONDS = 0.1
 
 
 @dataclass
@@ -72,6 +78,7 @@ class SimpleRetriever(Retriever):
         stream_slicer (Optional[StreamSlicer]): The stream slicer
         cursor (Optional[cursor]): The cursor
         parameters (Mapping[str, Any]): Additional runtime parameters to be used for string interpolation
+        prefetch_pages (int): The number of pages fetched ahead while the records of the current page are processed
     """
 
     requester: Requester
@@ -93,8 +100,11 @@ class SimpleRetriever(Retriever):
     ignore_stream_slicer_parameters_on_paginated_requests: bool = False
     additional_query_properties: Optional[QueryProperties] = None
     log_formatter: Optional[Callable[[requests.Response], Any]] = None
+    prefetch_pages: int = 0
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if self.prefetch_pages < 0:
+            raise ValueError(f"prefetch_pages must be positive but got {self.prefetch_pages}")
         self._paginator = self.paginator or NoPagination(parameters=parameters)
         self._parameters = parameters
         self._name = (
@@ -356,6 +366,52 @@ class SimpleRetriever(Retriever):
             log_formatter=self.log_formatter,
         )
 
+    def _fetch_property_chunks(
+        self,
+        executor: Optional[ThreadPoolExecutor],
+        max_concurrent_requests: int,
+        stream_state: Mapping[str, Any],
+        chunk_slices: List[StreamSlice],
+        next_page_token: Optional[Mapping[str, Any]],
+    ) -> Iterable[Tuple[int, Optional[requests.Response]]]:
+        """
+        Fetch the same page for each property chunk and yield the index of the chunk with its response.
+
+        Without an executor, the chunks are fetched one after another in order. Otherwise, up to `max_concurrent_requests` requests are in flight
+        at the same time and the responses are yielded as they arrive so that only a bounded number of responses are held in memory.
+        Requests still go through the requester so the API budget and the error handling apply to each of them.
+        """
+        if executor is None or len(chunk_slices) == 1:
+            for chunk_index, chunk_slice in enumerate(chunk_slices):
+                yield chunk_index, self._fetch_next_page(stream_state, chunk_slice, next_page_token)
+            return
+
+        pending_chunks = iter(enumerate(chunk_slices))
+        in_flight: Dict[Future[Optional[requests.Response]], int] = {}
+
+        def submit_next_chunk() -> None:
+            next_chunk = next(pending_chunks, None)
+            if next_chunk is not None:
+                chunk_index, chunk_slice = next_chunk
+                future = executor.submit(
+                    self._fetch_next_page, stream_state, chunk_slice, next_page_token
+                )
+                in_flight[future] = chunk_index
+
+        for _ in range(max_concurrent_requests):
+            submit_next_chunk()
+        try:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk_index = in_flight.pop(future)
+                    response = future.result()
+                    submit_next_chunk()
+                    yield chunk_index, response
+        finally:
+            for future in in_flight:
+                future.cancel()
+
     # This logic is similar to _read_pages in the HttpStream class. When making changes here, consider making changes there as well.
     def _read_pages(
         self,
@@ -368,85 +424,198 @@ class SimpleRetriever(Retriever):
         next_page_token: Optional[Mapping[str, Any]] = (
             {"next_page_token": initial_token} if initial_token is not None else None
         )
-        while not pagination_complete:
-            property_chunks: List[List[str]] = (
-                list(
-                    self.additional_query_properties.get_request_property_chunks(
-                        stream_slice=stream_slice
-                    )
-                )
-                if self.additional_query_properties
-                else [
-                    []
-                ]  # A single empty property chunk represents the case where property chunking is not configured
+        if (
+            self.prefetch_pages
+            and not self.additional_query_properties
+            and not self._paginator.next_page_token_depends_on_records()
+        ):
+            yield from self._read_prefetched_pages(
+                records_generator_fn, stream_state, stream_slice, next_page_token
             )
+            return
 
-            merged_records: MutableMapping[str, Any] = defaultdict(dict)
-            last_page_size = 0
-            last_record: Optional[Record] = None
-            response: Optional[requests.Response] = None
-            for properties in property_chunks:
-                if len(properties) > 0:
-                    stream_slice = StreamSlice(
+        property_chunking = (
+            self.additional_query_properties.property_chunking
+            if self.additional_query_properties
+            else None
+        )
+        max_concurrent_requests = (
+            property_chunking.max_concurrent_requests if property_chunking else 1
+        )
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=max_concurrent_requests, thread_name_prefix="property_chunks"
+            )
+            if max_concurrent_requests > 1
+            else None
+        )
+        try:
+            while not pagination_complete:
+                property_chunks: List[List[str]] = (
+                    list(
+                        self.additional_query_properties.get_request_property_chunks(
+                            stream_slice=stream_slice
+                        )
+                    )
+                    if self.additional_query_properties
+                    else [
+                        []
+                    ]  # A single empty property chunk represents the case where property chunking is not configured
+                )
+                chunk_slices = [
+                    StreamSlice(
                         partition=stream_slice.partition or {},
                         cursor_slice=stream_slice.cursor_slice or {},
                         extra_fields={"query_properties": properties},
                     )
-
-                response = self._fetch_next_page(stream_state, stream_slice, next_page_token)
-                for current_record in records_generator_fn(response):
-                    if (
-                        current_record
-                        and self.additional_query_properties
-                        and self.additional_query_properties.property_chunking
-                    ):
-                        merge_key = (
-                            self.additional_query_properties.property_chunking.get_merge_key(
-                                current_record
-                            )
-                        )
-                        if merge_key:
-                            _deep_merge(merged_records[merge_key], current_record)
+                    if len(properties) > 0
+                    else stream_slice
+                    for properties in property_chunks
+                ]
+
+                merged_records: MutableMapping[str, Any] = {}
+                # The position of the first record of each merge key so that merged records are emitted in the same order no matter the
+                # order in which the responses of the chunks arrive
+                merged_record_positions: MutableMapping[str, Tuple[int, int]] = {}
+                last_page_size = 0
+                last_record: Optional[Record] = None
+                response: Optional[requests.Response] = None
+                for chunk_index, chunk_response in self._fetch_property_chunks(
+                    executor, max_concurrent_requests, stream_state, chunk_slices, next_page_token
+                ):
+                    if chunk_index == len(chunk_slices) - 1:
+                        response = chunk_response
+                    for position, current_record in enumerate(records_generator_fn(chunk_response)):
+                        if current_record and property_chunking:
+                            merge_key = property_chunking.get_merge_key(current_record)
+                            if merge_key:
+                                if merge_key not in merged_records:
+                                    merged_records[merge_key] = {}
+                                    merged_record_positions[merge_key] = (chunk_index, position)
+                                else:
+                                    merged_record_positions[merge_key] = min(
+                                        merged_record_positions[merge_key], (chunk_index, position)
+                                    )
+                                _deep_merge(merged_records[merge_key], current_record)
+                            else:
+                                # We should still emit records even if the record did not have a merge key
+                                last_page_size += 1
+                                last_record = current_record
+                                yield current_record
                         else:
-                            # We should still emit records even if the record did not have a merge key
                             last_page_size += 1
                             last_record = current_record
                             yield current_record
-                    else:
+
+                if property_chunking:
+                    for merge_key in sorted(
+                        merged_records, key=merged_record_positions.__getitem__
+                    ):
+                        record = Record(
+                            data=merged_records[merge_key],
+                            stream_name=self.name,
+                            associated_slice=chunk_slices[-1],
+                        )
                         last_page_size += 1
-                        last_record = current_record
-                        yield current_record
-
-            if (
-                self.additional_query_properties
-                and self.additional_query_properties.property_chunking
-            ):
-                for merged_record in merged_records.values():
-                    record = Record(
-                        data=merged_record, stream_name=self.name, associated_slice=stream_slice
-                    )
-                    last_page_size += 1
-                    last_record = record
-                    yield record
+                        last_record = record
+                        yield record
 
-            if not response:
-                pagination_complete = True
-            else:
-                last_page_token_value = (
-                    next_page_token.get("next_page_token") if next_page_token else None
-                )
-                next_page_token = self._next_page_token(
-                    response=response,
-                    last_page_size=last_page_size,
-                    last_record=last_record,
-                    last_page_token_value=last_page_token_value,
-                )
-                if not next_page_token:
+                if not response:
                     pagination_complete = True
+                else:
+                    last_page_token_value = (
+                        next_page_token.get("next_page_token") if next_page_token else None
+                    )
+                    next_page_token = self._next_page_token(
+                        response=response,
+                        last_page_size=last_page_size,
+                        last_record=last_record,
+                        last_page_token_value=last_page_token_value,
+                    )
+                    if not next_page_token:
+                        pagination_complete = True
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    def _read_prefetched_pages(
+        self,
+        records_generator_fn: Callable[[Optional[requests.Response]], Iterable[Record]],
+        stream_state: Mapping[str, Any],
+        stream_slice: StreamSlice,
+        next_page_token: Optional[Mapping[str, Any]],
+    ) -> Iterable[Record]:
+        """
+        Read the pages while up to `prefetch_pages` next pages are fetched by a background thread. This is only possible when the
+        paginator computes the next page token from the response alone since the records of a page are not known yet when the next
+        page is requested.
+        """
+        pages: Queue[Union[Optional[requests.Response], Exception, object]] = Queue()
+        free_slots = threading.Semaphore(self.prefetch_pages)
+        is_reading = threading.Event()
+        is_reading.set()
+        threading.Thread(
+            target=self._prefetch_pages,
+            args=(stream_state, stream_slice, next_page_token, pages, free_slots, is_reading),
+            name=f"prefetch_pages_{self.name}",
+            daemon=True,
+        ).start()
+
+        try:
+            while True:
+                page = pages.get()
+                free_slots.release()
+                if page is _NO_MORE_PAGES:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield from records_generator_fn(page)  # type: ignore[arg-type]  # the page is a response at this point
+        finally:
+            # Stop the background thread if the records are not consumed until the end
+            is_reading.clear()
+
+        # Always return an empty generator just in case no records were ever yielded
+        yield from []
+
+    def _prefetch_pages(
+        self,
+        stream_state: Mapping[str, Any],
+        stream_slice: StreamSlice,
+        next_page_token: Optional[Mapping[str, Any]],
+        pages: Queue[Union[Optional[requests.Response], Exception, object]],
+        free_slots: threading.Semaphore,
+        is_reading: threading.Event,
+    ) -> None:
+        try:
+            while True:
+                while not free_slots.acquire(timeout=_PREFETCH_POLL_INTERVAL_IN_SECONDS):
+                    if not is_reading.is_set():
+                        return
+                if not is_reading.is_set():
+                    return
+                response = self._fetch_next_page(stream_state, stream_slice, next_page_token)
+                if response is not None:
+                    # Download the body now so that it does not have to be downloaded when the records are read
+                    response.content
+                    last_page_token_value = (
+                        next_page_token.get("next_page_token") if next_page_token else None
+                    )
+                    next_page_token = self._next_page_token(
+                        response=response,
+                        last_page_size=0,
+                        last_record=None,
+                        last_page_token_value=last_page_token_value,
+                    )
+                pages.put(response)
+                if not response or not next_page_token:
+                    pages.put(_NO_MORE_PAGES)
+                    return
+        except Exception as exception:
+            pages.put(exception)
+
     def _read_single_page(
         self,
         records_generator_fn: Callable[[Optional[requests.Response]], Iterable[Record]],
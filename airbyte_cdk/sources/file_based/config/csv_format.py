@@ -162,6 +162,12 @@ class CsvFormat(BaseModel):
         default=False,
         description="Whether to ignore errors that occur when the number of fields in the CSV does not match the number of columns in the schema.",
     )
+    use_columnar_reader: bool = Field(
+        title="Use Columnar Reader",
+        default=False,
+        description="Whether to read the CSV files in blocks converted column by column, which is faster for large files. The records are the same as the ones read row by row and formats that could produce different records are read row by row.",
+        airbyte_hidden=True,
+    )
 
     @validator("delimiter")
     def validate_delimiter(cls, v: str) -> str:
@@ -86,6 +86,9 @@ IDENTITIES_STREAM = "identities"
 class FileBasedSource(ConcurrentSourceAdapter, ABC):
     # We make each source override the concurrency level to give control over when they are upgraded.
     _concurrency_level = None
+    # The number of files of a slice read at the same time by streams that are not read concurrently. Sources have to override it as
+    # their stream reader is then used from several threads.
+    _max_concurrent_file_reads = 1
 
     def __init__(
         self,
@@ -342,6 +345,7 @@ class FileBasedSource(ConcurrentSourceAdapter, ABC):
             cursor=cursor,
             use_file_transfer=use_file_transfer(parsed_config),
             preserve_directory_structure=preserve_directory_structure(parsed_config),
+            max_concurrent_file_reads=self._max_concurrent_file_reads,
         )
 
     def _ensure_permissions_reader_available(self) -> None:
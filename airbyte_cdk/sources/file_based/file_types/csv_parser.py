@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
+import io
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -13,11 +15,15 @@ from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Opti
 from uuid import uuid4
 
 import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import (
     CsvFormat,
     CsvHeaderAutogenerated,
+    CsvHeaderFromCsv,
     CsvHeaderUserProvided,
     InferenceType,
 )
@@ -33,6 +39,7 @@ from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING, S
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 DIALECT_NAME = "_config_dialect"
+DEFAULT_COLUMNAR_BLOCK_SIZE = 4 * 1024 * 1024
 
 
 class _CsvReader:
@@ -151,15 +158,316 @@ class _CsvReader:
             fp.readline()
 
 
+class _UnsupportedCsvFile(Exception):
+    """
+    Raised by `_ColumnarCsvReader` before any record is returned when a file has to be read by `_CsvReader` to get the same records.
+    """
+
+
+class _ColumnarCsvReader(_CsvReader):
+    """
+    Reads CSV files in blocks with pyarrow and converts the values of a block column by column. The records are the same as the ones
+    returned by `_CsvReader` followed by `CsvParser._cast_types` and `CsvParser._to_nullable`:
+    * the headers and the rows to skip are read the same way `_CsvReader` reads them
+    * every value is read as a string and newlines are normalized like in files opened in text mode
+    * a column of a block is converted by pyarrow only if all its values convert exactly like their python conversion. Otherwise, its
+      values are converted one at a time like `CsvParser._cast_types` does
+
+    Formats for which the records could differ are not supported and must be read by `_CsvReader`: escape characters, encodings other
+    than UTF-8, ignored field mismatches and object or array columns. A row with a mismatched number of fields fails the read before the
+    records of its block are returned.
+    """
+
+    _SUPPORTED_ENCODINGS = {"utf-8", "utf-8-sig"}
+    _UNSUPPORTED_CAST_TYPES = {"array", "object"}
+    # The subsets of the strings accepted by python's `int` and `float` that pyarrow parses to the same value
+    _INTEGER_PATTERN = r"^[+-]?[0-9]+$"
+    _NUMBER_PATTERN = r"^[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?$"
+
+    def __init__(self, block_size: int = DEFAULT_COLUMNAR_BLOCK_SIZE) -> None:
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
+        self._block_size = block_size
+
+    def is_supported(
+        self, config_format: CsvFormat, deduped_property_types: Mapping[str, str], cast: bool
+    ) -> bool:
+        if config_format.escape_char or config_format.ignore_errors_on_fields_mismatch:
+            return False
+        if (
+            not config_format.encoding
+            or codecs.lookup(config_format.encoding).name not in self._SUPPORTED_ENCODINGS
+        ):
+            return False
+        return not cast or not any(
+            property_type in self._UNSUPPORTED_CAST_TYPES
+            for property_type in deduped_property_types.values()
+        )
+
+    def read_records(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        deduped_property_types: Mapping[str, str],
+        cast: bool,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Yield the records of the file in batches of one block. Raise `_UnsupportedCsvFile` before the first batch if the file has to be
+        read by `_CsvReader`.
+
+        :param deduped_property_types: The types of the columns used to convert the values and to decide which values can be null
+        :param cast: Whether to convert the values to the types of their column. Columns without a supported type are dropped then
+        """
+        config_format = _extract_format(config)
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            if isinstance(fp, io.TextIOBase):
+                raise _UnsupportedCsvFile("The file was not opened in binary mode")
+            headers, rows_to_skip, data_offset = self._read_headers(config, fp, config_format)
+            fp.seek(data_offset)
+            if (
+                data_offset == 0
+                and codecs.lookup(config_format.encoding).name != "utf-8-sig"  # type: ignore[arg-type]  # checked by is_supported
+                and fp.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8
+            ):
+                # The byte order mark would be part of the first value when read as UTF-8 while pyarrow drops it
+                raise _UnsupportedCsvFile("The file starts with a byte order mark")
+            fp.seek(data_offset)
+            if not fp.read(1):
+                # pyarrow fails on empty files while there are simply no records to read
+                return
+            fp.seek(data_offset)
+
+            invalid_rows: List[pa_csv.InvalidRow] = []
+
+            def _handle_invalid_row(invalid_row: pa_csv.InvalidRow) -> str:
+                invalid_rows.append(invalid_row)
+                return "error"
+
+            # The last column of duplicated headers is kept at the position of the first one like in the rows of `csv.DictReader`
+            column_index_by_name: Dict[str, int] = {}
+            for index, header in enumerate(headers):
+                column_index_by_name[header] = index
+
+            try:
+                # The first block is read when the reader is opened
+                reader = pa_csv.open_csv(
+                    fp,
+                    read_options=pa_csv.ReadOptions(
+                        use_threads=False, block_size=self._block_size, column_names=headers
+                    ),
+                    parse_options=pa_csv.ParseOptions(
+                        delimiter=config_format.delimiter,
+                        quote_char=config_format.quote_char,
+                        double_quote=config_format.double_quote,
+                        newlines_in_values=True,
+                        invalid_row_handler=_handle_invalid_row,
+                    ),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={header: pa.string() for header in headers},
+                        null_values=[],
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False,
+                    ),
+                )
+                for batch in reader:
+                    yield self._to_records(
+                        batch,
+                        column_index_by_name,
+                        deduped_property_types,
+                        cast,
+                        config_format,
+                        logger,
+                    )
+            except pa.ArrowInvalid as error:
+                if invalid_rows:
+                    invalid_row = invalid_rows[0]
+                    raise RecordParseError(
+                        FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS
+                        if invalid_row.actual_columns > invalid_row.expected_columns
+                        else FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS,
+                        filename=file.uri,
+                        lineno=rows_to_skip + (invalid_row.number or 0),
+                    ) from error
+                raise RecordParseError(
+                    FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri
+                ) from error
+
+    def _read_headers(
+        self, config: FileBasedStreamConfig, fp: IOBase, config_format: CsvFormat
+    ) -> Tuple[List[str], int, int]:
+        """
+        Read the headers and skip the rows before the data like `_CsvReader.read_data`. Return the headers, the number of lines skipped
+        and the offset of the data in bytes.
+        """
+        has_byte_order_mark = fp.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8
+        fp.seek(0)
+        # Line endings are not translated so that the length of the skipped lines in bytes can be computed
+        text_fp = io.TextIOWrapper(fp, encoding=config_format.encoding, newline="")  # type: ignore[type-var]  # fp is a binary file
+        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
+        csv.register_dialect(
+            dialect_name,
+            delimiter=config_format.delimiter,
+            quotechar=config_format.quote_char,
+            escapechar=config_format.escape_char,
+            doublequote=config_format.double_quote,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        try:
+            try:
+                headers = self._get_headers(text_fp, config_format, dialect_name)  # type: ignore[arg-type]  # TextIOWrapper is an IOBase
+            except UnicodeError:
+                raise AirbyteTracedException(
+                    message=f"{FileBasedSourceError.ENCODING_ERROR.value} Expected encoding: {config_format.encoding}",
+                )
+            except csv.Error as error:
+                raise _UnsupportedCsvFile(f"The headers could not be read: {error}")
+
+            rows_to_skip = (
+                config_format.skip_rows_before_header
+                + (1 if config_format.header_definition.has_header_row() else 0)
+                + config_format.skip_rows_after_header
+            )
+            data_offset = (
+                len(codecs.BOM_UTF8)
+                if has_byte_order_mark and codecs.lookup(text_fp.encoding).name == "utf-8-sig"
+                else 0
+            )
+            for _ in range(rows_to_skip):
+                data_offset += len(text_fp.readline().encode("utf-8"))
+        finally:
+            csv.unregister_dialect(dialect_name)
+            text_fp.detach()
+
+        if isinstance(config_format.header_definition, CsvHeaderFromCsv):
+            headers = [_to_universal_newlines(header) for header in headers]
+        return headers, rows_to_skip, data_offset
+
+    def _to_records(
+        self,
+        batch: pa.RecordBatch,
+        column_index_by_name: Mapping[str, int],
+        deduped_property_types: Mapping[str, str],
+        cast: bool,
+        config_format: CsvFormat,
+        logger: logging.Logger,
+    ) -> List[Dict[str, Any]]:
+        names = []
+        columns = []
+        warnings_per_row: Dict[int, List[str]] = defaultdict(list)
+        for name, index in column_index_by_name.items():
+            values = batch.column(index)
+            if pc.any(pc.match_substring(values, "\r")).as_py():
+                values = pc.replace_substring(
+                    pc.replace_substring(values, "\r\n", "\n"), "\r", "\n"
+                )
+            property_type = deduped_property_types.get(name)
+            if cast and property_type not in TYPE_PYTHON_MAPPING:
+                continue
+            names.append(name)
+            if cast and property_type and property_type != "string":
+                columns.append(
+                    self._cast_column(name, values, property_type, config_format, warnings_per_row)
+                )
+            else:
+                columns.append(
+                    self._to_nullable_strings(
+                        values,
+                        config_format.null_values
+                        if config_format.strings_can_be_null or property_type != "string"
+                        else set(),
+                    )
+                )
+
+        for row_index in sorted(warnings_per_row):
+            logger.warning(
+                f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_per_row[row_index])}",
+            )
+        if not columns:
+            return [{} for _ in range(batch.num_rows)]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def _cast_column(
+        self,
+        name: str,
+        values: pa.StringArray,
+        property_type: str,
+        config_format: CsvFormat,
+        warnings_per_row: Dict[int, List[str]],
+    ) -> List[Any]:
+        _, python_type = TYPE_PYTHON_MAPPING[property_type]
+        converted = self._cast_column_with_pyarrow(values, python_type, config_format)
+        if converted is not None:
+            # Converted values are never null values as those are strings
+            return converted
+
+        column = _to_python_list(values)
+        for row_index, value in enumerate(column):
+            try:
+                column[row_index] = _cast_value(value, python_type, config_format)
+            except ValueError:
+                warnings_per_row[row_index].append(_format_warning(name, value, property_type))
+                if value in config_format.null_values:
+                    column[row_index] = None
+        return column
+
+    def _cast_column_with_pyarrow(
+        self, values: pa.StringArray, python_type: Optional[type], config_format: CsvFormat
+    ) -> Optional[List[Any]]:
+        """
+        Convert the values with pyarrow if every value converts like with `_cast_value`. Return None otherwise.
+        """
+        if python_type is bool:
+            is_true = pc.is_in(values, value_set=pa.array(config_format.true_values, pa.string()))
+            is_false = pc.is_in(values, value_set=pa.array(config_format.false_values, pa.string()))
+            if pc.all(pc.or_(is_true, is_false)).as_py():
+                return _to_python_list(is_true)
+        elif python_type is int:
+            # pyarrow also parses hexadecimal integers which python's `int` does not
+            if pc.all(pc.match_substring_regex(values, self._INTEGER_PATTERN)).as_py():
+                try:
+                    return _to_python_list(pc.cast(values, pa.int64()))
+                except pa.ArrowInvalid:
+                    # The integers that don't fit in 64 bits
+                    pass
+        elif python_type is float:
+            if pc.all(pc.match_substring_regex(values, self._NUMBER_PATTERN)).as_py():
+                return _to_python_list(pc.cast(values, pa.float64()))
+        return None
+
+    @staticmethod
+    def _to_nullable_strings(values: pa.StringArray, null_values: Set[str]) -> List[Any]:
+        if null_values:
+            is_null = pc.is_in(values, value_set=pa.array(null_values, pa.string()))
+            values = pc.if_else(is_null, pa.scalar(None, pa.string()), values)
+        return _to_python_list(values)
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None, csv_field_max_bytes: int = 2**31):
+    def __init__(
+        self,
+        csv_reader: Optional[_CsvReader] = None,
+        csv_field_max_bytes: int = 2**31,
+        use_columnar_reader: bool = False,
+        columnar_block_size: int = DEFAULT_COLUMNAR_BLOCK_SIZE,
+    ):
+        """
+        :param use_columnar_reader: Read the records of every stream with pyarrow and convert them column by column when the format of
+        the stream allows it, even if `use_columnar_reader` is not set in the format. The records are the same as the ones read without
+        it. See `_ColumnarCsvReader` for the formats it does not support
+        :param columnar_block_size: The number of bytes of the file converted to records at once by the columnar reader. A row can't
+        be larger than a block
+        """
         # Increase the maximum length of data that can be parsed in a single CSV field. The default is 128k, which is typically sufficient
         # but given the use of Airbyte in loading a large variety of data it is best to allow for a larger maximum field size to avoid
         # skipping data on load. https://stackoverflow.com/questions/15063936/csv-error-field-larger-than-field-limit-131072
         csv.field_size_limit(csv_field_max_bytes)
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._use_columnar_reader = use_columnar_reader
+        self._columnar_csv_reader = _ColumnarCsvReader(columnar_block_size)
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -233,26 +541,47 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
+            cast = bool(deduped_property_types) and not config.schemaless
+            if (
+                self._use_columnar_reader or config_format.use_columnar_reader
+            ) and self._columnar_csv_reader.is_supported(
+                config_format, deduped_property_types, cast
+            ):
+                batches = self._columnar_csv_reader.read_records(
+                    config, file, stream_reader, logger, deduped_property_types, cast
+                )
+                try:
+                    for batch in batches:
+                        for record in batch:
+                            line_no += 1
+                            yield record
+                    return
+                except _UnsupportedCsvFile as error:
+                    logger.debug(f"Reading {file.uri} without the columnar reader: {error}")
+                finally:
+                    batches.close()
+
             cast_fn = CsvParser._get_cast_function(
                 deduped_property_types, config_format, logger, config.schemaless
             )
             data_generator = self._csv_reader.read_data(
                 config, file, stream_reader, logger, self.file_read_mode
             )
-            for row in data_generator:
-                line_no += 1
-                yield CsvParser._to_nullable(
-                    cast_fn(row),
-                    deduped_property_types,
-                    config_format.null_values,
-                    config_format.strings_can_be_null,
-                )
+            try:
+                for row in data_generator:
+                    line_no += 1
+                    yield CsvParser._to_nullable(
+                        cast_fn(row),
+                        deduped_property_types,
+                        config_format.null_values,
+                        config_format.strings_can_be_null,
+                    )
+            finally:
+                data_generator.close()
         except RecordParseError as parse_err:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no
             ) from parse_err
-        finally:
-            data_generator.close()
 
     @property
     def file_read_mode(self) -> FileReadMode:
@@ -356,39 +685,10 @@ class CsvParser(FileTypeParser):
 
             if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
                 _, python_type = TYPE_PYTHON_MAPPING[prop_type]
-
-                if python_type is None:
-                    if value == "":
-                        cast_value = None
-                    else:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type is bool:
-                    try:
-                        cast_value = _value_to_bool(
-                            value, config_format.true_values, config_format.false_values
-                        )
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type is dict:
-                    try:
-                        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
-                        cast_value = orjson.loads(value)
-                    except orjson.JSONDecodeError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type is list:
-                    try:
-                        cast_value = _value_to_list(value)
-                    except (ValueError, json.JSONDecodeError):
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type:
-                    try:
-                        cast_value = _value_to_python_type(value, python_type)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
+                try:
+                    cast_value = _cast_value(value, python_type, config_format)
+                except ValueError:
+                    warnings.append(_format_warning(key, value, prop_type))
 
                 result[key] = cast_value
 
@@ -493,6 +793,24 @@ class _JsonTypeInferrer(_TypeInferrer):
             return False
 
 
+def _cast_value(value: str, python_type: Optional[type], config_format: CsvFormat) -> Any:
+    """
+    Cast a value to the python type of its column. Raise ValueError if the value can't be cast.
+    """
+    if python_type is None:
+        if value == "":
+            return None
+        raise ValueError(f"Value {value} is not a valid null value")
+    if python_type is bool:
+        return _value_to_bool(value, config_format.true_values, config_format.false_values)
+    if python_type is dict:
+        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
+        return orjson.loads(value)
+    if python_type is list:
+        return _value_to_list(value)
+    return _value_to_python_type(value, python_type)
+
+
 def _value_to_bool(value: str, true_values: Set[str], false_values: Set[str]) -> bool:
     if value in true_values:
         return True
@@ -516,6 +834,21 @@ def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
 
+def _to_python_list(values: pa.Array) -> List[Any]:
+    """
+    Convert the values of an array to python objects. This is much faster than `pa.Array.to_pylist` but null values are only converted
+    to None for arrays of strings.
+    """
+    return values.to_numpy(zero_copy_only=False).tolist()  # type: ignore[no-any-return]
+
+
+def _to_universal_newlines(value: str) -> str:
+    """
+    Translate line endings like files opened in text mode do.
+    """
+    return value.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def _no_cast(row: Mapping[str, str]) -> Mapping[str, str]:
     return row
 
@@ -5,7 +5,7 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -29,10 +29,21 @@ from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeP
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 
+DEFAULT_BATCH_SIZE = 10_000
+
 
 class ParquetParser(FileTypeParser):
     ENCODING = None
 
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        :param batch_size: The maximum number of rows read from the file and converted to records at once. This bounds the memory used
+        while parsing a file regardless of the size of its row groups
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self._batch_size = batch_size
+
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
         ParquetParser does not require config checks, implicit pydantic validation is enough.
@@ -82,32 +93,41 @@ class ParquetParser(FileTypeParser):
             raise ConfigValidationError(FileBasedSourceError.CONFIG_VALIDATION_ERROR)
 
         line_no = 0
+        batch_index = 0
         try:
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 reader = pq.ParquetFile(fp)
                 partition_columns = {
                     x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)
                 }
-                for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
+                for batch_index, batch in enumerate(
+                    reader.iter_batches(batch_size=self._batch_size)
+                ):
+                    for record in ParquetParser._record_batch_to_records(batch, parquet_format):
                         line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(
-                                    batch.column(column)[row], parquet_format
-                                )
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                        record.update(partition_columns)
+                        yield record
         except Exception as exc:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD,
                 filename=file.uri,
-                lineno=f"{row_group=}, {line_no=}",
+                lineno=f"{batch_index=}, {line_no=}",
             ) from exc
 
+    @staticmethod
+    def _record_batch_to_records(
+        batch: pa.RecordBatch, parquet_format: ParquetFormat
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Convert a record batch to records by converting each column to python values at once instead of converting one cell at a time.
+        """
+        column_names = batch.schema.names
+        columns = [
+            ParquetParser._array_to_python_values(column, parquet_format)
+            for column in batch.columns
+        ]
+        return (dict(zip(column_names, row)) for row in zip(*columns))
+
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
         return [unquote(partition) for partition in filepath.split(os.sep) if "=" in partition]
@@ -128,58 +148,91 @@ class ParquetParser(FileTypeParser):
         else:
             return ParquetParser._scalar_to_python_value(parquet_value, parquet_format)
 
+    @staticmethod
+    def _array_to_python_values(
+        parquet_array: pa.Array, parquet_format: ParquetFormat
+    ) -> List[Any]:
+        """
+        Convert all the entries of a pyarrow array to values that can be output by the source. The result is the same as calling
+        `_scalar_to_python_value` on each entry.
+        """
+        parquet_type = parquet_array.type
+        if parquet_array.null_count == 0 and (
+            pa.types.is_boolean(parquet_type)
+            or pa.types.is_integer(parquet_type)
+            or pa.types.is_floating(parquet_type)
+        ):
+            # Without nulls, numpy holds the exact same values and converts them to python objects much faster than pyarrow scalars
+            return parquet_array.to_numpy(zero_copy_only=False).tolist()  # type: ignore[no-any-return]
+
+        values: List[Any] = parquet_array.to_pylist()
+        converter = ParquetParser._python_value_converter(parquet_type, parquet_format)
+        if converter is None:
+            return values
+        return [None if value is None else converter(value) for value in values]
+
     @staticmethod
     def _scalar_to_python_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        if parquet_value.as_py() is None:
+        value = parquet_value.as_py()
+        if value is None:
             return None
+        converter = ParquetParser._python_value_converter(parquet_value.type, parquet_format)
+        return value if converter is None else converter(value)
 
+    @staticmethod
+    def _python_value_converter(
+        parquet_type: pa.DataType, parquet_format: ParquetFormat
+    ) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting a non-null python value of the given pyarrow type to a value that can be output by the source
+        or None if the value can be output as is.
+        """
         # Convert date and datetime objects to isoformat strings
         if (
-            pa.types.is_time(parquet_value.type)
-            or pa.types.is_timestamp(parquet_value.type)
-            or pa.types.is_date(parquet_value.type)
+            pa.types.is_time(parquet_type)
+            or pa.types.is_timestamp(parquet_type)
+            or pa.types.is_date(parquet_type)
         ):
-            return parquet_value.as_py().isoformat()
+            return lambda value: value.isoformat()
 
         # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
 
         # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
 
-        if pa.types.is_decimal(parquet_value.type):
+        if pa.types.is_decimal(parquet_type):
             if parquet_format.decimal_as_float:
-                return float(parquet_value.as_py())
+                return float
             else:
-                return str(parquet_value.as_py())
+                return str
 
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
 
-        if pa.types.is_null(parquet_value.type):
-            return None
+        if pa.types.is_null(parquet_type):
+            return lambda value: None
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            if parquet_type.unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif parquet_type.unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif parquet_type.unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif parquet_type.unit == "ns":
+                return (
+                    lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
+                )
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
-        else:
-            return parquet_value.as_py()
+                raise ValueError(f"Unknown duration unit: {parquet_type.unit}")
+        return None
 
     @staticmethod
     def _dictionary_array_to_python_value(parquet_value: DictionaryArray) -> Dict[str, Any]:
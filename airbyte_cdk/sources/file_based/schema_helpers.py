@@ -6,7 +6,20 @@ import json
 from copy import deepcopy
 from enum import Enum
 from functools import total_ordering
-from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from airbyte_cdk.sources.file_based.exceptions import (
     ConfigValidationError,
@@ -198,32 +211,149 @@ def conforms_to_schema(record: Mapping[str, Any], schema: Mapping[str, Any]) ->
     - All columns in the record are in the schema.
     - For every column in the record, that column's type is equal to or narrower than the same column's
       type in the schema.
+
+    Pass a `SchemaValidator` as the schema to validate many records against the same schema.
     """
-    schema_columns = set(schema.get("properties", {}).keys())
-    record_columns = set(record.keys())
+    validator = schema if isinstance(schema, SchemaValidator) else SchemaValidator(schema)
+    return validator.get_invalid_column(record) is None
+
+
+# The python types of the values of each type, ordered like the comparable types
+_PYTHON_TYPES_BY_COMPARABLE_TYPE: Mapping[ComparableType, Type[Any]] = {
+    ComparableType.NULL: type(None),
+    ComparableType.BOOLEAN: bool,
+    ComparableType.INTEGER: int,
+    ComparableType.NUMBER: float,
+    ComparableType.STRING: str,
+    ComparableType.OBJECT: dict,
+}
+_KNOWN_PYTHON_TYPES = frozenset(_PYTHON_TYPES_BY_COMPARABLE_TYPE.values()) | {list}
 
-    if not record_columns.issubset(schema_columns):
-        return False
 
-    for column, definition in schema.get("properties", {}).items():
-        expected_type = definition.get("type")
-        value = record.get(column)
+class SchemaValidator(Mapping[str, Any]):
+    """
+    A schema compiled to check that records conform to it like `conforms_to_schema` does. The types accepted by each column are computed
+    once, when the first record is validated, so that validating a record only looks up the type of each of its values.
+
+    The validator is also a read-only view of the schema so that it can be passed wherever the schema is expected.
+    """
+
+    def __init__(self, schema: Mapping[str, Any]) -> None:
+        self._schema = schema
+        self._accepted_types_per_column: Optional[Dict[str, FrozenSet[Type[Any]]]] = None
+        self._validators_per_column: Dict[str, Callable[[Any], bool]] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._schema[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema)
+
+    def __len__(self) -> int:
+        return len(self._schema)
+
+    def get_invalid_column(self, record: Mapping[str, Any]) -> Optional[str]:
+        """
+        Return the first column of the record that is not in the schema or whose value's type is wider than the type of the column, or
+        None if the record conforms to the schema.
+        """
+        accepted_types_per_column = self._accepted_types_per_column
+        if accepted_types_per_column is None:
+            accepted_types_per_column = self._compile()
+        validators_per_column = self._validators_per_column
+        for column, value in record.items():
+            accepted_types = accepted_types_per_column.get(column)
+            if accepted_types is not None:
+                if type(value) not in accepted_types and not _is_subclass_of_accepted_type(
+                    value, accepted_types
+                ):
+                    return column
+                continue
+            validator = validators_per_column.get(column)
+            if validator is None or (value is not None and not validator(value)):
+                return column
+        return None
 
-        if value is not None:
-            if isinstance(expected_type, list):
-                return any(is_equal_or_narrower_type(value, e) for e in expected_type)
-            elif expected_type == "object":
-                return isinstance(value, dict)
+    def _compile(self) -> Dict[str, FrozenSet[Type[Any]]]:
+        """
+        Compute the types accepted by the columns. Records may be validated from several threads: the compiled columns are only published
+        once they are complete.
+        """
+        accepted_types_per_column: Dict[str, FrozenSet[Type[Any]]] = {}
+        validators_per_column: Dict[str, Callable[[Any], bool]] = {}
+        for column, definition in self._schema.get("properties", {}).items():
+            expected_type = definition.get("type")
+            if expected_type == "object":
+                validators_per_column[column] = _is_object
             elif expected_type == "array":
-                if not isinstance(value, list):
-                    return False
-                array_type = definition.get("items", {}).get("type")
-                if not all(is_equal_or_narrower_type(v, array_type) for v in value):
-                    return False
-            elif not is_equal_or_narrower_type(value, expected_type):
-                return False
-
-    return True
+                items = definition.get("items")
+                items_type = items.get("type") if isinstance(items, Mapping) else None
+                validators_per_column[column] = _get_array_validator(
+                    _get_accepted_types(items_type) if items_type is not None else None
+                )
+            else:
+                # Null values conform to every column
+                accepted_types_per_column[column] = _get_accepted_types(expected_type) | {
+                    type(None)
+                }
+        self._validators_per_column = validators_per_column
+        self._accepted_types_per_column = accepted_types_per_column
+        return accepted_types_per_column
+
+
+def _get_accepted_types(expected_type: Any) -> FrozenSet[Type[Any]]:
+    """
+    The python types of the values whose type is equal to or narrower than the expected type.
+    """
+    if isinstance(expected_type, list):
+        return frozenset().union(*(_get_accepted_types(member) for member in expected_type))
+    if expected_type == "array":
+        return frozenset({list})
+    comparable_type = get_comparable_type(expected_type)
+    if comparable_type is None:
+        return frozenset()
+    return frozenset(
+        python_type
+        for value_type, python_type in _PYTHON_TYPES_BY_COMPARABLE_TYPE.items()
+        if value_type <= comparable_type
+    )
+
+
+def _is_subclass_of_accepted_type(value: Any, accepted_types: FrozenSet[Type[Any]]) -> bool:
+    """
+    Values of subclasses of the known types, like enums of strings, are compared like the values of their base type.
+    """
+    if type(value) in _KNOWN_PYTHON_TYPES:
+        return False
+    if isinstance(value, list):
+        return list in accepted_types
+    inferred_type = get_inferred_type(value)
+    return (
+        inferred_type is not None
+        and _PYTHON_TYPES_BY_COMPARABLE_TYPE[inferred_type] in accepted_types
+    )
+
+
+def _is_object(value: Any) -> bool:
+    return isinstance(value, dict)
+
+
+def _get_array_validator(
+    accepted_item_types: Optional[FrozenSet[Type[Any]]],
+) -> Callable[[Any], bool]:
+    if accepted_item_types is None:
+        return lambda value: isinstance(value, list)
+    # Null items conform to every array
+    accepted_item_types = accepted_item_types | {type(None)}
+
+    def _is_valid_array(value: Any) -> bool:
+        return isinstance(value, list) and all(
+            type(item) in accepted_item_types
+            or _is_subclass_of_accepted_type(item, accepted_item_types)
+            for item in value
+        )
+
+    return _is_valid_array
 
 
 def _parse_json_input(input_schema: Union[str, Mapping[str, str]]) -> Optional[Mapping[str, str]]:
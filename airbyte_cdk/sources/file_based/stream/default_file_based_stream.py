@@ -7,9 +7,22 @@ import itertools
 import traceback
 from collections import defaultdict
 from copy import deepcopy
-from functools import cache
+from functools import cache, cached_property, partial
 from os import path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteStream, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
@@ -24,15 +37,18 @@ from airbyte_cdk.sources.file_based.exceptions import (
     StopSyncPerValidationPolicy,
 )
 from airbyte_cdk.sources.file_based.file_types import FileTransfer
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import (
     SchemaType,
+    SchemaValidator,
     file_transfer_schema,
     merge_schemas,
     schemaless_schema,
 )
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.file_read_ahead import FileReadAhead
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams import IncrementalMixin
 from airbyte_cdk.sources.streams.core import JsonSchema
@@ -47,6 +63,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
     FILE_TRANSFER_KW = "use_file_transfer"
     PRESERVE_DIRECTORY_STRUCTURE_KW = "preserve_directory_structure"
+    MAX_CONCURRENT_FILE_READS_KW = "max_concurrent_file_reads"
     FILES_KEY = "files"
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
     ab_last_mod_col = "_ab_source_file_last_modified"
@@ -56,6 +73,8 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     airbyte_columns = [ab_last_mod_col, ab_file_name_col]
     use_file_transfer = False
     preserve_directory_structure = True
+    # The number of files of a slice read at the same time. Files read concurrently are still emitted and added to the cursor in order
+    max_concurrent_file_reads = 1
     _file_transfer = FileTransfer()
 
     def __init__(self, **kwargs: Any):
@@ -65,6 +84,8 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             self.preserve_directory_structure = kwargs.pop(
                 self.PRESERVE_DIRECTORY_STRUCTURE_KW, True
             )
+        if self.MAX_CONCURRENT_FILE_READS_KW in kwargs:
+            self.max_concurrent_file_reads = kwargs.pop(self.MAX_CONCURRENT_FILE_READS_KW, 1)
         super().__init__(**kwargs)
 
     @property
@@ -88,6 +109,22 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             )
         self._cursor = value
 
+    @cached_property
+    def schema_validator(self) -> Optional[SchemaValidator]:
+        """
+        The catalog schema compiled once to validate the records of the stream.
+        """
+        if not isinstance(self.catalog_schema, Mapping):
+            return None
+        return SchemaValidator(self.catalog_schema)
+
+    def record_passes_validation_policy(self, record: Mapping[str, Any]) -> bool:
+        if self.validation_policy and self.schema_validator is not None:
+            return self.validation_policy.record_passes_validation_policy(
+                record=record, schema=self.schema_validator
+            )
+        return super().record_passes_validation_policy(record)
+
     @property
     def primary_key(self) -> PrimaryKeyType:
         return self.config.primary_key or self.get_parser().get_parser_defined_primary_key(
@@ -144,29 +181,61 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
-        for file in stream_slice["files"]:
+        files_to_read = self._read_files(stream_slice["files"], parser, schema)
+        try:
+            yield from self._read_records_from_files(files_to_read)
+        finally:
+            files_to_read.close()
+
+    def _read_files(
+        self, files: List[RemoteFile], parser: FileTypeParser, schema: Mapping[str, Any]
+    ) -> Generator[Tuple[RemoteFile, Iterator[Any]], None, None]:
+        """
+        Yield each file with its records or, for file transfers, its uploaded files. Files are read lazily, one after the other, unless
+        several files can be read at the same time.
+        """
+        read_file = partial(self._read_file, parser=parser, schema=schema)
+        if self.max_concurrent_file_reads > 1 and len(files) > 1:
+            yield from FileReadAhead(read_file, self.max_concurrent_file_reads).read(files)
+        else:
+            for file in files:
+                yield file, iter(read_file(file))
+
+    def _read_file(
+        self, file: RemoteFile, parser: FileTypeParser, schema: Mapping[str, Any]
+    ) -> Iterable[Any]:
+        if self.use_file_transfer:
+            yield from self._file_transfer.upload(
+                file=file, stream_reader=self.stream_reader, logger=self.logger
+            )
+        else:
+            yield from parser.parse_records(
+                self.config, file, self.stream_reader, self.logger, schema
+            )
+
+    def _read_records_from_files(
+        self, files_to_read: Iterable[Tuple[RemoteFile, Iterator[Any]]]
+    ) -> Iterable[AirbyteMessage]:
+        for file, file_items in files_to_read:
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
             n_skipped = line_no = 0
+            invalid_columns: Set[str] = set()
 
             try:
                 if self.use_file_transfer:
-                    for file_record_data, file_reference in self._file_transfer.upload(
-                        file=file, stream_reader=self.stream_reader, logger=self.logger
-                    ):
+                    for file_record_data, file_reference in file_items:
                         yield stream_data_to_airbyte_message(
                             self.name,
                             file_record_data.dict(exclude_none=True),
                             file_reference=file_reference,
                         )
                 else:
-                    for record in parser.parse_records(
-                        self.config, file, self.stream_reader, self.logger, schema
-                    ):
+                    for record in file_items:
                         line_no += 1
                         if self.config.schemaless:
                             record = {"data": record}
-                        elif not self.record_passes_validation_policy(record):
+                        elif not self._record_passes_validation_policy(record, invalid_columns):
                             n_skipped += 1
                             continue
                         record = self.transform_record(record, file, file_datetime_string)
@@ -178,7 +247,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                     type=MessageType.LOG,
                     log=AirbyteLogMessage(
                         level=Level.WARN,
-                        message=f"Stopping sync in accordance with the configured validation policy. Records in file did not conform to the schema. stream={self.name} file={file.uri} validation_policy={self.config.validation_policy.value} n_skipped={n_skipped}",
+                        message=f"Stopping sync in accordance with the configured validation policy. Records in file did not conform to the schema. stream={self.name} file={file.uri} validation_policy={self.config.validation_policy.value} n_skipped={n_skipped}{self._format_invalid_columns(invalid_columns)}",
                     ),
                 )
                 break
@@ -217,10 +286,37 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         type=MessageType.LOG,
                         log=AirbyteLogMessage(
                             level=Level.WARN,
-                            message=f"Records in file did not pass validation policy. stream={self.name} file={file.uri} n_skipped={n_skipped} validation_policy={self.validation_policy.name}",
+                            message=f"Records in file did not pass validation policy. stream={self.name} file={file.uri} n_skipped={n_skipped} validation_policy={self.validation_policy.name}{self._format_invalid_columns(invalid_columns)}",
                         ),
                     )
 
+    def _record_passes_validation_policy(
+        self, record: Mapping[str, Any], invalid_columns: Set[str]
+    ) -> bool:
+        """
+        Check the record against the validation policy and collect the column that made it fail, if any, for diagnostics.
+        """
+        try:
+            passes_validation_policy = self.record_passes_validation_policy(record)
+        except StopSyncPerValidationPolicy:
+            self._collect_invalid_column(record, invalid_columns)
+            raise
+        if not passes_validation_policy:
+            self._collect_invalid_column(record, invalid_columns)
+        return passes_validation_policy
+
+    def _collect_invalid_column(self, record: Mapping[str, Any], invalid_columns: Set[str]) -> None:
+        # Only records that do not pass the validation policy are validated again so that valid records are validated once
+        invalid_column = (
+            self.schema_validator.get_invalid_column(record) if self.schema_validator else None
+        )
+        if invalid_column is not None:
+            invalid_columns.add(invalid_column)
+
+    @staticmethod
+    def _format_invalid_columns(invalid_columns: Set[str]) -> str:
+        return f" invalid_columns={','.join(sorted(invalid_columns))}" if invalid_columns else ""
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
@@ -0,0 +1,182 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable,
+    Deque,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+T = TypeVar("T")
+
+
+class _EndOfFile:
+    pass
+
+
+_END_OF_FILE = _EndOfFile()
+
+
+class _FileBuffer(Generic[T]):
+    """
+    The items read from a file waiting to be consumed. The thread reading the file waits while the buffer is full.
+    """
+
+    def __init__(self, max_chunks: int) -> None:
+        self._chunks: Deque[Union[List[T], Exception, _EndOfFile]] = deque()
+        self._max_chunks = max_chunks
+        self._condition = threading.Condition()
+        self._is_cancelled = False
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def put(self, chunk: List[T]) -> bool:
+        """
+        Wait for space in the buffer and add the chunk. Return False if the buffer was cancelled and the file should not be read anymore.
+        """
+        with self._condition:
+            while len(self._chunks) >= self._max_chunks and not self._is_cancelled:
+                self._condition.wait()
+            if self._is_cancelled:
+                return False
+            self._chunks.append(chunk)
+            self._condition.notify_all()
+            return True
+
+    def finish(self, chunk: List[T], exception: Optional[Exception] = None) -> None:
+        """
+        Add the last chunk of the file followed by the exception that stopped the read, if any, without waiting for space in the buffer.
+        """
+        with self._condition:
+            if self._is_cancelled:
+                return
+            if chunk:
+                self._chunks.append(chunk)
+            self._chunks.append(exception if exception else _END_OF_FILE)
+            self._condition.notify_all()
+
+    def cancel(self) -> None:
+        with self._condition:
+            self._is_cancelled = True
+            self._chunks.clear()
+            self._condition.notify_all()
+
+    def items(self) -> Iterator[T]:
+        """
+        Yield the items of the file as they are read and raise the exception that stopped the read, if any.
+        """
+        while True:
+            with self._condition:
+                while not self._chunks:
+                    self._condition.wait()
+                chunk = self._chunks.popleft()
+                self._condition.notify_all()
+            if isinstance(chunk, _EndOfFile):
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield from chunk
+
+
+class FileReadAhead(Generic[T]):
+    """
+    Reads the next files of a slice in threads while the items of the current file are consumed so that files that are slow to download
+    or to parse are read concurrently instead of one after the other.
+
+    Each file is read by a single thread and its items are returned in order, file after file, so the files are consumed exactly like
+    when they are read sequentially: an exception raised while reading a file is raised when the items of that file are consumed, after
+    the items read before it. At most `max_concurrent_files` files are read at a time, including the file being consumed, and a file
+    holds at most `max_buffered_items` items in memory until it is consumed.
+    """
+
+    _CHUNK_SIZE = 100
+
+    def __init__(
+        self,
+        read_file: Callable[[RemoteFile], Iterable[T]],
+        max_concurrent_files: int,
+        max_buffered_items: int = 10_000,
+    ) -> None:
+        """
+        :param read_file: Reads the items of a file. It is called from multiple threads at the same time
+        :param max_concurrent_files: The maximum number of files read at the same time
+        :param max_buffered_items: The maximum number of items read from a file before they are consumed
+        """
+        if max_concurrent_files < 1:
+            raise ValueError(
+                f"max_concurrent_files must be a positive integer but was {max_concurrent_files}"
+            )
+        if max_buffered_items < 1:
+            raise ValueError(
+                f"max_buffered_items must be a positive integer but was {max_buffered_items}"
+            )
+        self._read_file = read_file
+        self._max_concurrent_files = max_concurrent_files
+        self._chunk_size = min(self._CHUNK_SIZE, max_buffered_items)
+        self._max_chunks = max_buffered_items // self._chunk_size
+
+    def read(
+        self, files: Iterable[RemoteFile]
+    ) -> Generator[Tuple[RemoteFile, Iterator[T]], None, None]:
+        """
+        Yield each file with an iterator over its items. The items of a file have to be consumed before the next file is requested: the
+        items that were not consumed are discarded then. Closing the generator stops reading the files.
+        """
+        files_to_read = iter(files)
+        pending_files: Deque[Tuple[RemoteFile, _FileBuffer[T]]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self._max_concurrent_files, thread_name_prefix="file_read_ahead"
+        ) as executor:
+            try:
+                while True:
+                    while len(pending_files) < self._max_concurrent_files:
+                        file = next(files_to_read, None)
+                        if file is None:
+                            break
+                        buffer: _FileBuffer[T] = _FileBuffer(self._max_chunks)
+                        executor.submit(self._read, file, buffer)
+                        pending_files.append((file, buffer))
+                    if not pending_files:
+                        return
+
+                    file, buffer = pending_files.popleft()
+                    try:
+                        yield file, buffer.items()
+                    finally:
+                        buffer.cancel()
+            finally:
+                # Let the threads still reading files stop before the executor waits for them
+                for _, buffer in pending_files:
+                    buffer.cancel()
+
+    def _read(self, file: RemoteFile, buffer: _FileBuffer[T]) -> None:
+        if buffer.is_cancelled:
+            return
+        chunk: List[T] = []
+        try:
+            for item in self._read_file(file):
+                chunk.append(item)
+                if len(chunk) >= self._chunk_size:
+                    if not buffer.put(chunk):
+                        return
+                    chunk = []
+        except Exception as exception:
+            buffer.finish(chunk, exception)
+            return
+        buffer.finish(chunk)
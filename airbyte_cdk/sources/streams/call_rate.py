@@ -8,9 +8,11 @@ import datetime
 import logging
 import re
 import time
+from collections import deque
 from datetime import timedelta
-from threading import RLock
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from functools import lru_cache
+from threading import Condition, Lock, RLock
+from typing import TYPE_CHECKING, Any, Deque, List, Mapping, Optional
 from urllib import parse
 
 import requests
@@ -159,6 +161,8 @@ class HttpRequestRegexMatcher(RequestMatcher):
       - Headers (header names compared case-insensitively)
     """
 
+    _URL_CACHE_SIZE = 1024
+
     def __init__(
         self,
         method: Optional[str] = None,
@@ -182,6 +186,12 @@ class HttpRequestRegexMatcher(RequestMatcher):
         # Compile the URL path pattern if provided.
         self._url_path_pattern = re.compile(url_path_pattern) if url_path_pattern else None
 
+        # The same paths are requested many times (pagination, retries, partitions) so the base and path checks are cached per path.
+        # The query is left out of the key as it changes with every page or cursor value.
+        self._matches_url_base_and_path = lru_cache(maxsize=self._URL_CACHE_SIZE)(
+            self._match_url_base_and_path
+        )
+
         # Normalize query parameters to strings.
         self._params = {str(k): str(v) for k, v in (params or {}).items()}
 
@@ -213,20 +223,10 @@ class HttpRequestRegexMatcher(RequestMatcher):
 
         # Parse the URL.
         parsed_url = parse.urlsplit(prepared_request.url)
-        # Reconstruct the base: scheme://netloc
-        request_url_base = f"{str(parsed_url.scheme)}://{str(parsed_url.netloc)}"
-        # The path (without query parameters)
-        request_path = str(parsed_url.path).rstrip("/")
-
-        # If a base URL is provided, check that it matches.
-        if self._url_base is not None:
-            if request_url_base != self._url_base:
-                return False
-
-        # If a URL path pattern is provided, ensure the path matches the regex.
-        if self._url_path_pattern is not None:
-            if not self._url_path_pattern.search(request_path):
-                return False
+        if not self._matches_url_base_and_path(
+            str(parsed_url.scheme), str(parsed_url.netloc), str(parsed_url.path)
+        ):
+            return False
 
         # Check query parameters.
         if self._params:
@@ -242,6 +242,24 @@ class HttpRequestRegexMatcher(RequestMatcher):
 
         return True
 
+    def _match_url_base_and_path(self, scheme: str, netloc: str, path: str) -> bool:
+        # Reconstruct the base: scheme://netloc
+        request_url_base = f"{scheme}://{netloc}"
+        # The path (without query parameters)
+        request_path = path.rstrip("/")
+
+        # If a base URL is provided, check that it matches.
+        if self._url_base is not None:
+            if request_url_base != self._url_base:
+                return False
+
+        # If a URL path pattern is provided, ensure the path matches the regex.
+        if self._url_path_pattern is not None:
+            if not self._url_path_pattern.search(request_path):
+                return False
+
+        return True
+
     def __str__(self) -> str:
         regex = self._url_path_pattern.pattern if self._url_path_pattern else None
         return (
@@ -475,6 +493,180 @@ class MovingWindowCallRatePolicy(BaseCallRatePolicy):
         )
 
 
+class SlidingWindowCallRatePolicy(BaseCallRatePolicy):
+    """
+    Policy with the same moving window semantics as MovingWindowCallRatePolicy implemented natively for threads sharing a budget.
+
+    The time of each call is kept in a ring buffer sized for the largest rate so that checking the rates does not depend on the
+    number of calls made. Threads blocked by `acquire` wait on a condition in the order they arrived and only the first one waits
+    for the window to move, the next one is woken up when it gets its call. This avoids threads waking up at the same time and
+    competing for the same call.
+    """
+
+    def __init__(self, rates: list[Rate], matchers: list[RequestMatcher]):
+        """Constructor
+
+        :param rates: list of rates, all of them must be respected
+        :param matchers:
+        """
+        if not rates:
+            raise ValueError("The list of rates can not be empty")
+        self._rates = [(rate.limit, rate.interval.total_seconds()) for rate in rates]
+        self._capacity = max(limit for limit, _ in self._rates)
+        self._call_times: List[float] = [0.0] * self._capacity
+        self._head = 0
+        self._size = 0
+        self._blocked_until = 0.0
+        self._lock = Lock()
+        self._waiters: Deque[Condition] = deque()
+        super().__init__(matchers=matchers)
+
+    def try_acquire(self, request: Any, weight: int) -> None:
+        self._validate(request, weight)
+        with self._lock:
+            now = time.monotonic()
+            # Do not take a call a waiting thread is waiting for
+            time_to_wait = self._time_to_wait(weight, now) if not self._waiters else None
+            if time_to_wait is not None and time_to_wait <= 0:
+                self._record_calls(weight, now)
+                return
+            raise self._rate_limit_hit(request, weight, now)
+
+    def acquire(self, request: Any, weight: int, timeout: Optional[float] = None) -> None:
+        """Block until the call is acquired. Threads get their calls in the order they called `acquire`.
+
+        :param request: a request object representing a single call to API
+        :param weight: number of requests to deduct from credit
+        :param timeout: if set, the maximum time to wait for the call in seconds
+        :raises: CallRateLimitHit - when the call could not be acquired before the timeout
+        """
+        self._validate(request, weight)
+        with self._lock:
+            now = time.monotonic()
+            deadline = now + timeout if timeout is not None else None
+            waiter = Condition(self._lock)
+            self._waiters.append(waiter)
+            try:
+                while True:
+                    time_to_wait: Optional[float] = None
+                    if self._waiters[0] is waiter:
+                        time_to_wait = self._time_to_wait(weight, now)
+                        if time_to_wait <= 0:
+                            self._record_calls(weight, now)
+                            return
+                    if deadline is not None:
+                        if now >= deadline:
+                            raise self._rate_limit_hit(request, weight, now)
+                        time_to_wait = (
+                            deadline - now
+                            if time_to_wait is None
+                            else min(time_to_wait, deadline - now)
+                        )
+                    waiter.wait(time_to_wait)
+                    now = time.monotonic()
+            finally:
+                self._waiters.remove(waiter)
+                if self._waiters:
+                    self._waiters[0].notify()
+
+    def update(
+        self, available_calls: Optional[int], call_reset_ts: Optional[datetime.datetime]
+    ) -> None:
+        """Adjust the calls to reflect the state of the API server. Like FixedWindowCallRatePolicy, only decreasing updates of the
+        available calls are applied so that the policy can be stricter than the API.
+
+        :param available_calls: the number of calls left in the window of the first rate
+        :param call_reset_ts: when the API will allow calls again if there are no calls left
+        """
+        if available_calls is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if available_calls == 0 and call_reset_ts is not None:
+                reset_in = (call_reset_ts - datetime.datetime.now()).total_seconds()
+                logger.debug("got rate limit update from api, no calls available for %ss", reset_in)
+                self._blocked_until = max(self._blocked_until, now + reset_in)
+            else:
+                limit, interval = self._rates[0]
+                current_available_calls = limit - self._count_calls(now - interval)
+                if available_calls < current_available_calls:
+                    logger.debug(
+                        "got rate limit update from api, adjusting available calls from %s to %s",
+                        current_available_calls,
+                        available_calls,
+                    )
+                    self._record_calls(current_available_calls - available_calls, now)
+            if self._waiters:
+                self._waiters[0].notify()
+
+    def _validate(self, request: Any, weight: int) -> None:
+        if weight > min(limit for limit, _ in self._rates):
+            raise ValueError("Weight can not exceed the call limit")
+        if not self.matches(request):
+            raise ValueError("Request does not match the policy")
+
+    def _time_to_wait(self, weight: int, now: float) -> float:
+        """
+        Return how long to wait before `weight` calls can be made without exceeding any rate.
+        """
+        return max(
+            self._blocked_until - now,
+            *(
+                self._time_to_wait_for_rate(limit, interval, weight, now)
+                for limit, interval in self._rates
+            ),
+        )
+
+    def _time_to_wait_for_rate(self, limit: int, interval: float, weight: int, now: float) -> float:
+        # The calls can be made if the (limit - weight + 1)th most recent call is out of the window
+        calls_back = limit - weight + 1
+        if calls_back > self._size:
+            return 0.0
+        return self._call_time(calls_back) + interval - now
+
+    def _call_time(self, calls_back: int) -> float:
+        return self._call_times[(self._head - calls_back) % self._capacity]
+
+    def _record_calls(self, weight: int, now: float) -> None:
+        for _ in range(weight):
+            self._call_times[self._head] = now
+            self._head = (self._head + 1) % self._capacity
+        self._size = min(self._size + weight, self._capacity)
+
+    def _count_calls(self, since: float) -> int:
+        # Call times are increasing so the number of calls after `since` is found by bisection
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._call_time(middle) > since:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def _rate_limit_hit(self, request: Any, weight: int, now: float) -> CallRateLimitHit:
+        limit, interval = max(
+            self._rates,
+            key=lambda rate: self._time_to_wait_for_rate(rate[0], rate[1], weight, now),
+        )
+        rate = f"{limit} per {timedelta(seconds=interval)}"
+        time_to_wait = timedelta(seconds=max(0.0, self._time_to_wait(weight, now)))
+        return CallRateLimitHit(
+            error=f"reached maximum number of allowed calls {rate}, next call available in {time_to_wait}.",
+            item=request,
+            weight=weight,
+            rate=rate,
+            time_to_wait=time_to_wait,
+        )
+
+    def __str__(self) -> str:
+        rates_info = ", ".join(
+            f"{limit} per {timedelta(seconds=interval)}" for limit, interval in self._rates
+        )
+        matcher_str = ", ".join(f"{matcher}" for matcher in self._matchers)
+        return f"SlidingWindowCallRatePolicy(rates=[{rates_info}], matchers=[{matcher_str}])"
+
+
 class AbstractAPIBudget(abc.ABC):
     """Interface to some API where a client allowed to have N calls per T interval.
 
@@ -563,13 +755,17 @@ class APIBudget(AbstractAPIBudget):
         """
 
         policy = self.get_matching_policy(request)
-        endpoint = self._extract_endpoint(request)
+        # Formatting the policies is costly and requests are acquired from many threads so only do it when debugging
+        is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
         if policy:
-            logger.debug(f"Acquiring call for endpoint {endpoint} using policy: {policy}")
+            if is_debug_enabled:
+                logger.debug(
+                    f"Acquiring call for endpoint {self._extract_endpoint(request)} using policy: {policy}"
+                )
             self._do_acquire(request=request, policy=policy, block=block, timeout=timeout)
-        elif self._policies:
+        elif self._policies and is_debug_enabled:
             logger.debug(
-                f"No policies matched for endpoint {endpoint} (request: {request}). Allowing call by default."
+                f"No policies matched for endpoint {self._extract_endpoint(request)} (request: {request}). Allowing call by default."
             )
 
     def update_from_response(self, request: Any, response: Any) -> None:
@@ -591,6 +787,11 @@ class APIBudget(AbstractAPIBudget):
         :param timeout: maximum time to wait if blocking
         :raises: CallRateLimitHit if unable to acquire a call credit
         """
+        if block and isinstance(policy, SlidingWindowCallRatePolicy):
+            # Waiting threads are woken up by the policy when their call is available instead of sleeping and trying again
+            policy.acquire(request, weight=1, timeout=timeout)
+            return
+
         last_exception = None
         endpoint = self._extract_endpoint(request)
         # sometimes we spend all budget before a second attempt, so we have a few more attempts
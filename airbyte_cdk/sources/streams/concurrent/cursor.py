@@ -158,10 +158,17 @@ class ConcurrentCursor(Cursor):
         self.start, self._concurrent_state = self._get_concurrent_state(stream_state)
         self._lookback_window = lookback_window
         self._slice_range = slice_range
+        # The most recent cursor values are only parsed for comparison while records are observed. Their raw value is kept to parse
+        # them with `parse_value` when the partition is closed
         self._most_recent_cursor_value_per_partition: MutableMapping[
             Union[StreamSlice, Mapping[str, Any], None], Any
         ] = {}
+        self._most_recent_raw_cursor_value_per_partition: MutableMapping[
+            Union[StreamSlice, Mapping[str, Any], None], Any
+        ] = {}
         self._has_closed_at_least_one_slice = False
+        # Once merged, the slices of the state are kept merged as partitions are closed instead of being merged again for every partition
+        self._are_slices_merged = False
         self._cursor_granularity = cursor_granularity
         # Flag to track if the logger has been triggered (per stream)
         self._should_be_synced_logger_triggered = False
@@ -170,7 +177,7 @@ class ConcurrentCursor(Cursor):
     @property
     def state(self) -> MutableMapping[str, Any]:
         return self._connector_state_converter.convert_to_state_message(
-            self.cursor_field, self._concurrent_state
+            self.cursor_field, self._concurrent_state, are_slices_merged=self._are_slices_merged
         )
 
     @property
@@ -205,37 +212,49 @@ class ConcurrentCursor(Cursor):
             record.associated_slice
         )
         try:
-            cursor_value = self._extract_cursor_value(record)
+            raw_cursor_value = self._cursor_field.extract_value(record)
+            cursor_value = self._connector_state_converter.parse_value_for_comparison(
+                raw_cursor_value
+            )
 
             if most_recent_cursor_value is None or most_recent_cursor_value < cursor_value:
                 self._most_recent_cursor_value_per_partition[record.associated_slice] = cursor_value
+                self._most_recent_raw_cursor_value_per_partition[record.associated_slice] = (
+                    raw_cursor_value
+                )
         except ValueError:
             self._log_for_record_without_cursor_value()
 
     def _extract_cursor_value(self, record: Record) -> Any:
         return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
 
+    def _get_most_recent_cursor_value(self, partition: Partition) -> Any:
+        _slice = partition.to_slice()
+        if _slice not in self._most_recent_raw_cursor_value_per_partition:
+            return None
+        return self._connector_state_converter.parse_value(
+            self._most_recent_raw_cursor_value_per_partition[_slice]
+        )
+
     def close_partition(self, partition: Partition) -> None:
-        slice_count_before = len(self._concurrent_state.get("slices", []))
-        self._add_slice_to_state(partition)
-        if slice_count_before < len(
-            self._concurrent_state["slices"]
+        if self._add_slice_to_state(
+            partition
         ):  # only emit if at least one slice has been processed
-            self._merge_partitions()
             self._emit_state_message()
         self._has_closed_at_least_one_slice = True
 
-    def _add_slice_to_state(self, partition: Partition) -> None:
-        most_recent_cursor_value = self._most_recent_cursor_value_per_partition.get(
-            partition.to_slice()
-        )
+    def _add_slice_to_state(self, partition: Partition) -> bool:
+        """
+        Add the slice of the partition to the state, keeping the slices merged. Return whether a slice was added.
+        """
+        most_recent_cursor_value = self._get_most_recent_cursor_value(partition)
 
         if self._slice_boundary_fields:
             if "slices" not in self._concurrent_state:
                 raise RuntimeError(
                     f"The state for stream {self._stream_name} should have at least one slice to delineate the sync start time, but no slices are present. This is unexpected. Please contact Support."
                 )
-            self._concurrent_state["slices"].append(
+            self._insert_slice(
                 {
                     self._connector_state_converter.START_KEY: self._extract_from_slice(
                         partition, self._slice_boundary_fields[self._START_BOUNDARY]
@@ -246,6 +265,7 @@ class ConcurrentCursor(Cursor):
                     self._connector_state_converter.MOST_RECENT_RECORD_KEY: most_recent_cursor_value,
                 }
             )
+            return True
         elif most_recent_cursor_value:
             if self._has_closed_at_least_one_slice:
                 # If we track state value using records cursor field, we can only do that if there is one partition. This is because we save
@@ -263,13 +283,19 @@ class ConcurrentCursor(Cursor):
                     "expected. Please contact the Airbyte team."
                 )
 
-            self._concurrent_state["slices"].append(
+            self._insert_slice(
                 {
                     self._connector_state_converter.START_KEY: self.start,
                     self._connector_state_converter.END_KEY: most_recent_cursor_value,
                     self._connector_state_converter.MOST_RECENT_RECORD_KEY: most_recent_cursor_value,
                 }
             )
+            return True
+        return False
+
+    def _insert_slice(self, _slice: MutableMapping[str, Any]) -> None:
+        self._merge_partitions()
+        self._connector_state_converter.insert_interval(self._concurrent_state["slices"], _slice)
 
     def _emit_state_message(self) -> None:
         self._connector_state_manager.update_state_for_stream(
@@ -283,9 +309,12 @@ class ConcurrentCursor(Cursor):
         self._message_repository.emit_message(state_message)
 
     def _merge_partitions(self) -> None:
+        if self._are_slices_merged:
+            return
         self._concurrent_state["slices"] = self._connector_state_converter.merge_intervals(
             self._concurrent_state["slices"]
         )
+        self._are_slices_merged = True
 
     def _extract_from_slice(self, partition: Partition, key: str) -> CursorValueType:
         try:
@@ -467,7 +496,11 @@ class ConcurrentCursor(Cursor):
         :return: True if the record's cursor value falls within the sync boundaries
         """
         try:
-            record_cursor_value: CursorValueType = self._extract_cursor_value(record)
+            record_cursor_value: CursorValueType = (
+                self._connector_state_converter.parse_value_for_comparison(
+                    self._cursor_field.extract_value(record)
+                )
+            )
         except ValueError:
             self._log_for_record_without_cursor_value()
             return True
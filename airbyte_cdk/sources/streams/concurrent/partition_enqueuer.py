@@ -1,8 +1,9 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
-import time
+import warnings
 from queue import Queue
+from typing import Optional
 
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
@@ -22,15 +23,21 @@ class PartitionEnqueuer:
         self,
         queue: Queue[QueueItem],
         thread_pool_manager: ThreadPoolManager,
-        sleep_time_in_seconds: float = 0.1,
+        sleep_time_in_seconds: Optional[float] = None,
     ) -> None:
         """
         :param queue:  The queue to put the partitions in.
-        :param throttler: The throttler to use to throttle the partition generation.
+        :param thread_pool_manager: The thread pool manager to wait on to throttle the partition generation.
+        :param sleep_time_in_seconds: Deprecated and ignored: the partition generation does not poll anymore, it waits for a task slot.
         """
+        if sleep_time_in_seconds is not None:
+            warnings.warn(
+                "sleep_time_in_seconds is deprecated and ignored as PartitionEnqueuer waits for a task slot instead of polling",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self._queue = queue
         self._thread_pool_manager = thread_pool_manager
-        self._sleep_time_in_seconds = sleep_time_in_seconds
 
     def generate_partitions(self, stream: AbstractStream) -> None:
         """
@@ -53,10 +60,8 @@ class PartitionEnqueuer:
                 # Also note that we do not expect this to create deadlocks where all worker threads wait because we have less
                 # PartitionEnqueuer threads than worker threads.
                 #
-                # Also note that prune_to_validate_has_reached_futures_limit has a lock while pruning which might create a bottleneck in
-                # terms of performance.
-                while self._thread_pool_manager.prune_to_validate_has_reached_futures_limit():
-                    time.sleep(self._sleep_time_in_seconds)
+                # Also note that waiting does not poll: the thread is woken up as soon as a pending future is done.
+                self._thread_pool_manager.wait_for_task_slot()
                 self._queue.put(partition)
             self._queue.put(PartitionGenerationCompletedSentinel(stream))
         except Exception as e:
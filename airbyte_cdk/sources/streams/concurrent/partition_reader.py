@@ -1,14 +1,21 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import time
+from contextlib import nullcontext
 from queue import Queue
+from typing import ContextManager, List, Optional
 
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
 )
+from airbyte_cdk.sources.types import Record
 
 
 class PartitionReader:
@@ -17,12 +24,29 @@ class PartitionReader:
     """
 
     _IS_SUCCESSFUL = True
+    DEFAULT_BATCH_MAX_WAIT_SECONDS = 1.0
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(
+        self,
+        queue: Queue[QueueItem],
+        batch_size: int = 1,
+        batch_max_wait_seconds: float = DEFAULT_BATCH_MAX_WAIT_SECONDS,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+    ) -> None:
         """
         :param queue: The queue to put the records in.
+        :param batch_size: The maximum number of records put in the queue as a single list. With a value of 1, records are put in the
+          queue one by one.
+        :param batch_max_wait_seconds: The maximum time a batch is kept open before being put in the queue. As the check is done when a
+          record is read, a batch can be held longer if the partition is slow to produce records.
+        :param concurrency_controller: If provided, limits the number of partitions read at the same time.
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer but was {batch_size}")
         self._queue = queue
+        self._batch_size = batch_size
+        self._batch_max_wait_seconds = batch_max_wait_seconds
+        self._concurrency_controller = concurrency_controller
 
     def process_partition(self, partition: Partition) -> None:
         """
@@ -36,10 +60,39 @@ class PartitionReader:
         :param partition: The partition to read data from
         :return: None
         """
+        partition_slot: ContextManager[None] = (
+            self._concurrency_controller.partition_slot()
+            if self._concurrency_controller
+            else nullcontext()
+        )
         try:
-            for record in partition.read():
-                self._queue.put(record)
+            with partition_slot:
+                if self._batch_size > 1:
+                    self._process_partition_in_batches(partition)
+                else:
+                    for record in partition.read():
+                        self._queue.put(record)
             self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
         except Exception as e:
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _process_partition_in_batches(self, partition: Partition) -> None:
+        """
+        Put the records of the partition in the queue as lists. A batch is put in the queue once it reaches `batch_size` records or once it
+        has been open for more than `batch_max_wait_seconds`. Records read before an exception is raised are still put in the queue so that
+        the main thread sees them before the exception, exactly like in the record-by-record mode.
+        """
+        batch: List[Record] = []
+        batch_deadline = 0.0
+        try:
+            for record in partition.read():
+                if not batch:
+                    batch_deadline = time.monotonic() + self._batch_max_wait_seconds
+                batch.append(record)
+                if len(batch) >= self._batch_size or time.monotonic() >= batch_deadline:
+                    self._queue.put(batch)
+                    batch = []
+        finally:
+            if batch:
+                self._queue.put(batch)
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import bisect
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable, List, MutableMapping, Optional, Tuple
@@ -32,17 +33,24 @@ class AbstractStreamStateConverter(ABC):
         self._is_sequential_state = is_sequential_state
 
     def convert_to_state_message(
-        self, cursor_field: "CursorField", stream_state: MutableMapping[str, Any]
+        self,
+        cursor_field: "CursorField",
+        stream_state: MutableMapping[str, Any],
+        are_slices_merged: bool = False,
     ) -> MutableMapping[str, Any]:
         """
         Convert the state message from the concurrency-compatible format to the stream's original format.
 
         e.g.
         { "created": "2021-01-18T21:18:20.000Z" }
+
+        :param are_slices_merged: If the slices of the state are already sorted and merged as by `merge_intervals`, they are not merged again
         """
         if self.is_state_message_compatible(stream_state) and self._is_sequential_state:
             legacy_state = stream_state.get("legacy", {})
-            latest_complete_time = self._get_latest_complete_time(stream_state.get("slices", []))
+            latest_complete_time = self._get_latest_complete_time(
+                stream_state.get("slices", []), are_slices_merged
+            )
             if latest_complete_time is not None:
                 legacy_state.update(
                     {cursor_field.cursor_field_key: self._to_state_message(latest_complete_time)}
@@ -51,7 +59,9 @@ class AbstractStreamStateConverter(ABC):
         else:
             return self.serialize(stream_state, ConcurrencyCompatibleStateType.date_range)
 
-    def _get_latest_complete_time(self, slices: List[MutableMapping[str, Any]]) -> Any:
+    def _get_latest_complete_time(
+        self, slices: List[MutableMapping[str, Any]], are_slices_merged: bool = False
+    ) -> Any:
         """
         Get the latest time before which all records have been processed.
         """
@@ -59,8 +69,7 @@ class AbstractStreamStateConverter(ABC):
             raise RuntimeError(
                 "Expected at least one slice but there were none. This is unexpected; please contact Support."
             )
-        merged_intervals = self.merge_intervals(slices)
-        first_interval = merged_intervals[0]
+        first_interval = slices[0] if are_slices_merged else self.merge_intervals(slices)[0]
 
         return first_interval.get("most_recent_cursor_value") or first_interval[self.START_KEY]
 
@@ -159,21 +168,61 @@ class AbstractStreamStateConverter(ABC):
             current_interval_start = current_interval[self.START_KEY]
 
             if self.increment(last_interval_end) >= current_interval_start:
-                last_interval[self.END_KEY] = max(last_interval_end, current_interval[self.END_KEY])
-                last_interval_cursor_value = last_interval.get("most_recent_cursor_value")
-                current_interval_cursor_value = current_interval.get("most_recent_cursor_value")
-
-                last_interval["most_recent_cursor_value"] = (
-                    max(current_interval_cursor_value, last_interval_cursor_value)
-                    if current_interval_cursor_value and last_interval_cursor_value
-                    else current_interval_cursor_value or last_interval_cursor_value
-                )
+                self._merge_into(last_interval, current_interval)
             else:
                 # Add a new interval if no overlap
                 merged_intervals.append(current_interval)
 
         return merged_intervals
 
+    def insert_interval(
+        self, merged_intervals: List[MutableMapping[str, Any]], interval: MutableMapping[str, Any]
+    ) -> None:
+        """
+        Insert an interval in a list of intervals already merged by `merge_intervals`, merging it with the intervals it overlaps or is
+        adjacent to so that the list stays in the form `merge_intervals` would return.
+
+        The position of the interval is found by binary search and only the intervals it is merged with are visited, so the merged form
+        can be kept up to date as intervals are added instead of merging all the intervals again.
+        """
+        position = bisect.bisect_right(
+            merged_intervals, interval[self.START_KEY], key=lambda i: i[self.START_KEY]
+        )
+        first = position
+        if position > 0 and (
+            self.increment(merged_intervals[position - 1][self.END_KEY]) >= interval[self.START_KEY]
+        ):
+            first = position - 1
+
+        if first < position:
+            merged_interval = merged_intervals[first]
+            self._merge_into(merged_interval, interval)
+        else:
+            merged_interval = interval
+        last = position
+        while (
+            last < len(merged_intervals)
+            and self.increment(merged_interval[self.END_KEY])
+            >= merged_intervals[last][self.START_KEY]
+        ):
+            self._merge_into(merged_interval, merged_intervals[last])
+            last += 1
+
+        merged_intervals[first:last] = [merged_interval]
+
+    def _merge_into(
+        self, interval: MutableMapping[str, Any], following_interval: MutableMapping[str, Any]
+    ) -> None:
+        interval[self.END_KEY] = max(interval[self.END_KEY], following_interval[self.END_KEY])
+        interval_cursor_value = interval.get("most_recent_cursor_value")
+        following_interval_cursor_value = following_interval.get("most_recent_cursor_value")
+
+        interval["most_recent_cursor_value"] = (
+            max(following_interval_cursor_value, interval_cursor_value)
+            if following_interval_cursor_value and interval_cursor_value
+            else following_interval_cursor_value or interval_cursor_value
+        )
+
     @abstractmethod
     def parse_value(self, value: Any) -> Any:
         """
@@ -181,6 +230,16 @@ class AbstractStreamStateConverter(ABC):
         """
         ...
 
+    def parse_value_for_comparison(self, value: Any) -> Any:
+        """
+        Parse the value of the cursor field into a value that compares with the values returned by `parse_value` the same way the result
+        of `parse_value` would. This is called for every record, so converters can provide a cheaper parsing here. `parse_value` is then
+        only called on the values that end up in the state.
+
+        Like `parse_value`, raise ValueError if the value can't be parsed.
+        """
+        return self.parse_value(value)
+
     @property
     @abstractmethod
     def zero_value(self) -> Any: ...
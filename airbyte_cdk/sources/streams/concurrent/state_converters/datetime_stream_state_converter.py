@@ -2,9 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import re
 from abc import abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, List, MutableMapping, Optional, Tuple
+from typing import Any, Callable, List, Mapping, MutableMapping, Optional, Tuple
 
 # FIXME We would eventually like the Concurrent package do be agnostic of the declarative package. However, this is a breaking change and
 #  the goal in the short term is only to fix the issue we are seeing for source-declarative-manifest.
@@ -17,6 +18,89 @@ from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_sta
 from airbyte_cdk.utils.datetime_helpers import AirbyteDateTime, ab_datetime_now, ab_datetime_parse
 
 
+class _FastDatetimeParser:
+    """
+    Parses datetime strings of a strict shape with a regex and the datetime constructor, which is much cheaper than strptime or dateutil.
+
+    The shape only allows zero-padded fields so a string matching it is parsed by strptime, or dateutil, to the same datetime. Strings
+    that don't match the shape or that are not valid dates return None so that the caller falls back to the full parsing.
+    """
+
+    _DIRECTIVES: Mapping[str, str] = {
+        "%Y": r"(?P<year>\d{4})",
+        "%m": r"(?P<month>\d{2})",
+        "%d": r"(?P<day>\d{2})",
+        "%H": r"(?P<hour>\d{2})",
+        "%M": r"(?P<minute>\d{2})",
+        "%S": r"(?P<second>\d{2})",
+        "%f": r"(?P<fraction>\d{1,6})",
+        "%z": r"(?P<offset>Z|[+-]\d{2}:?[0-5]\d)",
+    }
+    _REQUIRED_DIRECTIVES = ("%Y", "%m", "%d")
+
+    def __init__(self, pattern: str):
+        self._pattern = re.compile(pattern)
+
+    @classmethod
+    def from_format(cls, datetime_format: str) -> Optional["_FastDatetimeParser"]:
+        """
+        Return None if the format has directives that are not supported.
+        """
+        # Same as DatetimeParser
+        datetime_format = datetime_format.replace("%_ms", "%f")
+        tokens = [token for token in re.split(r"(%.)", datetime_format) if token]
+        directives = [token for token in tokens if token.startswith("%")]
+        if (
+            any(directive not in cls._DIRECTIVES for directive in directives)
+            or len(set(directives)) != len(directives)
+            or any(directive not in directives for directive in cls._REQUIRED_DIRECTIVES)
+        ):
+            return None
+        return cls(
+            "".join(
+                cls._DIRECTIVES[token] if token.startswith("%") else re.escape(token)
+                for token in tokens
+            )
+        )
+
+    def parse(self, timestamp: Any) -> Optional[datetime]:
+        if not isinstance(timestamp, str):
+            return None
+        match = self._pattern.fullmatch(timestamp)
+        if not match:
+            return None
+        fields = match.groupdict()
+        fraction = fields.get("fraction")
+        offset = fields.get("offset")
+        try:
+            return datetime(
+                int(fields["year"]),
+                int(fields["month"]),
+                int(fields["day"]),
+                int(fields.get("hour") or 0),
+                int(fields.get("minute") or 0),
+                int(fields.get("second") or 0),
+                int(fraction.ljust(6, "0")) if fraction else 0,
+                self._parse_offset(offset) if offset else timezone.utc,
+            )
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_offset(offset: str) -> timezone:
+        if offset == "Z":
+            return timezone.utc
+        sign = -1 if offset[0] == "-" else 1
+        return timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:])))
+
+
+# Timestamps like "2021-01-18T21:18:20.000Z" or "2021-01-18 21:18:20+02:00" that are parsed the same way by dateutil
+_RFC3339_PARSER = _FastDatetimeParser(
+    r"(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})[T ](?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})"
+    r"(?:\.(?P<fraction>\d{1,6}))?(?P<offset>Z|[+-]\d{2}:[0-5]\d)?"
+)
+
+
 class DateTimeStreamStateConverter(AbstractStreamStateConverter):
     def _from_state_message(self, value: Any) -> Any:
         return self.parse_timestamp(value)
@@ -133,6 +217,14 @@ class EpochValueConcurrentStreamStateConverter(DateTimeStreamStateConverter):
     def output_format(self, timestamp: datetime) -> int:
         return int(timestamp.timestamp())
 
+    def parse_value_for_comparison(self, value: Any) -> Any:
+        if type(value) is int:
+            try:
+                return datetime.fromtimestamp(value, timezone.utc)
+            except (OverflowError, OSError, ValueError):
+                pass
+        return self.parse_value(value)
+
     def parse_timestamp(self, timestamp: int) -> datetime:
         dt_object = AirbyteDateTime.fromtimestamp(timestamp, timezone.utc)
         if not isinstance(dt_object, AirbyteDateTime):
@@ -181,6 +273,10 @@ class IsoMillisConcurrentStreamStateConverter(DateTimeStreamStateConverter):
         millis = dt.microsecond // 1000 if dt.microsecond else 0
         return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{millis:03d}Z"
 
+    def parse_value_for_comparison(self, value: Any) -> Any:
+        parsed = _RFC3339_PARSER.parse(value)
+        return parsed if parsed is not None else self.parse_value(value)
+
     def parse_timestamp(self, timestamp: str) -> datetime:
         dt_object = ab_datetime_parse(timestamp)
         if not isinstance(dt_object, AirbyteDateTime):
@@ -210,10 +306,26 @@ class CustomFormatConcurrentStreamStateConverter(IsoMillisConcurrentStreamStateC
         self._input_datetime_formats = input_datetime_formats if input_datetime_formats else []
         self._input_datetime_formats += [self._datetime_format]
         self._parser = DatetimeParser()
+        self._fast_parsers = [
+            _FastDatetimeParser.from_format(datetime_format)
+            for datetime_format in self._input_datetime_formats
+        ]
 
     def output_format(self, timestamp: datetime) -> str:
         return self._parser.format(timestamp, self._datetime_format)
 
+    def parse_value_for_comparison(self, value: Any) -> Any:
+        for datetime_format, fast_parser in zip(self._input_datetime_formats, self._fast_parsers):
+            parsed = fast_parser.parse(value) if fast_parser else None
+            if parsed is not None:
+                return parsed
+            # strptime is more lenient than the fast parser so the format can still match
+            try:
+                return self._parser.parse(value, datetime_format)
+            except ValueError:
+                pass
+        raise ValueError(f"No format in {self._input_datetime_formats} matching {value}")
+
     def parse_timestamp(self, timestamp: str) -> datetime:
         for datetime_format in self._input_datetime_formats:
             try:
@@ -4,9 +4,10 @@
 
 import logging
 import os
+import time
 import urllib
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, List, Mapping, Optional, Tuple, Union
 
 import orjson
 import requests
@@ -40,11 +41,8 @@ from airbyte_cdk.sources.streams.http.exceptions import (
     RequestBodyException,
     UserDefinedBackoffException,
 )
-from airbyte_cdk.sources.streams.http.rate_limiting import (
-    http_client_default_backoff_handler,
-    rate_limit_default_backoff_handler,
-    user_defined_backoff_handler,
-)
+from airbyte_cdk.sources.streams.http.rate_limiting import RetryEngine, RetryMetrics
+from airbyte_cdk.sources.streams.http.request_observer import HttpRequestObserver
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
@@ -91,6 +89,7 @@ class HttpClient:
         error_message_parser: Optional[ErrorMessageParser] = None,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        request_observer: Optional[HttpRequestObserver] = None,
     ):
         self._name = name
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
@@ -117,9 +116,17 @@ class HttpClient:
         else:
             self._backoff_strategies = [DefaultBackoffStrategy()]
         self._error_message_parser = error_message_parser or JsonErrorMessageParser()
-        self._request_attempt_count: Dict[requests.PreparedRequest, int] = {}
+        self._retry_engine = RetryEngine()
         self._disable_retries = disable_retries
         self._message_repository = message_repository
+        self._request_observer = request_observer
+
+    @property
+    def retry_metrics(self) -> RetryMetrics:
+        """
+        The number of attempts and the time spent backing off for the requests sent by this client.
+        """
+        return self._retry_engine.metrics
 
     @property
     def cache_filename(self) -> str:
@@ -259,22 +266,17 @@ class HttpClient:
         max_tries = max(0, max_retries) + 1
         max_time = self._max_time
 
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(
-            self._send
-        )
-        rate_limit_backoff_handler = rate_limit_default_backoff_handler(max_tries=max_tries)
-        backoff_handler = http_client_default_backoff_handler(
-            max_tries=max_tries, max_time=max_time
+        return self._retry_engine.send(
+            lambda attempt_count: self._send(
+                request,
+                request_kwargs,
+                log_formatter=log_formatter,
+                exit_on_rate_limit=exit_on_rate_limit,
+                attempt_count=attempt_count,
+            ),
+            max_tries=max_tries,
+            max_time=max_time,
         )
-        # backoff handlers wrap _send, so it will always return a response
-        response = backoff_handler(rate_limit_backoff_handler(user_backoff_handler))(
-            request,
-            request_kwargs,
-            log_formatter=log_formatter,
-            exit_on_rate_limit=exit_on_rate_limit,
-        )  # type: ignore # mypy can't infer that backoff_handler wraps _send
-
-        return response
 
     def _send(
         self,
@@ -282,11 +284,9 @@ class HttpClient:
         request_kwargs: Mapping[str, Any],
         log_formatter: Optional[Callable[[requests.Response], Any]] = None,
         exit_on_rate_limit: Optional[bool] = False,
+        attempt_count: int = 1,
     ) -> requests.Response:
-        if request not in self._request_attempt_count:
-            self._request_attempt_count[request] = 1
-        else:
-            self._request_attempt_count[request] += 1
+        if attempt_count > 1:
             if hasattr(self._session, "auth") and isinstance(self._session.auth, AuthBase):
                 self._session.auth(request)
 
@@ -298,14 +298,18 @@ class HttpClient:
         response: Optional[requests.Response] = None
         exc: Optional[requests.RequestException] = None
 
+        start_time = time.perf_counter()
         try:
             response = self._session.send(request, **request_kwargs)
         except requests.RequestException as e:
             exc = e
+        latency = time.perf_counter() - start_time
 
         error_resolution: ErrorResolution = self._error_handler.interpret_response(
             response if response is not None else exc
         )
+        if self._request_observer is not None:
+            self._request_observer.on_request_attempt(latency, error_resolution.response_action)
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
@@ -343,6 +347,7 @@ class HttpClient:
             request=request,
             error_resolution=error_resolution,
             exit_on_rate_limit=exit_on_rate_limit,
+            attempt_count=attempt_count,
         )
 
         return response  # type: ignore # will either return a valid response of type requests.Response or raise an exception
@@ -370,17 +375,6 @@ class HttpClient:
             except Exception:
                 return "The Content of the Response couldn't be decoded."
 
-    def _evict_key(self, prepared_request: requests.PreparedRequest) -> None:
-        """
-        Addresses high memory consumption when enabling concurrency in https://github.com/airbytehq/oncall/issues/6821.
-
-        The `_request_attempt_count` attribute keeps growing as multiple requests are made using the same `http_client`.
-        To mitigate this issue, we evict keys for completed requests once we confirm that no further retries are needed.
-        This helps manage memory usage more efficiently while maintaining the necessary logic for retry attempts.
-        """
-        if prepared_request in self._request_attempt_count:
-            del self._request_attempt_count[prepared_request]
-
     def _handle_error_resolution(
         self,
         response: Optional[requests.Response],
@@ -388,10 +382,8 @@ class HttpClient:
         request: requests.PreparedRequest,
         error_resolution: ErrorResolution,
         exit_on_rate_limit: Optional[bool] = False,
+        attempt_count: int = 1,
     ) -> None:
-        if error_resolution.response_action not in self._ACTIONS_TO_RETRY_ON:
-            self._evict_key(request)
-
         # Emit stream status RUNNING with the reason RATE_LIMITED to log that the rate limit has been reached
         if error_resolution.response_action == ResponseAction.RATE_LIMITED:
             # TODO: Update to handle with message repository when concurrent message repository is ready
@@ -447,7 +439,7 @@ class HttpClient:
             for backoff_strategy in self._backoff_strategies:
                 backoff_time = backoff_strategy.backoff_time(
                     response_or_exception=response if response is not None else exc,
-                    attempt_count=self._request_attempt_count[request],
+                    attempt_count=attempt_count,
                 )
                 if backoff_time:
                     user_defined_backoff_time = backoff_time
@@ -4,7 +4,9 @@
 
 import logging
 import sys
+import threading
 import time
+from dataclasses import dataclass, replace
 from typing import Any, Callable, Mapping, Optional
 
 import backoff
@@ -156,3 +158,167 @@ def rate_limit_default_backoff_handler(
         on_backoff=log_retry_attempt,
         **kwargs,
     )
+
+
+@dataclass
+class RetryMetrics:
+    """
+    Retry metrics of the requests sent through a RetryEngine.
+
+    :param requests: the number of requests sent
+    :param attempts: the number of attempts made to send the requests, retries included
+    :param retried_requests: the number of requests that were attempted more than once
+    :param backoff_time_in_seconds: the time spent waiting before retrying the requests
+    """
+
+    requests: int = 0
+    attempts: int = 0
+    retried_requests: int = 0
+    backoff_time_in_seconds: float = 0.0
+
+
+class _RetryLayer:
+    """
+    The retry state of one of the backoff handlers: the number of tries, when the first and the current tries started and how many
+    exponential waits were done.
+    """
+
+    __slots__ = ("tries", "start", "try_start", "waits")
+
+    def __init__(self, now: float) -> None:
+        self.reset(now)
+
+    def reset(self, now: float) -> None:
+        self.tries = 1
+        self.start = now
+        self.try_start = now
+        self.waits = 0
+
+    def next_try(self, now: float) -> None:
+        self.tries += 1
+        self.try_start = now
+
+    @property
+    def elapsed(self) -> float:
+        return self.try_start - self.start
+
+    def is_exhausted(self, max_tries: int, max_time: Optional[int]) -> bool:
+        return self.tries >= max_tries or (max_time is not None and self.elapsed >= max_time)
+
+    def next_exponential_wait(self) -> float:
+        wait: float = 2**self.waits
+        self.waits += 1
+        return wait
+
+
+class RetryEngine:
+    """
+    Sends requests with the same retry behavior as `http_client_default_backoff_handler` wrapping
+    `rate_limit_default_backoff_handler` wrapping `user_defined_backoff_handler` without building the decorators for every request.
+
+    Each handler only catches its own exceptions and keeps its own tries and elapsed time. When a handler retries, the state of the
+    handlers it wraps is reset the same way calling the wrapped function again would. The attempts and the time spent backing off are
+    logged for every request that was retried and aggregated in `metrics`.
+    """
+
+    def __init__(self) -> None:
+        self._metrics = RetryMetrics()
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> RetryMetrics:
+        """
+        A snapshot of the retry metrics of all the requests sent so far.
+        """
+        with self._lock:
+            return replace(self._metrics)
+
+    def send(
+        self, send_attempt: Callable[[int], Response], max_tries: int, max_time: Optional[int]
+    ) -> Response:
+        """
+        Call `send_attempt` with the attempt count, starting at 1, until it returns a response or the retries are exhausted.
+
+        :param send_attempt: sends the request once and raises a backoff exception if the request should be retried
+        :param max_tries: the maximum number of tries of each handler
+        :param max_time: the maximum time in seconds the default and user defined handlers retry for
+        """
+        start = time.monotonic()
+        default_layer = _RetryLayer(start)
+        rate_limit_layer = _RetryLayer(start)
+        user_defined_layer = _RetryLayer(start)
+        attempt_count = 0
+        backoff_time = 0.0
+        try:
+            while True:
+                attempt_count += 1
+                try:
+                    return send_attempt(attempt_count)
+                except UserDefinedBackoffException as exception:
+                    if user_defined_layer.is_exhausted(max_tries, max_time):
+                        logger.error(
+                            f"Max retry limit reached in {user_defined_layer.elapsed}s. Request: {exception.request}, Response: {exception.response}"
+                        )
+                        raise
+                    self._log_response(exception)
+                    logger.info(f"Retrying. Sleeping for {exception.backoff} seconds")
+                    wait = exception.backoff + 1  # extra second to cover any fractions of second
+                    time.sleep(wait)
+                    backoff_time += wait
+                    user_defined_layer.next_try(time.monotonic())
+                except RateLimitBackoffException as exception:
+                    if rate_limit_layer.is_exhausted(max_tries, None):
+                        raise
+                    wait = rate_limit_layer.next_exponential_wait()
+                    self._log_retry_attempt(exception, rate_limit_layer.tries, wait)
+                    time.sleep(wait)
+                    backoff_time += wait
+                    now = time.monotonic()
+                    rate_limit_layer.next_try(now)
+                    user_defined_layer.reset(now)
+                except TRANSIENT_EXCEPTIONS as exception:
+                    if default_layer.is_exhausted(max_tries, max_time):
+                        raise
+                    wait = default_layer.next_exponential_wait()
+                    if max_time is not None:
+                        wait = min(wait, max_time - default_layer.elapsed)
+                    self._log_retry_attempt(exception, default_layer.tries, wait)
+                    time.sleep(wait)
+                    backoff_time += wait
+                    now = time.monotonic()
+                    default_layer.next_try(now)
+                    rate_limit_layer.reset(now)
+                    user_defined_layer.reset(now)
+        finally:
+            self._record(attempt_count, backoff_time, time.monotonic() - start)
+
+    def _record(self, attempt_count: int, backoff_time: float, elapsed: float) -> None:
+        with self._lock:
+            self._metrics.requests += 1
+            self._metrics.attempts += attempt_count
+            if attempt_count > 1:
+                self._metrics.retried_requests += 1
+                self._metrics.backoff_time_in_seconds += backoff_time
+        if attempt_count > 1:
+            logger.debug(
+                f"Request sent in {attempt_count} attempts",
+                extra={
+                    "attempts": attempt_count,
+                    "backoff_time_in_seconds": backoff_time,
+                    "elapsed_time_in_seconds": elapsed,
+                },
+            )
+
+    @staticmethod
+    def _log_response(exception: Exception) -> None:
+        if isinstance(exception, RequestException) and exception.response:
+            logger.info(
+                f"Status code: {exception.response.status_code!r}, Response Content: {exception.response.content!r}"
+            )
+
+    @classmethod
+    def _log_retry_attempt(cls, exception: Exception, tries: int, wait: float) -> None:
+        cls._log_response(exception)
+        logger.info(
+            f"Caught retryable error '{str(exception)}' after {tries} tries. Waiting {wait} seconds then retrying..."
+        )
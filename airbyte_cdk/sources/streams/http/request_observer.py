@@ -0,0 +1,24 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from airbyte_cdk.sources.streams.http.error_handlers.response_models import ResponseAction
+
+
+class HttpRequestObserver(ABC):
+    """
+    Receives the outcome of every attempt made by an HttpClient to send a request. Attempts are reported from the threads sending the
+    requests so implementations must be thread-safe and fast.
+    """
+
+    @abstractmethod
+    def on_request_attempt(
+        self, latency_in_seconds: float, response_action: Optional[ResponseAction]
+    ) -> None:
+        """
+        :param latency_in_seconds: the time it took to get the response or the exception
+        :param response_action: how the error handler resolved the response or the exception, if it resolved it
+        """
@@ -3,10 +3,13 @@
 #
 
 import logging
+import numbers
+from collections import OrderedDict
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Generator, Mapping, Optional, cast
+from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Tuple, cast
 
 from jsonschema import Draft7Validator, RefResolver, ValidationError, Validator, validators
+from jsonschema.exceptions import RefResolutionError
 
 MAX_NESTING_DEPTH = 3
 json_to_python_simple = {
@@ -44,6 +47,41 @@ def _strtobool(value: str, /) -> int:
     raise ValueError(f"Invalid boolean value: {normalized_str}")
 
 
+# A compiled schema node validates (and normalizes the children of) an instance. The path is a linked list of `(parent_path, key)`
+# tuples that is only turned into a list when an error needs to be reported.
+_CompiledNode = Callable[[Any, Any], None]
+_Converter = Callable[[Any], Any]
+_ErrorReporter = Callable[[Any, Any, Any], None]
+
+
+def _is_integer(instance: Any) -> bool:
+    if isinstance(instance, bool):
+        return False
+    return isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer())
+
+
+def _is_number(instance: Any) -> bool:
+    return not isinstance(instance, bool) and isinstance(instance, numbers.Number)
+
+
+# Same semantic as the type checker used by the validator created in TypeTransformer
+_TYPE_CHECKS: Mapping[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": _is_integer,
+    "null": lambda instance: instance is None,
+    "number": _is_number,
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+
+
+class _UnsupportedSchema(Exception):
+    """
+    Raised when a schema uses a construct that the compiled normalizer can't handle exactly like the jsonschema traversal
+    """
+
+
 class TransformConfig(Flag):
     """
     TypeTransformer class config. Configs can be combined using bitwise or operator e.g.
@@ -69,15 +107,23 @@ class TypeTransformer:
     """
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
+    _MAX_COMPILED_SCHEMAS = 32
 
-    def __init__(self, config: TransformConfig):
+    def __init__(self, config: TransformConfig, compile_schema: bool = True):
         """
         Initialize TypeTransformer instance.
         :param config Transform config that would be applied to object
+        :param compile_schema If True, schemas are compiled once into a tree of functions that normalize records in a single pass instead
+            of traversing them with a jsonschema validator for each record. Schemas that can't be compiled fall back on the validator.
         """
         if TransformConfig.NoTransform in config and config != TransformConfig.NoTransform:
             raise Exception("NoTransform option cannot be combined with other flags.")
         self._config = config
+        self._compile_schema = compile_schema
+        # Compiled schemas are keyed by the id of the schema. The schema is kept in the value to ensure the id is not reused
+        self._compiled_schemas: OrderedDict[
+            int, Tuple[Mapping[str, Any], Optional[_CompiledNode]]
+        ] = OrderedDict()
         all_validators = {
             key: self.__get_normalizer(key, orig_validator)
             for key, orig_validator in Draft7Validator.VALIDATORS.items()
@@ -104,6 +150,7 @@ class TypeTransformer:
                 "Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer"
             )
         self._custom_normalizer = normalization_callback
+        self._compiled_schemas.clear()
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -238,6 +285,11 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        if self._compile_schema:
+            compiled_schema = self._get_compiled_schema(schema)
+            if compiled_schema is not None:
+                compiled_schema(record, None)
+                return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -246,6 +298,37 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledNode]:
+        """
+        Return the compiled version of the schema or None if the schema can't be compiled.
+        """
+        cached = self._compiled_schemas.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        try:
+            compiled_schema: Optional[_CompiledNode] = _SchemaCompiler(self, schema).compile()
+        except _UnsupportedSchema as exception:
+            logger.debug(
+                f"Schema can't be compiled, records will be normalized using jsonschema: {exception}"
+            )
+            compiled_schema = None
+        self._compiled_schemas[id(schema)] = (schema, compiled_schema)
+        if len(self._compiled_schemas) > self._MAX_COMPILED_SCHEMAS:
+            self._compiled_schemas.popitem(last=False)
+        return compiled_schema
+
+    def _report_type_error(self, instance: Any, types: Any, path: Any) -> None:
+        field_path: List[Any] = []
+        while path is not None:
+            path, key = path
+            field_path.append(key)
+        field_path.reverse()
+        error = ValidationError(
+            "", validator="type", validator_value=types, instance=instance, path=field_path
+        )
+        logger.warning(self.get_error_message(error))
+
     def get_error_message(self, e: ValidationError) -> str:
         """
         Construct a sanitized error message from a ValidationError instance.
@@ -275,3 +358,280 @@ class TypeTransformer:
 
         else:
             return python_to_json[type(input_data)]
+
+
+def _noop(instance: Any, path: Any) -> None:
+    pass
+
+
+def _raise_on_use(exception: Exception) -> Callable[..., Any]:
+    def raise_exception(*args: Any) -> Any:
+        raise exception
+
+    return raise_exception
+
+
+class _SchemaCompiler:
+    """
+    Compiles a JSON schema into a tree of functions that behave like the jsonschema traversal done by TypeTransformer i.e.:
+    * "properties" and "items" normalize the values of the instance using the subschema after resolving its "$ref" and then descend into
+      them
+    * "type" reports an error if the instance is not of the expected type
+    * "$ref" descends into the referenced schema
+    * other keywords are ignored
+
+    `$ref`s are resolved once at compilation time. Anything that would not be processed exactly like the jsonschema traversal raises
+    _UnsupportedSchema.
+    """
+
+    def __init__(self, transformer: TypeTransformer, schema: Mapping[str, Any]) -> None:
+        if not isinstance(schema, dict):
+            raise _UnsupportedSchema(f"Expected the schema to be an object but was {type(schema)}")
+        self._transformer = transformer
+        self._schema = schema
+        self._resolver = RefResolver.from_schema(schema)
+        self._compiled_references: Dict[str, _CompiledNode] = {}
+        self._references_being_compiled: Dict[str, List[_CompiledNode]] = {}
+
+    def compile(self) -> _CompiledNode:
+        return self._compile_node(self._schema)
+
+    def _compile_node(self, schema: Any) -> _CompiledNode:
+        if not isinstance(schema, dict):
+            raise _UnsupportedSchema(f"Expected a schema to be an object but was {schema!r}")
+
+        scope = schema.get("$id", "")
+        if scope:
+            self._resolver.push_scope(scope)
+        try:
+            keyword_nodes = []
+            for keyword, value in schema.items():
+                if keyword == "type":
+                    keyword_nodes.append(self._compile_type(value))
+                elif keyword == "$ref":
+                    keyword_nodes.append(self._compile_reference(value))
+                elif keyword == "properties":
+                    keyword_nodes.append(self._compile_properties(value))
+                elif keyword == "items":
+                    keyword_nodes.append(self._compile_items(value))
+        finally:
+            if scope:
+                self._resolver.pop_scope()
+
+        keyword_nodes = [node for node in keyword_nodes if node is not _noop]
+        if not keyword_nodes:
+            return _noop
+        if len(keyword_nodes) == 1:
+            return keyword_nodes[0]
+
+        def validate_keywords(instance: Any, path: Any) -> None:
+            for keyword_node in keyword_nodes:
+                keyword_node(instance, path)
+
+        return validate_keywords
+
+    def _compile_type(self, types: Any) -> _CompiledNode:
+        type_list = [types] if isinstance(types, str) else types
+        if not isinstance(type_list, list) or not all(isinstance(t, str) for t in type_list):
+            raise _UnsupportedSchema(f"Unsupported type definition {types!r}")
+        unknown_types = [t for t in type_list if t not in _TYPE_CHECKS]
+        if unknown_types:
+            raise _UnsupportedSchema(f"Unknown types {unknown_types}")
+
+        report_type_error = self._transformer._report_type_error
+        if len(type_list) == 1:
+            type_check = _TYPE_CHECKS[type_list[0]]
+
+            def validate_type(instance: Any, path: Any) -> None:
+                if not type_check(instance):
+                    report_type_error(instance, types, path)
+
+            return validate_type
+
+        type_checks = [_TYPE_CHECKS[t] for t in type_list]
+
+        def validate_types(instance: Any, path: Any) -> None:
+            for check in type_checks:
+                if check(instance):
+                    return
+            report_type_error(instance, types, path)
+
+        return validate_types
+
+    def _compile_reference(self, reference: Any) -> _CompiledNode:
+        if not isinstance(reference, str):
+            raise _UnsupportedSchema(f"Unsupported reference {reference!r}")
+        try:
+            url, resolved = self._resolve(reference)
+        except RefResolutionError as exception:
+            # Like the jsonschema traversal, only fail if a record actually needs the reference
+            return _raise_on_use(exception)
+        if url in self._compiled_references:
+            return self._compiled_references[url]
+        if url in self._references_being_compiled:
+            # The schema is recursive. The node will only be known once the compilation of the reference is done hence the indirection
+            cell = self._references_being_compiled[url]
+            return lambda instance, path: cell[0](instance, path)
+
+        cell = [_noop]
+        self._references_being_compiled[url] = cell
+        self._resolver.push_scope(url)
+        try:
+            cell[0] = self._compile_node(resolved)
+        finally:
+            self._resolver.pop_scope()
+            del self._references_being_compiled[url]
+        self._compiled_references[url] = cell[0]
+        return cell[0]
+
+    def _compile_properties(self, properties: Any) -> _CompiledNode:
+        if not isinstance(properties, dict):
+            raise _UnsupportedSchema(f"Expected properties to be an object but was {properties!r}")
+
+        compiled_properties = []
+        for key, subschema in properties.items():
+            converter = self._compile_converter(subschema)
+            node = self._compile_node(subschema)
+            if converter is not None or node is not _noop:
+                compiled_properties.append((key, converter, node))
+        if not compiled_properties:
+            return _noop
+
+        def validate_properties(instance: Any, path: Any) -> None:
+            if not isinstance(instance, dict):
+                return
+            for key, converter, node in compiled_properties:
+                if key in instance:
+                    if converter is None:
+                        node(instance[key], (path, key))
+                    else:
+                        value = converter(instance[key])
+                        instance[key] = value
+                        node(value, (path, key))
+
+        return validate_properties
+
+    def _compile_items(self, items: Any) -> _CompiledNode:
+        if not isinstance(items, dict):
+            # tuple validation and boolean schemas are not supported by TypeTransformer
+            raise _UnsupportedSchema(f"Expected items to be an object but was {items!r}")
+
+        converter = self._compile_converter(items)
+        node = self._compile_node(items)
+        if converter is None and node is _noop:
+            return _noop
+
+        def validate_items(instance: Any, path: Any) -> None:
+            if not isinstance(instance, list):
+                return
+            if converter is not None:
+                for index, item in enumerate(instance):
+                    instance[index] = converter(item)
+            if node is not _noop:
+                for index, item in enumerate(instance):
+                    node(item, (path, index))
+
+        return validate_items
+
+    def _resolve(self, reference: str) -> Tuple[str, Any]:
+        return cast(Tuple[str, Any], self._resolver.resolve(reference))
+
+    def _compile_converter(self, subschema: Any) -> Optional[_Converter]:
+        """
+        Compile the equivalent of `TypeTransformer.__normalize` for the subschema. None is returned if the value would not be changed.
+        """
+        if not isinstance(subschema, dict):
+            raise _UnsupportedSchema(f"Expected a schema to be an object but was {subschema!r}")
+        if "$ref" in subschema:
+            # Like TypeTransformer, only the first level of reference is resolved to get the subschema used for normalization
+            try:
+                _, subschema = self._resolve(subschema["$ref"])
+            except RefResolutionError as exception:
+                return _raise_on_use(exception)
+            if not isinstance(subschema, dict):
+                raise _UnsupportedSchema(f"Expected a schema to be an object but was {subschema!r}")
+
+        transformer = self._transformer
+        default_converter: Optional[_Converter] = None
+        if TransformConfig.DefaultSchemaNormalization in transformer._config:
+            if type(transformer).default_convert is TypeTransformer.default_convert:
+                default_converter = _compile_default_converter(subschema)
+            else:
+                # default_convert has been overridden so we can't assume what it does
+                default_convert = transformer.default_convert
+                default_converter = lambda value: default_convert(value, subschema)  # noqa: E731
+
+        custom_normalizer = transformer._custom_normalizer
+        if custom_normalizer is None:
+            return default_converter
+        if default_converter is None:
+            return lambda value: custom_normalizer(value, subschema)
+
+        def convert(value: Any) -> Any:
+            return custom_normalizer(default_converter(value), subschema)  # type: ignore[misc]  # default_converter is not None
+
+        return convert
+
+
+def _compile_default_converter(subschema: Mapping[str, Any]) -> Optional[_Converter]:
+    """
+    Compile the equivalent of `TypeTransformer.default_convert` for the subschema. None is returned if the value would not be changed.
+    """
+    target_type = subschema.get("type", [])
+    if not isinstance(target_type, (str, list)):
+        raise _UnsupportedSchema(f"Unsupported type definition {target_type!r}")
+    is_nullable = "null" in target_type
+    if isinstance(target_type, list):
+        target_type = [t for t in target_type if t != "null"]
+        if len(target_type) != 1:
+            return None
+        target_type = target_type[0]
+
+    if target_type == "string":
+        return _build_converter(is_nullable, str, lambda value: str(value))
+    elif target_type == "number":
+        return _build_converter(is_nullable, float, lambda value: float(value))
+    elif target_type == "integer":
+        return _build_converter(is_nullable, int, lambda value: int(value))
+    elif target_type == "boolean":
+        return _build_converter(
+            is_nullable,
+            bool,
+            lambda value: _strtobool(value) == 1 if isinstance(value, str) else bool(value),
+        )
+    elif target_type == "array":
+        items = subschema.get("items", {})
+        if not isinstance(items, dict):
+            raise _UnsupportedSchema(f"Expected items to be an object but was {items!r}")
+        try:
+            item_types = set(items.get("type", set()))
+        except TypeError:
+            return None
+        if not item_types.issubset(json_to_python_simple):
+            return None
+        simple_types = frozenset(json_to_python_simple.values())
+
+        def wrap_in_array(value: Any) -> Any:
+            if type(value) in simple_types and not (value is None and is_nullable):
+                return [value]
+            return value
+
+        return wrap_in_array
+    return None
+
+
+def _build_converter(
+    is_nullable: bool, target_python_type: type, cast_value: _Converter
+) -> _Converter:
+    def convert(value: Any) -> Any:
+        if type(value) is target_python_type:
+            # casting a value to its own type returns the value
+            return value
+        if value is None and is_nullable:
+            return None
+        try:
+            return cast_value(value)
+        except (ValueError, TypeError):
+            return value
+
+    return convert
@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import threading
+from typing import Any, Dict, Iterable, List, Mapping
 
 import dpath
 
@@ -55,26 +56,112 @@ def get_secrets(
     return result
 
 
+class _SecretMatcher:
+    """
+    Finds the occurrences of a fixed set of secrets in strings.
+
+    Checking every secret against a string costs a scan of the string per secret. When there are many long secrets, they are indexed
+    by their substrings of `_GRAM_SIZE` characters instead: an occurrence of a secret of at least `_MIN_INDEXED_SECRET_LENGTH`
+    characters always contains one of the substrings of the string starting at a multiple of `_GRAM_STEP` so only those substrings
+    need to be looked up to find the secrets that might be in the string.
+    """
+
+    _GRAM_SIZE = 8
+    _MIN_INDEXED_SECRET_LENGTH = 24
+    _GRAM_STEP = _MIN_INDEXED_SECRET_LENGTH - _GRAM_SIZE + 1
+    # Below this number of long secrets, checking each secret is faster than looking up the substrings of the string
+    _MIN_SECRETS_TO_INDEX = 64
+
+    def __init__(self, secrets: Iterable[Any]) -> None:
+        unique_secrets = {str(secret) for secret in secrets if secret}
+        long_secrets = [
+            secret for secret in unique_secrets if len(secret) >= self._MIN_INDEXED_SECRET_LENGTH
+        ]
+        self._secrets_by_gram: Dict[str, List[str]] = {}
+        if len(long_secrets) >= self._MIN_SECRETS_TO_INDEX:
+            for secret in long_secrets:
+                for gram in {
+                    secret[i : i + self._GRAM_SIZE]
+                    for i in range(len(secret) - self._GRAM_SIZE + 1)
+                }:
+                    self._secrets_by_gram.setdefault(gram, []).append(secret)
+            self._unindexed_secrets = [
+                secret for secret in unique_secrets if len(secret) < self._MIN_INDEXED_SECRET_LENGTH
+            ]
+        else:
+            self._unindexed_secrets = list(unique_secrets)
+
+    def replace(self, string: str, replacement: str) -> str:
+        """
+        Replace the secrets found in the string. Overlapping occurrences are replaced as a whole so that no part of a secret is left
+        in the string no matter how secrets overlap.
+        """
+        found_secrets = [secret for secret in self._unindexed_secrets if secret in string]
+        if self._secrets_by_gram and len(string) >= self._MIN_INDEXED_SECRET_LENGTH:
+            grams = {
+                string[i : i + self._GRAM_SIZE]
+                for i in range(0, len(string) - self._GRAM_SIZE + 1, self._GRAM_STEP)
+            }
+            candidates = {
+                secret
+                for gram in self._secrets_by_gram.keys() & grams
+                for secret in self._secrets_by_gram[gram]
+            }
+            found_secrets.extend(secret for secret in candidates if secret in string)
+        if not found_secrets:
+            return string
+
+        intervals = []
+        for secret in found_secrets:
+            start = string.find(secret)
+            while start != -1:
+                intervals.append((start, start + len(secret)))
+                start = string.find(secret, start + 1)
+        intervals.sort()
+
+        parts = []
+        position = 0
+        current_start, current_end = intervals[0]
+        for start, end in intervals[1:]:
+            if start < current_end:
+                current_end = max(current_end, end)
+            else:
+                parts.append(string[position:current_start])
+                parts.append(replacement)
+                position = current_end
+                current_start, current_end = start, end
+        parts.append(string[position:current_start])
+        parts.append(replacement)
+        parts.append(string[current_end:])
+        return "".join(parts)
+
+
 __SECRETS_FROM_CONFIG: List[str] = []
+__SECRET_MATCHER = _SecretMatcher([])
+# Secrets can be added by the threads refreshing tokens while other threads filter messages
+__SECRETS_LOCK = threading.Lock()
 
 
 def update_secrets(secrets: List[str]) -> None:
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
-    __SECRETS_FROM_CONFIG = secrets
+    global __SECRETS_FROM_CONFIG, __SECRET_MATCHER
+    with __SECRETS_LOCK:
+        __SECRETS_FROM_CONFIG = secrets
+        __SECRET_MATCHER = _SecretMatcher(__SECRETS_FROM_CONFIG)
 
 
 def add_to_secrets(secret: str) -> None:
     """Add to the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
-    __SECRETS_FROM_CONFIG.append(secret)
+    global __SECRET_MATCHER
+    with __SECRETS_LOCK:
+        # Tokens are added each time they are refreshed and the same token is often returned again: rebuilding the matcher would only
+        # index the same secrets again
+        if secret in __SECRETS_FROM_CONFIG:
+            return
+        __SECRETS_FROM_CONFIG.append(secret)
+        __SECRET_MATCHER = _SecretMatcher(__SECRETS_FROM_CONFIG)
 
 
 def filter_secrets(string: str) -> str:
     """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    return __SECRET_MATCHER.replace(string, "****")
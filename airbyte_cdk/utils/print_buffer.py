@@ -1,11 +1,11 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
 import sys
+import threading
 import time
-from io import StringIO
 from threading import RLock
 from types import TracebackType
-from typing import Optional
+from typing import BinaryIO, Optional
 
 
 class PrintBuffer:
@@ -17,9 +17,23 @@ class PrintBuffer:
     scenarios where you want to minimize the number of I/O operations by grouping
     multiple print statements together and flushing them as a single operation.
 
+    Messages are stored as UTF-8 bytes so that already serialized messages can be
+    written without being decoded and encoded again. Every write is appended to the
+    buffer while holding a lock so messages written by different threads are never
+    interleaved as long as each message is passed to a single `write` or `write_bytes`
+    call.
+
+    The buffer is flushed when:
+    * it grows over `max_buffer_size` bytes
+    * a write happens more than `flush_interval` seconds after the last flush
+    * a background thread sees that the buffer was not flushed for more than `flush_interval` seconds. This thread only runs while the
+      runtime context is entered and ensures messages are not held back when nothing else is written
+    * `flush` is called explicitly, for example after a STATE message
+
     Attributes:
-        buffer (StringIO): A buffer to store the messages before flushing.
+        buffer (bytearray): A buffer to store the messages before flushing.
         flush_interval (float): The time interval (in seconds) after which the buffer is flushed.
+        max_buffer_size (int): The number of bytes after which the buffer is flushed.
         last_flush_time (float): The last time the buffer was flushed.
         lock (RLock): A reentrant lock to ensure thread-safe operations.
 
@@ -27,6 +41,9 @@ class PrintBuffer:
         write(message: str) -> None:
             Writes a message to the buffer and flushes if the interval has passed.
 
+        write_bytes(message: bytes, flush: bool = False) -> None:
+            Writes an already encoded message to the buffer and flushes if requested or if a threshold is reached.
+
         flush() -> None:
             Flushes the buffer content to the standard output.
 
@@ -37,25 +54,62 @@ class PrintBuffer:
             Exits the runtime context and restores the original stdout and stderr.
     """
 
-    def __init__(self, flush_interval: float = 0.1):
-        self.buffer = StringIO()
+    DEFAULT_MAX_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        flush_interval: float = 0.1,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        output: Optional[BinaryIO] = None,
+    ):
+        """
+        :param flush_interval: The time interval (in seconds) after which the buffer is flushed
+        :param max_buffer_size: The number of bytes after which the buffer is flushed
+        :param output: The binary stream to flush to. Defaults to the binary layer of the original stdout
+        """
+        self.buffer = bytearray()
         self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
         self.last_flush_time = time.monotonic()
         self.lock = RLock()
+        self._output = output
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
 
     def write(self, message: str) -> None:
+        self.write_bytes(message.encode("utf-8", errors="backslashreplace"))
+
+    def write_bytes(self, message: bytes, flush: bool = False) -> None:
         with self.lock:
-            self.buffer.write(message)
-            current_time = time.monotonic()
-            if (current_time - self.last_flush_time) >= self.flush_interval:
+            self.buffer += message
+            if (
+                flush
+                or len(self.buffer) >= self.max_buffer_size
+                or (time.monotonic() - self.last_flush_time) >= self.flush_interval
+            ):
                 self.flush()
-                self.last_flush_time = current_time
 
     def flush(self) -> None:
         with self.lock:
-            combined_message = self.buffer.getvalue()
-            sys.__stdout__.write(combined_message)  # type: ignore[union-attr]
-            self.buffer = StringIO()
+            self.last_flush_time = time.monotonic()
+            if not self.buffer:
+                return
+            if self._output:
+                self._output.write(self.buffer)
+                self._output.flush()
+            else:
+                stdout = sys.__stdout__
+                # Anything written to the text layer of stdout needs to be flushed before writing to the binary layer to preserve ordering
+                stdout.flush()  # type: ignore[union-attr]
+                stdout.buffer.write(self.buffer)  # type: ignore[union-attr, arg-type]
+                stdout.buffer.flush()  # type: ignore[union-attr]
+            self.buffer = bytearray()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.flush_interval):
+            with self.lock:
+                if (time.monotonic() - self.last_flush_time) >= self.flush_interval:
+                    self.flush()
 
     def __enter__(self) -> "PrintBuffer":
         self.old_stdout, self.old_stderr = sys.stdout, sys.stderr
@@ -63,6 +117,12 @@ class PrintBuffer:
         if "pytest" not in str(type(sys.stdout)).lower():
             sys.stdout = self
             sys.stderr = self
+        if not (self._flusher and self._flusher.is_alive()):
+            self._stop_flusher.clear()
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="print-buffer-flusher", daemon=True
+            )
+            self._flusher.start()
         return self
 
     def __exit__(
@@ -71,5 +131,9 @@ class PrintBuffer:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
+        self._stop_flusher.set()
+        if self._flusher:
+            self._flusher.join()
+            self._flusher = None
         self.flush()
         sys.stdout, sys.stderr = self.old_stdout, self.old_stderr
@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import threading
+import time
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
+from airbyte_cdk.sources.streams.http.error_handlers import ResponseAction
+
+_WINDOW_SIZE = 10
+
+
+def _create_controller(
+    min_concurrency: int = 1, max_concurrency: int = 10, initial_concurrency: int = 5
+) -> AdaptiveConcurrencyController:
+    return AdaptiveConcurrencyController(
+        min_concurrency=min_concurrency,
+        max_concurrency=max_concurrency,
+        logger=Mock(),
+        initial_concurrency=initial_concurrency,
+        window_size=_WINDOW_SIZE,
+    )
+
+
+def _observe_window(
+    controller: AdaptiveConcurrencyController,
+    latency: float = 0.1,
+    response_actions: List[ResponseAction] = [],
+) -> None:
+    for index in range(_WINDOW_SIZE):
+        response_action = (
+            response_actions[index] if index < len(response_actions) else ResponseAction.SUCCESS
+        )
+        controller.on_request_attempt(latency, response_action)
+
+
+def test_given_healthy_requests_when_window_is_complete_then_increase_concurrency_by_one() -> None:
+    controller = _create_controller()
+
+    _observe_window(controller)
+
+    assert controller.concurrency == 6
+    controller._logger.info.assert_called_once()
+    assert "from 5 to 6" in controller._logger.info.call_args[0][0]
+
+
+def test_given_window_is_not_complete_then_keep_concurrency() -> None:
+    controller = _create_controller()
+
+    for _ in range(_WINDOW_SIZE - 1):
+        controller.on_request_attempt(0.1, ResponseAction.SUCCESS)
+
+    assert controller.concurrency == 5
+
+
+def test_given_rate_limited_requests_then_decrease_concurrency_multiplicatively() -> None:
+    controller = _create_controller(initial_concurrency=8)
+
+    _observe_window(controller, response_actions=[ResponseAction.RATE_LIMITED])
+
+    assert controller.concurrency == 4
+    assert "1 requests were rate limited" in controller._logger.info.call_args[0][0]
+
+
+def test_given_too_many_retries_then_decrease_concurrency_multiplicatively() -> None:
+    controller = _create_controller(initial_concurrency=8)
+
+    _observe_window(controller, response_actions=[ResponseAction.RETRY] * 2)
+
+    assert controller.concurrency == 4
+
+
+def test_given_latency_degrades_then_decrease_concurrency_by_one() -> None:
+    controller = _create_controller()
+    _observe_window(controller, latency=0.1)
+
+    _observe_window(controller, latency=1.0)
+
+    assert controller.concurrency == 5
+
+
+def test_given_latency_stays_high_then_baseline_adapts_and_concurrency_increases_again() -> None:
+    controller = _create_controller(max_concurrency=100, initial_concurrency=50)
+    _observe_window(controller, latency=0.1)
+
+    concurrencies = []
+    for _ in range(30):
+        _observe_window(controller, latency=0.5)
+        concurrencies.append(controller.concurrency)
+
+    assert min(concurrencies) < 51
+    assert concurrencies[-1] > min(concurrencies)
+
+
+def test_concurrency_stays_within_bounds() -> None:
+    controller = _create_controller(min_concurrency=2, max_concurrency=6, initial_concurrency=5)
+
+    for _ in range(5):
+        _observe_window(controller)
+    assert controller.concurrency == 6
+
+    for _ in range(5):
+        _observe_window(controller, response_actions=[ResponseAction.RATE_LIMITED])
+    assert controller.concurrency == 2
+
+
+@pytest.mark.parametrize(
+    "min_concurrency, max_concurrency, decrease_factor",
+    [
+        pytest.param(0, 10, 0.5, id="test_min_concurrency_below_one"),
+        pytest.param(11, 10, 0.5, id="test_min_concurrency_above_max_concurrency"),
+        pytest.param(1, 10, 1.0, id="test_decrease_factor_does_not_decrease"),
+    ],
+)
+def test_given_invalid_parameters_then_raise(
+    min_concurrency: int, max_concurrency: int, decrease_factor: float
+) -> None:
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyController(
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            logger=Mock(),
+            decrease_factor=decrease_factor,
+        )
+
+
+def test_partition_slots_are_limited_and_released_when_concurrency_increases() -> None:
+    controller = _create_controller(initial_concurrency=2)
+    number_of_partitions_being_read = 0
+    max_number_of_partitions_being_read = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def read_partition() -> None:
+        nonlocal number_of_partitions_being_read, max_number_of_partitions_being_read
+        with controller.partition_slot():
+            with lock:
+                number_of_partitions_being_read += 1
+                max_number_of_partitions_being_read = max(
+                    max_number_of_partitions_being_read, number_of_partitions_being_read
+                )
+            release.wait()
+            with lock:
+                number_of_partitions_being_read -= 1
+
+    threads = [threading.Thread(target=read_partition) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    assert number_of_partitions_being_read == 2
+
+    _observe_window(controller)
+    time.sleep(0.1)
+    assert number_of_partitions_being_read == 3
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert max_number_of_partitions_being_read == 3
+    assert controller._partitions_being_read == 0
@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+from unittest.mock import Mock
+
+from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import MemoryBoundedQueue
+from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
+from airbyte_cdk.sources.types import Record
+
+
+def _consume_records(metrics_log_interval_seconds: float) -> Mock:
+    logger = Mock()
+    threadpool = Mock(spec=ThreadPoolManager)
+    threadpool.task_slot_wait_seconds = 1.5
+    source = ConcurrentSource(
+        threadpool, logger, metrics_log_interval_seconds=metrics_log_interval_seconds
+    )
+    queue = MemoryBoundedQueue(max_size_in_bytes=2 * 1024 * 1024)
+    for _ in range(2):
+        queue.put(Record(data={"id": 1}, stream_name="a_stream"))
+    processor = Mock(spec=ConcurrentReadProcessor)
+    processor.on_record.return_value = []
+    processor.is_done.side_effect = [False, True]
+
+    list(source._consume_from_queue(queue, processor))
+
+    return logger
+
+
+def test_given_metrics_log_interval_elapsed_when_consume_from_queue_then_log_queue_metrics() -> (
+    None
+):
+    logger = _consume_records(metrics_log_interval_seconds=0)
+
+    logger.info.assert_called_once()
+    message = logger.info.call_args.args[0]
+    assert message.startswith("Queue metrics: 1 items of an estimated 0.0 MiB out of 2.0 MiB")
+    assert "partition generation blocked on pending tasks for 1.5s" in message
+
+
+def test_given_metrics_log_interval_not_elapsed_when_consume_from_queue_then_do_not_log() -> None:
+    logger = _consume_records(metrics_log_interval_seconds=60)
+
+    logger.info.assert_not_called()
+
+
+def test_given_no_record_batch_size_when_create_then_hand_off_records_in_batches() -> None:
+    source = ConcurrentSource.create(2, 1, Mock(), Mock(), Mock())
+
+    assert source._record_batch_size == ConcurrentSource.DEFAULT_RECORD_BATCH_SIZE
+    assert ConcurrentSource.DEFAULT_RECORD_BATCH_SIZE > 1
@@ -0,0 +1,141 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import threading
+from queue import Empty, Full
+from unittest.mock import Mock
+
+import orjson
+import pytest
+
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import MemoryBoundedQueue
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.types import Record
+
+_STREAM_NAME = "a_stream"
+
+
+def _record(size_in_bytes: int, stream_name: str = _STREAM_NAME) -> Record:
+    # {"value":"..."} is 12 bytes on top of the value
+    return Record(data={"value": "x" * (size_in_bytes - 12)}, stream_name=stream_name)
+
+
+def test_given_records_under_the_limit_when_put_then_do_not_block() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=1000, sample_interval=1)
+
+    for _ in range(10):
+        queue.put(_record(100), block=False)
+
+    metrics = queue.metrics
+    assert (metrics.depth, metrics.size_in_bytes) == (10, 1000)
+    with pytest.raises(Full):
+        queue.put(_record(100), block=False)
+
+
+def test_given_records_are_consumed_when_get_then_free_space() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=1000, sample_interval=1)
+    records = [_record(500), _record(500)]
+    for record in records:
+        queue.put(record)
+
+    assert queue.get() is records[0]
+    queue.put(_record(500), block=False)
+    assert queue.metrics.size_in_bytes == 1000
+
+
+def test_given_record_larger_than_the_limit_when_queue_is_empty_then_accept_it() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=100, sample_interval=1)
+
+    queue.put(_record(1000), block=False)
+
+    assert queue.qsize() == 1
+    with pytest.raises(Full):
+        queue.put(Mock(spec=Partition), block=False)
+
+
+def test_given_sample_interval_when_put_then_estimate_records_from_the_sampled_records() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=1_000_000, sample_interval=10)
+
+    queue.put(_record(100))
+    for _ in range(8):
+        queue.put(_record(1000))
+
+    # Only the first record was measured
+    assert queue.metrics.size_in_bytes == 900
+    queue.put(_record(1000))
+    assert queue.metrics.size_in_bytes == 900 + 550
+
+
+def test_given_batch_of_records_when_put_then_estimate_the_size_of_the_batch() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=1_000_000)
+
+    queue.put([_record(100) for _ in range(50)])
+    queue.put(Mock(spec=Partition))
+
+    assert queue.metrics.size_in_bytes == 50 * 100 + 1024
+    assert queue.qsize() == 2
+
+
+def test_given_streams_of_different_sizes_when_put_then_estimate_each_stream_separately() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=1_000_000)
+
+    queue.put(_record(100, "small_records"))
+    queue.put(_record(10_000, "large_records"))
+    queue.put(_record(100, "small_records"))
+    queue.put(_record(10_000, "large_records"))
+
+    assert queue.metrics.size_in_bytes == 2 * 100 + 2 * 10_000
+
+
+def test_given_full_queue_when_put_then_block_until_the_consumer_frees_space() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=100, sample_interval=1)
+    queue.put(_record(100))
+    producer = threading.Thread(target=queue.put, args=(_record(100),))
+
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+
+    queue.get()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    assert queue.metrics.producer_blocked_seconds >= 0.2
+
+
+def test_given_empty_queue_when_get_with_timeout_then_raise_and_track_blocked_time() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=100)
+
+    with pytest.raises(Empty):
+        queue.get(timeout=0.1)
+    with pytest.raises(Empty):
+        queue.get(block=False)
+
+    assert queue.metrics.consumer_blocked_seconds >= 0.1
+
+
+def test_given_full_queue_when_put_with_timeout_then_raise() -> None:
+    queue = MemoryBoundedQueue(max_size_in_bytes=100, sample_interval=1)
+    queue.put(_record(100))
+
+    with pytest.raises(Full):
+        queue.put(_record(100), timeout=0.1)
+
+    assert queue.qsize() == 1
+    assert queue.metrics.size_in_bytes == 100
+
+
+@pytest.mark.slow
+def test_memory_bounded_queue_holds_less_memory_than_item_bounded_queue_with_large_records() -> (
+    None
+):
+    record_size = 100 * 1024
+    item_bounded_queue_size = 10_000 * record_size
+    queue = MemoryBoundedQueue(max_size_in_bytes=64 * 1024 * 1024)
+    while True:
+        try:
+            queue.put(_record(record_size), block=False)
+        except Full:
+            break
+
+    assert queue.metrics.size_in_bytes < item_bounded_queue_size / 10
+    assert len(orjson.dumps(_record(record_size).data)) == record_size
@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import io
+import json
+from typing import Any, List
+
+import pytest
+import requests
+
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+
+
+def _create_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _extract(decoder: StreamingJsonDecoder, body: bytes, field_path: List[str]) -> List[Any]:
+    extractor = DpathExtractor(field_path=field_path, config={}, decoder=decoder, parameters={})
+    return list(extractor.extract_records(_create_response(body)))
+
+
+_BODIES = [
+    pytest.param(b'{"data": [{"id": 1}, {"id": 2}]}', ["data"], id="test_top_level_array"),
+    pytest.param(
+        b'{"meta": {"count": 2, "tags": ["a", "]"]}, "page": {"data": [{"id": 1}, {"id": 2}]}}',
+        ["page", "data"],
+        id="test_nested_array_after_other_keys",
+    ),
+    pytest.param(
+        b'{"data": [{"name": "a \\"quoted\\" ] } [ {"}, {"name": "back\\\\slash"}]}',
+        ["data"],
+        id="test_strings_with_escapes_and_brackets",
+    ),
+    pytest.param(
+        b'{ "data" :\n [ 1 , -2.5e3 , true , null , "text" , [ 1 , 2 ] ] \n}',
+        ["data"],
+        id="test_scalars_and_whitespaces",
+    ),
+    pytest.param(b'{"data": []}', ["data"], id="test_empty_array"),
+    pytest.param(b'{"data": {"id": 1}}', ["data"], id="test_object_at_path"),
+    pytest.param(b'{"other": [{"id": 1}]}', ["data"], id="test_missing_path"),
+    pytest.param(b'[{"id": 1}, {"id": 2}]', [], id="test_root_array"),
+    pytest.param(
+        b'{"data": [{"list": [{"id": 1}]}, {"list": [{"id": 2}]}]}',
+        ["data", "*", "list"],
+        id="test_wildcard_path",
+    ),
+    pytest.param(b'{"data": [{"id": 1}', ["other"], id="test_invalid_json"),
+    pytest.param(b"", ["data"], id="test_empty_response"),
+    pytest.param('{"data": [{"name": "é€😀"}]}'.encode(), ["data"], id="test_multibyte_characters"),
+]
+
+
+@pytest.mark.parametrize("body, field_path", _BODIES)
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+def test_streaming_json_decoder_extracts_the_same_records_as_json_decoder(
+    body: bytes, field_path: List[str], chunk_size: int
+) -> None:
+    expected_records = list(
+        DpathExtractor(
+            field_path=field_path, config={}, decoder=JsonDecoder(parameters={}), parameters={}
+        ).extract_records(_create_response(body))
+    )
+
+    records = _extract(StreamingJsonDecoder(parameters={}, chunk_size=chunk_size), body, field_path)
+
+    assert records == expected_records
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+def test_streaming_json_decoder_decode_returns_the_whole_body(chunk_size: int) -> None:
+    decoder = StreamingJsonDecoder(parameters={}, chunk_size=chunk_size)
+
+    for body in [b'{"data": [1, 2]}', b"[]", b"not json"]:
+        assert list(decoder.decode(_create_response(body))) == list(
+            JsonDecoder(parameters={}).decode(_create_response(body))
+        )
+    assert decoder.is_stream_response()
+
+
+def test_given_invalid_item_when_streaming_then_raise() -> None:
+    decoder = StreamingJsonDecoder(parameters={})
+
+    with pytest.raises(Exception):
+        _extract(decoder, b'{"data": [{"id": 1}, {"id": ]}', ["data"])
+
+
+def test_given_records_are_consumed_when_streaming_then_response_is_read_incrementally() -> None:
+    chunk_size = 1024
+    body = json.dumps(
+        {
+            "meta": {"count": 10_000, "links": ["]", "}"]},
+            "page": {"data": [{"id": i, "value": "x" * 100} for i in range(10_000)]},
+        }
+    ).encode()
+    response = _create_response(body)
+    records = DpathExtractor(
+        field_path=["page", "data"],
+        config={},
+        decoder=StreamingJsonDecoder(parameters={}, chunk_size=chunk_size),
+        parameters={},
+    ).extract_records(response)
+
+    assert next(iter(records)) == {"id": 0, "value": "x" * 100}
+    assert response.raw.tell() < 4 * chunk_size
+
+
+@pytest.mark.slow
+@pytest.mark.limit_memory("20 MB")
+def test_streaming_json_decoder_memory_usage_on_large_page(requests_mock, tmp_path) -> None:
+    number_of_records = 500_000
+    record = json.dumps({"id": 1, "name": "a name", "tags": ["a", "b"], "nested": {"value": 1.5}})
+    file_path = tmp_path / "response.json"
+    # ≈ 40 MB of response
+    with open(file_path, "w") as file:
+        file.write('{"meta": {}, "data": [')
+        for i in range(number_of_records):
+            file.write(f",{record}" if i else record)
+        file.write("]}")
+    requests_mock.get("https://api.test/records", body=open(file_path, "rb"))
+
+    counter = 0
+    extractor = DpathExtractor(
+        field_path=["data"], config={}, decoder=StreamingJsonDecoder(parameters={}), parameters={}
+    )
+    for _ in extractor.extract_records(requests.get("https://api.test/records", stream=True)):
+        counter += 1
+
+    assert counter == number_of_records
@@ -4,7 +4,9 @@
 import io
 import json
 from typing import Dict, List, Union
+from unittest.mock import patch
 
+import dpath
 import pytest
 import requests
 
@@ -15,7 +17,11 @@ from airbyte_cdk.sources.declarative.decoders.json_decoder import (
     IterableDecoder,
     JsonDecoder,
 )
-from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import (
+    DpathExtractor,
+    _CompiledPath,
+)
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
@@ -122,3 +128,138 @@ def test_dpath_extractor(field_path: List, decoder: Decoder, body, expected_reco
     actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
+
+
+_BODY = {
+    "data": [
+        {"id": 1, "list": [{"id": 11}, {"id": 12}], "empty": {}, "zero": 0, "null": None},
+        {"id": 2, "list": {"a": {"id": 21}, "b": {"id": 22}}, "string": "value"},
+    ],
+    "0": {"id": "key zero"},
+    "nested": {"deep": {"deeper": {"records": [{"id": 1}]}}},
+}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        ["data"],
+        ["nested", "deep", "deeper", "records"],
+        ["data", "0"],
+        ["data", 0],
+        ["data", "-1"],
+        ["data", -1],
+        ["data", "01"],
+        ["data", "2"],
+        ["data", "-3"],
+        ["0"],
+        [0],
+        ["data", "0", "list", "1"],
+        ["data", "0", "empty"],
+        ["data", "0", "zero"],
+        ["data", "0", "null"],
+        ["data", "1", "string", "0"],
+        ["missing", "key"],
+        ["data", "*"],
+        ["data", "*", "id"],
+        ["data", "*", "list", "*"],
+        ["data", "*", "list", "*", "id"],
+        ["data", "*", "list", "0"],
+        ["*", "id"],
+        ["data", "*", "missing"],
+    ],
+)
+def test_compiled_path_matches_dpath(path: List) -> None:
+    expected = dpath.values(_BODY, path) if "*" in path else dpath.get(_BODY, path, default=[])
+
+    compiled_path = _CompiledPath.compile(path)
+
+    assert compiled_path is not None
+    assert compiled_path.extract(_BODY) == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        ["data", "0", "list", "1"],
+        ["data", "-1"],
+        ["data", "0", "null"],
+        ["nested", "deep"],
+        ["missing", "key"],
+        ["data", "2"],
+    ],
+)
+def test_compiled_path_get_matches_dpath_get(path: List) -> None:
+    compiled_path = _CompiledPath.compile(path)
+    assert compiled_path is not None
+
+    try:
+        expected = dpath.get(_BODY, path)
+    except KeyError:
+        with pytest.raises(KeyError):
+            compiled_path.get(_BODY)
+    else:
+        assert compiled_path.get(_BODY) == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    [["data", "?"], ["data", "**"], ["da*"], ["data", "[0]"], ["data", None], ["data", 1.0]],
+)
+def test_given_glob_or_unsupported_segment_when_compile_then_return_none(path: List) -> None:
+    assert _CompiledPath.compile(path) is None
+
+
+def test_given_glob_path_when_extract_records_then_fall_back_to_dpath() -> None:
+    extractor = DpathExtractor(
+        field_path=["d?ta"], config=config, decoder=decoder_json, parameters=parameters
+    )
+
+    records = list(extractor.extract_records(create_response({"data": [{"id": 1}]})))
+
+    assert records == [{"id": 1}]
+
+
+def test_given_static_path_when_extract_records_then_do_not_interpolate_the_path() -> None:
+    extractor = DpathExtractor(
+        field_path=["data", "1"], config=config, decoder=decoder_json, parameters=parameters
+    )
+
+    with patch.object(InterpolatedString, "eval") as interpolated_string_eval:
+        records = list(extractor.extract_records(create_response({"data": [{}, {"id": 2}]})))
+
+    assert records == [{"id": 2}]
+    interpolated_string_eval.assert_not_called()
+
+
+@pytest.mark.slow
+def test_given_large_body_when_extract_with_compiled_path_then_do_not_use_dpath() -> None:
+    number_of_records = 20_000
+    body = {
+        "response": {
+            "result": {
+                "page": {
+                    "records": [
+                        {"id": i, "attributes": {"name": f"name {i}", "tags": ["a", "b", "c"]}}
+                        for i in range(number_of_records)
+                    ]
+                }
+            }
+        },
+        "metadata": {"links": [{"href": f"https://api.test/{i}"} for i in range(100)]},
+    }
+    path = ["response", "result", "page", "records"]
+    wildcard_path = ["response", "result", "page", "records", "*", "attributes"]
+    expected = dpath.get(body, path)
+    expected_wildcard = dpath.values(body, wildcard_path)
+
+    # The compiled paths look the values up directly instead of walking every leaf of the body with dpath
+    with patch.object(dpath, "get") as dpath_get, patch.object(dpath, "values") as dpath_values:
+        extracted = _CompiledPath.compile(path).extract(body)
+        extracted_wildcard = _CompiledPath.compile(wildcard_path).extract(body)
+
+    assert extracted == expected
+    assert extracted_wildcard == expected_wildcard
+    assert len(extracted_wildcard) == number_of_records
+    dpath_get.assert_not_called()
+    dpath_values.assert_not_called()
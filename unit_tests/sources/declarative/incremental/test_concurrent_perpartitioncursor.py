@@ -1,8 +1,9 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 import copy
+import logging
 from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Any, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 from unittest.mock import MagicMock, patch
 from urllib.parse import unquote
 
@@ -20,6 +21,14 @@ from airbyte_cdk.sources.declarative.concurrent_declarative_source import (
     ConcurrentDeclarativeSource,
 )
 from airbyte_cdk.sources.declarative.incremental import ConcurrentPerPartitionCursor
+from airbyte_cdk.sources.declarative.incremental.concurrent_partition_cursor import (
+    ConcurrentCursorFactory,
+)
+from airbyte_cdk.sources.declarative.incremental.partition_state_store import (
+    InMemoryPartitionStateStore,
+    PartitionStateStore,
+    SqlitePartitionStateStore,
+)
 from airbyte_cdk.sources.declarative.stream_slicers.declarative_partition_generator import (
     DeclarativePartition,
 )
@@ -27,7 +36,7 @@ from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
 from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import (
     CustomFormatConcurrentStreamStateConverter,
 )
-from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.sources.types import Record, StreamSlice
 from airbyte_cdk.test.catalog_builder import CatalogBuilder, ConfiguredAirbyteStreamBuilder
 from airbyte_cdk.test.entrypoint_wrapper import EntrypointOutput, read
 
@@ -3773,3 +3782,346 @@ def test_given_global_state_when_read_then_state_is_not_per_partition() -> None:
             "use_global_cursor": True,  # ensures that it is running the Concurrent CDK version as this is not populated in the declarative implementation
         },  # this state does have per partition which would be under `states`
     )
+
+
+def _generate_and_close_partitions(
+    cursor: ConcurrentPerPartitionCursor, partition_ids: Iterable[str]
+) -> int:
+    """
+    Simulate the main thread closing every partition as soon as its slices are generated.
+    """
+    partition_router = cursor._partition_router
+    partition_router.stream_slices.return_value = (
+        StreamSlice(partition={"id": partition_id}, cursor_slice={})
+        for partition_id in partition_ids
+    )
+    # Not using a mock return value as mocks keep track of every call
+    partition_router.get_stream_state = lambda: {"parent": {"state": "state"}}
+    retriever = MagicMock()
+    message_repository = MagicMock()
+    number_of_slices = 0
+    for stream_slice in cursor.stream_slices():
+        cursor.close_partition(
+            DeclarativePartition("test_stream", {}, retriever, message_repository, stream_slice)
+        )
+        number_of_slices += 1
+    return number_of_slices
+
+
+def _create_cursor_with_partitions(
+    cursor_factory: ConcurrentCursorFactory,
+    number_of_partitions_in_state: int,
+    partition_state_store: Optional[PartitionStateStore] = None,
+) -> ConcurrentPerPartitionCursor:
+    return ConcurrentPerPartitionCursor(
+        cursor_factory=cursor_factory,
+        partition_router=MagicMock(),
+        stream_name="test_stream",
+        stream_namespace=None,
+        stream_state={
+            "states": [
+                {
+                    "partition": {"id": f"state_{i}"},
+                    "cursor": {"updated_at": "2024-01-01T00:00:00Z"},
+                }
+                for i in range(number_of_partitions_in_state)
+            ],
+        },
+        message_repository=MagicMock(),
+        connector_state_manager=MagicMock(),
+        connector_state_converter=MagicMock(),
+        cursor_field=CursorField(cursor_field_key="updated_at"),
+        partition_state_store=partition_state_store,
+    )
+
+
+class _OneSliceCursor:
+    def __init__(self, state: Optional[Mapping[str, Any]] = None) -> None:
+        self.initial_state = state
+        self.state = {"updated_at": "2024-01-02T00:00:00Z"}
+
+    def stream_slices(self) -> Iterable[Mapping[str, Any]]:
+        yield {}
+
+    def close_partition(self, partition: Any) -> None:
+        pass
+
+
+def test_given_partition_limit_reached_when_generate_partitions_then_drop_oldest_finished_partitions():
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(lambda stream_state, runtime_lookback_window: _OneSliceCursor()),
+        number_of_partitions_in_state=1,
+    )
+    cursor.DEFAULT_MAX_PARTITIONS_NUMBER = 3
+
+    _generate_and_close_partitions(cursor, ["1", "2", "3", "4"])
+
+    # The partition from the state was not finished during this sync so it is kept over the finished ones
+    assert list(cursor._cursor_per_partition.keys()) == [
+        '{"id":"state_0"}',
+        '{"id":"3"}',
+        '{"id":"4"}',
+    ]
+    assert [state["partition"] for state in cursor.state["states"]] == [
+        {"id": "state_0"},
+        {"id": "3"},
+        {"id": "4"},
+    ]
+
+
+def test_given_no_finished_partition_when_partition_limit_reached_then_drop_oldest_partition():
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(lambda stream_state, runtime_lookback_window: _OneSliceCursor()),
+        number_of_partitions_in_state=3,
+    )
+    cursor.DEFAULT_MAX_PARTITIONS_NUMBER = 3
+
+    cursor._partition_router.stream_slices.return_value = iter(
+        [StreamSlice(partition={"id": "1"}, cursor_slice={})]
+    )
+    list(cursor.stream_slices())
+
+    assert list(cursor._cursor_per_partition.keys()) == [
+        '{"id":"state_1"}',
+        '{"id":"state_2"}',
+        '{"id":"1"}',
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.limit_memory("100 MB")
+def test_partition_generation_with_partition_limit_reached_benchmark(caplog):
+    caplog.set_level(logging.ERROR, logger="airbyte")
+    number_of_partitions = 500_000
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(lambda stream_state, runtime_lookback_window: _OneSliceCursor()),
+        # Partitions from the previous sync which are not finished so they need to be skipped when evicting partitions
+        number_of_partitions_in_state=ConcurrentPerPartitionCursor.DEFAULT_MAX_PARTITIONS_NUMBER
+        // 2,
+    )
+
+    number_of_slices = _generate_and_close_partitions(
+        cursor, (str(i) for i in range(number_of_partitions))
+    )
+
+    assert number_of_slices == number_of_partitions
+    assert (
+        len(cursor._cursor_per_partition)
+        == ConcurrentPerPartitionCursor.DEFAULT_MAX_PARTITIONS_NUMBER
+    )
+
+
+@pytest.mark.parametrize(
+    "partition_state_store_factory",
+    [
+        pytest.param(InMemoryPartitionStateStore, id="in_memory"),
+        pytest.param(SqlitePartitionStateStore, id="sqlite"),
+    ],
+)
+def test_given_partition_state_store_when_partition_limit_reached_then_keep_state_of_every_partition(
+    partition_state_store_factory,
+):
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(
+            lambda stream_state, runtime_lookback_window: _OneSliceCursor(stream_state)
+        ),
+        number_of_partitions_in_state=2,
+        partition_state_store=partition_state_store_factory(),
+    )
+    cursor.DEFAULT_MAX_PARTITIONS_NUMBER = 2
+    cursor.SWITCH_TO_GLOBAL_LIMIT = 1
+
+    _generate_and_close_partitions(cursor, ["1", "state_1", "2", "3"])
+
+    final_state = cursor.state
+    assert final_state["use_global_cursor"] is False
+    assert final_state["states"] == [
+        {"partition": {"id": "state_0"}, "cursor": {"updated_at": "2024-01-01T00:00:00Z"}},
+        {"partition": {"id": "state_1"}, "cursor": {"updated_at": "2024-01-02T00:00:00Z"}},
+        {"partition": {"id": "1"}, "cursor": {"updated_at": "2024-01-02T00:00:00Z"}},
+        {"partition": {"id": "2"}, "cursor": {"updated_at": "2024-01-02T00:00:00Z"}},
+        {"partition": {"id": "3"}, "cursor": {"updated_at": "2024-01-02T00:00:00Z"}},
+    ]
+    assert len(cursor._cursor_per_partition) <= cursor.DEFAULT_MAX_PARTITIONS_NUMBER
+
+
+def test_given_partition_state_store_when_partition_in_store_is_synced_then_cursor_is_created_from_stored_state():
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(
+            lambda stream_state, runtime_lookback_window: _OneSliceCursor(stream_state)
+        ),
+        number_of_partitions_in_state=1,
+        partition_state_store=InMemoryPartitionStateStore(),
+    )
+
+    _generate_and_close_partitions(cursor, ["state_0"])
+
+    assert cursor._cursor_per_partition['{"id":"state_0"}'].initial_state == {
+        "updated_at": "2024-01-01T00:00:00Z"
+    }
+
+
+def test_given_partition_state_store_when_no_finished_partition_then_do_not_drop_partitions():
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(lambda stream_state, runtime_lookback_window: _OneSliceCursor()),
+        number_of_partitions_in_state=0,
+        partition_state_store=InMemoryPartitionStateStore(),
+    )
+    cursor.DEFAULT_MAX_PARTITIONS_NUMBER = 2
+    cursor._partition_router.stream_slices.return_value = iter(
+        [StreamSlice(partition={"id": str(i)}, cursor_slice={}) for i in range(3)]
+    )
+
+    list(cursor.stream_slices())
+
+    assert len(cursor._cursor_per_partition) == 3
+
+
+@pytest.mark.slow
+def test_given_millions_of_partitions_when_using_sqlite_partition_state_store_then_keep_every_partition_state(
+    caplog,
+):
+    caplog.set_level(logging.ERROR, logger="airbyte")
+    number_of_partitions_in_state = 2_000_000
+    number_of_synced_partitions = 200_000
+    partition_state_store = SqlitePartitionStateStore()
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(
+            lambda stream_state, runtime_lookback_window: _OneSliceCursor(stream_state)
+        ),
+        number_of_partitions_in_state=number_of_partitions_in_state,
+        partition_state_store=partition_state_store,
+    )
+
+    # Half of the synced partitions were in the state
+    _generate_and_close_partitions(
+        cursor,
+        (f"state_{i}" if i % 2 else str(i) for i in range(number_of_synced_partitions)),
+    )
+    final_state = cursor.state
+
+    assert len(cursor._cursor_per_partition) <= cursor.DEFAULT_MAX_PARTITIONS_NUMBER
+    assert final_state["use_global_cursor"] is False
+    assert (
+        len(final_state["states"])
+        == number_of_partitions_in_state + number_of_synced_partitions // 2
+    )
+    assert final_state["states"][0] == {
+        "partition": {"id": "state_0"},
+        "cursor": {"updated_at": "2024-01-01T00:00:00Z"},
+    }
+    assert final_state["states"][1] == {
+        "partition": {"id": "state_1"},
+        "cursor": {"updated_at": "2024-01-02T00:00:00Z"},
+    }
+    assert final_state["states"][-1] == {
+        "partition": {"id": str(number_of_synced_partitions - 2)},
+        "cursor": {"updated_at": "2024-01-02T00:00:00Z"},
+    }
+    partition_state_store.close()
+
+
+class _UpdatedOnCloseCursor:
+    def __init__(self, state: Mapping[str, Any]) -> None:
+        self.state = state
+
+    def stream_slices(self) -> Iterable[Mapping[str, Any]]:
+        yield {}
+
+    def close_partition(self, partition: Any) -> None:
+        self.state["updated_at"] = "2024-01-02T00:00:00Z"
+
+
+def test_given_state_emitted_when_partition_closed_then_reuse_state_entries_of_unchanged_partitions():
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(
+            lambda stream_state, runtime_lookback_window: _UpdatedOnCloseCursor(stream_state)
+        ),
+        number_of_partitions_in_state=2,
+    )
+
+    state_before_close = cursor.state
+    _generate_and_close_partitions(cursor, ["state_1", "1"])
+    state_after_close = cursor.state
+
+    assert state_after_close["states"][0] is state_before_close["states"][0]
+    assert state_before_close["states"][1] == {
+        "partition": {"id": "state_1"},
+        "cursor": {"updated_at": "2024-01-01T00:00:00Z"},
+    }
+    assert state_after_close["states"][1:] == [
+        {"partition": {"id": "state_1"}, "cursor": {"updated_at": "2024-01-02T00:00:00Z"}},
+        {"partition": {"id": "1"}, "cursor": {"updated_at": "2024-01-02T00:00:00Z"}},
+    ]
+
+
+@pytest.mark.slow
+def test_given_many_partitions_when_emitting_states_then_serialize_only_changed_partitions(caplog):
+    caplog.set_level(logging.ERROR, logger="airbyte")
+    number_of_emissions = 100
+    cursor = _create_cursor_with_partitions(
+        ConcurrentCursorFactory(
+            lambda stream_state, runtime_lookback_window: _UpdatedOnCloseCursor(stream_state)
+        ),
+        number_of_partitions_in_state=ConcurrentPerPartitionCursor.SWITCH_TO_GLOBAL_LIMIT
+        - number_of_emissions,
+    )
+    cursor._partition_router.stream_slices.return_value = (
+        StreamSlice(partition={"id": str(i)}, cursor_slice={}) for i in range(number_of_emissions)
+    )
+    cursor._partition_router.get_stream_state = lambda: {"parent": {"state": "state"}}
+
+    # One more partition changes between state messages
+    with patch.object(cursor, "_to_dict", wraps=cursor._to_dict) as to_dict:
+        for stream_slice in cursor.stream_slices():
+            cursor.close_partition(
+                DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), stream_slice)
+            )
+            state = cursor.state
+
+    assert len(state["states"]) == ConcurrentPerPartitionCursor.SWITCH_TO_GLOBAL_LIMIT
+    # Serializing every partition for every state message would decode each partition once per state message
+    assert to_dict.call_count <= ConcurrentPerPartitionCursor.SWITCH_TO_GLOBAL_LIMIT
+
+
+def test_given_records_older_than_global_cursor_when_observe_then_do_not_parse_their_cursor_value():
+    partition_cursor = MagicMock()
+    partition_cursor.stream_slices.return_value = iter([{}])
+    connector_state_converter = CustomFormatConcurrentStreamStateConverter(
+        datetime_format="%Y-%m-%dT%H:%M:%SZ",
+        input_datetime_formats=["%Y-%m-%dT%H:%M:%SZ"],
+        is_sequential_state=True,
+        cursor_granularity=timedelta(0),
+    )
+    cursor = ConcurrentPerPartitionCursor(
+        cursor_factory=ConcurrentCursorFactory(
+            lambda stream_state, runtime_lookback_window: partition_cursor
+        ),
+        partition_router=MagicMock(),
+        stream_name="test_stream",
+        stream_namespace=None,
+        stream_state={},
+        message_repository=MagicMock(),
+        connector_state_manager=MagicMock(),
+        connector_state_converter=connector_state_converter,
+        cursor_field=CursorField(cursor_field_key="updated_at"),
+    )
+    cursor._partition_router.stream_slices.return_value = iter(
+        [StreamSlice(partition={"id": "1"}, cursor_slice={})]
+    )
+    (stream_slice,) = cursor.stream_slices()
+    records = [Record({"updated_at": "2024-01-31T00:00:00Z"}, "test_stream", stream_slice)] + [
+        Record({"updated_at": f"2024-01-{day:02}T00:00:00Z"}, "test_stream", stream_slice)
+        for day in range(1, 31)
+    ]
+
+    with patch.object(
+        connector_state_converter, "parse_value", wraps=connector_state_converter.parse_value
+    ) as parse_value:
+        for record in records:
+            cursor.observe(record)
+
+    # Only the value becoming the global cursor is fully parsed to be formatted
+    assert parse_value.call_count == 1
+    assert cursor._new_global_cursor == {"updated_at": "2024-01-31T00:00:00Z"}
+    assert partition_cursor.observe.call_count == len(records)
@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import os
+from typing import Callable
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.sources.declarative.incremental import (
+    InMemoryPartitionStateStore,
+    LazyPartitionStateStore,
+    PartitionStateStore,
+    SqlitePartitionStateStore,
+)
+
+_STORE_FACTORIES = [
+    pytest.param(InMemoryPartitionStateStore, id="in_memory"),
+    pytest.param(SqlitePartitionStateStore, id="sqlite"),
+    pytest.param(lambda: LazyPartitionStateStore(SqlitePartitionStateStore), id="lazy_sqlite"),
+]
+
+
+@pytest.mark.parametrize("store_factory", _STORE_FACTORIES)
+def test_given_unknown_partition_when_get_then_return_none(
+    store_factory: Callable[[], PartitionStateStore],
+) -> None:
+    store = store_factory()
+
+    assert store.get('{"id":"1"}') is None
+    assert '{"id":"1"}' not in store
+    assert len(store) == 0
+
+
+@pytest.mark.parametrize("store_factory", _STORE_FACTORIES)
+def test_given_states_set_when_get_then_return_latest_state(
+    store_factory: Callable[[], PartitionStateStore],
+) -> None:
+    store = store_factory()
+
+    store.set('{"id":"1"}', {"updated_at": "2024-01-01"})
+    store.set('{"id":"1"}', {"updated_at": "2024-01-02"})
+
+    assert store.get('{"id":"1"}') == {"updated_at": "2024-01-02"}
+    assert '{"id":"1"}' in store
+    assert len(store) == 1
+
+
+@pytest.mark.parametrize("store_factory", _STORE_FACTORIES)
+def test_given_state_replaced_when_items_then_keep_insertion_order(
+    store_factory: Callable[[], PartitionStateStore],
+) -> None:
+    store = store_factory()
+    store.set('{"id":"1"}', {"updated_at": "2024-01-01"})
+    store.set('{"id":"2"}', {"updated_at": "2024-01-01"})
+    store.set('{"id":"1"}', {"updated_at": "2024-01-02"})
+
+    assert list(store.items()) == [
+        ('{"id":"1"}', {"updated_at": "2024-01-02"}),
+        ('{"id":"2"}', {"updated_at": "2024-01-01"}),
+    ]
+
+
+def test_given_more_states_than_a_page_when_items_then_return_all_states() -> None:
+    store = SqlitePartitionStateStore()
+    number_of_partitions = SqlitePartitionStateStore._ITEMS_PAGE_SIZE * 2 + 1
+    for i in range(number_of_partitions):
+        store.set(str(i), {"updated_at": i})
+
+    items = list(store.items())
+
+    assert len(items) == number_of_partitions
+    assert items[-1] == (str(number_of_partitions - 1), {"updated_at": number_of_partitions - 1})
+
+
+def test_given_database_path_when_reopen_then_states_are_kept(tmp_path) -> None:
+    database_path = str(tmp_path / "partition_state.db")
+    store = SqlitePartitionStateStore(database_path)
+    store.set('{"id":"1"}', {"updated_at": "2024-01-01"})
+    store.close()
+
+    store = SqlitePartitionStateStore(database_path)
+
+    assert len(store) == 1
+    assert store.get('{"id":"1"}') == {"updated_at": "2024-01-01"}
+
+
+def test_when_close_then_delete_temporary_database() -> None:
+    store = SqlitePartitionStateStore()
+    temporary_directory = store._temporary_directory.name
+
+    store.close()
+
+    assert not os.path.exists(temporary_directory)
+
+
+def test_given_no_state_set_when_read_and_close_lazy_store_then_do_not_create_store() -> None:
+    create_store = Mock(side_effect=SqlitePartitionStateStore)
+    store = LazyPartitionStateStore(create_store)
+
+    assert store.get('{"id":"1"}') is None
+    assert '{"id":"1"}' not in store
+    assert list(store.items()) == []
+    assert len(store) == 0
+    store.close()
+
+    create_store.assert_not_called()
+
+
+def test_given_states_set_when_lazy_store_then_create_store_once() -> None:
+    create_store = Mock(side_effect=InMemoryPartitionStateStore)
+    store = LazyPartitionStateStore(create_store)
+
+    store.set('{"id":"1"}', {"updated_at": "2024-01-01"})
+    store.set('{"id":"2"}', {"updated_at": "2024-01-02"})
+
+    create_store.assert_called_once()
+    assert list(store.items()) == [
+        ('{"id":"1"}', {"updated_at": "2024-01-01"}),
+        ('{"id":"2"}', {"updated_at": "2024-01-02"}),
+    ]
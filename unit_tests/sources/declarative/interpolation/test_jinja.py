@@ -2,14 +2,19 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import ast
 import datetime
+import functools
+from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
+from jinja2 import meta
+from jinja2.environment import Template
 from jinja2.exceptions import TemplateSyntaxError
 
 from airbyte_cdk import StreamSlice
-from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
+from airbyte_cdk.sources.declarative.interpolation.jinja import _ENVIRONMENT, JinjaInterpolation
 from airbyte_cdk.utils import AirbyteTracedException
 
 interpolation = JinjaInterpolation()
@@ -357,3 +362,152 @@ def test_interpolation_private_partition_attribute():
     actual_output = JinjaInterpolation().eval(template, {}, **{"stream_slice": stream_slice})
 
     assert actual_output == expected_output
+
+
+@pytest.mark.parametrize(
+    "template_string, expected_value",
+    [
+        pytest.param("a plain string", "a plain string", id="test_plain_string"),
+        pytest.param("1234", 1234, id="test_number"),
+        pytest.param("{{ 'quoted' }}", "quoted", id="test_constant_expression"),
+        pytest.param("a {# comment #}string", "a string", id="test_comment"),
+        pytest.param("{% raw %}{{ raw }}{% endraw %}", "{{ raw }}", id="test_raw_block"),
+    ],
+)
+def test_given_constant_template_when_eval_then_render_only_once(template_string, expected_value):
+    assert interpolation.eval(template_string, {}) == expected_value
+
+    with patch.object(Template, "render", side_effect=AssertionError("should not render")):
+        assert interpolation.eval(template_string, {}) == expected_value
+
+
+def test_given_constant_template_with_mutable_value_when_eval_then_return_a_new_value():
+    value = interpolation.eval("[1, 2]", {})
+    value.append(3)
+
+    assert interpolation.eval("[1, 2]", {}) == [1, 2]
+
+
+def test_given_constant_template_and_valid_types_when_eval_then_return_string_if_type_is_not_valid():
+    assert interpolation.eval("1234", {}, valid_types=(str,)) == "1234"
+    assert interpolation.eval("1234", {}, valid_types=(int,)) == 1234
+
+
+def test_templates_are_compiled_once_for_all_instances():
+    template_string = "{{ config['compiled_once'] }}"
+    JinjaInterpolation().eval(template_string, {"compiled_once": "a"})
+
+    with patch.object(_ENVIRONMENT, "parse", side_effect=AssertionError("should not parse")):
+        assert JinjaInterpolation().eval(template_string, {"compiled_once": "b"}) == "b"
+
+
+@pytest.mark.parametrize(
+    "rendered",
+    [
+        "1",
+        " -1.5",
+        "\n1",
+        "#comment\n1",
+        "\\\n1",
+        "True",
+        "None",
+        "set()",
+        "𝐬et()",
+        "b'bytes'",
+        "Rb'bytes'",
+        "u'text'",
+        "[1, 2]",
+        "(1, 2)",
+        "{'a': 1}",
+        "1234J",
+        "'quoted'",
+        "...",
+    ],
+)
+def test_rendered_python_literals_are_evaluated(rendered):
+    assert interpolation.eval("{{ config['value'] }}", {"value": rendered}) == ast.literal_eval(
+        rendered
+    )
+
+
+@pytest.mark.parametrize(
+    "rendered",
+    ["hello world", "Truely", "https://airbyte.io", "_private", "<tag>", "/path", "2021-09-01"],
+)
+def test_rendered_non_literals_are_returned_as_is(rendered):
+    assert interpolation.eval("{{ config['value'] }}", {"value": rendered}) == rendered
+
+
+def _legacy_eval(input_str, config, default=None, valid_types=None, **additional_parameters):
+    """
+    The evaluation as it was done before templates were compiled, with the parsed and compiled templates cached per string
+    """
+    context = {"config": config, **additional_parameters}
+    for alias, equivalent in {
+        "stream_interval": "stream_slice",
+        "stream_partition": "stream_slice",
+    }.items():
+        if alias in context:
+            raise ValueError(alias)
+        elif equivalent in context:
+            context[alias] = context[equivalent]
+    for variable_name in ["stream_state"]:
+        if variable_name in input_str:
+            raise ValueError(variable_name)
+    undeclared = _legacy_find_undeclared_variables(input_str)
+    if {var for var in undeclared if var not in context}:
+        raise ValueError(undeclared)
+    result = _legacy_compile(input_str).render(context)
+    try:
+        evaluated = ast.literal_eval(result)
+    except (ValueError, SyntaxError):
+        return result
+    if not valid_types or isinstance(evaluated, valid_types):
+        return evaluated
+    return result
+
+
+@functools.cache
+def _legacy_find_undeclared_variables(input_str):
+    return meta.find_undeclared_variables(_ENVIRONMENT.parse(input_str))
+
+
+@functools.cache
+def _legacy_compile(input_str):
+    return _ENVIRONMENT.from_string(input_str)
+
+
+@pytest.mark.parametrize(
+    "template_string, context, expected_renders",
+    [
+        pytest.param("updated_at", {}, 0, id="constant"),
+        pytest.param("{{ record['id'] }}", {"record": {"id": "an_id"}}, 100, id="simple_variable"),
+        pytest.param(
+            "{{ (record['name'] | lower | replace(' ', '_')) ~ '_' ~ stream_slice['start'] | string }}",
+            {"record": {"name": "A Name"}, "stream_slice": {"start": "2021-01-01"}},
+            100,
+            id="filter_heavy",
+        ),
+    ],
+)
+def test_given_repeated_evaluations_when_eval_then_parse_once_and_do_not_literal_eval_non_literals(
+    template_string, context, expected_renders
+):
+    number_of_evaluations = 100
+    config = {"api_key": "a key"}
+    assert interpolation.eval(template_string, config, **context) == _legacy_eval(
+        template_string, config, **context
+    )
+
+    with (
+        patch.object(_ENVIRONMENT, "parse", wraps=_ENVIRONMENT.parse) as parse,
+        patch.object(Template, "render", autospec=True, side_effect=Template.render) as render,
+        patch.object(ast, "literal_eval", wraps=ast.literal_eval) as literal_eval,
+    ):
+        for _ in range(number_of_evaluations):
+            interpolation.eval(template_string, config, **context)
+
+    # The evaluation as it was done before parsed the undeclared variables, rendered and literal evaluated the output every time
+    parse.assert_not_called()
+    assert render.call_count == expected_renders
+    literal_eval.assert_not_called()
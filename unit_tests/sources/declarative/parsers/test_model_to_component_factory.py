@@ -5,6 +5,7 @@
 # mypy: ignore-errors
 from datetime import datetime, timedelta, timezone
 from typing import Any, Iterable, Mapping
+from unittest.mock import patch
 
 import freezegun
 import pytest
@@ -35,7 +36,11 @@ from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator
+from airbyte_cdk.sources.declarative.decoders import (
+    JsonDecoder,
+    PaginationDecoderDecorator,
+    StreamingJsonDecoder,
+)
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import (
@@ -44,9 +49,12 @@ from airbyte_cdk.sources.declarative.extractors.record_filter import (
 from airbyte_cdk.sources.declarative.incremental import (
     CursorFactory,
     DatetimeBasedCursor,
+    InMemoryPartitionStateStore,
+    LazyPartitionStateStore,
     PerPartitionCursor,
     PerPartitionWithGlobalCursor,
     ResumableFullRefreshCursor,
+    SqlitePartitionStateStore,
 )
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.models import AsyncRetriever as AsyncRetrieverModel
@@ -81,6 +89,9 @@ from airbyte_cdk.sources.declarative.models import Spec as SpecModel
 from airbyte_cdk.sources.declarative.models import (
     SubstreamPartitionRouter as SubstreamPartitionRouterModel,
 )
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    JsonDecoder as JsonDecoderModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     OffsetIncrement as OffsetIncrementModel,
 )
@@ -159,7 +170,10 @@ from airbyte_cdk.sources.declarative.spec import Spec
 from airbyte_cdk.sources.declarative.transformations import AddFields, RemoveFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
-from airbyte_cdk.sources.streams.call_rate import MovingWindowCallRatePolicy
+from airbyte_cdk.sources.streams.call_rate import (
+    MovingWindowCallRatePolicy,
+    SlidingWindowCallRatePolicy,
+)
 from airbyte_cdk.sources.streams.concurrent.clamping import (
     ClampingEndProvider,
     DayClampingStrategy,
@@ -689,6 +703,7 @@ def test_create_substream_partition_router():
         - stream: "#/stream_B"
           parent_key: someid
           partition_field: word_id
+          read_concurrency: 4
     """
     parsed_manifest = YamlDeclarativeSource._parse(content)
     resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
@@ -724,6 +739,8 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].parent_key.eval({}) == "someid"
     assert partition_router.parent_stream_configs[1].partition_field.eval({}) == "word_id"
     assert partition_router.parent_stream_configs[1].request_option is None
+    assert partition_router.parent_stream_configs[0].read_concurrency == 1
+    assert partition_router.parent_stream_configs[1].read_concurrency == 4
 
 
 def test_datetime_based_cursor():
@@ -2598,6 +2615,102 @@ def test_simple_retriever_emit_log_messages():
     assert connector_builder_factory._message_repository._log_level == Level.DEBUG
 
 
+@pytest.mark.parametrize(
+    "stream_records, emit_connector_builder_messages, expected_decoder_type",
+    [
+        pytest.param(None, False, JsonDecoder, id="test_default"),
+        pytest.param(True, False, StreamingJsonDecoder, id="test_stream_records"),
+        pytest.param(True, True, JsonDecoder, id="test_stream_records_in_connector_builder"),
+    ],
+)
+def test_create_json_decoder(
+    stream_records, emit_connector_builder_messages, expected_decoder_type
+):
+    model = JsonDecoderModel(type="JsonDecoder", stream_records=stream_records)
+
+    decoder = ModelToComponentFactory(
+        emit_connector_builder_messages=emit_connector_builder_messages
+    ).create_component(JsonDecoderModel, model.dict(), config={})
+
+    assert type(decoder) is expected_decoder_type
+
+
+@pytest.mark.parametrize(
+    "pagination_strategy, is_supported",
+    [
+        pytest.param(
+            {"type": "PageIncrement", "page_size": 100},
+            True,
+            id="test_page_increment",
+        ),
+        pytest.param(
+            {"type": "CursorPagination", "cursor_value": "{{ headers.link.next.url }}"},
+            True,
+            id="test_cursor_pagination_from_headers",
+        ),
+        pytest.param(
+            {
+                "type": "CursorPagination",
+                "cursor_value": "{{ last_record.id }}",
+                "stop_condition": "{{ response.has_more is false }}",
+            },
+            False,
+            id="test_cursor_pagination_from_response",
+        ),
+        pytest.param(
+            {"type": "OffsetIncrement", "page_size": 100},
+            False,
+            id="test_offset_increment",
+        ),
+    ],
+)
+def test_given_stream_records_when_create_simple_retriever_with_paginator_then_accept_pagination_without_response_body(
+    pagination_strategy, is_supported
+):
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "decoder": {"type": "JsonDecoder", "stream_records": True},
+        "record_selector": {
+            "type": "RecordSelector",
+            "extractor": {"type": "DpathExtractor", "field_path": ["data"]},
+        },
+        "requester": {
+            "type": "HttpRequester",
+            "name": "list",
+            "url_base": "orange.com",
+            "path": "/v1/api",
+        },
+        "paginator": {
+            "type": "DefaultPaginator",
+            "pagination_strategy": pagination_strategy,
+            "page_token_option": {
+                "type": "RequestOption",
+                "inject_into": "request_parameter",
+                "field_name": "page",
+            },
+        },
+    }
+
+    def _create_retriever():
+        return factory.create_component(
+            model_type=SimpleRetrieverModel,
+            component_definition=simple_retriever_model,
+            config={},
+            name="Test",
+            primary_key="id",
+            stream_slicer=None,
+            transformations=[],
+        )
+
+    if is_supported:
+        retriever = _create_retriever()
+        assert isinstance(retriever.record_selector.extractor.decoder, StreamingJsonDecoder)
+        assert isinstance(retriever._paginator, DefaultPaginator)
+    else:
+        with pytest.raises(ValueError, match="is not supported for pagination"):
+            _create_retriever()
+
+
 def test_create_page_increment():
     model = PageIncrementModel(
         type="PageIncrement",
@@ -3435,6 +3548,97 @@ def test_create_concurrent_cursor_from_perpartition_cursor_runs_state_migrations
     )
 
 
+@pytest.mark.parametrize(
+    "partition_state_store, expected_store_type",
+    [
+        pytest.param(None, type(None), id="test_no_store"),
+        pytest.param("in_memory", InMemoryPartitionStateStore, id="test_in_memory_store"),
+        pytest.param("sqlite", LazyPartitionStateStore, id="test_sqlite_store"),
+    ],
+)
+def test_create_concurrent_cursor_from_perpartition_cursor_with_partition_state_store(
+    partition_state_store, expected_store_type
+):
+    state = {
+        "states": [
+            {
+                "partition": {"type": "type_1"},
+                "cursor": {"updated_at": "2024-08-01T00:00:00.000000Z"},
+            }
+        ],
+        "state": {"updated_at": "2024-08-01T00:00:00.000000Z"},
+    }
+    config = {
+        "start_time": "2024-08-01T00:00:00.000000Z",
+        "end_time": "2024-09-01T00:00:00.000000Z",
+    }
+    cursor_component_definition = {
+        "type": "DatetimeBasedCursor",
+        "cursor_field": "updated_at",
+        "datetime_format": "%Y-%m-%dT%H:%M:%S.%fZ",
+        "start_datetime": "{{ config['start_time'] }}",
+        "end_datetime": "{{ config['end_time'] }}",
+        "partition_state_store": partition_state_store,
+    }
+
+    cursor = ModelToComponentFactory().create_concurrent_cursor_from_perpartition_cursor(
+        state_manager=ConnectorStateManager(),
+        model_type=DatetimeBasedCursorModel,
+        component_definition=cursor_component_definition,
+        stream_name="test",
+        stream_namespace=None,
+        config=config,
+        stream_state=state,
+        partition_router=ListPartitionRouter(
+            cursor_field="type", values=["type_1", "type_2"], config=config, parameters={}
+        ),
+    )
+    store = cursor._partition_state_store
+
+    assert type(store) is expected_store_type
+    list(cursor.stream_slices())
+    cursor.ensure_at_least_one_state_emitted()
+    assert cursor.state["states"][0] == state["states"][0]
+    if isinstance(store, LazyPartitionStateStore):
+        # The temporary database is deleted once the stream is done
+        assert isinstance(store._store, SqlitePartitionStateStore)
+        assert store._store._temporary_directory is None
+
+
+def test_given_sqlite_partition_state_store_and_no_state_when_create_cursor_then_do_not_create_database():
+    config = {
+        "start_time": "2024-08-01T00:00:00.000000Z",
+        "end_time": "2024-09-01T00:00:00.000000Z",
+    }
+    cursor_component_definition = {
+        "type": "DatetimeBasedCursor",
+        "cursor_field": "updated_at",
+        "datetime_format": "%Y-%m-%dT%H:%M:%S.%fZ",
+        "start_datetime": "{{ config['start_time'] }}",
+        "end_datetime": "{{ config['end_time'] }}",
+        "partition_state_store": "sqlite",
+    }
+
+    with patch(
+        "airbyte_cdk.sources.declarative.parsers.model_to_component_factory.SqlitePartitionStateStore"
+    ) as sqlite_partition_state_store:
+        cursor = ModelToComponentFactory().create_concurrent_cursor_from_perpartition_cursor(
+            state_manager=ConnectorStateManager(),
+            model_type=DatetimeBasedCursorModel,
+            component_definition=cursor_component_definition,
+            stream_name="test",
+            stream_namespace=None,
+            config=config,
+            stream_state={},
+            partition_router=ListPartitionRouter(
+                cursor_field="type", values=["type_1", "type_2"], config=config, parameters={}
+            ),
+        )
+        assert cursor.state["states"] == []
+
+    sqlite_partition_state_store.assert_not_called()
+
+
 def test_create_concurrent_cursor_uses_min_max_datetime_format_if_defined():
     """
     Validates a special case for when the start_time.datetime_format and end_time.datetime_format are defined, the date to
@@ -3799,6 +4003,39 @@ def test_api_budget():
     assert policy._bucket.rates[0].interval == 100  # 100 ms
 
 
+def test_api_budget_sliding_window_policy():
+    api_budget_manifest = {
+        "type": "HTTPAPIBudget",
+        "policies": [
+            {
+                "type": "SlidingWindowCallRatePolicy",
+                "rates": [
+                    {"type": "Rate", "limit": 3, "interval": "PT1S"},
+                    {"type": "Rate", "limit": "{{ config['hourly_limit'] }}", "interval": "PT1H"},
+                ],
+                "matchers": [
+                    {
+                        "type": "HttpRequestRegexMatcher",
+                        "method": "GET",
+                        "url_base": "https://api.sendgrid.com",
+                        "url_path_pattern": "/v3/marketing/lists",
+                    }
+                ],
+            }
+        ],
+    }
+
+    factory = ModelToComponentFactory()
+    factory.set_api_budget(api_budget_manifest, {"hourly_limit": 100})
+
+    policy = factory._api_budget._policies[0]
+    assert isinstance(policy, SlidingWindowCallRatePolicy)
+    assert policy._rates == [(3, 1.0), (100, 3600.0)]
+    assert policy.matches(
+        requests.Request("GET", "https://api.sendgrid.com/v3/marketing/lists").prepare()
+    )
+
+
 def test_api_budget_fixed_window_policy():
     manifest = {
         "type": "DeclarativeSource",
@@ -4057,6 +4294,7 @@ def test_simple_retriever_with_query_properties():
             type: PropertyChunking
             property_limit_type: property_count
             property_limit: 3
+            max_concurrent_requests: 4
             record_merge_strategy:
               type: GroupByKeyMergeStrategy
               key: ["id"]
@@ -4104,6 +4342,7 @@ def test_simple_retriever_with_query_properties():
     assert isinstance(property_chunking, PropertyChunking)
     assert property_chunking.property_limit_type == PropertyLimitType.property_count
     assert property_chunking.property_limit == 3
+    assert property_chunking.max_concurrent_requests == 4
 
     merge_strategy = (
         stream.retriever.additional_query_properties.property_chunking.record_merge_strategy
@@ -4215,6 +4454,7 @@ def test_simple_retriever_with_request_parameters_properties_from_endpoint():
     assert isinstance(property_chunking, PropertyChunking)
     assert property_chunking.property_limit_type == PropertyLimitType.property_count
     assert property_chunking.property_limit == 3
+    assert property_chunking.max_concurrent_requests == 1
 
 
 def test_simple_retriever_with_requester_properties_from_endpoint():
@@ -0,0 +1,311 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Mapping, Tuple
+
+import orjson
+import pytest
+
+from airbyte_cdk.sources.declarative.models import (
+    SubstreamPartitionRouter as SubstreamPartitionRouterModel,
+)
+from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import (
+    ModelToComponentFactory,
+)
+from airbyte_cdk.sources.declarative.partition_routers import SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+
+_RECORDS = [
+    ({"id": 1, "name": "é"}, {"parent_slice": "first"}),
+    ({"id": 2, "nested": {"list": [1, 2.5, None, True]}}, {}),
+]
+
+
+class _ParentStream:
+    def __init__(self, records: List[Tuple[Mapping[str, Any], Mapping[str, Any]]]) -> None:
+        self.records = records
+        self.reads = 0
+
+    def read(self) -> Iterable[Tuple[Mapping[str, Any], Mapping[str, Any]]]:
+        self.reads += 1
+        yield from self.records
+
+
+def test_given_parent_read_completely_when_read_again_then_replay_records_from_disk() -> None:
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(_RECORDS)
+
+    first_read = list(cache.read("parent", parent_stream.read))
+    second_read = list(cache.read("parent", parent_stream.read))
+
+    assert first_read == _RECORDS
+    assert second_read == _RECORDS
+    assert parent_stream.reads == 1
+    metrics = cache.metrics
+    assert (metrics.hits, metrics.misses, metrics.cached_records) == (1, 1, 2)
+    assert metrics.disk_usage_in_bytes > 0
+    assert metrics.memory_usage_in_bytes == 0
+
+
+def test_given_different_keys_when_read_then_read_each_parent() -> None:
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(_RECORDS)
+
+    list(cache.read("parent", parent_stream.read))
+    list(cache.read("other_parent", parent_stream.read))
+
+    assert parent_stream.reads == 2
+
+
+def test_given_parent_read_not_consumed_completely_when_read_again_then_read_parent() -> None:
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(_RECORDS)
+
+    records = iter(cache.read("parent", parent_stream.read))
+    next(records)
+    records.close()
+
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+    assert parent_stream.reads == 2
+    assert cache.metrics.cached_records == 2
+
+
+def test_given_parent_read_fails_when_read_again_then_read_parent() -> None:
+    cache = ParentRecordCache()
+
+    def _failing_read() -> Iterable[Tuple[Mapping[str, Any], Mapping[str, Any]]]:
+        yield _RECORDS[0]
+        raise ValueError("the parent stream failed")
+
+    with pytest.raises(ValueError):
+        list(cache.read("parent", _failing_read))
+
+    parent_stream = _ParentStream(_RECORDS)
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+    assert parent_stream.reads == 1
+
+
+def test_given_parent_being_cached_on_same_thread_when_read_then_read_parent_without_waiting() -> (
+    None
+):
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(_RECORDS)
+
+    first_read = iter(cache.read("parent", parent_stream.read))
+    next(first_read)
+    concurrent_read = list(cache.read("parent", parent_stream.read))
+    list(first_read)
+
+    assert concurrent_read == _RECORDS
+    assert parent_stream.reads == 2
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+    assert parent_stream.reads == 2
+
+
+def test_given_parent_being_cached_on_other_thread_when_read_then_wait_and_replay_records() -> None:
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(_RECORDS)
+    first_read = iter(cache.read("parent", parent_stream.read))
+    next(first_read)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        concurrent_read = executor.submit(lambda: list(cache.read("parent", parent_stream.read)))
+        time.sleep(0.1)
+        assert not concurrent_read.done()
+        list(first_read)
+
+        assert concurrent_read.result(timeout=5) == _RECORDS
+    assert parent_stream.reads == 1
+    assert (cache.metrics.hits, cache.metrics.misses) == (1, 1)
+
+
+def test_given_parent_caching_on_other_thread_fails_when_read_then_wait_and_read_parent() -> None:
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(_RECORDS)
+    first_read = iter(cache.read("parent", parent_stream.read))
+    next(first_read)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        concurrent_read = executor.submit(lambda: list(cache.read("parent", parent_stream.read)))
+        time.sleep(0.1)
+        first_read.close()
+
+        assert concurrent_read.result(timeout=5) == _RECORDS
+    assert parent_stream.reads == 2
+    assert cache.metrics.cached_records == 2
+
+
+def test_given_parent_caching_thread_ended_without_closing_read_when_read_then_read_parent() -> (
+    None
+):
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(_RECORDS)
+    abandoned_reads = []
+
+    def _abandon_read() -> None:
+        abandoned_read = iter(cache.read("parent", parent_stream.read))
+        next(abandoned_read)
+        abandoned_reads.append(abandoned_read)
+
+    thread = threading.Thread(target=_abandon_read)
+    thread.start()
+    thread.join()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        concurrent_read = executor.submit(lambda: list(cache.read("parent", parent_stream.read)))
+        assert concurrent_read.result(timeout=5) == _RECORDS
+    assert parent_stream.reads == 2
+
+
+def test_given_parent_caching_stalled_when_read_then_read_parent_after_writer_timeout() -> None:
+    cache = ParentRecordCache(writer_timeout_in_seconds=0.1)
+    parent_stream = _ParentStream(_RECORDS)
+    stalled_read = iter(cache.read("parent", parent_stream.read))
+    next(stalled_read)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        concurrent_read = executor.submit(lambda: list(cache.read("parent", parent_stream.read)))
+        assert concurrent_read.result(timeout=5) == _RECORDS
+    assert parent_stream.reads == 2
+    stalled_read.close()
+
+
+def test_given_record_that_can_not_be_serialized_when_read_then_do_not_cache() -> None:
+    cache = ParentRecordCache()
+    records = _RECORDS + [({"id": 3, "updated_at": datetime.datetime(2024, 1, 1)}, {})]
+    parent_stream = _ParentStream(records)
+
+    assert list(cache.read("parent", parent_stream.read)) == records
+    assert list(cache.read("parent", parent_stream.read)) == records
+    assert parent_stream.reads == 2
+    assert cache.metrics.cached_records == 0
+
+
+def test_given_request_cache_path_when_read_then_store_records_in_request_cache_path(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path / "request_cache"))
+    cache = ParentRecordCache()
+
+    list(cache.read("parent", _ParentStream(_RECORDS).read))
+
+    (cache_directory,) = os.listdir(tmp_path / "request_cache")
+    assert len(os.listdir(tmp_path / "request_cache" / cache_directory)) == 1
+
+    cache.close()
+
+    assert os.listdir(tmp_path / "request_cache") == []
+    assert cache.metrics.disk_usage_in_bytes == 0
+
+
+_NUMBER_OF_PARENT_RECORDS = 1_000_000
+_PAGE_SIZE = 10_000
+
+
+def _parent_page(request, context) -> bytes:
+    page = int(request.qs.get("page", ["0"])[0])
+    first_id = page * _PAGE_SIZE
+    return orjson.dumps(
+        {
+            "data": [
+                {"id": record_id, "name": f"parent {record_id}", "updated_at": "2024-01-01"}
+                for record_id in range(
+                    first_id, min(first_id + _PAGE_SIZE, _NUMBER_OF_PARENT_RECORDS)
+                )
+            ]
+        }
+    )
+
+
+def _create_child_partition_router(
+    factory: ModelToComponentFactory, partition_field: str, use_cache: bool
+) -> SubstreamPartitionRouter:
+    parent_stream = {
+        "type": "DeclarativeStream",
+        "name": "parents",
+        "primary_key": "id",
+        "schema_loader": {"type": "InlineSchemaLoader", "schema": {}},
+        "retriever": {
+            "type": "SimpleRetriever",
+            "requester": {
+                "type": "HttpRequester",
+                "url_base": "https://parent-record-cache.test",
+                "path": "/parents",
+                "http_method": "GET",
+                "use_cache": use_cache,
+            },
+            "record_selector": {
+                "type": "RecordSelector",
+                "extractor": {"type": "DpathExtractor", "field_path": ["data"]},
+            },
+            "paginator": {
+                "type": "DefaultPaginator",
+                "pagination_strategy": {
+                    "type": "PageIncrement",
+                    "page_size": _PAGE_SIZE,
+                    "start_from_page": 0,
+                },
+                "page_token_option": {
+                    "type": "RequestOption",
+                    "inject_into": "request_parameter",
+                    "field_name": "page",
+                },
+            },
+        },
+    }
+    return factory.create_component(
+        model_type=SubstreamPartitionRouterModel,
+        component_definition={
+            "type": "SubstreamPartitionRouter",
+            "parent_stream_configs": [
+                {
+                    "type": "ParentStreamConfig",
+                    "stream": parent_stream,
+                    "parent_key": "id",
+                    "partition_field": partition_field,
+                    "extra_fields": [["name"]],
+                }
+            ],
+        },
+        config={},
+    )
+
+
+def _read_children_partitions(factory: ModelToComponentFactory, use_cache: bool) -> None:
+    partition_routers = [
+        _create_child_partition_router(factory, partition_field, use_cache)
+        for partition_field in ["parent_id", "owner_id", "account_id"]
+    ]
+    for partition_router in partition_routers:
+        number_of_partitions = sum(1 for _ in partition_router.stream_slices())
+        assert number_of_partitions == _NUMBER_OF_PARENT_RECORDS
+
+
+@pytest.mark.slow
+def test_given_three_children_when_read_with_parent_record_cache_then_request_parent_once(
+    requests_mock,
+) -> None:
+    requests_mock.get("https://parent-record-cache.test/parents", content=_parent_page)
+    record_cache = ParentRecordCache()
+    factory = ModelToComponentFactory()
+    factory.set_parent_record_cache(record_cache)
+
+    _read_children_partitions(factory, use_cache=False)
+
+    metrics = record_cache.metrics
+    assert requests_mock.call_count == _NUMBER_OF_PARENT_RECORDS // _PAGE_SIZE + 1
+    assert metrics.hits == 2
+    assert metrics.cached_records == _NUMBER_OF_PARENT_RECORDS
+    assert metrics.disk_usage_in_bytes > 0
+    # The parent records are on disk instead of in memory once cached
+    assert metrics.memory_usage_in_bytes == 0
+    record_cache.close()
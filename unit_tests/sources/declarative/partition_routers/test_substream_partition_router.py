@@ -2,9 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
 import logging
+import threading
+import time
 from functools import partial
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from unittest.mock import MagicMock
 
 import pytest as pytest
 
@@ -12,6 +16,7 @@ from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, SyncMode, T
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.incremental import (
     ChildPartitionResumableFullRefreshCursor,
+    DeclarativeCursor,
     ResumableFullRefreshCursor,
 )
 from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import (
@@ -24,14 +29,21 @@ from airbyte_cdk.sources.declarative.partition_routers import (
     CartesianProductStreamSlicer,
     ListPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
     SubstreamPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.requesters.paginators.default_paginator import (
+    PaginatorTestReadDecorator,
+)
 from airbyte_cdk.sources.declarative.requesters.request_option import (
     RequestOption,
     RequestOptionType,
 )
+from airbyte_cdk.sources.declarative.retrievers import SimpleRetriever
 from airbyte_cdk.sources.streams.checkpoint import Cursor
 from airbyte_cdk.sources.types import Record
 from airbyte_cdk.utils import AirbyteTracedException
@@ -837,6 +849,343 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
 
 
+@pytest.mark.parametrize(
+    "incremental_dependency, expected_parent_reads",
+    [
+        pytest.param(False, 1, id="test_parent_records_are_read_once"),
+        pytest.param(True, 2, id="test_incremental_parent_records_are_not_cached"),
+    ],
+)
+def test_given_parent_record_cache_when_stream_slices_then_share_parent_records_between_routers(
+    incremental_dependency, expected_parent_reads
+):
+    record_cache = ParentRecordCache()
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    parent_reads = []
+    read_only_records = parent_stream.read_only_records
+    parent_stream.read_only_records = lambda: parent_reads.append(1) or read_only_records()
+
+    def _create_partition_router(partition_field: str) -> SubstreamPartitionRouter:
+        return SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=parent_stream,
+                    parent_key="id",
+                    partition_field=partition_field,
+                    extra_fields=[["data"]],
+                    incremental_dependency=incremental_dependency,
+                    record_cache=record_cache,
+                    record_cache_key="first_stream_key",
+                    parameters={},
+                    config={},
+                )
+            ],
+            parameters={},
+            config={},
+        )
+
+    first_slices = list(_create_partition_router("first_stream_id").stream_slices())
+    second_slices = list(_create_partition_router("parent_id").stream_slices())
+
+    assert [(s.partition, s.extra_fields) for s in first_slices] == [
+        ({"first_stream_id": 0, "parent_slice": {"slice": "first"}}, {"data": "A"}),
+        ({"first_stream_id": 1, "parent_slice": {"slice": "first"}}, {"data": "B"}),
+        ({"first_stream_id": 2, "parent_slice": {"slice": "second"}}, {"data": "C"}),
+    ]
+    assert [(s.partition, s.extra_fields) for s in second_slices] == [
+        ({"parent_id": 0, "parent_slice": {"slice": "first"}}, {"data": "A"}),
+        ({"parent_id": 1, "parent_slice": {"slice": "first"}}, {"data": "B"}),
+        ({"parent_id": 2, "parent_slice": {"slice": "second"}}, {"data": "C"}),
+    ]
+    assert len(parent_reads) == expected_parent_reads
+
+
+def _create_concurrent_parent_stream_config(
+    stream: DeclarativeStream, partition_field: str, **kwargs: Any
+) -> ParentStreamConfig:
+    return ParentStreamConfig(
+        stream=stream,
+        parent_key="id",
+        partition_field=partition_field,
+        read_concurrency=2,
+        parameters={},
+        config={},
+        **kwargs,
+    )
+
+
+class BlockingMockStream(MockStream):
+    """
+    Waits for the partitions sharing the barrier to be read at the same time before returning records.
+    """
+
+    def __init__(self, slices, records, name, barrier: threading.Barrier):
+        super().__init__(slices, records, name)
+        self._barrier = barrier
+
+    def read_records(self, sync_mode: SyncMode, stream_slice=None, **kwargs: Any):
+        self._barrier.wait()
+        yield from super().read_records(sync_mode, stream_slice=stream_slice, **kwargs)
+
+
+def test_given_read_concurrency_when_stream_slices_then_return_the_same_slices_as_sequential_read():
+    def _create_partition_router(read_concurrency: int) -> SubstreamPartitionRouter:
+        return SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=MockStream(parent_slices, all_parent_data, "first_stream"),
+                    parent_key="id",
+                    partition_field="first_stream_id",
+                    extra_fields=[["data"]],
+                    read_concurrency=read_concurrency,
+                    parameters={},
+                    config={},
+                ),
+                ParentStreamConfig(
+                    stream=MockStream(second_parent_stream_slice, more_records, "second_stream"),
+                    parent_key="id",
+                    partition_field="second_stream_id",
+                    parameters={},
+                    config={},
+                ),
+            ],
+            parameters={},
+            config={},
+        )
+
+    def _sorted(slices: Iterable[StreamSlice]) -> List[Any]:
+        return sorted(
+            [(s.partition, s.extra_fields) for s in slices], key=lambda partition: repr(partition)
+        )
+
+    assert _sorted(_create_partition_router(read_concurrency=3).stream_slices()) == _sorted(
+        _create_partition_router(read_concurrency=1).stream_slices()
+    )
+
+
+def test_given_read_concurrency_when_stream_slices_then_read_parent_partitions_and_parents_at_the_same_time():
+    # Reading the partitions and the parents one after the other would break the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _create_concurrent_parent_stream_config(
+                BlockingMockStream(
+                    parent_slices[:2],
+                    data_first_parent_slice + data_second_parent_slice,
+                    "first_stream",
+                    barrier,
+                ),
+                "first_stream_id",
+            ),
+            _create_concurrent_parent_stream_config(
+                BlockingMockStream(
+                    second_parent_stream_slice, more_records, "second_stream", barrier
+                ),
+                "second_stream_id",
+            ),
+        ],
+        parameters={},
+        config={},
+    )
+
+    assert len(list(partition_router.stream_slices())) == 5
+
+
+def test_given_resumable_full_refresh_parent_when_read_concurrently_then_read_pages_in_order():
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _create_concurrent_parent_stream_config(
+                MockResumableFullRefreshStream(
+                    slices=[StreamSlice(partition={}, cursor_slice={})],
+                    cursor=ResumableFullRefreshCursor(parameters={}),
+                    record_pages=[[{"id": 1}], [{"id": 2}]],
+                    name="first_stream",
+                ),
+                "first_stream_id",
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+    assert list(partition_router.stream_slices()) == [
+        {"first_stream_id": 1, "parent_slice": {}},
+        {"first_stream_id": 2, "parent_slice": {}},
+    ]
+
+
+def test_given_incremental_parent_read_concurrently_when_stream_slices_then_parent_state_follows_yielded_slices():
+    mock_slices = [
+        StreamSlice(
+            cursor_slice={"start_time": "2024-04-27", "end_time": "2024-05-27"}, partition={}
+        ),
+        StreamSlice(
+            cursor_slice={"start_time": "2024-05-27", "end_time": "2024-06-27"}, partition={}
+        ),
+    ]
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _create_concurrent_parent_stream_config(
+                MockIncrementalStream(
+                    slices=mock_slices,
+                    records=[
+                        Record({"id": "may_record_0", "updated_at": "2024-05-15"}, mock_slices[0]),
+                        Record({"id": "jun_record_0", "updated_at": "2024-06-15"}, mock_slices[1]),
+                    ],
+                    name="first_stream",
+                ),
+                "first_stream_id",
+                incremental_dependency=True,
+            ),
+            _create_concurrent_parent_stream_config(
+                MockStream(parent_slices, all_parent_data, "second_stream"), "second_stream_id"
+            ),
+        ],
+        parameters={},
+        config={},
+    )
+    # The parent stream reads all its records before the first slice is consumed so its own state is already the final one
+    slices = iter(partition_router.stream_slices())
+    first_slice = next(slices)
+    time.sleep(0.1)
+
+    expected_states = {
+        "may_record_0": {"first_stream": {}},
+        "jun_record_0": {"first_stream": {"start_time": "2024-04-27", "end_time": "2024-05-27"}},
+    }
+    for stream_slice in itertools.chain([first_slice], slices):
+        if "first_stream_id" in stream_slice:
+            assert (
+                partition_router.get_stream_state()
+                == expected_states[stream_slice["first_stream_id"]]
+            )
+    assert partition_router.get_stream_state() == {
+        "first_stream": {"start_time": "2024-05-27", "end_time": "2024-06-27"}
+    }
+
+
+def test_given_parent_read_concurrently_fails_when_stream_slices_then_raise():
+    class FailingMockStream(MockStream):
+        def read_records(self, sync_mode: SyncMode, stream_slice=None, **kwargs: Any):
+            if stream_slice["slice"] == "second":
+                raise ValueError("the parent partition failed")
+            yield from super().read_records(sync_mode, stream_slice=stream_slice, **kwargs)
+
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _create_concurrent_parent_stream_config(
+                FailingMockStream(parent_slices, all_parent_data, "first_stream"),
+                "first_stream_id",
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+    with pytest.raises(ValueError, match="the parent partition failed"):
+        list(partition_router.stream_slices())
+
+
+def test_given_slices_not_consumed_completely_when_read_concurrently_then_stop_reading_parents():
+    parent_stream = MockStream(
+        [{"slice": f"slice_{i}"} for i in range(100)],
+        [{"id": i, "slice": f"slice_{i % 100}"} for i in range(10_000)],
+        "first_stream",
+    )
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _create_concurrent_parent_stream_config(parent_stream, "first_stream_id")
+        ],
+        parameters={},
+        config={},
+    )
+    threads_before = threading.active_count()
+
+    slices = iter(partition_router.stream_slices())
+    next(slices)
+    slices.close()
+
+    assert threading.active_count() == threads_before
+    assert partition_router.get_stream_state() == {}
+
+
+class RetrieverMockStream(MockStream):
+    """
+    Records the retriever cursor and the thread of each partition read.
+    """
+
+    def __init__(self, slices, records, name, paginator=None):
+        super().__init__(slices, records, name)
+        self.retriever = SimpleRetriever(
+            requester=MagicMock(),
+            record_selector=MagicMock(),
+            primary_key="id",
+            name=name,
+            paginator=paginator,
+            cursor=MagicMock(spec=DeclarativeCursor),
+            config={},
+            parameters={},
+        )
+        self.reads = []
+
+    def read_records(self, sync_mode: SyncMode, stream_slice=None, **kwargs: Any):
+        self.reads.append((self.retriever.cursor, threading.current_thread().name))
+        yield from super().read_records(sync_mode, stream_slice=stream_slice, **kwargs)
+
+
+def test_given_parent_retriever_with_cursor_when_read_concurrently_then_read_partitions_without_cursor():
+    parent_stream = RetrieverMockStream(parent_slices, all_parent_data, "first_stream")
+    cursor = parent_stream.retriever.cursor
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _create_concurrent_parent_stream_config(parent_stream, "first_stream_id")
+        ],
+        parameters={},
+        config={},
+    )
+
+    assert len(list(partition_router.stream_slices())) == len(all_parent_data)
+    assert [partition_cursor for partition_cursor, _ in parent_stream.reads] == [None] * len(
+        parent_slices
+    )
+    assert parent_stream.retriever.cursor is cursor
+
+
+def test_given_parent_paginator_of_test_reads_when_read_concurrency_then_read_partitions_one_after_the_other():
+    parent_stream = RetrieverMockStream(
+        parent_slices,
+        all_parent_data,
+        "first_stream",
+        paginator=PaginatorTestReadDecorator(MagicMock(), maximum_number_of_pages=5),
+    )
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _create_concurrent_parent_stream_config(parent_stream, "first_stream_id")
+        ],
+        parameters={},
+        config={},
+    )
+
+    assert len(list(partition_router.stream_slices())) == len(all_parent_data)
+    assert len({thread_name for _, thread_name in parent_stream.reads}) == 1
+    assert all(
+        partition_cursor is parent_stream.retriever.cursor
+        for partition_cursor, _ in parent_stream.reads
+    )
+
+
+def test_given_read_concurrency_below_one_when_create_parent_stream_config_then_raise():
+    with pytest.raises(ValueError):
+        ParentStreamConfig(
+            stream=MockStream([{}], parent_records, "first_stream"),
+            parent_key="id",
+            partition_field="first_stream_id",
+            read_concurrency=0,
+            parameters={},
+            config={},
+        )
+
+
 def test_substream_using_incremental_parent_stream():
     mock_slices = [
         StreamSlice(
@@ -1379,3 +1728,55 @@ def test_cartesian_product_stream_slicer_warning_log_message(
         assert warning_message in logged_warnings
     else:
         assert warning_message not in logged_warnings
+
+
+class CountingMockStream(MockStream):
+    """
+    Records the largest number of partitions read at the same time. The partitions wait for each other in groups of `barrier.parties`.
+    """
+
+    def __init__(self, slices, records, name, barrier: threading.Barrier):
+        super().__init__(slices, records, name)
+        self._barrier = barrier
+        self._lock = threading.Lock()
+        self._partitions_being_read = 0
+        self.max_partitions_read_at_the_same_time = 0
+
+    def read_records(self, sync_mode: SyncMode, stream_slice=None, **kwargs: Any):
+        with self._lock:
+            self._partitions_being_read += 1
+            self.max_partitions_read_at_the_same_time = max(
+                self.max_partitions_read_at_the_same_time, self._partitions_being_read
+            )
+        self._barrier.wait()
+        records = list(super().read_records(sync_mode, stream_slice=stream_slice, **kwargs))
+        with self._lock:
+            self._partitions_being_read -= 1
+        yield from records
+
+
+def test_given_read_concurrency_when_stream_slices_then_read_up_to_read_concurrency_partitions_at_the_same_time():
+    read_concurrency = 8
+    parent_stream = CountingMockStream(
+        [{"slice": f"slice_{i}"} for i in range(40)],
+        [{"id": i, "slice": f"slice_{i % 40}"} for i in range(4_000)],
+        "first_stream",
+        threading.Barrier(read_concurrency, timeout=5),
+    )
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=parent_stream,
+                parent_key="id",
+                partition_field="first_stream_id",
+                read_concurrency=read_concurrency,
+                parameters={},
+                config={},
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+    assert sum(1 for _ in partition_router.stream_slices()) == 4_000
+    assert parent_stream.max_partitions_read_at_the_same_time == read_concurrency
@@ -112,3 +112,35 @@ def test_last_record_is_node_if_no_records():
     response = requests.Response()
     next_page_token = strategy.next_page_token(response, 0, None)
     assert next_page_token is None
+
+
+@pytest.mark.parametrize(
+    "cursor_value, stop_condition, expected_depends_on_records",
+    [
+        pytest.param("{{ response.next }}", None, False, id="test_response_cursor"),
+        pytest.param(
+            "{{ headers.link.next.url }}",
+            "{{ not response.has_more }}",
+            False,
+            id="test_header_cursor_with_response_stop_condition",
+        ),
+        pytest.param("{{ last_record.id }}", None, True, id="test_last_record_cursor"),
+        pytest.param(
+            "{{ response.next }}",
+            "{{ last_page_size < 10 }}",
+            True,
+            id="test_last_page_size_stop_condition",
+        ),
+    ],
+)
+def test_next_page_token_depends_on_records(
+    cursor_value, stop_condition, expected_depends_on_records
+):
+    strategy = CursorPaginationStrategy(
+        cursor_value=cursor_value,
+        stop_condition=stop_condition,
+        config={},
+        parameters={},
+    )
+
+    assert strategy.next_page_token_depends_on_records() == expected_depends_on_records
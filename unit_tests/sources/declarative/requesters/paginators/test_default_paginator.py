@@ -578,3 +578,48 @@ def test_path_with_additional_interpolation_context() -> None:
         stream_state=stream_state,
         stream_slice=stream_slice,
     )
+
+
+@pytest.mark.parametrize(
+    "pagination_strategy, expected_depends_on_records",
+    [
+        pytest.param(
+            CursorPaginationStrategy(cursor_value="{{ response.next }}", config={}, parameters={}),
+            False,
+            id="test_cursor_from_response",
+        ),
+        pytest.param(
+            CursorPaginationStrategy(cursor_value="{{ last_record.id }}", config={}, parameters={}),
+            True,
+            id="test_cursor_from_last_record",
+        ),
+        pytest.param(
+            OffsetIncrement(
+                page_size=2,
+                extractor=DpathExtractor(field_path=[], parameters={}, config={}),
+                config={},
+                parameters={},
+            ),
+            True,
+            id="test_offset_increment",
+        ),
+        pytest.param(
+            PageIncrement(page_size=2, config={}, parameters={}),
+            True,
+            id="test_page_increment",
+        ),
+    ],
+)
+def test_next_page_token_depends_on_records(pagination_strategy, expected_depends_on_records):
+    paginator = DefaultPaginator(
+        pagination_strategy=pagination_strategy,
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+    )
+
+    assert paginator.next_page_token_depends_on_records() == expected_depends_on_records
+    assert (
+        PaginatorTestReadDecorator(paginator).next_page_token_depends_on_records()
+        == expected_depends_on_records
+    )
@@ -884,7 +884,7 @@ def test_request_attempt_count_is_tracked_across_retries(http_requester_factory)
         http_requester._http_client._send_with_retry(request=request_mock, request_kwargs={})
 
     assert (
-        http_requester._http_client._request_attempt_count.get(request_mock)
+        http_requester._http_client.retry_metrics.attempts
         == http_requester._http_client._max_retries + 1
     )
 
@@ -910,7 +910,7 @@ def test_request_attempt_count_with_exponential_backoff_strategy(http_requester_
         http_requester._http_client._send_with_retry(request=request_mock, request_kwargs={})
 
     assert (
-        http_requester._http_client._request_attempt_count.get(request_mock)
+        http_requester._http_client.retry_metrics.attempts
         == http_requester._http_client._max_retries + 1
     )
 
@@ -941,7 +941,7 @@ def test_backoff_strategy_from_manifest_is_respected(http_requester_factory: Any
         http_requester._http_client._send_with_retry(request=request_mock, request_kwargs={})
 
     assert (
-        http_requester._http_client._request_attempt_count.get(request_mock)
+        http_requester._http_client.retry_metrics.attempts
         == http_requester._http_client._max_retries + 1
     )
 
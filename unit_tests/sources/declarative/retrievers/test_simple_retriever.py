@@ -3,9 +3,15 @@
 #
 
 import json
+import socket
+import threading
+import time
+from datetime import timedelta
 from functools import partial
-from typing import Any, Iterable, Mapping, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar, Iterable, List, Mapping, Optional
 from unittest.mock import MagicMock, Mock, patch
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import requests
@@ -25,6 +31,7 @@ from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import (
     ModelToComponentFactory,
 )
 from airbyte_cdk.sources.declarative.partition_routers import SinglePartitionRouter
+from airbyte_cdk.sources.declarative.requesters import HttpRequester
 from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies import (
     CursorPaginationStrategy,
@@ -38,12 +45,19 @@ from airbyte_cdk.sources.declarative.requesters.query_properties.property_chunki
     GroupByKey,
     PropertyLimitType,
 )
-from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
+from airbyte_cdk.sources.declarative.requesters.request_option import (
+    RequestOption,
+    RequestOptionType,
+)
+from airbyte_cdk.sources.declarative.requesters.request_options import (
+    InterpolatedRequestOptionsProvider,
+)
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import (
     SimpleRetriever,
     SimpleRetrieverTestReadDecorator,
 )
+from airbyte_cdk.sources.streams.call_rate import APIBudget, MovingWindowCallRatePolicy, Rate
 from airbyte_cdk.sources.types import Record, StreamSlice
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
@@ -1657,3 +1671,409 @@ def test_simple_retriever_still_emit_records_if_no_merge_key():
 
     assert len(actual_records) == 10
     assert actual_records == expected_records
+
+
+def _create_property_chunking_retriever(
+    requester: Any, max_concurrent_requests: int, property_list: List[str]
+) -> SimpleRetriever:
+    extractor = DpathExtractor(
+        field_path=["data"], decoder=JsonDecoder(parameters={}), config=config, parameters={}
+    )
+    record_selector = RecordSelector(
+        name="stream_name",
+        extractor=extractor,
+        record_filter=None,
+        transformations=[],
+        config=config,
+        parameters={},
+        schema_normalization=TypeTransformer(TransformConfig.NoTransform),
+    )
+    query_properties = QueryProperties(
+        property_list=property_list,
+        always_include_properties=["id"],
+        property_chunking=PropertyChunking(
+            property_limit_type=PropertyLimitType.property_count,
+            property_limit=2,
+            record_merge_strategy=GroupByKey(key="id", config=config, parameters={}),
+            config=config,
+            parameters={},
+            max_concurrent_requests=max_concurrent_requests,
+        ),
+        config=config,
+        parameters={},
+    )
+    return SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        record_selector=record_selector,
+        additional_query_properties=query_properties,
+        parameters={},
+        config={},
+    )
+
+
+def _create_property_chunk_response(properties: List[str], ids: List[str]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(
+        {
+            "data": [
+                {"id": i, **{name: f"{name}_{i}" for name in properties if name != "id"}}
+                for i in ids
+            ]
+        }
+    ).encode("utf-8")
+    return response
+
+
+class _SlowChunkRequester:
+    """
+    Requester answering the first chunks last so that responses arrive out of order when fetched concurrently.
+    """
+
+    def __init__(self, property_list: List[str]) -> None:
+        self._property_list = property_list
+        self._lock = threading.Lock()
+        self.requests_in_flight = 0
+        self.max_requests_in_flight = 0
+
+    def send_request(self, stream_slice: StreamSlice, **kwargs: Any) -> requests.Response:
+        properties = stream_slice.extra_fields["query_properties"]
+        with self._lock:
+            self.requests_in_flight += 1
+            self.max_requests_in_flight = max(self.max_requests_in_flight, self.requests_in_flight)
+        time.sleep(0.01 * (len(self._property_list) - self._property_list.index(properties[1])))
+        with self._lock:
+            self.requests_in_flight -= 1
+        # Records are not returned in the same order by every chunk and some records are missing from some chunks
+        ids = ["3", "1", "2"] if properties[1] == self._property_list[0] else ["1", "2", "3", "4"]
+        return _create_property_chunk_response(properties, ids)
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [2, 3, 10])
+def test_given_concurrent_property_chunks_when_read_records_then_records_are_the_same_as_sequential_fetching(
+    max_concurrent_requests: int,
+) -> None:
+    property_list = ["a", "b", "c", "d", "e"]
+    sequential_records = list(
+        _create_property_chunking_retriever(
+            _SlowChunkRequester(property_list), 1, property_list
+        ).read_records(records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={}))
+    )
+    requester = _SlowChunkRequester(property_list)
+
+    records = list(
+        _create_property_chunking_retriever(
+            requester, max_concurrent_requests, property_list
+        ).read_records(records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={}))
+    )
+
+    assert [dict(record.data) for record in records] == [
+        dict(record.data) for record in sequential_records
+    ]
+    assert [record.data["id"] for record in records] == ["3", "1", "2", "4"]
+    assert records[0].data == {
+        "id": "3",
+        "a": "a_3",
+        "b": "b_3",
+        "c": "c_3",
+        "d": "d_3",
+        "e": "e_3",
+    }
+    assert records[3].data == {"id": "4", "c": "c_4", "d": "d_4", "e": "e_4"}
+    # The properties are split in 3 chunks
+    assert requester.max_requests_in_flight == min(max_concurrent_requests, 3)
+
+
+def test_given_concurrent_property_chunks_when_a_request_fails_then_raise() -> None:
+    def send_request(stream_slice: StreamSlice, **kwargs: Any) -> requests.Response:
+        properties = stream_slice.extra_fields["query_properties"]
+        if "c" in properties:
+            raise ValueError("request failed")
+        return _create_property_chunk_response(properties, ["1"])
+
+    property_list = ["a", "b", "c", "d"]
+    requester = MagicMock()
+    requester.send_request.side_effect = send_request
+    retriever = _create_property_chunking_retriever(requester, 2, property_list)
+
+    with pytest.raises(ValueError, match="request failed"):
+        list(
+            retriever.read_records(
+                records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+            )
+        )
+
+
+def test_given_max_concurrent_requests_lower_than_one_when_create_property_chunking_then_raise() -> (
+    None
+):
+    with pytest.raises(ValueError):
+        PropertyChunking(
+            property_limit_type=PropertyLimitType.property_count,
+            property_limit=2,
+            record_merge_strategy=None,
+            config=config,
+            parameters={},
+            max_concurrent_requests=0,
+        )
+
+
+class _PropertyChunkServer(BaseHTTPRequestHandler):
+    """
+    Returns the requested properties for a few records once `barrier.parties` requests are received at the same time and records the
+    largest number of requests received at the same time.
+    """
+
+    __test__: ClassVar[bool] = False  # Tell Pytest this is not a Pytest class
+    barrier: ClassVar[threading.Barrier]
+    lock: ClassVar[threading.Lock] = threading.Lock()
+    requests_being_served: ClassVar[int] = 0
+    max_requests_served_at_the_same_time: ClassVar[int] = 0
+
+    def do_GET(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.requests_being_served += 1
+            cls.max_requests_served_at_the_same_time = max(
+                cls.max_requests_served_at_the_same_time, cls.requests_being_served
+            )
+        try:
+            self.barrier.wait()
+        finally:
+            with cls.lock:
+                cls.requests_being_served -= 1
+        properties = parse_qs(urlparse(self.path).query)["properties"][0].split(",")
+        body = {
+            "data": [
+                {"id": str(i), **{name: f"{name}_{i}" for name in properties if name != "id"}}
+                for i in range(50)
+            ]
+        }
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode("utf-8"))
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.mark.slow
+def test_given_max_concurrent_requests_when_read_records_then_request_property_chunks_at_the_same_time() -> (
+    None
+):
+    max_concurrent_requests = 5
+    _PropertyChunkServer.barrier = threading.Barrier(max_concurrent_requests, timeout=5)
+    _PropertyChunkServer.max_requests_served_at_the_same_time = 0
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        port = s.getsockname()[1]
+    httpd = ThreadingHTTPServer(("localhost", port), _PropertyChunkServer)
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+    property_list = [f"property_{i}" for i in range(20)]  # 10 chunks of 2 properties
+    number_of_slices = 10
+
+    def read_all_slices() -> None:
+        requester = HttpRequester(
+            name="stream_name",
+            url_base=f"http://localhost:{port}",
+            path="records",
+            http_method=HttpMethod.GET,
+            request_options_provider=InterpolatedRequestOptionsProvider(
+                config=config, parameters={}, query_properties_key="properties"
+            ),
+            api_budget=APIBudget(
+                policies=[
+                    MovingWindowCallRatePolicy(
+                        rates=[Rate(limit=10_000, interval=timedelta(minutes=1))], matchers=[]
+                    )
+                ]
+            ),
+            config=config,
+            parameters={},
+        )
+        retriever = _create_property_chunking_retriever(
+            requester, max_concurrent_requests, property_list
+        )
+        for i in range(number_of_slices):
+            records = list(
+                retriever.read_records(
+                    records_schema={},
+                    stream_slice=StreamSlice(cursor_slice={}, partition={"slice": i}),
+                )
+            )
+            assert len(records) == 50
+            assert len(records[0].data) == len(property_list) + 1
+
+    try:
+        read_all_slices()
+    finally:
+        httpd.shutdown()
+        thread.join(timeout=5)
+
+    # The requests would break the barrier of the server if they were not sent at the same time
+    assert _PropertyChunkServer.max_requests_served_at_the_same_time == max_concurrent_requests
+
+
+def _create_paginated_retriever(
+    requester: Any, prefetch_pages: int, cursor_value: str = "{{ response.next_page }}"
+) -> SimpleRetriever:
+    extractor = DpathExtractor(
+        field_path=["data"], decoder=JsonDecoder(parameters={}), config=config, parameters={}
+    )
+    return SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        record_selector=RecordSelector(
+            name="stream_name",
+            extractor=extractor,
+            record_filter=None,
+            transformations=[],
+            config=config,
+            parameters={},
+            schema_normalization=TypeTransformer(TransformConfig.NoTransform),
+        ),
+        paginator=DefaultPaginator(
+            pagination_strategy=CursorPaginationStrategy(
+                cursor_value=cursor_value, config=config, parameters={}
+            ),
+            page_token_option=RequestOption(
+                inject_into=RequestOptionType.request_parameter, field_name="page", parameters={}
+            ),
+            config=config,
+            url_base="https://airbyte.io",
+            parameters={},
+        ),
+        prefetch_pages=prefetch_pages,
+        parameters={},
+        config={},
+    )
+
+
+class _PaginatedRequester:
+    def __init__(self, number_of_pages: int, failing_page: Optional[int] = None) -> None:
+        self._number_of_pages = number_of_pages
+        self._failing_page = failing_page
+        self.fetched_pages = 0
+        self.fetching_threads: List[str] = []
+
+    def send_request(
+        self, next_page_token: Optional[Mapping[str, Any]], **kwargs: Any
+    ) -> requests.Response:
+        page = next_page_token["next_page_token"] if next_page_token else 0
+        self.fetching_threads.append(threading.current_thread().name)
+        if page == self._failing_page:
+            raise ValueError("request failed")
+        self.fetched_pages += 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {
+                "data": [{"id": f"{page}_{i}", "page": page} for i in range(3)],
+                "next_page": page + 1 if page + 1 < self._number_of_pages else None,
+            }
+        ).encode("utf-8")
+        return response
+
+
+@pytest.mark.parametrize("prefetch_pages", [1, 2])
+def test_given_prefetch_pages_when_read_records_then_fetch_at_most_prefetch_pages_ahead(
+    prefetch_pages: int,
+) -> None:
+    requester = _PaginatedRequester(number_of_pages=5)
+    retriever = _create_paginated_retriever(requester, prefetch_pages)
+
+    records = []
+    for record in retriever.read_records(
+        records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+    ):
+        # Give time to the background thread to fetch as many pages as it is allowed to
+        time.sleep(0.01)
+        assert requester.fetched_pages <= record["page"] + 1 + prefetch_pages
+        records.append(record)
+
+    expected_records = list(
+        _create_paginated_retriever(_PaginatedRequester(number_of_pages=5), 0).read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+    assert [record.data for record in records] == [record.data for record in expected_records]
+    assert len(records) == 15
+    assert threading.current_thread().name not in requester.fetching_threads
+
+
+def test_given_prefetch_pages_when_a_request_fails_then_raise() -> None:
+    requester = _PaginatedRequester(number_of_pages=5, failing_page=2)
+    retriever = _create_paginated_retriever(requester, 1)
+    records = []
+
+    with pytest.raises(ValueError, match="request failed"):
+        for record in retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        ):
+            records.append(record)
+
+    assert len(records) == 6
+
+
+def test_given_paginator_depends_on_records_when_read_records_then_do_not_prefetch() -> None:
+    requester = _PaginatedRequester(number_of_pages=3)
+    retriever = _create_paginated_retriever(
+        requester,
+        2,
+        cursor_value="{{ response.next_page if last_page_size == 3 else None }}",
+    )
+
+    records = list(
+        retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+
+    assert len(records) == 9
+    assert set(requester.fetching_threads) == {threading.current_thread().name}
+
+
+def test_given_records_are_not_all_consumed_when_read_records_then_stop_prefetching() -> None:
+    requester = _PaginatedRequester(number_of_pages=100)
+    records = _create_paginated_retriever(requester, 1).read_records(
+        records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+    )
+
+    next(iter(records))
+    records.close()
+    time.sleep(0.3)
+
+    assert requester.fetched_pages <= 3
+    assert not any(thread.name.startswith("prefetch_pages") for thread in threading.enumerate())
+
+
+def test_given_negative_prefetch_pages_when_create_retriever_then_raise() -> None:
+    with pytest.raises(ValueError):
+        _create_paginated_retriever(_PaginatedRequester(number_of_pages=1), -1)
+
+
+def test_given_prefetch_pages_when_read_records_then_fetch_next_page_while_records_are_processed() -> (
+    None
+):
+    number_of_pages = 20
+    requester = _PaginatedRequester(number_of_pages=number_of_pages)
+    retriever = _create_paginated_retriever(requester, prefetch_pages=1)
+    number_of_records = 0
+
+    for record in retriever.read_records(
+        records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+    ):
+        number_of_records += 1
+        # The next page is fetched while the records of the current page are processed
+        next_page_fetched = min(record["page"] + 2, number_of_pages)
+        deadline = time.monotonic() + 5
+        while requester.fetched_pages < next_page_fetched and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert requester.fetched_pages >= next_page_fetched
+
+    assert number_of_records == 3 * number_of_pages
@@ -30,6 +30,9 @@ from airbyte_cdk.models import (
     StreamDescriptor,
     SyncMode,
 )
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.declarative.concurrent_declarative_source import (
     ConcurrentDeclarativeSource,
 )
@@ -1659,6 +1662,44 @@ def test_concurrency_level_initial_number_partitions_to_generate_is_always_one_o
     assert source._concurrent_source._initial_number_partitions_to_generate == 1
 
 
+def test_given_adaptive_concurrency_level_then_requests_feed_the_concurrency_controller():
+    config = {"start_date": "2024-07-01T00:00:00.000Z", "num_workers": 20}
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name="palaces", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            ),
+        ]
+    )
+
+    manifest = copy.deepcopy(_MANIFEST)
+    manifest["concurrency_level"] = {
+        "type": "ConcurrencyLevel",
+        "default_concurrency": "{{ config['num_workers'] }}",
+        "max_concurrency": 25,
+        "adaptive": True,
+        "min_concurrency": 4,
+    }
+
+    source = ConcurrentDeclarativeSource(
+        source_config=manifest, config=config, catalog=catalog, state=[]
+    )
+
+    concurrency_controller = source._concurrent_source._concurrency_controller
+    assert isinstance(concurrency_controller, AdaptiveConcurrencyController)
+    assert concurrency_controller._min_concurrency == 4
+    assert concurrency_controller._max_concurrency == 20
+    palaces_stream = next(
+        stream for stream in source.streams(config=config) if stream.name == "palaces"
+    )
+    requester = palaces_stream.retriever.requester
+    assert requester._http_client._request_observer is concurrency_controller
+
+
 def test_given_partition_routing_and_incremental_sync_then_stream_is_concurrent():
     manifest = {
         "version": "5.0.0",
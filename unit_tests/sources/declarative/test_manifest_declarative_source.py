@@ -1885,21 +1885,80 @@ def test_only_parent_streams_use_cache():
     assert not streams[1].retriever.requester.use_cache
 
     # Parent stream created for substream
-    assert (
-        streams[1].retriever.stream_slicer._partition_router.parent_stream_configs[0].stream.name
-        == "applications"
-    )
-    assert (
-        streams[1]
-        .retriever.stream_slicer._partition_router.parent_stream_configs[0]
-        .stream.retriever.requester.use_cache
-    )
+    partition_router = streams[1].retriever.stream_slicer._partition_router
+    parent_stream_config = partition_router.parent_stream_configs[0]
+    assert parent_stream_config.stream.name == "applications"
+    assert parent_stream_config.stream.retriever.requester.use_cache
+    assert parent_stream_config.record_cache is not None
+    assert parent_stream_config.record_cache_key
 
     # Main stream without caching
     assert streams[2].name == "jobs"
     assert not streams[2].retriever.requester.use_cache
 
 
+def test_given_parent_stream_only_read_by_substream_when_streams_then_parent_does_not_use_cache():
+    applications_stream = {
+        "type": "DeclarativeStream",
+        "$parameters": {
+            "name": "applications",
+            "primary_key": "id",
+            "url_base": "https://harvest.greenhouse.io/v1/",
+        },
+        "schema_loader": {
+            "name": "{{ parameters.stream_name }}",
+            "file_path": "./source_sendgrid/schemas/{{ parameters.name }}.yaml",
+        },
+        "retriever": {
+            "requester": {"path": "applications"},
+            "record_selector": {"extractor": {"type": "DpathExtractor", "field_path": []}},
+        },
+    }
+    manifest = {
+        "version": "0.29.3",
+        "definitions": {},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "$parameters": {
+                    "name": "applications_interviews",
+                    "primary_key": "id",
+                    "url_base": "https://harvest.greenhouse.io/v1/",
+                },
+                "schema_loader": {
+                    "name": "{{ parameters.stream_name }}",
+                    "file_path": "./source_sendgrid/schemas/{{ parameters.name }}.yaml",
+                },
+                "retriever": {
+                    "requester": {"path": "applications_interviews"},
+                    "record_selector": {"extractor": {"type": "DpathExtractor", "field_path": []}},
+                    "partition_router": {
+                        "parent_stream_configs": [
+                            {
+                                "parent_key": "id",
+                                "partition_field": "parent_id",
+                                "stream": applications_stream,
+                            }
+                        ],
+                        "type": "SubstreamPartitionRouter",
+                    },
+                },
+            },
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["applications_interviews"]},
+    }
+
+    streams = ManifestDeclarativeSource(source_config=manifest).streams({})
+
+    # The records of the parent stream are cached by the parent record cache instead of its responses
+    parent_stream_config = streams[
+        0
+    ].retriever.stream_slicer._partition_router.parent_stream_configs[0]
+    assert parent_stream_config.stream.name == "applications"
+    assert not parent_stream_config.stream.retriever.requester.use_cache
+    assert parent_stream_config.record_cache is not None
+
+
 def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMessage]:
     source = ManifestDeclarativeSource(source_config=manifest)
     catalog = ConfiguredAirbyteCatalog(
@@ -8,7 +8,7 @@ import io
 import logging
 import unittest
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from typing import Any, Dict, Generator, List, Set, Tuple
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
@@ -29,7 +29,11 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import (
+    CsvParser,
+    _cast_value,
+    _CsvReader,
+)
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -785,3 +789,310 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+def _stream_reader_for(data: bytes, encoding: str = "utf-8") -> Mock:
+    def _open_file(file, mode, encoding_, logger_):
+        if mode == FileReadMode.READ_BINARY:
+            return io.BytesIO(data)
+        return io.TextIOWrapper(io.BytesIO(data), encoding=encoding_)
+
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = _open_file
+    return stream_reader
+
+
+def _parse_records(
+    parser: CsvParser,
+    data: bytes,
+    config_format: CsvFormat,
+    schema: Dict[str, Any],
+    schemaless: bool = False,
+) -> Tuple[List[Dict[str, Any]], Mock, Mock]:
+    config = FileBasedStreamConfig(
+        name="test",
+        validation_policy="Emit Record",
+        file_type="csv",
+        format=config_format,
+        schemaless=schemaless,
+    )
+    stream_reader = _stream_reader_for(data)
+    parser_logger = Mock(spec=logging.Logger)
+    records = list(
+        parser.parse_records(
+            config,
+            RemoteFile(uri="a uri", last_modified=datetime.now()),
+            stream_reader,
+            parser_logger,
+            schema,
+        )
+    )
+    return records, stream_reader, parser_logger
+
+
+def _schema(**property_types: str) -> Dict[str, Any]:
+    return {"properties": {name: {"type": type_} for name, type_ in property_types.items()}}
+
+
+_TYPED_SCHEMA = _schema(
+    string="string", integer="integer", number="number", boolean="boolean", null="null"
+)
+
+
+@pytest.mark.parametrize(
+    "data, config_format, schema, schemaless",
+    [
+        pytest.param(
+            b"string,integer,number,boolean,null\na,1,1.5,true,\nb,-2,3,0,\nc,3,-1e3,yes,\n",
+            CsvFormat(),
+            _TYPED_SCHEMA,
+            False,
+            id="values-cast-by-pyarrow",
+        ),
+        pytest.param(
+            b"string,integer,number,boolean,null\na,+1, 2.5,maybe,x\nb,1.0,inf,TRUE,\nc,99999999999999999999,1_0,,\n",
+            CsvFormat(),
+            _TYPED_SCHEMA,
+            False,
+            id="values-cast-one-at-a-time",
+        ),
+        pytest.param(
+            b"integer\n0x1F\n0X10\n0b101\n0o17\n1_000\n007\n-0\n",
+            CsvFormat(),
+            _schema(integer="integer"),
+            False,
+            id="non-decimal-integers",
+        ),
+        pytest.param(
+            b"integer\n0x1F\n0X10\n",
+            CsvFormat(),
+            _schema(integer="integer"),
+            False,
+            id="hexadecimal-integers",
+        ),
+        pytest.param(
+            b"string,integer,number,boolean,null\nNA,NA,NA,NA,NA\n,,,,\nnull,2,2.5,true,\n",
+            CsvFormat(null_values={"NA", "", "null"}, strings_can_be_null=True),
+            _TYPED_SCHEMA,
+            False,
+            id="null-values",
+        ),
+        pytest.param(
+            b"string,integer,number,boolean,null\nNA,NA,NA,NA,NA\n,,,,\n",
+            CsvFormat(null_values={"NA", ""}, strings_can_be_null=False),
+            _TYPED_SCHEMA,
+            False,
+            id="strings-can-not-be-null",
+        ),
+        pytest.param(
+            b"boolean\nja\nnein\nyes\n",
+            CsvFormat(true_values=["ja"], false_values=["nein"]),
+            _schema(boolean="boolean"),
+            False,
+            id="custom-boolean-values",
+        ),
+        pytest.param(
+            b"string,integer,not_in_schema\na,1,x\nNA,NA,NA\n",
+            CsvFormat(null_values={"NA"}),
+            _schema(string="string", integer="integer"),
+            True,
+            id="schemaless",
+        ),
+        pytest.param(
+            b"string,not_in_schema\na,x\n",
+            CsvFormat(),
+            _schema(string="string"),
+            False,
+            id="columns-not-in-schema-are-dropped",
+        ),
+        pytest.param(
+            b"not_in_schema\nx\ny\n",
+            CsvFormat(),
+            _schema(string="string"),
+            False,
+            id="no-column-in-schema",
+        ),
+        pytest.param(
+            b"skipped\nskipped,too\nstring,integer\nskipped after\na,1\nb,2\n",
+            CsvFormat(skip_rows_before_header=2, skip_rows_after_header=1),
+            _schema(string="string", integer="integer"),
+            False,
+            id="skip-rows",
+        ),
+        pytest.param(
+            b"skipped\na,1\nb,2\n",
+            CsvFormat(skip_rows_before_header=1, header_definition=CsvHeaderAutogenerated()),
+            _schema(f0="string", f1="integer"),
+            False,
+            id="autogenerated-headers",
+        ),
+        pytest.param(
+            b"a,1\nb,2\n",
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["string", "integer"])),
+            _schema(string="string", integer="integer"),
+            False,
+            id="user-provided-headers",
+        ),
+        pytest.param(
+            b'string,other\r\n"a\r\nb","c\rd"\r\n\r\n"e",f\r\n',
+            CsvFormat(),
+            _schema(string="string", other="string"),
+            False,
+            id="line-endings",
+        ),
+        pytest.param(
+            b"col,other,col\n1,2,3\n",
+            CsvFormat(),
+            _schema(col="integer", other="integer"),
+            False,
+            id="duplicated-headers",
+        ),
+        pytest.param(
+            b"col;other\n'a;b';'c''d'\n",
+            CsvFormat(delimiter=";", quote_char="'"),
+            _schema(col="string", other="string"),
+            False,
+            id="delimiter-and-quote-char",
+        ),
+        pytest.param(
+            "\ufeffstring,integer\n\u00e9,1\n".encode("utf-8"),
+            CsvFormat(encoding="utf-8-sig"),
+            _schema(string="string", integer="integer"),
+            False,
+            id="byte-order-mark",
+        ),
+        pytest.param(
+            b"string,integer\n",
+            CsvFormat(),
+            _schema(string="string", integer="integer"),
+            False,
+            id="no-records",
+        ),
+    ],
+)
+def test_given_columnar_reader_when_parse_records_then_return_same_records_and_warnings(
+    data: bytes, config_format: CsvFormat, schema: Dict[str, Any], schemaless: bool
+) -> None:
+    records, _, python_logger = _parse_records(CsvParser(), data, config_format, schema, schemaless)
+    columnar_records, stream_reader, columnar_logger = _parse_records(
+        CsvParser(use_columnar_reader=True, columnar_block_size=16),
+        data,
+        config_format,
+        schema,
+        schemaless,
+    )
+
+    assert columnar_records == records
+    assert [type(value) for record in columnar_records for value in record.values()] == [
+        type(value) for record in records for value in record.values()
+    ]
+    assert columnar_logger.warning.call_args_list == python_logger.warning.call_args_list
+    assert [call.args[1] for call in stream_reader.open_file.call_args_list] == [
+        FileReadMode.READ_BINARY
+    ]
+
+
+@pytest.mark.parametrize(
+    "data, config_format, schema",
+    [
+        pytest.param(
+            b'col\n"a\\"b"\n',
+            CsvFormat(escape_char="\\"),
+            _schema(col="string"),
+            id="escape-char",
+        ),
+        pytest.param(
+            "col\n\u00e9\n".encode("latin-1"),
+            CsvFormat(encoding="latin-1"),
+            _schema(col="string"),
+            id="encoding-other-than-utf-8",
+        ),
+        pytest.param(
+            b'col\n{"a": 1}\n',
+            CsvFormat(),
+            _schema(col="object"),
+            id="object-column",
+        ),
+        pytest.param(
+            "\ufeffa\n".encode("utf-8"),
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["col"])),
+            _schema(col="string"),
+            id="byte-order-mark-in-values-read-as-utf-8",
+        ),
+    ],
+)
+def test_given_format_not_supported_by_columnar_reader_when_parse_records_then_read_without_it(
+    data: bytes, config_format: CsvFormat, schema: Dict[str, Any]
+) -> None:
+    records, _, _ = _parse_records(CsvParser(), data, config_format, schema)
+    columnar_records, stream_reader, _ = _parse_records(
+        CsvParser(use_columnar_reader=True), data, config_format, schema
+    )
+
+    assert columnar_records == records
+    assert stream_reader.open_file.call_args_list[-1].args[1] == FileReadMode.READ
+
+
+def test_given_columnar_reader_enabled_in_format_when_parse_records_then_read_with_columnar_reader() -> (
+    None
+):
+    data = b"string,integer\na,1\nb,2\n"
+    schema = _schema(string="string", integer="integer")
+
+    records, _, _ = _parse_records(CsvParser(), data, CsvFormat(), schema)
+    columnar_records, stream_reader, _ = _parse_records(
+        CsvParser(), data, CsvFormat(use_columnar_reader=True), schema
+    )
+
+    assert columnar_records == records
+    assert [call.args[1] for call in stream_reader.open_file.call_args_list] == [
+        FileReadMode.READ_BINARY
+    ]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(_TOO_MANY_VALUES, id="too-many-values"),
+        pytest.param(_TOO_FEW_VALUES, id="too-few-values"),
+    ],
+)
+def test_given_mismatch_between_values_and_header_when_parse_records_with_columnar_reader_then_raise_exception(
+    data: List[str],
+) -> None:
+    with pytest.raises(RecordParseError):
+        _parse_records(
+            CsvParser(use_columnar_reader=True),
+            "\n".join(data).encode("utf-8"),
+            CsvFormat(),
+            _schema(header1="string", header2="string", header3="string"),
+        )
+
+
+def test_given_values_pyarrow_can_cast_when_parse_records_with_columnar_reader_then_do_not_cast_values_one_at_a_time() -> (
+    None
+):
+    number_of_rows = 1_000
+    rows = [
+        f"{index},{index * 1.5},{'true' if index % 2 else 'false'},name {index},{'' if index % 10 else 'NA'}"
+        for index in range(number_of_rows)
+    ]
+    data = "\n".join(["id,amount,active,name,comment"] + rows).encode("utf-8")
+    config_format = CsvFormat(null_values={"NA"})
+    schema = _schema(
+        id="integer", amount="number", active="boolean", name="string", comment="string"
+    )
+
+    with mock.patch(
+        "airbyte_cdk.sources.file_based.file_types.csv_parser._cast_value", wraps=_cast_value
+    ) as cast_value:
+        records, _, _ = _parse_records(CsvParser(), data, config_format, schema)
+        row_by_row_casts = cast_value.call_count
+        cast_value.reset_mock()
+        columnar_records, _, _ = _parse_records(
+            CsvParser(use_columnar_reader=True), data, config_format, schema
+        )
+
+    assert columnar_records == records
+    assert row_by_row_casts == 5 * number_of_rows
+    cast_value.assert_not_called()
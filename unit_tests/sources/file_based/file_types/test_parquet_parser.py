@@ -4,11 +4,15 @@
 
 import asyncio
 import datetime
+import decimal
+import io
+import json
 import math
-from typing import Any, Mapping, Union
-from unittest.mock import Mock
+from typing import Any, Dict, List, Mapping, Union
+from unittest.mock import MagicMock, Mock, patch
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pyarrow import Scalar
 
@@ -517,3 +521,178 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
         asyncio.get_event_loop().run_until_complete(
             parser.infer_schema(config, file, stream_reader, logger)
         )
+
+
+def _parquet_file_stream_reader(table: pa.Table, row_group_size: int) -> MagicMock:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    stream_reader = MagicMock()
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(buffer.getvalue())
+    return stream_reader
+
+
+def _parse_records(
+    parser: ParquetParser, parquet_format: ParquetFormat, uri: str, stream_reader: MagicMock
+) -> List[Dict[str, Any]]:
+    config = FileBasedStreamConfig(
+        name="test.parquet",
+        format=parquet_format,
+        validation_policy=ValidationPolicy.emit_record,
+    )
+    file = RemoteFile(uri=uri, last_modified=datetime.datetime.now())
+    return list(parser.parse_records(config, file, stream_reader, Mock(), None))
+
+
+def _records_converted_cell_by_cell(
+    table: pa.Table, parquet_format: ParquetFormat, partition_columns: Mapping[str, str]
+) -> List[Dict[str, Any]]:
+    return [
+        {
+            **{
+                column: ParquetParser._to_output_value(table.column(column)[row], parquet_format)
+                for column in table.column_names
+            },
+            **partition_columns,
+        }
+        for row in range(table.num_rows)
+    ]
+
+
+_ALL_TYPES_TABLE = pa.table(
+    {
+        "bool": pa.array([True, None, False] * 5, type=pa.bool_()),
+        "bool_without_nulls": pa.array([True, False, True] * 5, type=pa.bool_()),
+        "int8": pa.array([-1, None, 3] * 5, type=pa.int8()),
+        "int64_without_nulls": pa.array([2**62, -4, 0] * 5, type=pa.int64()),
+        "uint64_without_nulls": pa.array([2**64 - 1, 1, 0] * 5, type=pa.uint64()),
+        "float32_without_nulls": pa.array([2.7, -1.5, 0.1] * 5, type=pa.float32()),
+        "float64": pa.array([3.14, None, float("inf")] * 5, type=pa.float64()),
+        "string": pa.array(["a", None, "\u00e9t\u00e9"] * 5, type=pa.string()),
+        "binary": pa.array([b"binary", None, b""] * 5, type=pa.binary()),
+        "fixed_size_binary": pa.array([b"t1", None, b"t2"] * 5, type=pa.binary(2)),
+        "large_binary": pa.array([b"large", b"binary", None] * 5, type=pa.large_binary()),
+        "time64": pa.array([datetime.time(6, 7, 8), None, datetime.time(0)] * 5, pa.time64("us")),
+        "timestamp": pa.array(
+            [datetime.datetime(2023, 7, 7, 10, 11, 12, 13), None, datetime.datetime(1970, 1, 1)]
+            * 5,
+            type=pa.timestamp("us"),
+        ),
+        "timestamp_with_tz": pa.array(
+            [datetime.datetime(2021, 2, 3, 4, 5, tzinfo=datetime.timezone.utc), None, None] * 5,
+            type=pa.timestamp("ms", "utc"),
+        ),
+        "date32": pa.array([datetime.date(2023, 7, 7), None, datetime.date(1, 1, 1)] * 5),
+        "duration": pa.array([12345, None, 0] * 5, type=pa.duration("ms")),
+        "decimal128": pa.array(
+            [decimal.Decimal("12.345"), None, decimal.Decimal("-0.001")] * 5,
+            type=pa.decimal128(5, 3),
+        ),
+        "decimal256": pa.array(
+            [decimal.Decimal("13.00"), decimal.Decimal("1E+2"), None] * 5,
+            type=pa.decimal256(8, 2),
+        ),
+        "struct": pa.array(
+            [{"field": 1}, None, {"field": None}] * 5, type=pa.struct([("field", pa.int32())])
+        ),
+        "list": pa.array([[1, 2, 3], None, []] * 5, type=pa.list_(pa.int32())),
+        "map": pa.array(
+            [[("hello", 1), ("world", 2)], None, []] * 5, type=pa.map_(pa.string(), pa.int32())
+        ),
+        "dictionary": pa.array(["apple", None, "cherry"] * 5).dictionary_encode(),
+        "null": pa.array([None] * 15, type=pa.null()),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "parquet_format",
+    [
+        pytest.param(_default_parquet_format, id="test_decimal_as_string"),
+        pytest.param(_decimal_as_float_parquet_format, id="test_decimal_as_float"),
+    ],
+)
+@pytest.mark.parametrize(
+    "batch_size",
+    [
+        pytest.param(1, id="test_batch_size_1"),
+        pytest.param(4, id="test_batch_size_not_aligned_with_row_groups"),
+        pytest.param(10_000, id="test_default_batch_size"),
+    ],
+)
+def test_parse_records_outputs_the_same_values_as_cell_by_cell_conversion(
+    parquet_format: ParquetFormat, batch_size: int
+) -> None:
+    stream_reader = _parquet_file_stream_reader(_ALL_TYPES_TABLE, row_group_size=6)
+    expected_table = pq.read_table(
+        io.BytesIO(stream_reader.open_file.return_value.__enter__.return_value.getvalue())
+    )
+    partition_columns = {"year": "2023", "string": "overridden by partition"}
+
+    records = _parse_records(
+        ParquetParser(batch_size=batch_size),
+        parquet_format,
+        "s3://mybucket/year=2023/string=overridden%20by%20partition/test.parquet",
+        stream_reader,
+    )
+
+    expected_records = _records_converted_cell_by_cell(
+        expected_table, parquet_format, partition_columns
+    )
+    assert len(records) == _ALL_TYPES_TABLE.num_rows
+    assert json.dumps(records) == json.dumps(expected_records)
+
+
+def test_given_batch_size_lower_than_one_when_create_parser_then_raise() -> None:
+    with pytest.raises(ValueError):
+        ParquetParser(batch_size=0)
+
+
+def test_given_batch_when_parse_records_then_convert_each_column_at_once_instead_of_each_cell() -> (
+    None
+):
+    number_of_rows = 1_000
+    table = pa.table(
+        {
+            "id": pa.array(range(number_of_rows), type=pa.int64()),
+            "amount": pa.array([i / 3 for i in range(number_of_rows)], type=pa.float64()),
+            "price": pa.array(
+                [decimal.Decimal(i) / 100 for i in range(number_of_rows)], type=pa.decimal128(12, 2)
+            ),
+            "name": pa.array([f"name {i}" for i in range(number_of_rows)], type=pa.string()),
+            "payload": pa.array([b"payload"] * number_of_rows, type=pa.binary()),
+            "updated_at": pa.array(
+                [
+                    datetime.datetime(2023, 1, 1) + datetime.timedelta(seconds=i)
+                    for i in range(number_of_rows)
+                ],
+                type=pa.timestamp("us"),
+            ),
+            "is_active": pa.array([i % 2 == 0 for i in range(number_of_rows)], type=pa.bool_()),
+        }
+    )
+    stream_reader = _parquet_file_stream_reader(table, row_group_size=number_of_rows)
+    expected_table = pq.read_table(
+        io.BytesIO(stream_reader.open_file.return_value.__enter__.return_value.getvalue())
+    )
+    expected_records = _records_converted_cell_by_cell(expected_table, _default_parquet_format, {})
+
+    with (
+        patch.object(
+            ParquetParser,
+            "_scalar_to_python_value",
+            wraps=ParquetParser._scalar_to_python_value,
+        ) as scalar_to_python_value,
+        patch.object(
+            ParquetParser,
+            "_python_value_converter",
+            wraps=ParquetParser._python_value_converter,
+        ) as python_value_converter,
+    ):
+        records = _parse_records(
+            ParquetParser(), _default_parquet_format, "s3://mybucket/test.parquet", stream_reader
+        )
+
+    assert records == expected_records
+    scalar_to_python_value.assert_not_called()
+    # boolean, integer and floating columns without nulls are converted by numpy without looking up a converter
+    assert python_value_converter.call_count == 4
@@ -302,6 +302,13 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                                     "default": False,
                                                     "description": "Whether to ignore errors that occur when the number of fields in the CSV does not match the number of columns in the schema.",
                                                 },
+                                                "use_columnar_reader": {
+                                                    "title": "Use Columnar Reader",
+                                                    "description": "Whether to read the CSV files in blocks converted column by column, which is faster for large files. The records are the same as the ones read row by row and formats that could produce different records are read row by row.",
+                                                    "default": False,
+                                                    "airbyte_hidden": True,
+                                                    "type": "boolean",
+                                                },
                                             },
                                             "required": ["filetype"],
                                         },
@@ -2,11 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
+import os
+import threading
 import traceback
 import unittest
 from copy import deepcopy
 from datetime import datetime, timezone
-from typing import Any, Iterable, Iterator, Mapping
+from io import IOBase
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple
 from unittest import mock
 from unittest.mock import Mock
 
@@ -24,18 +28,29 @@ from airbyte_cdk.sources.file_based import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.availability_strategy import (
     AbstractFileBasedAvailabilityStrategy,
 )
+from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import ValidationPolicy
 from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
 from airbyte_cdk.sources.file_based.exceptions import (
     DuplicatedFilesError,
     FileBasedErrorsCollector,
     FileBasedSourceError,
+    StopSyncPerValidationPolicy,
+)
+from airbyte_cdk.sources.file_based.file_based_stream_reader import (
+    AbstractFileBasedStreamReader,
+    FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_record_data import FileRecordData
-from airbyte_cdk.sources.file_based.file_types import FileTransfer
+from airbyte_cdk.sources.file_based.file_types import CsvParser, FileTransfer
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
-from airbyte_cdk.sources.file_based.schema_validation_policies import AbstractSchemaValidationPolicy
+from airbyte_cdk.sources.file_based.schema_helpers import SchemaValidator
+from airbyte_cdk.sources.file_based.schema_validation_policies import (
+    DEFAULT_SCHEMA_VALIDATION_POLICIES,
+    AbstractSchemaValidationPolicy,
+)
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.stream.default_file_based_stream import DefaultFileBasedStream
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
@@ -554,3 +569,267 @@ class DefaultFileBasedStreamSchemaTest(unittest.TestCase):
             airbyte_stream = non_file_based_stream.as_airbyte_stream()
             assert isinstance(airbyte_stream, AirbyteStream)
             assert airbyte_stream.is_file_based
+
+
+class DefaultFileBasedStreamConcurrentFileReadsTest(unittest.TestCase):
+    _NOW = datetime(2022, 10, 22, tzinfo=timezone.utc)
+
+    def setUp(self) -> None:
+        self._stream_config = Mock()
+        self._stream_config.format = MockFormat()
+        self._stream_config.name = "a stream name"
+        self._stream_config.schemaless = False
+        self._parser = Mock(spec=FileTypeParser)
+        self._validation_policy = Mock(spec=AbstractSchemaValidationPolicy)
+        self._validation_policy.name = "validation policy name"
+        self._validation_policy.record_passes_validation_policy.return_value = True
+        self._cursor = Mock(spec=AbstractFileBasedCursor)
+
+        self._stream = DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=Mock(),
+            stream_reader=Mock(spec=AbstractFileBasedStreamReader),
+            availability_strategy=Mock(spec=AbstractFileBasedAvailabilityStrategy),
+            discovery_policy=Mock(spec=AbstractDiscoveryPolicy),
+            parsers={MockFormat: self._parser},
+            validation_policy=self._validation_policy,
+            cursor=self._cursor,
+            errors_collector=FileBasedErrorsCollector(),
+            max_concurrent_file_reads=3,
+        )
+        self._files = [
+            RemoteFile(uri=f"file_{index}", last_modified=self._NOW) for index in range(5)
+        ]
+
+    def test_given_files_read_concurrently_when_read_records_from_slice_then_emit_records_and_add_files_in_order(
+        self,
+    ) -> None:
+        self._parser.parse_records.side_effect = (
+            lambda config, file, stream_reader, logger, schema: (
+                {"file": file.uri, "line": line} for line in range(300)
+            )
+        )
+
+        messages = list(self._stream.read_records_from_slice({"files": self._files}))
+
+        assert [
+            (message.record.data["file"], message.record.data["line"]) for message in messages
+        ] == [(file.uri, line) for file in self._files for line in range(300)]
+        assert self._cursor.add_file.call_args_list == [mock.call(file) for file in self._files]
+
+    def test_given_error_in_file_read_concurrently_when_read_records_from_slice_then_read_other_files(
+        self,
+    ) -> None:
+        def _parse_records(config, file, stream_reader, logger, schema):
+            if file.uri == "file_2":
+                raise ValueError("An error")
+            yield {"file": file.uri}
+
+        self._parser.parse_records.side_effect = _parse_records
+
+        messages = list(self._stream.read_records_from_slice({"files": self._files}))
+
+        assert [
+            message.log.level if message.type == MessageType.LOG else message.record.data["file"]
+            for message in messages
+        ] == ["file_0", "file_1", Level.ERROR, "file_3", "file_4"]
+        assert self._cursor.add_file.call_args_list == [
+            mock.call(file) for file in self._files if file.uri != "file_2"
+        ]
+
+    def test_given_sync_stopped_by_validation_policy_when_read_records_from_slice_then_stop_reading_files(
+        self,
+    ) -> None:
+        self._parser.parse_records.side_effect = (
+            lambda config, file, stream_reader, logger, schema: (
+                {"file": file.uri} for _ in range(1_000_000)
+            )
+        )
+        self._validation_policy.record_passes_validation_policy.side_effect = (
+            StopSyncPerValidationPolicy("the record does not conform to the schema")
+        )
+
+        messages = list(self._stream.read_records_from_slice({"files": self._files}))
+
+        assert [message.log.level for message in messages] == [Level.WARN]
+        self._cursor.add_file.assert_not_called()
+
+
+class DefaultFileBasedStreamSchemaValidationTest(unittest.TestCase):
+    _NOW = datetime(2022, 10, 22, tzinfo=timezone.utc)
+    _SCHEMA = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": ["null", "string"]}},
+    }
+
+    def setUp(self) -> None:
+        self._stream_config = Mock()
+        self._stream_config.format = MockFormat()
+        self._stream_config.name = "a stream name"
+        self._stream_config.schemaless = False
+        self._parser = Mock(spec=FileTypeParser)
+        self._parser.parse_records.return_value = [
+            {"id": 1, "name": "a name"},
+            {"id": "not an id", "name": "a name"},
+            {"id": 3, "unknown": "a value"},
+        ]
+
+    def _stream(self, validation_policy: ValidationPolicy) -> DefaultFileBasedStream:
+        self._stream_config.validation_policy = validation_policy
+        return DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=self._SCHEMA,
+            stream_reader=Mock(spec=AbstractFileBasedStreamReader),
+            availability_strategy=Mock(spec=AbstractFileBasedAvailabilityStrategy),
+            discovery_policy=Mock(spec=AbstractDiscoveryPolicy),
+            parsers={MockFormat: self._parser},
+            validation_policy=DEFAULT_SCHEMA_VALIDATION_POLICIES[validation_policy],
+            cursor=Mock(spec=AbstractFileBasedCursor),
+            errors_collector=FileBasedErrorsCollector(),
+        )
+
+    def test_given_records_not_conforming_to_schema_when_read_records_from_slice_then_warn_with_invalid_columns(
+        self,
+    ) -> None:
+        stream = self._stream(ValidationPolicy.skip_record)
+
+        messages = list(
+            stream.read_records_from_slice(
+                {"files": [RemoteFile(uri="a_file", last_modified=self._NOW)]}
+            )
+        )
+
+        assert [message.record.data["id"] for message in messages[:-1]] == [1]
+        assert messages[-1].log.level == Level.WARN
+        assert messages[-1].log.message.endswith(
+            "n_skipped=2 validation_policy=skip_record invalid_columns=id,unknown"
+        )
+
+    def test_given_sync_stopped_by_validation_policy_when_read_records_from_slice_then_warn_with_invalid_column(
+        self,
+    ) -> None:
+        stream = self._stream(ValidationPolicy.wait_for_discover)
+
+        messages = list(
+            stream.read_records_from_slice(
+                {"files": [RemoteFile(uri="a_file", last_modified=self._NOW)]}
+            )
+        )
+
+        assert messages[-1].log.level == Level.WARN
+        assert messages[-1].log.message.endswith("invalid_columns=id")
+
+    def test_when_read_records_from_slice_then_validate_records_with_the_schema_compiled_once(
+        self,
+    ) -> None:
+        stream = self._stream(ValidationPolicy.skip_record)
+
+        with mock.patch(
+            "airbyte_cdk.sources.file_based.stream.default_file_based_stream.SchemaValidator",
+            wraps=SchemaValidator,
+        ) as schema_validator_class:
+            for file in ["a_file", "another_file"]:
+                list(
+                    stream.read_records_from_slice(
+                        {"files": [RemoteFile(uri=file, last_modified=self._NOW)]}
+                    )
+                )
+
+        schema_validator_class.assert_called_once_with(self._SCHEMA)
+        assert stream.schema_validator == self._SCHEMA
+
+
+class _LocalFilesStreamReader(AbstractFileBasedStreamReader):
+    """
+    Reads files from a local directory. The first `files_opened_at_the_same_time` files are only opened once all of them are being
+    opened, so reading them one after the other fails.
+    """
+
+    def __init__(self, directory: str, files_opened_at_the_same_time: int) -> None:
+        super().__init__()
+        self._directory = directory
+        self._barrier = threading.Barrier(files_opened_at_the_same_time, timeout=5)
+        self._lock = threading.Lock()
+        self._opened_files = 0
+
+    @property
+    def config(self) -> Optional[AbstractFileBasedSpec]:
+        return self._config
+
+    @config.setter
+    def config(self, value: AbstractFileBasedSpec) -> None:
+        self._config = value
+
+    def get_matching_files(
+        self, globs: List[str], prefix: Optional[str], logger: logging.Logger
+    ) -> Iterable[RemoteFile]:
+        return [
+            RemoteFile(uri=file_name, last_modified=datetime(2025, 1, 1))
+            for file_name in sorted(os.listdir(self._directory))
+        ]
+
+    def open_file(
+        self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger
+    ) -> IOBase:
+        with self._lock:
+            self._opened_files += 1
+            wait_for_other_files = self._opened_files <= self._barrier.parties
+        if wait_for_other_files:
+            self._barrier.wait()
+        return open(os.path.join(self._directory, file.uri), mode.value, encoding=encoding)  # type: ignore[return-value]
+
+    def file_size(self, file: RemoteFile) -> int:
+        return os.path.getsize(os.path.join(self._directory, file.uri))
+
+    def upload(
+        self, file: RemoteFile, local_directory: str, logger: logging.Logger
+    ) -> Tuple[FileRecordData, AirbyteRecordMessageFileReference]:
+        raise NotImplementedError("Files are only read as records")
+
+
+def _read_local_files(
+    directory: str, max_concurrent_file_reads: int
+) -> Tuple[List[AirbyteMessage], List[RemoteFile]]:
+    stream_reader = _LocalFilesStreamReader(
+        directory, files_opened_at_the_same_time=max_concurrent_file_reads
+    )
+    cursor = Mock(spec=AbstractFileBasedCursor)
+    stream = DefaultFileBasedStream(
+        config=FileBasedStreamConfig(
+            name="a_stream", validation_policy="Emit Record", file_type="csv", format=CsvFormat()
+        ),
+        catalog_schema={
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+        },
+        stream_reader=stream_reader,
+        availability_strategy=Mock(spec=AbstractFileBasedAvailabilityStrategy),
+        discovery_policy=Mock(spec=AbstractDiscoveryPolicy),
+        parsers={CsvFormat: CsvParser()},
+        validation_policy=DEFAULT_SCHEMA_VALIDATION_POLICIES[ValidationPolicy.emit_record],
+        cursor=cursor,
+        errors_collector=FileBasedErrorsCollector(),
+        max_concurrent_file_reads=max_concurrent_file_reads,
+    )
+    files = list(stream_reader.get_matching_files([], None, logging.getLogger()))
+    messages = list(stream.read_records_from_slice({"files": files}))
+    return messages, [call.args[0] for call in cursor.add_file.call_args_list]
+
+
+def test_given_files_sharing_last_modified_when_read_files_concurrently_then_output_the_same_records_and_files_as_sequential_read(
+    tmp_path,
+) -> None:
+    number_of_files = 40
+    for file_index in range(number_of_files):
+        (tmp_path / f"file_{file_index:03}.csv").write_text(
+            "id,name\n" + "".join(f"{row},name {row}\n" for row in range(200))
+        )
+
+    sequential_messages, sequential_files = _read_local_files(str(tmp_path), 1)
+    concurrent_messages, concurrent_files = _read_local_files(str(tmp_path), 8)
+
+    assert len(concurrent_messages) == number_of_files * 200
+    assert [message.record.data for message in concurrent_messages] == [
+        message.record.data for message in sequential_messages
+    ]
+    assert concurrent_files == sequential_files
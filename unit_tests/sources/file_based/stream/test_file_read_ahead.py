@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List
+
+import pytest
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.file_read_ahead import FileReadAhead
+
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _files(number_of_files: int) -> List[RemoteFile]:
+    return [RemoteFile(uri=f"file_{index}", last_modified=_NOW) for index in range(number_of_files)]
+
+
+def _read_items(file: RemoteFile) -> Iterable[str]:
+    for index in range(250):
+        yield f"{file.uri}_{index}"
+
+
+def test_given_files_when_read_then_return_items_of_each_file_in_order() -> None:
+    files = _files(5)
+
+    items = [
+        (file.uri, list(file_items))
+        for file, file_items in FileReadAhead(_read_items, max_concurrent_files=3).read(files)
+    ]
+
+    assert items == [(file.uri, list(_read_items(file))) for file in files]
+
+
+def test_given_error_while_reading_a_file_when_read_then_raise_it_after_the_items_read_before() -> (
+    None
+):
+    def _read_failing_file(file: RemoteFile) -> Iterable[str]:
+        yield f"{file.uri}_0"
+        if file.uri == "file_1":
+            raise ValueError("the file is corrupted")
+        yield f"{file.uri}_1"
+
+    items = []
+    errors = []
+    for file, file_items in FileReadAhead(_read_failing_file, max_concurrent_files=3).read(
+        _files(3)
+    ):
+        try:
+            for item in file_items:
+                items.append(item)
+        except ValueError as error:
+            errors.append((file.uri, str(error)))
+
+    assert items == ["file_0_0", "file_0_1", "file_1_0", "file_2_0", "file_2_1"]
+    assert errors == [("file_1", "the file is corrupted")]
+
+
+def test_given_max_concurrent_files_when_read_then_read_files_at_the_same_time() -> None:
+    # Every file waits for the other ones to be read at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _read_file_concurrently(file: RemoteFile) -> Iterable[str]:
+        barrier.wait()
+        yield file.uri
+
+    items = [
+        item
+        for _, file_items in FileReadAhead(_read_file_concurrently, max_concurrent_files=3).read(
+            _files(3)
+        )
+        for item in file_items
+    ]
+
+    assert items == ["file_0", "file_1", "file_2"]
+
+
+def test_given_files_not_consumed_when_read_then_buffer_at_most_max_buffered_items() -> None:
+    items_read: Dict[str, int] = {}
+
+    def _count_items(file: RemoteFile) -> Iterable[str]:
+        for item in _read_items(file):
+            items_read[file.uri] = items_read.get(file.uri, 0) + 1
+            yield item
+
+    files_to_read = FileReadAhead(_count_items, max_concurrent_files=2, max_buffered_items=10).read(
+        _files(4)
+    )
+    file, file_items = next(files_to_read)
+    next(file_items)
+    files_to_read.close()
+
+    # A file stops once its buffer is full and the next chunk is ready: 10 buffered items plus 10 items waiting to be buffered
+    assert set(items_read) <= {"file_0", "file_1"}
+    assert all(count <= 20 for count in items_read.values())
+
+
+def test_given_items_of_a_file_not_consumed_when_next_file_then_skip_them() -> None:
+    files_to_read = FileReadAhead(_read_items, max_concurrent_files=2, max_buffered_items=10).read(
+        _files(2)
+    )
+
+    _, first_file_items = next(files_to_read)
+    next(first_file_items)
+    _, second_file_items = next(files_to_read)
+
+    assert list(second_file_items) == list(_read_items(_files(2)[1]))
+    with pytest.raises(StopIteration):
+        next(files_to_read)
+
+
+def test_given_invalid_max_concurrent_files_when_create_then_raise() -> None:
+    with pytest.raises(ValueError):
+        FileReadAhead(_read_items, max_concurrent_files=0)
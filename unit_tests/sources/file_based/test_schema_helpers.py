@@ -3,6 +3,7 @@
 #
 
 from typing import Any, Mapping, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -10,7 +11,9 @@ from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, Sch
 from airbyte_cdk.sources.file_based.schema_helpers import (
     ComparableType,
     SchemaType,
+    SchemaValidator,
     conforms_to_schema,
+    is_equal_or_narrower_type,
     merge_schemas,
     type_mapping_to_jsonschema,
 )
@@ -231,12 +234,115 @@ SCHEMA = {
             False,
             id="nonconforming-object-is-not-a-string",
         ),
+        pytest.param(
+            {"union_field": 1, "integer_field": "not an integer"},
+            {
+                "type": "object",
+                "properties": {
+                    "union_field": {"type": ["null", "integer"]},
+                    "integer_field": {"type": "integer"},
+                },
+            },
+            False,
+            id="nonconforming-column-after-union-column",
+        ),
+        pytest.param(
+            {"object_field": {}, "integer_field": "not an integer"},
+            {
+                "type": "object",
+                "properties": {
+                    "object_field": {"type": "object"},
+                    "integer_field": {"type": "integer"},
+                },
+            },
+            False,
+            id="nonconforming-column-after-object-column",
+        ),
+        pytest.param(
+            {"union_field": [1, 2]},
+            {"type": "object", "properties": {"union_field": {"type": ["null", "array"]}}},
+            True,
+            id="conforming-array-in-union-column",
+        ),
     ],
 )
 def test_conforms_to_schema(
     record: Mapping[str, Any], schema: Mapping[str, Any], expected_result: bool
 ) -> None:
     assert conforms_to_schema(record, schema) == expected_result
+    assert conforms_to_schema(record, SchemaValidator(schema)) == expected_result
+
+
+@pytest.mark.parametrize(
+    "record,expected_invalid_column",
+    [
+        pytest.param(COMPLETE_CONFORMING_RECORD, None, id="record-conforms"),
+        pytest.param(NONCONFORMING_EXTRA_COLUMN_RECORD, "column_x", id="extra-column"),
+        pytest.param(NONCONFORMING_WIDER_TYPE_RECORD, "null_field", id="wider-type"),
+        pytest.param(
+            NONCONFORMING_TOO_WIDE_ARRAY_RECORD, "array_field", id="array-values-too-wide"
+        ),
+    ],
+)
+def test_schema_validator_get_invalid_column(
+    record: Mapping[str, Any], expected_invalid_column: Optional[str]
+) -> None:
+    assert SchemaValidator(SCHEMA).get_invalid_column(record) == expected_invalid_column
+
+
+def test_schema_validator_is_a_view_of_the_schema() -> None:
+    validator = SchemaValidator(SCHEMA)
+
+    assert validator == SCHEMA
+    assert validator["properties"] is SCHEMA["properties"]
+
+
+def _conforms_to_schema_without_compiling(
+    record: Mapping[str, Any], schema: Mapping[str, Any]
+) -> bool:
+    # The validation of each record against the raw schema, as it was done before the schema was compiled
+    if not set(record.keys()).issubset(set(schema.get("properties", {}).keys())):
+        return False
+    for column, definition in schema.get("properties", {}).items():
+        value = record.get(column)
+        if value is not None and not is_equal_or_narrower_type(value, definition.get("type")):
+            return False
+    return True
+
+
+def test_given_many_records_when_validate_with_schema_validator_then_compile_schema_once_and_do_not_compare_types() -> (
+    None
+):
+    types = ["string", "number", "integer", "boolean"]
+    schema = {
+        "type": "object",
+        "properties": {
+            f"column_{index}": {"type": types[index % len(types)]} for index in range(500)
+        },
+    }
+    values = {"string": "a value", "number": 1.5, "integer": 1, "boolean": True}
+    records = [
+        {f"column_{index}": values[types[index % len(types)]] for index in range(500)}
+        for _ in range(100)
+    ]
+    records.append({**records[0], "column_1": "not a number"})
+    expected_results = [_conforms_to_schema_without_compiling(record, schema) for record in records]
+
+    validator = SchemaValidator(schema)
+    with (
+        patch.object(
+            SchemaValidator, "_compile", autospec=True, side_effect=SchemaValidator._compile
+        ) as compile_schema,
+        patch(
+            "airbyte_cdk.sources.file_based.schema_helpers.is_equal_or_narrower_type"
+        ) as compare_types,
+    ):
+        results = [conforms_to_schema(record, validator) for record in records]
+
+    assert results == expected_results
+    assert results[-1] is False
+    compile_schema.assert_called_once()
+    compare_types.assert_not_called()
 
 
 def test_comparable_types() -> None:
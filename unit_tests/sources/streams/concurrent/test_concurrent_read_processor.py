@@ -585,6 +585,29 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         ]
         assert messages == expected_messages
 
+    def test_on_record_batch_then_emit_records_in_order_and_observe_each(self):
+        stream_instances_to_read_from = [self._stream]
+        handler = ConcurrentReadProcessor(
+            stream_instances_to_read_from,
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        records = [Record({"id": 1}, _STREAM_NAME), Record({"id": 2}, _STREAM_NAME)]
+
+        messages = list(handler.on_record_batch(records))
+
+        assert [
+            message.record.data for message in messages if message.type == MessageType.RECORD
+        ] == [
+            {"id": 1},
+            {"id": 2},
+        ]
+        assert self._stream.cursor.observe.call_args_list == [call(records[0]), call(records[1])]
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_exception_return_trace_message_and_on_stream_complete_return_stream_status(self):
         stream_instances_to_read_from = [self._stream, self._another_stream]
@@ -1,21 +1,23 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import random
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from functools import partial
-from typing import Any, Mapping, Optional
+from typing import Any, Iterable, Mapping, MutableMapping, Optional
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import freezegun
 import pytest
 from isodate import parse_duration
 
+from airbyte_cdk.models import AirbyteStateBlob
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.incremental.datetime_based_cursor import DatetimeBasedCursor
-from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
 from airbyte_cdk.sources.streams.concurrent.clamping import (
     ClampingEndProvider,
     ClampingStrategy,
@@ -110,6 +112,33 @@ class ConcurrentCursorStateTest(TestCase):
             _NO_LOOKBACK_WINDOW,
         )
 
+    def test_given_equal_cursor_values_in_different_formats_when_close_partition_then_keep_first_observed_value(
+        self,
+    ) -> None:
+        cursor = ConcurrentCursor(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            deepcopy(_NO_STATE),
+            self._message_repository,
+            self._state_manager,
+            CustomFormatConcurrentStreamStateConverter(
+                "%Y-%m-%dT%H:%M:%S%z", is_sequential_state=False
+            ),
+            CursorField(_A_CURSOR_FIELD_KEY),
+            None,
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            EpochValueConcurrentStreamStateConverter.get_end_provider(),
+            _NO_LOOKBACK_WINDOW,
+        )
+        partition = _partition(_NO_SLICE)
+
+        cursor.observe(_record("2024-01-01T02:00:00+0200", partition))
+        cursor.observe(_record("2024-01-01T00:00:00+0000", partition))
+        cursor.observe(_record("2023-12-31T00:00:00+0000", partition))
+        cursor.close_partition(partition)
+
+        assert cursor.state["slices"][0]["most_recent_cursor_value"] == "2024-01-01T02:00:00+0200"
+
     def test_given_no_cursor_value_when_observe_then_do_not_raise(self) -> None:
         cursor = self._cursor_with_slice_boundary_fields()
         partition = _partition(_NO_SLICE)
@@ -172,6 +201,32 @@ class ConcurrentCursorStateTest(TestCase):
             },
         )
 
+    def test_given_partitions_closed_out_of_order_when_close_partition_then_emit_merged_slices(
+        self,
+    ) -> None:
+        cursor = self._cursor_with_slice_boundary_fields(is_sequential_state=False)
+        for lower, upper in [(21, 30), (0, 10), (40, 50), (11, 20)]:
+            cursor.close_partition(
+                _partition(
+                    StreamSlice(
+                        partition={
+                            _LOWER_SLICE_BOUNDARY_FIELD: lower,
+                            _UPPER_SLICE_BOUNDARY_FIELD: upper,
+                        },
+                        cursor_slice={},
+                    ),
+                )
+            )
+
+        assert self._state_manager.update_state_for_stream.call_count == 4
+        assert self._state_manager.update_state_for_stream.call_args_list[-1].args[2] == {
+            "slices": [
+                {"start": 0, "end": 30, "most_recent_cursor_value": 0},
+                {"start": 40, "end": 50},
+            ],
+            "state_type": "date-range",
+        }
+
     def test_close_partition_emits_message_to_lower_boundary_when_no_prior_state_exists(
         self,
     ) -> None:
@@ -1846,3 +1901,182 @@ def test_should_be_synced(record: Record, should_be_synced: bool):
         _NO_LOOKBACK_WINDOW,
     )
     assert cursor.should_be_synced(record) == should_be_synced
+
+
+class _EagerlyParsingConcurrentCursor(ConcurrentCursor):
+    """
+    Parses every cursor value with `parse_value` like ConcurrentCursor did before cursor values were parsed for comparison
+    """
+
+    def observe(self, record: Record) -> None:
+        most_recent_cursor_value = self._most_recent_cursor_value_per_partition.get(
+            record.associated_slice
+        )
+        cursor_value = self._extract_cursor_value(record)
+        if most_recent_cursor_value is None or most_recent_cursor_value < cursor_value:
+            self._most_recent_cursor_value_per_partition[record.associated_slice] = cursor_value
+            self._most_recent_raw_cursor_value_per_partition[record.associated_slice] = (
+                self._cursor_field.extract_value(record)
+            )
+
+
+@pytest.mark.parametrize(
+    "converter, datetime_format",
+    [
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter(
+                "%Y-%m-%dT%H:%M:%S.%fZ", is_sequential_state=False
+            ),
+            "%Y-%m-%dT%H:%M:%S.%fZ",
+            id="custom_format",
+        ),
+        pytest.param(
+            IsoMillisConcurrentStreamStateConverter(is_sequential_state=False),
+            "%Y-%m-%dT%H:%M:%S.%f+00:00",
+            id="iso",
+        ),
+    ],
+)
+def test_given_many_records_when_observe_then_do_not_parse_each_cursor_value(
+    converter, datetime_format
+) -> None:
+    number_of_records = 1_000
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    partition = _partition(
+        StreamSlice(
+            partition={},
+            cursor_slice={
+                _LOWER_SLICE_BOUNDARY_FIELD: converter.output_format(start),
+                _UPPER_SLICE_BOUNDARY_FIELD: converter.output_format(start + timedelta(days=30)),
+            },
+        )
+    )
+    # Records are mostly ascending like when an API sorts them by update time
+    records = [
+        _record((start + timedelta(seconds=i * 7 % 1000 + i)).strftime(datetime_format), partition)
+        for i in range(number_of_records)
+    ]
+
+    def _observe(cursor_class):
+        cursor = cursor_class(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            Mock(spec=MessageRepository),
+            Mock(spec=ConnectorStateManager),
+            converter,
+            CursorField(_A_CURSOR_FIELD_KEY),
+            _SLICE_BOUNDARY_FIELDS,
+            start,
+            converter.get_end_provider(),
+        )
+        with patch.object(converter, "parse_value", wraps=converter.parse_value) as parse_value:
+            for record in records:
+                cursor.observe(record)
+        cursor.close_partition(partition)
+        return parse_value.call_count, cursor.state
+
+    eager_parse_count, eager_state = _observe(_EagerlyParsingConcurrentCursor)
+    parse_count, state = _observe(ConcurrentCursor)
+
+    assert state == eager_state
+    assert eager_parse_count == number_of_records
+    assert parse_count == 0
+
+
+class _SlicePartition(Partition):
+    def __init__(self, _slice: StreamSlice) -> None:
+        self._slice = _slice
+
+    def read(self) -> Iterable[Record]:
+        return []
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return self._slice
+
+    def stream_name(self) -> str:
+        return _A_STREAM_NAME
+
+    def __hash__(self) -> int:
+        return hash(self._slice)
+
+
+class _RemergingConcurrentCursor(ConcurrentCursor):
+    """
+    Merges all the slices every time a partition is closed like ConcurrentCursor did before the slices were kept merged
+    """
+
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        return self._connector_state_converter.convert_to_state_message(
+            self.cursor_field, self._concurrent_state
+        )
+
+    def _insert_slice(self, _slice: MutableMapping[str, Any]) -> None:
+        self._concurrent_state["slices"].append(_slice)
+        self._concurrent_state["slices"] = self._connector_state_converter.merge_intervals(
+            self._concurrent_state["slices"]
+        )
+
+
+def test_given_out_of_order_slices_when_close_partitions_then_do_not_merge_all_slices_again() -> (
+    None
+):
+    number_of_slices = 2_000
+    # Slices are closed out of order within windows like when many partitions are read concurrently
+    closing_window = 100
+    slice_order = []
+    for window_start in range(0, number_of_slices, closing_window):
+        window = list(range(window_start, window_start + closing_window))
+        random.Random(window_start).shuffle(window)
+        slice_order.extend(window)
+    partitions = [
+        _SlicePartition(
+            StreamSlice(
+                partition={},
+                cursor_slice={
+                    _LOWER_SLICE_BOUNDARY_FIELD: index * 10,
+                    _UPPER_SLICE_BOUNDARY_FIELD: index * 10 + 9,
+                },
+            )
+        )
+        for index in slice_order
+    ]
+    records = [
+        _record(partition.to_slice()[_UPPER_SLICE_BOUNDARY_FIELD], partition)
+        for partition in partitions
+    ]
+
+    def _close_partitions(cursor_class):
+        message_repository = InMemoryMessageRepository()
+        converter = EpochValueConcurrentStreamStateConverter(is_sequential_state=True)
+        cursor = cursor_class(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            message_repository,
+            ConnectorStateManager(),
+            converter,
+            CursorField(_A_CURSOR_FIELD_KEY),
+            _SLICE_BOUNDARY_FIELDS,
+            datetime.fromtimestamp(0, timezone.utc),
+            EpochValueConcurrentStreamStateConverter.get_end_provider(),
+        )
+        with patch.object(
+            converter, "merge_intervals", wraps=converter.merge_intervals
+        ) as merge_intervals:
+            for partition, record in zip(partitions, records):
+                cursor.observe(record)
+                cursor.close_partition(partition)
+        return merge_intervals.call_count, [
+            message.state.stream.stream_state for message in message_repository.consume_queue()
+        ]
+
+    remerging_merge_count, remerging_states = _close_partitions(_RemergingConcurrentCursor)
+    merge_count, states = _close_partitions(ConcurrentCursor)
+
+    assert states == remerging_states
+    assert states[-1] == AirbyteStateBlob({_A_CURSOR_FIELD_KEY: number_of_slices * 10 - 1})
+    assert remerging_merge_count >= number_of_slices
+    # The slices of the initial state are merged once, before the first slice is inserted
+    assert merge_count <= 1
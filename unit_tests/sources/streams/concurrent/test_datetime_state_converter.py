@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from datetime import datetime, timezone
+import random
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -406,3 +408,150 @@ def test_given_when_parse_timestamp_then_eventually_fallback_on_output_format():
     parsed_datetime = converter.parse_timestamp("2024-01-01T02:00:00")
 
     assert parsed_datetime == datetime(2024, 1, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "converter, value",
+    [
+        pytest.param(EpochValueConcurrentStreamStateConverter(), 1617030403, id="epoch"),
+        pytest.param(
+            EpochValueConcurrentStreamStateConverter(), "1617030403", id="epoch_as_string"
+        ),
+        pytest.param(EpochValueConcurrentStreamStateConverter(), 10**20, id="epoch_out_of_range"),
+        pytest.param(
+            IsoMillisConcurrentStreamStateConverter(), "2021-01-18T21:18:20.000Z", id="iso"
+        ),
+        pytest.param(
+            IsoMillisConcurrentStreamStateConverter(), "2021-01-18 21:18:20", id="iso_naive"
+        ),
+        pytest.param(
+            IsoMillisConcurrentStreamStateConverter(),
+            "2021-01-18T21:18:20.5-05:30",
+            id="iso_offset",
+        ),
+        pytest.param(IsoMillisConcurrentStreamStateConverter(), "2021-01-18", id="iso_date"),
+        pytest.param(IsoMillisConcurrentStreamStateConverter(), 1617030403, id="iso_epoch"),
+        pytest.param(
+            IsoMillisConcurrentStreamStateConverter(), "2021-02-30T00:00:00Z", id="iso_invalid_date"
+        ),
+        pytest.param(IsoMillisConcurrentStreamStateConverter(), "not a date", id="iso_invalid"),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "2021-01-18T21:18:20.123Z",
+            id="custom_format",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S%z"),
+            "2021-01-18T21:18:20+0200",
+            id="custom_format_with_offset",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S.%_msZ"),
+            "2021-01-18T21:18:20.123Z",
+            id="custom_format_with_milliseconds",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d %H:%M:%S"),
+            "2021-1-8 1:18:20",
+            id="custom_format_without_padding",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d", ["%Y-%m-%d %H:%M:%S"]),
+            "2021-01-18",
+            id="custom_format_second_input_format",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "2021-02-30",
+            id="custom_format_invalid_date",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%s"), "1617030403", id="custom_epoch"
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%d/%m/%Y %B"),
+            "18/01/2021 January",
+            id="custom_format_not_supported_by_fast_parser",
+        ),
+    ],
+)
+def test_parse_value_for_comparison_is_consistent_with_parse_value(converter, value):
+    try:
+        expected_value = converter.parse_value(value)
+    except Exception as exception:
+        with pytest.raises(type(exception)):
+            converter.parse_value_for_comparison(value)
+        return
+
+    value_for_comparison = converter.parse_value_for_comparison(value)
+
+    assert value_for_comparison == expected_value
+    assert value_for_comparison.utcoffset() == expected_value.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "intervals, expected_intervals",
+    [
+        pytest.param(
+            [{"start": 0, "end": 10}, {"start": 20, "end": 30}],
+            [{"start": 0, "end": 10}, {"start": 20, "end": 30}],
+            id="disjoint",
+        ),
+        pytest.param(
+            [{"start": 20, "end": 30}, {"start": 0, "end": 10}, {"start": 11, "end": 19}],
+            [{"start": 0, "end": 30, "most_recent_cursor_value": None}],
+            id="filling_a_gap_merges_both_neighbours",
+        ),
+        pytest.param(
+            [
+                {"start": 0, "end": 10, "most_recent_cursor_value": 5},
+                {"start": 30, "end": 40, "most_recent_cursor_value": 35},
+                {"start": 5, "end": 50},
+            ],
+            [{"start": 0, "end": 50, "most_recent_cursor_value": 35}],
+            id="overlapping_many_intervals",
+        ),
+        pytest.param(
+            [{"start": 10, "end": 20}, {"start": 12, "end": 15}],
+            [{"start": 10, "end": 20, "most_recent_cursor_value": None}],
+            id="contained",
+        ),
+    ],
+)
+def test_insert_interval(intervals, expected_intervals):
+    converter = EpochValueConcurrentStreamStateConverter()
+    merged_intervals = []
+
+    for interval in intervals:
+        converter.insert_interval(merged_intervals, _to_datetimes(interval))
+
+    assert merged_intervals == [_to_datetimes(interval) for interval in expected_intervals]
+
+
+def _to_datetimes(interval):
+    return {
+        key: datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+        for key, value in interval.items()
+    }
+
+
+def test_insert_interval_is_consistent_with_merge_intervals():
+    converter = EpochValueConcurrentStreamStateConverter()
+    rng = random.Random(0)
+    for _ in range(200):
+        intervals = []
+        for _ in range(rng.randint(1, 20)):
+            start = datetime.fromtimestamp(rng.randint(0, 100), timezone.utc)
+            intervals.append(
+                {
+                    "start": start,
+                    "end": start + timedelta(seconds=rng.randint(0, 10)),
+                    "most_recent_cursor_value": rng.choice([None, start]),
+                }
+            )
+        merged_intervals = []
+
+        for interval in deepcopy(intervals):
+            converter.insert_interval(merged_intervals, interval)
+
+        assert merged_intervals == converter.merge_intervals(deepcopy(intervals))
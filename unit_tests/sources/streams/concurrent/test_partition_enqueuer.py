@@ -6,6 +6,8 @@ from queue import Queue
 from typing import Callable, Iterable, List
 from unittest.mock import Mock, patch
 
+import pytest
+
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
 )
@@ -24,22 +26,16 @@ class PartitionEnqueuerTest(unittest.TestCase):
     def setUp(self) -> None:
         self._queue: Queue[QueueItem] = Queue()
         self._thread_pool_manager = Mock(spec=ThreadPoolManager)
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = False
         self._partition_generator = PartitionEnqueuer(self._queue, self._thread_pool_manager)
 
-    @patch("airbyte_cdk.sources.streams.concurrent.partition_enqueuer.time.sleep")
-    def test_given_no_partitions_when_generate_partitions_then_do_not_wait(self, mocked_sleep):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = (
-            True  # shouldn't be called but just in case
-        )
+    def test_given_no_partitions_when_generate_partitions_then_do_not_wait(self):
         stream = self._a_stream([])
 
         self._partition_generator.generate_partitions(stream)
 
-        assert mocked_sleep.call_count == 0
+        assert self._thread_pool_manager.wait_for_task_slot.call_count == 0
 
     def test_given_no_partitions_when_generate_partitions_then_only_push_sentinel(self):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = True
         stream = self._a_stream([])
 
         self._partition_generator.generate_partitions(stream)
@@ -47,7 +43,6 @@ class PartitionEnqueuerTest(unittest.TestCase):
         assert self._consume_queue() == [PartitionGenerationCompletedSentinel(stream)]
 
     def test_given_partitions_when_generate_partitions_then_return_partitions_before_sentinel(self):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = False
         stream = self._a_stream(_SOME_PARTITIONS)
 
         self._partition_generator.generate_partitions(stream)
@@ -56,20 +51,33 @@ class PartitionEnqueuerTest(unittest.TestCase):
             PartitionGenerationCompletedSentinel(stream)
         ]
 
-    @patch("airbyte_cdk.sources.streams.concurrent.partition_enqueuer.time.sleep")
-    def test_given_partition_but_limit_reached_when_generate_partitions_then_wait_until_not_hitting_limit(
-        self, mocked_sleep
-    ):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.side_effect = [
-            True,
-            True,
-            False,
+    def test_given_sleep_time_when_create_then_warn_deprecation_and_do_not_sleep(self):
+        with pytest.warns(DeprecationWarning):
+            partition_generator = PartitionEnqueuer(
+                self._queue, self._thread_pool_manager, sleep_time_in_seconds=0.1
+            )
+        stream = self._a_stream(_SOME_PARTITIONS)
+
+        with patch("time.sleep") as sleep:
+            partition_generator.generate_partitions(stream)
+
+        sleep.assert_not_called()
+        assert self._consume_queue() == _SOME_PARTITIONS + [
+            PartitionGenerationCompletedSentinel(stream)
         ]
-        stream = self._a_stream([Mock(spec=Partition)])
+
+    def test_given_partitions_when_generate_partitions_then_wait_for_a_task_slot_before_each_partition(
+        self,
+    ):
+        queue_sizes_when_waiting = []
+        self._thread_pool_manager.wait_for_task_slot.side_effect = (
+            lambda: queue_sizes_when_waiting.append(self._queue.qsize())
+        )
+        stream = self._a_stream(_SOME_PARTITIONS)
 
         self._partition_generator.generate_partitions(stream)
 
-        assert mocked_sleep.call_count == 2
+        assert queue_sizes_when_waiting == [0, 1]
 
     def test_given_exception_when_generate_partitions_then_return_exception_and_sentinel(self):
         stream = Mock(spec=AbstractStream)
@@ -1,13 +1,17 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import threading
 import unittest
 from queue import Queue
-from typing import Callable, Iterable, List
+from typing import Callable, Iterable, List, Optional
 from unittest.mock import Mock
 
 import pytest
 
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -61,6 +65,74 @@ class PartitionReaderTest(unittest.TestCase):
             PartitionCompleteSentinel(partition),
         ]
 
+    def test_given_batch_size_when_process_partition_then_queue_records_in_lists_of_at_most_batch_size(
+        self,
+    ):
+        records = [Record({"id": i}, "stream") for i in range(5)]
+        partition = self._a_partition(records)
+        PartitionReader(self._queue, batch_size=2).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            records[0:2],
+            records[2:4],
+            records[4:5],
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_batch_max_wait_elapsed_when_process_partition_then_queue_partial_batch(self):
+        partition = self._a_partition(_RECORDS)
+        PartitionReader(self._queue, batch_size=100, batch_max_wait_seconds=0).process_partition(
+            partition
+        )
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [[_RECORDS[0]], [_RECORDS[1]], PartitionCompleteSentinel(partition)]
+
+    def test_given_batch_size_and_exception_when_process_partition_then_queue_pending_batch_before_exception(
+        self,
+    ):
+        partition = Mock()
+        exception = ValueError()
+        partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
+        PartitionReader(self._queue, batch_size=100).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            _RECORDS,
+            StreamThreadException(exception, partition.stream_name()),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_batch_size_lower_than_one_when_create_then_raise(self):
+        with pytest.raises(ValueError):
+            PartitionReader(self._queue, batch_size=0)
+
+    def test_given_concurrency_controller_when_process_partition_then_hold_a_partition_slot_while_reading(
+        self,
+    ):
+        concurrency_controller = AdaptiveConcurrencyController(
+            min_concurrency=1, max_concurrency=1, logger=Mock()
+        )
+        reader = PartitionReader(self._queue, concurrency_controller=concurrency_controller)
+        partitions_being_read_during_read = []
+
+        def read() -> Iterable[Record]:
+            partitions_being_read_during_read.append(concurrency_controller._partitions_being_read)
+            yield from _RECORDS
+            raise ValueError()
+
+        partition = Mock(spec=Partition)
+        partition.read.side_effect = read
+        reader.process_partition(partition)
+
+        assert partitions_being_read_during_read == [1]
+        assert concurrency_controller._partitions_being_read == 0
+        assert isinstance(self._consume_queue()[-2], StreamThreadException)
+
     def _a_partition(self, records: List[Record]) -> Partition:
         partition = Mock(spec=Partition)
         partition.read.return_value = iter(records)
@@ -83,3 +155,43 @@ class PartitionReaderTest(unittest.TestCase):
             if isinstance(queue_item, PartitionCompleteSentinel):
                 break
         return queue_content
+
+
+class _CountingQueue(Queue[QueueItem]):
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize)
+        self.number_of_puts = 0
+
+    def put(self, item: QueueItem, block: bool = True, timeout: Optional[float] = None) -> None:
+        self.number_of_puts += 1
+        super().put(item, block, timeout)
+
+
+def _count_queue_operations(batch_size: int, number_of_records: int) -> int:
+    """
+    Return the number of items put in the queue to hand off the records of a partition.
+    """
+    queue = _CountingQueue(maxsize=max(10_000 // batch_size, 100))
+    partition = Mock(spec=Partition)
+    partition.read.return_value = (Record({"id": i}, "stream") for i in range(number_of_records))
+    # The batches are only bounded by their size so that the number of queue operations does not depend on the speed of the machine
+    reader = PartitionReader(queue, batch_size=batch_size, batch_max_wait_seconds=float("inf"))
+
+    worker = threading.Thread(target=reader.process_partition, args=(partition,))
+    worker.start()
+    consumed = 0
+    while not isinstance(item := queue.get(), PartitionCompleteSentinel):
+        consumed += len(item) if isinstance(item, list) else 1
+    worker.join()
+
+    assert consumed == number_of_records
+    return queue.number_of_puts
+
+
+def test_given_batch_size_when_hand_off_records_then_put_one_item_per_batch_in_the_queue():
+    number_of_records = 10_000
+    per_record_puts = _count_queue_operations(1, number_of_records)
+    batched_puts = _count_queue_operations(1_000, number_of_records)
+    # The records and the sentinel
+    assert per_record_puts == number_of_records + 1
+    assert batched_puts == number_of_records // 1_000 + 1
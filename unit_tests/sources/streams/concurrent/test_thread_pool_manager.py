@@ -1,6 +1,7 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import threading
 from concurrent.futures import Future, ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import Mock
@@ -83,3 +84,33 @@ class ThreadPoolManagerTest(TestCase):
 
         self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+
+class ThreadPoolManagerTaskSlotTest(TestCase):
+    def setUp(self):
+        self._threadpool = ThreadPoolExecutor(max_workers=2)
+        self._thread_pool_manager = ThreadPoolManager(
+            self._threadpool, Mock(), max_concurrent_tasks=1
+        )
+
+    def tearDown(self):
+        self._threadpool.shutdown(wait=True)
+
+    def test_given_no_pending_task_when_wait_for_task_slot_then_return_immediately(self):
+        self._thread_pool_manager.wait_for_task_slot()
+
+        assert self._thread_pool_manager.task_slot_wait_seconds < 1
+
+    def test_given_limit_reached_when_wait_for_task_slot_then_wait_until_task_is_done(self):
+        task_can_complete = threading.Event()
+        self._thread_pool_manager.submit(task_can_complete.wait)
+        waiter = threading.Thread(target=self._thread_pool_manager.wait_for_task_slot)
+
+        waiter.start()
+        waiter.join(timeout=0.2)
+        assert waiter.is_alive()
+
+        task_can_complete.set()
+        waiter.join(timeout=5)
+        assert not waiter.is_alive()
+        assert self._thread_pool_manager.task_slot_wait_seconds >= 0.2
@@ -24,6 +24,7 @@ from airbyte_cdk.sources.streams.http.exceptions import (
     RequestBodyException,
     UserDefinedBackoffException,
 )
+from airbyte_cdk.sources.streams.http.request_observer import HttpRequestObserver
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -421,9 +422,11 @@ def test_evicting_requests_for_request_count():
         returned_response = http_client._send_with_retry(prepared_request, request_kwargs={})
         assert returned_response == valid_response
 
-    # for the number of requests_to_make if we didn't evict the requests we could see increase the value ~0.5 MB
-    size_of_request_count_store = asizeof.asizeof(http_client._request_attempt_count)
-    assert size_of_request_count_store < 250
+    # the retry state is scoped to each request so memory does not grow with the number of requests
+    size_of_retry_engine = asizeof.asizeof(http_client._retry_engine)
+    assert size_of_retry_engine < 2048
+    assert http_client.retry_metrics.requests == requests_to_make
+    assert http_client.retry_metrics.attempts == 3 * requests_to_make
 
 
 def test_session_request_exception_raises_backoff_exception():
@@ -744,3 +747,35 @@ def test_given_different_headers_then_response_is_not_cached(requests_mock):
     )
 
     assert second_response.json()["test"] == "second response"
+
+
+def test_given_request_observer_when_send_then_report_every_attempt():
+    request_observer = MagicMock(spec=HttpRequestObserver)
+    http_client = HttpClient(
+        name="test",
+        logger=MagicMock(),
+        error_handler=HttpStatusErrorHandler(logger=MagicMock(), max_retries=1),
+        request_observer=request_observer,
+    )
+    rate_limited_response = MagicMock(spec=requests.Response)
+    rate_limited_response.status_code = 429
+    rate_limited_response.headers = {}
+    rate_limited_response.ok = False
+    valid_response = MagicMock(spec=requests.Response)
+    valid_response.status_code = 200
+    valid_response.headers = {}
+    valid_response.ok = True
+
+    with (
+        patch.object(requests.Session, "send", side_effect=[rate_limited_response, valid_response]),
+        patch("time.sleep"),
+    ):
+        http_client.send_request(
+            http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={}
+        )
+
+    assert [call.args[1] for call in request_observer.on_request_attempt.call_args_list] == [
+        ResponseAction.RATE_LIMITED,
+        ResponseAction.SUCCESS,
+    ]
+    assert all(call.args[0] >= 0 for call in request_observer.on_request_attempt.call_args_list)
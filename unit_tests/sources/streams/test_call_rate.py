@@ -3,9 +3,11 @@
 #
 import os
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -20,6 +22,7 @@ from airbyte_cdk.sources.streams.call_rate import (
     HttpRequestRegexMatcher,
     MovingWindowCallRatePolicy,
     Rate,
+    SlidingWindowCallRatePolicy,
     UnlimitedCallRatePolicy,
 )
 from airbyte_cdk.sources.streams.http import HttpStream
@@ -303,6 +306,194 @@ class TestMovingWindowCallRatePolicy:
         assert str(excinfo.value) == "Bucket for item=call with Rate limit=2/1.0h is already full"
 
 
+class TestSlidingWindowCallRatePolicy:
+    def test_no_rates(self):
+        with pytest.raises(ValueError, match="The list of rates can not be empty"):
+            SlidingWindowCallRatePolicy(rates=[], matchers=[])
+
+    def test_limit_rate(self):
+        policy = SlidingWindowCallRatePolicy(rates=[Rate(10, timedelta(minutes=1))], matchers=[])
+
+        for _ in range(10):
+            policy.try_acquire("call", weight=1)
+
+        with pytest.raises(CallRateLimitHit) as excinfo1:
+            policy.try_acquire("call", weight=1)
+        assert excinfo1.value.time_to_wait.total_seconds() == pytest.approx(60, 0.1)
+        assert excinfo1.value.rate == "10 per 0:01:00"
+
+        time.sleep(0.1)
+
+        with pytest.raises(CallRateLimitHit) as excinfo2:
+            policy.try_acquire("call", weight=1)
+        assert excinfo2.value.time_to_wait < excinfo1.value.time_to_wait
+
+    def test_limit_rate_support_custom_weight(self):
+        policy = SlidingWindowCallRatePolicy(rates=[Rate(10, timedelta(minutes=1))], matchers=[])
+
+        policy.try_acquire("call", weight=2)
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=9)
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(60, 0.1)
+        policy.try_acquire("call", weight=8)
+        with pytest.raises(ValueError, match="Weight can not exceed the call limit"):
+            policy.try_acquire("call", weight=11)
+
+    def test_multiple_limit_rates(self):
+        policy = SlidingWindowCallRatePolicy(
+            matchers=[],
+            rates=[
+                Rate(10, timedelta(minutes=10)),
+                Rate(3, timedelta(seconds=10)),
+                Rate(2, timedelta(hours=1)),
+            ],
+        )
+
+        policy.try_acquire("call", weight=2)
+
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=1)
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(3600, 0.1)
+        assert excinfo.value.rate == "2 per 1:00:00"
+
+    def test_calls_leave_the_window(self):
+        policy = SlidingWindowCallRatePolicy(
+            rates=[Rate(2, timedelta(milliseconds=100))], matchers=[]
+        )
+        policy.try_acquire("call", weight=2)
+
+        time.sleep(0.15)
+
+        policy.try_acquire("call", weight=1)
+        policy.try_acquire("call", weight=1)
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire("call", weight=1)
+
+    def test_update_available_calls(self):
+        policy = SlidingWindowCallRatePolicy(rates=[Rate(100, timedelta(hours=1))], matchers=[])
+
+        policy.update(available_calls=2, call_reset_ts=None)
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire("call", weight=3)
+        policy.try_acquire("call", weight=1)
+
+        # increasing the number of calls available is ignored
+        policy.update(available_calls=20, call_reset_ts=None)
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire("call", weight=2)
+
+    def test_update_with_reset_time_blocks_until_reset(self):
+        policy = SlidingWindowCallRatePolicy(rates=[Rate(100, timedelta(hours=1))], matchers=[])
+
+        policy.update(available_calls=0, call_reset_ts=datetime.now() + timedelta(minutes=5))
+
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=1)
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(300, 0.1)
+
+    def test_acquire_serves_waiting_threads_in_order(self):
+        policy = SlidingWindowCallRatePolicy(
+            rates=[Rate(1, timedelta(milliseconds=20))], matchers=[]
+        )
+        policy.try_acquire("call", weight=1)
+        acquired: List[int] = []
+
+        def acquire(index: int) -> None:
+            policy.acquire(index, weight=1)
+            acquired.append(index)
+
+        threads = []
+        for index in range(5):
+            thread = threading.Thread(target=acquire, args=(index,))
+            thread.start()
+            threads.append(thread)
+            # wait for the thread to be waiting so that the order of arrival is known
+            while len(policy._waiters) < index + 1:
+                time.sleep(0.001)
+        for thread in threads:
+            thread.join()
+
+        assert acquired == [0, 1, 2, 3, 4]
+        assert not policy._waiters
+
+    def test_given_timeout_when_acquire_then_raise(self):
+        policy = SlidingWindowCallRatePolicy(rates=[Rate(1, timedelta(minutes=1))], matchers=[])
+        policy.acquire("call", weight=1)
+
+        start = time.monotonic()
+        with pytest.raises(CallRateLimitHit):
+            policy.acquire("call", weight=1, timeout=0.05)
+
+        assert time.monotonic() - start < 1
+        assert not policy._waiters
+
+    def test_api_budget_waits_on_the_policy(self, mocker):
+        policy = SlidingWindowCallRatePolicy(
+            rates=[Rate(1, timedelta(milliseconds=50))], matchers=[]
+        )
+        budget = APIBudget(policies=[policy])
+        sleep = mocker.patch("airbyte_cdk.sources.streams.call_rate.time.sleep")
+
+        start = time.monotonic()
+        budget.acquire_call(Request("GET", "https://example.com/"))
+        budget.acquire_call(Request("GET", "https://example.com/"))
+
+        assert time.monotonic() - start >= 0.04
+        sleep.assert_not_called()
+        with pytest.raises(CallRateLimitHit):
+            budget.acquire_call(Request("GET", "https://example.com/"), block=False)
+
+
+class _CountingCondition(threading.Condition):
+    """
+    Counts the waits of all the conditions. Conditions of a policy share its lock so the count is only updated by one thread at a time.
+    """
+
+    number_of_waits = 0
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        _CountingCondition.number_of_waits += 1
+        return super().wait(timeout)
+
+
+def test_given_threads_competing_for_calls_when_acquire_then_respect_rate_and_wait_at_most_twice_per_call():
+    limit = 10
+    interval = timedelta(milliseconds=50)
+    number_of_threads = 16
+    number_of_calls = 60
+    _CountingCondition.number_of_waits = 0
+    policy = SlidingWindowCallRatePolicy(rates=[Rate(limit, interval)], matchers=[])
+    budget = APIBudget(policies=[policy])
+    remaining_calls = iter(range(number_of_calls))
+    lock = threading.Lock()
+
+    def make_calls() -> None:
+        while True:
+            with lock:
+                if next(remaining_calls, None) is None:
+                    return
+            budget.acquire_call(Request("GET", "https://example.com/"))
+
+    with (
+        patch("airbyte_cdk.sources.streams.call_rate.Condition", _CountingCondition),
+        patch.object(policy, "_record_calls", wraps=policy._record_calls) as record_calls,
+    ):
+        threads = [threading.Thread(target=make_calls) for _ in range(number_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    call_times = sorted(call.args[1] for call in record_calls.call_args_list)
+    assert len(call_times) == number_of_calls
+    assert all(
+        call_times[i] - call_times[i - limit] >= interval.total_seconds()
+        for i in range(limit, number_of_calls)
+    )
+    # A thread waits for the threads that arrived before it, then only the first thread in line waits for the window to move
+    assert 0 < _CountingCondition.number_of_waits <= 2 * number_of_calls
+
+
 class TestHttpStreamIntegration:
     def test_without_cache(self, mocker, requests_mock):
         """Test that HttpStream will use call budget when provided"""
@@ -445,3 +636,29 @@ class TestHttpRequestRegexMatcher:
         assert not matcher(req_bad_path)
         assert not matcher(req_bad_param)
         assert not matcher(req_bad_header)
+
+    def test_url_checks_are_cached(self):
+        matcher = HttpRequestRegexMatcher(
+            url_base="https://example.com", url_path_pattern=r"/test/"
+        )
+
+        for _ in range(3):
+            assert matcher(Request("GET", "https://example.com/test/path").prepare())
+            assert not matcher(Request("GET", "https://example.com/other").prepare())
+
+        assert matcher._matches_url_base_and_path.cache_info().hits == 4
+
+    def test_given_urls_only_differing_by_query_when_match_then_cache_url_checks_once_and_check_params_of_each_url(
+        self,
+    ):
+        matcher = HttpRequestRegexMatcher(
+            url_base="https://example.com", url_path_pattern=r"/test/", params={"foo": "bar"}
+        )
+
+        for page in range(100):
+            assert matcher(
+                Request("GET", f"https://example.com/test/path?foo=bar&page={page}").prepare()
+            )
+        assert not matcher(Request("GET", "https://example.com/test/path?page=100").prepare())
+
+        assert matcher._matches_url_base_and_path.cache_info().currsize == 1
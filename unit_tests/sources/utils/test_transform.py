@@ -3,10 +3,12 @@
 #
 
 import json
+from copy import deepcopy
+from unittest.mock import patch
 
 import pytest
 
-from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer, _SchemaCompiler
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -321,8 +323,11 @@ VERY_NESTED_SCHEMA = {
         "max_nesting_depth_protection",
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize("compile_schema", [True, False])
+def test_transform(schema, actual, expected, expected_warns, compile_schema, caplog):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=compile_schema)
+    # parameters are shared between the compiled and not compiled runs so the record needs to be copied
+    actual = deepcopy(actual)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -385,3 +390,113 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+def test_given_recursive_schema_when_transform_then_normalize_every_level():
+    schema = {
+        "type": "object",
+        "properties": {"node": {"$ref": "#/definitions/node"}},
+        "definitions": {
+            "node": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "string"},
+                    "child": {"$ref": "#/definitions/node"},
+                },
+            }
+        },
+    }
+    record = {"node": {"value": 1, "child": {"value": 2, "child": {"value": 3}}}}
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, schema)
+
+    assert record == {"node": {"value": "1", "child": {"value": "2", "child": {"value": "3"}}}}
+
+
+def test_given_schema_not_supported_by_compilation_when_transform_then_fallback_on_jsonschema():
+    schema = {
+        "type": "object",
+        "properties": {"tuple": {"type": "array", "items": [{"type": "string"}]}},
+    }
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    record = {"tuple": [1]}
+    with pytest.raises(AttributeError):
+        # TypeTransformer does not support tuple validation
+        transformer.transform(record, schema)
+
+    assert transformer._get_compiled_schema(schema) is None
+
+
+def test_given_custom_transform_registered_after_compilation_when_transform_then_use_custom_transform():
+    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization)
+    transformer.transform({"value": 12}, SIMPLE_SCHEMA)
+
+    transformer.registerCustomTransform(lambda instance, schema: "transformed")
+    record = {"value": 12}
+    transformer.transform(record, SIMPLE_SCHEMA)
+
+    assert record == {"value": "transformed"}
+
+
+def _wide_schema_and_record(number_of_columns):
+    types = ["string", "integer", "number", "boolean", ["null", "string"]]
+    schema = {
+        "type": "object",
+        "properties": {
+            f"column_{i}": {"type": types[i % len(types)]} for i in range(number_of_columns)
+        },
+    }
+    values = [1, "2", "3.5", "true", None]
+    return schema, {f"column_{i}": values[i % len(values)] for i in range(number_of_columns)}
+
+
+def _nested_schema_and_record(depth):
+    schema = {"type": "object", "properties": {"id": {"type": "string"}}}
+    record = {"id": 1}
+    for _ in range(depth):
+        schema = {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/child"}},
+            },
+            "definitions": {"child": schema},
+        }
+        record = {"id": 1, "children": [record, deepcopy(record)]}
+    return schema, record
+
+
+@pytest.mark.parametrize(
+    "schema_and_record",
+    [
+        pytest.param(_wide_schema_and_record(200), id="wide_schema"),
+        pytest.param(_nested_schema_and_record(5), id="nested_schema"),
+    ],
+)
+def test_given_many_records_when_transform_with_compiled_schema_then_compile_once_and_do_not_use_jsonschema(
+    schema_and_record,
+):
+    schema, record = schema_and_record
+    number_of_records = 100
+    expected_records = [deepcopy(record) for _ in range(number_of_records)]
+    jsonschema_transformer = TypeTransformer(
+        TransformConfig.DefaultSchemaNormalization, compile_schema=False
+    )
+    for expected_record in expected_records:
+        jsonschema_transformer.transform(expected_record, schema)
+
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    records = [deepcopy(record) for _ in range(number_of_records)]
+    with (
+        patch.object(
+            _SchemaCompiler, "compile", autospec=True, side_effect=_SchemaCompiler.compile
+        ) as compile_schema,
+        patch.object(transformer, "_normalizer", wraps=transformer._normalizer) as normalizer,
+    ):
+        for copied_record in records:
+            transformer.transform(copied_record, schema)
+
+    assert records == expected_records
+    compile_schema.assert_called_once()
+    normalizer.assert_not_called()
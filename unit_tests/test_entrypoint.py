@@ -2,7 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
+import json
 import os
+import sys
 from argparse import Namespace
 from collections import defaultdict
 from copy import deepcopy
@@ -25,6 +28,7 @@ from airbyte_cdk.models import (
     AirbyteMessage,
     AirbyteMessageSerializer,
     AirbyteRecordMessage,
+    AirbyteRecordMessageFileReference,
     AirbyteStateBlob,
     AirbyteStateMessage,
     AirbyteStateStats,
@@ -45,7 +49,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
-from airbyte_cdk.utils import AirbyteTracedException
+from airbyte_cdk.utils import AirbyteTracedException, PrintBuffer
 
 
 class MockSource(Source):
@@ -791,3 +795,117 @@ def test_given_serialization_error_using_orjson_then_fallback_on_json(
     # There will be multiple messages here because the fixture `entrypoint` sets a control message. We only care about records here
     record_messages = list(filter(lambda message: "RECORD" in message, messages))
     assert len(record_messages) == 2
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        pytest.param(
+            AirbyteRecordMessage(stream="stream", data={"id": 1, "name": "é"}, emitted_at=1),
+            id="test_simple_record",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1, namespace="public"),
+            id="test_record_with_namespace",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream",
+                data={"id": None, "nested": {"field": None}, "list": [None]},
+                emitted_at=1,
+            ),
+            id="test_record_with_none_values",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream",
+                data={"id": 1},
+                emitted_at=1,
+                file_reference=AirbyteRecordMessageFileReference(
+                    staging_file_url="/staging/file.csv",
+                    source_file_relative_path="file.csv",
+                    file_size_bytes=10,
+                ),
+            ),
+            id="test_record_with_file_reference",
+        ),
+    ],
+)
+def test_record_serialization_is_the_same_as_airbyte_message_serializer(record):
+    message = AirbyteMessage(type=Type.RECORD, record=record)
+
+    assert AirbyteEntrypoint.airbyte_message_to_bytes(message) == orjson.dumps(
+        AirbyteMessageSerializer.dump(message)
+    )
+
+
+def test_given_record_that_orjson_cannot_serialize_when_airbyte_message_to_bytes_then_fallback_on_json():
+    message = AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(
+            stream="stream", data={"data": 7046723166326052303072}, emitted_at=1
+        ),
+    )
+
+    assert json.loads(AirbyteEntrypoint.airbyte_message_to_bytes(message)) == {
+        "type": "RECORD",
+        "record": {"stream": "stream", "data": {"data": 7046723166326052303072}, "emitted_at": 1},
+    }
+
+
+def test_given_records_when_airbyte_message_to_bytes_then_do_not_use_airbyte_message_serializer(
+    mocker,
+):
+    messages = [
+        AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(
+                stream="stream",
+                data={"id": i, "name": f"name {i}", "updated_at": "2024-01-01T00:00:00Z"},
+                emitted_at=1,
+            ),
+        )
+        for i in range(100)
+    ]
+    expected_serialized_messages = [
+        orjson.dumps(AirbyteMessageSerializer.dump(message)) for message in messages
+    ]
+    dump = mocker.patch.object(
+        AirbyteMessageSerializer, "dump", wraps=AirbyteMessageSerializer.dump
+    )
+
+    serialized_messages = [
+        AirbyteEntrypoint.airbyte_message_to_bytes(message) for message in messages
+    ]
+
+    assert serialized_messages == expected_serialized_messages
+    dump.assert_not_called()
+
+
+def test_given_stdout_is_print_buffer_when_write_state_message_then_flush_immediately(mocker):
+    output = io.BytesIO()
+    print_buffer = PrintBuffer(flush_interval=60, output=output)
+    mocker.patch.object(sys, "stdout", print_buffer)
+    record = AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1),
+    )
+    state = AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(
+                stream_descriptor=StreamDescriptor(name="stream"),
+                stream_state=AirbyteStateBlob(id=1),
+            ),
+        ),
+    )
+
+    entrypoint_module._write_to_stdout(AirbyteEntrypoint.airbyte_message_to_bytes(record) + b"\n")
+    assert output.getvalue() == b""
+
+    entrypoint_module._write_to_stdout(AirbyteEntrypoint.airbyte_message_to_bytes(state) + b"\n")
+    assert [orjson.loads(line)["type"] for line in output.getvalue().splitlines()] == [
+        "RECORD",
+        "STATE",
+    ]
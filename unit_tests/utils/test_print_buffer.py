@@ -0,0 +1,86 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import io
+import threading
+import time
+
+from airbyte_cdk.utils.print_buffer import PrintBuffer
+
+_A_LONG_INTERVAL = 60
+
+
+def test_given_message_written_when_flush_then_output_contains_message():
+    output = io.BytesIO()
+    print_buffer = PrintBuffer(flush_interval=_A_LONG_INTERVAL, output=output)
+
+    print_buffer.write("a message é\n")
+    print_buffer.write_bytes(b"a serialized message\n")
+    assert output.getvalue() == b""
+
+    print_buffer.flush()
+    assert output.getvalue() == "a message é\na serialized message\n".encode()
+
+
+def test_given_flush_requested_when_write_bytes_then_flush_immediately():
+    output = io.BytesIO()
+    print_buffer = PrintBuffer(flush_interval=_A_LONG_INTERVAL, output=output)
+
+    print_buffer.write_bytes(b"a record\n")
+    print_buffer.write_bytes(b"a state\n", flush=True)
+
+    assert output.getvalue() == b"a record\na state\n"
+
+
+def test_given_buffer_exceeds_max_size_when_write_bytes_then_flush():
+    output = io.BytesIO()
+    print_buffer = PrintBuffer(flush_interval=_A_LONG_INTERVAL, max_buffer_size=10, output=output)
+
+    print_buffer.write_bytes(b"12345\n")
+    assert output.getvalue() == b""
+
+    print_buffer.write_bytes(b"67890\n")
+    assert output.getvalue() == b"12345\n67890\n"
+
+
+def test_given_no_more_writes_when_in_context_then_background_flush():
+    output = io.BytesIO()
+    print_buffer = PrintBuffer(flush_interval=0.01, output=output)
+
+    with print_buffer:
+        print_buffer.write_bytes(b"a message\n")
+        deadline = time.monotonic() + 5
+        while not output.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert output.getvalue() == b"a message\n"
+
+
+def test_given_many_producer_threads_when_write_then_lines_are_never_interleaved():
+    output = io.BytesIO()
+    print_buffer = PrintBuffer(flush_interval=0.001, max_buffer_size=4096, output=output)
+    number_of_threads = 32
+    lines_per_thread = 2_000
+
+    def _produce(thread_id: int) -> None:
+        for line_number in range(lines_per_thread):
+            # Lines of different sizes increase the chances of exposing partial writes
+            line = f"{thread_id}:{line_number}:{'x' * (line_number % 300)}\n"
+            if line_number % 2:
+                print_buffer.write(line)
+            else:
+                print_buffer.write_bytes(line.encode())
+
+    with print_buffer:
+        threads = [threading.Thread(target=_produce, args=(i,)) for i in range(number_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    lines = output.getvalue().decode().splitlines()
+    assert len(lines) == number_of_threads * lines_per_thread
+    next_line_number_per_thread = [0] * number_of_threads
+    for line in lines:
+        thread_id, line_number, padding = line.split(":")
+        assert int(line_number) == next_line_number_per_thread[int(thread_id)]
+        assert padding == "x" * (int(line_number) % 300)
+        next_line_number_per_thread[int(thread_id)] += 1
@@ -2,10 +2,28 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
+from typing import Any, Callable, List, Optional
+from unittest.mock import patch
+
+import backoff
+import freezegun
 import pytest
-from requests import exceptions
+from requests import Request, Response, exceptions
 
-from airbyte_cdk.sources.streams.http.rate_limiting import default_backoff_handler
+from airbyte_cdk.sources.streams.http.exceptions import (
+    DefaultBackoffException,
+    RateLimitBackoffException,
+    UserDefinedBackoffException,
+)
+from airbyte_cdk.sources.streams.http.rate_limiting import (
+    RetryEngine,
+    RetryMetrics,
+    default_backoff_handler,
+    http_client_default_backoff_handler,
+    rate_limit_default_backoff_handler,
+    user_defined_backoff_handler,
+)
 
 
 def helper_with_exceptions(exception_type):
@@ -30,3 +48,163 @@ def test_default_backoff_handler(
     )(helper_with_exceptions)
     with pytest.raises(exception_to_raise):
         backoff_handler(exception_to_raise)
+
+
+def _send_attempt_raising(exceptions_to_raise: List[Optional[Exception]], response: Response):
+    remaining_exceptions = list(exceptions_to_raise)
+
+    def send_attempt(*args: Any, **kwargs: Any) -> Response:
+        exception = remaining_exceptions.pop(0) if remaining_exceptions else None
+        if exception:
+            raise exception
+        return response
+
+    return send_attempt
+
+
+def _legacy_send_with_retry(send_attempt, max_tries: int, max_time: Optional[int]) -> Response:
+    user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(
+        send_attempt
+    )
+    rate_limit_backoff_handler = rate_limit_default_backoff_handler(max_tries=max_tries)
+    backoff_handler = http_client_default_backoff_handler(max_tries=max_tries, max_time=max_time)
+    return backoff_handler(rate_limit_backoff_handler(user_backoff_handler))(None, {})
+
+
+def _run_recording_sleeps(monkeypatch, frozen_datetime, send: Callable[[], Response]):
+    sleeps = []
+
+    def sleep(seconds: float) -> None:
+        if seconds:
+            sleeps.append(seconds)
+            frozen_datetime.tick(seconds)
+
+    monkeypatch.setattr("time.sleep", sleep)
+    try:
+        return send(), sleeps
+    except Exception as exception:
+        return type(exception), sleeps
+
+
+_REQUEST = Request("GET", "https://api.test/records").prepare()
+
+
+def _user_defined(backoff_time: float) -> UserDefinedBackoffException:
+    return UserDefinedBackoffException(backoff=backoff_time, request=_REQUEST, response=None)
+
+
+def _rate_limited() -> RateLimitBackoffException:
+    return RateLimitBackoffException(request=_REQUEST, response=None)
+
+
+def _transient() -> DefaultBackoffException:
+    return DefaultBackoffException(request=_REQUEST, response=None)
+
+
+@pytest.mark.parametrize(
+    "exceptions_to_raise, max_tries, max_time",
+    [
+        pytest.param([], 3, 10, id="test_no_retry"),
+        pytest.param([_transient(), _transient()], 3, 600, id="test_transient_errors"),
+        pytest.param([_transient()] * 5, 3, 600, id="test_transient_errors_exceed_max_tries"),
+        pytest.param([_transient()] * 10, 10, 5, id="test_transient_errors_exceed_max_time"),
+        pytest.param(
+            [exceptions.ConnectTimeout(), exceptions.ReadTimeout()], 3, 600, id="test_timeouts"
+        ),
+        pytest.param([_rate_limited()] * 4, 6, 1, id="test_rate_limited_ignores_max_time"),
+        pytest.param([_rate_limited()] * 4, 3, 600, id="test_rate_limited_exceed_max_tries"),
+        pytest.param([_user_defined(2)] * 2, 3, 600, id="test_user_defined_backoff"),
+        pytest.param([_user_defined(2)] * 3, 3, 600, id="test_user_defined_exceed_max_tries"),
+        pytest.param([_user_defined(4)] * 5, 10, 10, id="test_user_defined_exceed_max_time"),
+        pytest.param(
+            [_user_defined(1), _rate_limited(), _user_defined(1), _user_defined(1)],
+            3,
+            600,
+            id="test_rate_limited_resets_user_defined_tries",
+        ),
+        pytest.param(
+            [_user_defined(1), _rate_limited(), _transient(), _rate_limited(), _rate_limited()],
+            3,
+            600,
+            id="test_transient_error_resets_rate_limited_tries",
+        ),
+        pytest.param(
+            [_user_defined(30), _user_defined(30), _transient(), _user_defined(30), _transient()],
+            10,
+            60,
+            id="test_max_time_of_transient_errors_starts_with_the_try",
+        ),
+        pytest.param([ValueError()], 3, 600, id="test_not_retryable_error"),
+    ],
+)
+def test_retry_engine_retries_like_the_backoff_handlers(
+    monkeypatch,
+    exceptions_to_raise: List[Exception],
+    max_tries: int,
+    max_time: int,
+) -> None:
+    response = Response()
+    engine = RetryEngine()
+    with freezegun.freeze_time(datetime.datetime.now()) as frozen_datetime:
+        expected_outcome, expected_sleeps = _run_recording_sleeps(
+            monkeypatch,
+            frozen_datetime,
+            lambda: _legacy_send_with_retry(
+                _send_attempt_raising(exceptions_to_raise, response), max_tries, max_time
+            ),
+        )
+        outcome, sleeps = _run_recording_sleeps(
+            monkeypatch,
+            frozen_datetime,
+            lambda: engine.send(
+                _send_attempt_raising(exceptions_to_raise, response), max_tries, max_time
+            ),
+        )
+
+    assert outcome == expected_outcome
+    assert sleeps == expected_sleeps
+    assert engine.metrics.backoff_time_in_seconds == sum(sleeps)
+
+
+@pytest.mark.usefixtures("mock_sleep")
+def test_retry_engine_passes_the_attempt_count_and_aggregates_metrics() -> None:
+    engine = RetryEngine()
+    attempt_counts = []
+    remaining_exceptions = [_user_defined(1), _transient()]
+
+    def send_attempt(attempt_count: int) -> Response:
+        attempt_counts.append(attempt_count)
+        if remaining_exceptions:
+            raise remaining_exceptions.pop(0)
+        return Response()
+
+    engine.send(send_attempt, max_tries=3, max_time=600)
+    engine.send(send_attempt, max_tries=3, max_time=600)
+
+    assert attempt_counts == [1, 2, 3, 1]
+    assert engine.metrics == RetryMetrics(
+        requests=2, attempts=4, retried_requests=1, backoff_time_in_seconds=3.0
+    )
+
+
+def test_given_successful_requests_when_send_with_retry_engine_then_do_not_create_backoff_handlers() -> (
+    None
+):
+    number_of_requests = 100
+    response = Response()
+
+    def send_attempt(*args: Any, **kwargs: Any) -> Response:
+        return response
+
+    engine = RetryEngine()
+    with patch.object(backoff, "on_exception", wraps=backoff.on_exception) as on_exception:
+        _legacy_send_with_retry(send_attempt, max_tries=6, max_time=600)
+        legacy_handlers = on_exception.call_count
+        on_exception.reset_mock()
+        for _ in range(number_of_requests):
+            assert engine.send(send_attempt, max_tries=6, max_time=600) is response
+
+    assert legacy_handlers == 3
+    on_exception.assert_not_called()
+    assert engine.metrics.requests == number_of_requests
+    assert engine.metrics.attempts == number_of_requests
@@ -2,9 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import random
+import string
+from unittest.mock import patch
+
 import pytest
 
 from airbyte_cdk.utils.airbyte_secrets_utils import (
+    _SecretMatcher,
     add_to_secrets,
     filter_secrets,
     get_secret_paths,
@@ -184,3 +190,146 @@ def test_secrets_added_are_filtered():
     add_to_secrets(ADDED_SECRET)
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE}"
+
+
+def test_given_secret_already_added_when_add_to_secrets_then_do_not_rebuild_matcher(reset_secrets):
+    add_to_secrets("a_refreshed_token")
+
+    with patch(
+        "airbyte_cdk.utils.airbyte_secrets_utils._SecretMatcher", wraps=_SecretMatcher
+    ) as secret_matcher:
+        add_to_secrets("a_refreshed_token")
+
+    secret_matcher.assert_not_called()
+    assert filter_secrets("token: a_refreshed_token") == "token: ****"
+
+
+@pytest.fixture
+def reset_secrets():
+    yield
+    update_secrets([])
+
+
+@pytest.mark.parametrize(
+    "secrets, sensitive_str, expected_filtered",
+    [
+        pytest.param(["x", "xk"], "a xk b", "a **** b", id="test_prefix_secret_registered_first"),
+        pytest.param(["xk", "x"], "a xk b", "a **** b", id="test_prefix_secret_registered_last"),
+        pytest.param(["ab", "bcd"], "_abcd_", "_****_", id="test_overlapping_secrets"),
+        pytest.param(["aa"], "aaa", "****", id="test_overlapping_occurrences"),
+        pytest.param(["ab", "cd"], "abcd", "********", id="test_adjacent_secrets"),
+        pytest.param(
+            ["secret", "secret", SECRET_INT_VALUE],
+            f"secret {SECRET_INT_VALUE}",
+            "**** ****",
+            id="test_duplicated_and_int_secrets",
+        ),
+    ],
+)
+def test_secret_filtering_replaces_maximal_matches(
+    reset_secrets, secrets, sensitive_str, expected_filtered
+):
+    update_secrets(secrets)
+
+    assert filter_secrets(sensitive_str) == expected_filtered
+
+
+def _reference_filter(secrets, string):
+    is_secret = [False] * len(string)
+    for secret in secrets:
+        start = string.find(secret)
+        while start != -1:
+            is_secret[start : start + len(secret)] = [True] * len(secret)
+            start = string.find(secret, start + 1)
+    filtered = []
+    for i, character in enumerate(string):
+        if not is_secret[i]:
+            filtered.append(character)
+        elif i == 0 or not is_secret[i - 1] or _starts_a_new_secret(secrets, string, i):
+            filtered.append("****")
+    return "".join(filtered)
+
+
+def _starts_a_new_secret(secrets, string, position):
+    # A position starts a new replacement if no occurrence covering the previous character also covers it
+    for secret in secrets:
+        for start in range(max(0, position - len(secret) + 1), position):
+            if string.startswith(secret, start) and start + len(secret) > position:
+                return False
+    return True
+
+
+@pytest.mark.parametrize("number_of_secrets", [3, 200])
+def test_secret_filtering_matches_reference_implementation(reset_secrets, number_of_secrets):
+    random_generator = random.Random(number_of_secrets)
+    alphabet = "abc"
+    secrets = [
+        "".join(random_generator.choices(alphabet, k=random_generator.randint(24, 30)))
+        for _ in range(number_of_secrets)
+    ] + ["ab", "abca"]
+    update_secrets(secrets)
+
+    for _ in range(50):
+        parts = [
+            "".join(random_generator.choices(alphabet + " ", k=random_generator.randint(0, 20)))
+            for _ in range(10)
+        ]
+        sensitive_str = "".join(
+            part + (random_generator.choice(secrets) if random_generator.random() < 0.5 else "")
+            for part in parts
+        )
+
+        assert filter_secrets(sensitive_str) == _reference_filter(secrets, sensitive_str)
+
+
+def _legacy_filter_secrets(secrets, string):
+    for secret in secrets:
+        if secret:
+            string = string.replace(str(secret), "****")
+    return string
+
+
+class _CandidateCountingDict(dict):
+    """
+    Records the secrets looked up by gram, i.e. the secrets a string is checked against besides the secrets that are not indexed.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.looked_up_secrets = []
+
+    def __getitem__(self, key):
+        secrets = super().__getitem__(key)
+        self.looked_up_secrets.extend(secrets)
+        return secrets
+
+
+def test_given_many_long_secrets_when_filter_secrets_then_only_check_the_secrets_sharing_substrings_with_the_string(
+    reset_secrets,
+):
+    random_generator = random.Random(0)
+    characters = string.ascii_letters + string.digits
+    secrets = [
+        "".join(random_generator.choices(characters, k=random_generator.randint(32, 64)))
+        for _ in range(300)
+    ] + ["a_short_password"]
+    update_secrets(secrets)
+    debug_payload = json.dumps(
+        {
+            "request": {"url": "https://api.test/v1/records", "headers": {"Authorization": "****"}},
+            "response": [
+                {"id": i, "value": "".join(random_generator.choices(characters, k=64))}
+                for i in range(1_000)
+            ],
+        }
+    )
+    messages = [debug_payload, debug_payload + secrets[42], "Sending request to https://api.test"]
+    matcher = _SecretMatcher(secrets)
+    secrets_by_gram = _CandidateCountingDict(matcher._secrets_by_gram)
+    matcher._secrets_by_gram = secrets_by_gram
+
+    filtered = [matcher.replace(message, "****") for message in messages]
+
+    assert filtered == [_legacy_filter_secrets(secrets, message) for message in messages]
+    assert filtered == [filter_secrets(message) for message in messages]
+    assert set(secrets_by_gram.looked_up_secrets) == {secrets[42]}